@@ -515,11 +515,17 @@ class FindContours(qt.QMainWindow):
         nbPoints = 0
 
         # iso contours
+        from silx.image.marchingsquares import MarchingSquaresMergeImpl
+        startTime = time.time()
+        if isinstance(self.__algo, MarchingSquaresMergeImpl):
+            # all the levels are processed at once
+            allPolygons = self.__algo.find_contours(list(values))
+        else:
+            allPolygons = [self.__algo.find_contours(value) for value in values]
+        nbTime += (time.time() - startTime)
+
         ipolygon = 0
-        for ivalue, value in enumerate(values):
-            startTime = time.time()
-            polygons = self.__algo.find_contours(value)
-            nbTime += (time.time() - startTime)
+        for ivalue, (value, polygons) in enumerate(zip(values, allPolygons)):
             nbPolygons += len(polygons)
             for polygon in polygons:
                 if len(polygon) == 0:
@@ -25,7 +25,7 @@
 
 __authors__ = ["P. Knobel"]
 __license__ = "MIT"
-__date__ = "05/02/2019"
+__date__ = "19/10/2026"
 
 import ast
 import os
@@ -34,11 +34,6 @@ from glob import glob
 import logging
 import re
 import time
-import numpy
-
-import silx.io
-from silx.io.specfile import is_specfile
-from silx.io import fabioh5
 
 _logger = logging.getLogger(__name__)
 """Module logger"""
@@ -151,6 +146,8 @@ def are_all_specfile(filenames):
     """Return True if all files in a list are SPEC files.
     :param List[str] filenames: list of filenames
     """
+    from silx.io.specfile import is_specfile
+
     for fname in filenames:
         if not is_specfile(fname):
             return False
@@ -161,6 +158,8 @@ def contains_specfile(filenames):
     """Return True if any file in a list are SPEC files.
     :param List[str] filenames: list of filenames
     """
+    from silx.io.specfile import is_specfile
+
     for fname in filenames:
         if is_specfile(fname):
             return True
@@ -300,6 +299,9 @@ def main(argv):
         hdf5plugin = None
 
     import h5py
+    import numpy
+    import silx.io
+    from silx.io import fabioh5
 
     try:
         from silx.io.convert import write_to_h5
@@ -25,7 +25,7 @@
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "12/10/2018"
+__date__ = "19/10/2026"
 
 import logging
 import os.path
@@ -161,6 +161,26 @@ class DataPanel(qt.QWidget):
                 if data.file.filename == root.file.filename:
                     self.__dataViewer.setData(None)
 
+    def updateDatasetsFrom(self, updatedH5):
+        """
+        Update the displayed view if it displays this dataset, which was
+        modified in place.
+
+        Usually used when new data was written in a file followed in SWMR
+        mode.
+
+        :param updatedH5: The h5py dataset which was modified
+        """
+        data = self.__dataViewer.data()
+        if data is None or not hasattr(data, "file") or data.file is None:
+            return
+        if (data.file.filename != updatedH5.file.filename or
+                data.name != updatedH5.name):
+            return
+        if data is not updatedH5 and hasattr(data, "refresh"):
+            data.refresh()
+        self.__dataViewer.updateData()
+
     def replaceDatasetsFrom(self, removedH5, loadedH5):
         """
         Replace any dataset from any NXdata items using the same dataset name
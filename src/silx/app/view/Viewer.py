@@ -25,7 +25,7 @@
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "15/01/2019"
+__date__ = "19/10/2026"
 
 
 import os
@@ -86,6 +86,7 @@ class Viewer(qt.QMainWindow):
         treeModel.sigH5pyObjectLoaded.connect(self.__h5FileLoaded)
         treeModel.sigH5pyObjectRemoved.connect(self.__h5FileRemoved)
         treeModel.sigH5pyObjectSynchronized.connect(self.__h5FileSynchonized)
+        treeModel.sigH5pyObjectUpdated.connect(self.__h5pyObjectUpdated)
         treeModel.setDatasetDragEnabled(True)
         self.__treeModelSorted = silx.gui.hdf5.NexusSortFilterProxyModel(self.__treeview)
         self.__treeModelSorted.setSourceModel(treeModel)
@@ -469,6 +470,9 @@ class Viewer(qt.QMainWindow):
         self.__customNxdata.replaceDatasetsFrom(removedH5, loadedH5)
         removedH5.close()
 
+    def __h5pyObjectUpdated(self, updatedH5):
+        self.__dataPanel.updateDatasetsFrom(updatedH5)
+
     def closeEvent(self, event):
         self.__context.saveSettings()
 
@@ -505,6 +509,8 @@ class Viewer(qt.QMainWindow):
         settings.beginGroup("content")
         isSorted = self._sortContentAction.isChecked()
         settings.setValue("is-sorted", isSorted)
+        isFollowing = self._followSwmrAction.isChecked()
+        settings.setValue("follow-swmr", isFollowing)
         settings.endGroup()
 
         if isFullScreen:
@@ -558,6 +564,13 @@ class Viewer(qt.QMainWindow):
         except ValueError:
             isSorted = True
         self.setContentSorted(isSorted)
+        isFollowing = settings.value("follow-swmr", False)
+        try:
+            if not isinstance(isFollowing, bool):
+                isFollowing = utils.stringToBool(isFollowing)
+        except ValueError:
+            isFollowing = False
+        self._followSwmrAction.setChecked(isFollowing)
         settings.endGroup()
 
         if not pos.isNull():
@@ -650,6 +663,14 @@ class Viewer(qt.QMainWindow):
         self._plotImageOrientationMenu.addAction(action)
         self._useYAxisOrientationUpward = action
 
+        # Content
+
+        action = qt.QAction("Follow files written in SWMR mode", self)
+        action.setStatusTip("Periodically refresh the datasets of the files opened in SWMR mode")
+        action.setCheckable(True)
+        action.toggled.connect(self.__setFollowModeEnabled)
+        self._followSwmrAction = action
+
         # Windows
 
         action = qt.QAction("Show custom NXdata selector", self)
@@ -744,6 +765,8 @@ class Viewer(qt.QMainWindow):
         optionMenu = self.menuBar().addMenu("&Options")
         optionMenu.addMenu(self._plotImageOrientationMenu)
         optionMenu.addMenu(self._plotBackendMenu)
+        optionMenu.addSeparator()
+        optionMenu.addAction(self._followSwmrAction)
         optionMenu.aboutToShow.connect(self.__updateOptionMenu)
 
         viewMenu = self.menuBar().addMenu("&Views")
@@ -845,6 +868,10 @@ class Viewer(qt.QMainWindow):
                 paths = pathss.pop(0)
                 self.__expandNodesFromPaths(self.__treeview, index, paths)
 
+    def __setFollowModeEnabled(self, enabled):
+        treeModel = self.__treeview.findHdf5TreeModel()
+        treeModel.setFollowModeEnabled(enabled)
+
     def isContentSorted(self):
         """Returns whether the file content is sorted or not.
 
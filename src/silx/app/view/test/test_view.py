@@ -38,8 +38,11 @@ from silx.gui import qt
 from silx.app.view.Viewer import Viewer
 from silx.app.view.About import About
 from silx.app.view.DataPanel import DataPanel
+from silx.gui.data.DataViewerFrame import DataViewerFrame
 from silx.app.view.CustomNxdataWidget import CustomNxdataWidget
 from silx.gui.hdf5._utils import Hdf5DatasetMimeData
+from silx.gui.data import DataViews
+from silx.gui.data.NumpyAxesSelector import NumpyAxesSelector
 from silx.gui.utils.testutils import TestCaseQt
 from silx.io import commonh5
 
@@ -180,6 +183,36 @@ class TestDataPanel(TestCaseQt):
             widget.setData(None)
             f.close()
 
+    def testUpdateDatasetsFrom(self):
+        filename = self.data_h5.replace("data.h5", "growing.h5")
+        with h5py.File(filename, mode='w') as f:
+            dataset = f.create_dataset(
+                "stack", data=numpy.arange(3 * 4 * 5).reshape(3, 4, 5),
+                maxshape=(None, 4, 5))
+            other = f.create_dataset("other", data=numpy.arange(3))
+            widget = DataPanel()
+            widget.setData(dataset)
+            viewer = widget.findChild(DataViewerFrame)
+            viewer.setDisplayMode(DataViews.RAW_MODE)
+            selector = widget.findChild(NumpyAxesSelector)
+            selector.setSelection((1, slice(None), slice(None)))
+            try:
+                dataset.resize((6, 4, 5))
+
+                # Another dataset is not updated
+                widget.updateDatasetsFrom(other)
+                self.assertEqual(selector.selection(), (1, slice(None), slice(None)))
+
+                widget.updateDatasetsFrom(dataset)
+                self.assertIs(widget.getData(), dataset)
+                self.assertEqual(viewer.displayedView().modeId(), DataViews.RAW_MODE)
+                self.assertEqual(selector.selection(), (1, slice(None), slice(None)))
+                # The new frames can be selected
+                selector.setSelection((5, slice(None), slice(None)))
+                self.assertEqual(selector.selection(), (5, slice(None), slice(None)))
+            finally:
+                widget.setData(None)
+
     def testReplaceDatasetsFrom(self):
         f = h5py.File(self.data_h5, mode='r')
         f2 = h5py.File(self.data2_h5, mode='r')
@@ -0,0 +1,51 @@
+# coding: utf-8
+# /*##########################################################################
+# Copyright (C) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Benchmarks of silx hot paths.
+
+The benchmarks are run from the command line with:
+
+.. code-block:: bash
+
+    # Run all the benchmarks and save the results
+    python -m silx.benchmark --output results.json
+    # Run quickly a selection of benchmarks and compare with saved results
+    python -m silx.benchmark --quick -k "combo_*" -k "io_*" --baseline results.json
+
+Use ``python -m silx.benchmark --help`` for the full list of options.
+"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+
+from .runner import (  # noqa
+    benchmark,
+    compare,
+    get_benchmarks,
+    load,
+    run,
+    save,
+    SkipBenchmark,
+)
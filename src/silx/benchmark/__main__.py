@@ -0,0 +1,155 @@
+# coding: utf-8
+# /*##########################################################################
+# Copyright (C) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Command line interface of the benchmark suite: `python -m silx.benchmark`
+"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+
+import argparse
+import logging
+import sys
+
+from . import runner
+
+
+_logger = logging.getLogger(__name__)
+
+
+def _parse_threads(text):
+    """Parse a comma-separated list of thread counts ('all' for None)"""
+    return [None if value.strip() == "all" else int(value)
+            for value in text.split(",")]
+
+
+def _format_duration(duration):
+    """Returns a readable string for a duration in seconds"""
+    for unit, factor in (("s", 1.), ("ms", 1e-3), ("us", 1e-6)):
+        if duration >= factor:
+            return "%.3f%s" % (duration / factor, unit)
+    return "%.1fns" % (duration / 1e-9)
+
+
+def _print_result(name, result):
+    if "skipped" in result:
+        print("%-70s skipped: %s" % (name, result["skipped"]))
+    elif "error" in result:
+        print("%-70s error: %s" % (name, result["error"]))
+    else:
+        print("%-70s %12s (x%d)" % (
+            name, _format_duration(result["median"]), result["number"]))
+    sys.stdout.flush()
+
+
+def main(argv):
+    """Main function of the benchmark suite
+
+    :param argv: Command line arguments
+    :returns: exit status, 1 if a regression was found
+    """
+    parser = argparse.ArgumentParser(prog="python -m silx.benchmark",
+                                     description=__doc__)
+    parser.add_argument(
+        "-k", "--select", action="append", default=[], metavar="PATTERN",
+        help="Only run benchmarks matching this shell-style pattern "
+             "(can be repeated)")
+    parser.add_argument(
+        "-l", "--list", action="store_true",
+        help="List the benchmarks and their parameters, then exit")
+    parser.add_argument(
+        "-q", "--quick", action="store_true",
+        help="Only run the first (smallest) case of each benchmark")
+    parser.add_argument(
+        "--threads", type=_parse_threads, metavar="N[,N...]",
+        help="Thread counts to use for benchmarks with a 'num_threads' "
+             "parameter ('all' for all available CPUs)")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2,
+        help="Minimum duration of each measure in seconds (default: 0.2)")
+    parser.add_argument(
+        "--repeat", type=int, default=5,
+        help="Number of measures of each case (default: 5)")
+    parser.add_argument(
+        "-o", "--output", metavar="FILE",
+        help="Save the results in this JSON file")
+    parser.add_argument(
+        "-b", "--baseline", metavar="FILE",
+        help="Compare the results with the ones saved in this JSON file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="Relative slowdown above which a case is reported as a "
+             "regression (default: 0.1)")
+    options = parser.parse_args(argv[1:])
+
+    benchmarks = runner.get_benchmarks(options.select)
+    if not benchmarks:
+        _logger.error("No benchmark matching %s", options.select)
+        return 2
+
+    overrides = {}
+    if options.threads is not None:
+        overrides["num_threads"] = options.threads
+
+    if options.list:
+        for bench in benchmarks:
+            for params in bench.cases(options.quick, overrides):
+                print(bench.case_name(params))
+        return 0
+
+    baseline = None
+    if options.baseline is not None:
+        baseline = runner.load(options.baseline)
+
+    results = runner.run(benchmarks,
+                         quick=options.quick,
+                         overrides=overrides,
+                         min_time=options.min_time,
+                         repeat=options.repeat,
+                         callback=_print_result)
+
+    if options.output is not None:
+        runner.save(results, options.output)
+
+    if baseline is None:
+        return 0
+
+    comparison = runner.compare(results, baseline, options.threshold)
+    print("\nComparison with %s (silx %s):" % (
+        options.baseline, baseline["environment"].get("silx", "?")))
+    regressions = 0
+    for name, before, after, ratio, regression in comparison:
+        print("%-70s %12s -> %12s  x%.2f%s" % (
+            name, _format_duration(before), _format_duration(after), ratio,
+            "  REGRESSION" if regression else ""))
+        regressions += regression
+    print("%d regression(s) out of %d compared case(s)" % (
+        regressions, len(comparison)))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    sys.exit(main(sys.argv))
@@ -0,0 +1,259 @@
+# coding: utf-8
+# /*##########################################################################
+# Copyright (C) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Benchmarks of silx hot paths.
+
+The first value of each parameter is used by the quick mode.
+"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy
+
+from .runner import benchmark, SkipBenchmark
+
+
+def _random(shape, dtype, seed=0):
+    """Returns reproducible random data of the given dtype"""
+    state = numpy.random.RandomState(seed)
+    if numpy.issubdtype(dtype, numpy.integer):
+        info = numpy.iinfo(dtype)
+        return state.randint(max(info.min, -2**15), min(info.max, 2**15),
+                             size=shape).astype(dtype)
+    return state.random_sample(shape).astype(dtype)
+
+
+def _temp_dir():
+    """Returns a context manager providing a temporary directory"""
+    return tempfile.TemporaryDirectory(prefix="silx_benchmark_")
+
+
+# Startup #####################################################################
+
+@benchmark(command=["import silx",
+                    "import silx.io",
+                    "import silx.math",
+                    "import silx.gui",
+                    "silx --help",
+                    "silx convert --help"])
+def startup(command):
+    if command.startswith("import "):
+        args = [sys.executable, "-c", command]
+    else:
+        args = [sys.executable, "-m"] + command.split()
+    return lambda: subprocess.run(args, check=True, stdout=subprocess.DEVNULL)
+
+
+# silx.math ###################################################################
+
+@benchmark(size=[10**6, 10**7],
+           dtype=["float32", "float64", "int32", "uint16"],
+           min_positive=[False, True])
+def combo_min_max(size, dtype, min_positive):
+    from silx.math import combo
+    data = _random(size, dtype)
+    return lambda: combo.min_max(data, min_positive=min_positive)
+
+
+@benchmark(size=[10**6, 10**7],
+           dtype=["float32", "uint16"],
+           normalization=["linear", "log", "gamma"])
+def colormap_cmap(size, dtype, normalization):
+    from silx.math.colormap import cmap
+    data = _random(size, dtype) + 1
+    colors = _random((256, 4), "uint8")
+    return lambda: cmap(data, colors, 1., 1000., normalization)
+
+
+@benchmark(size=[10**6, 10**7],
+           dims=[1, 2],
+           dtype=["float32", "float64"])
+def histogramnd(size, dims, dtype):
+    from silx.math.histogram import Histogramnd
+    sample = _random((size, dims) if dims > 1 else size, dtype)
+    histo_range = [[0., 1.]] * dims
+    n_bins = [1024 // dims] * dims
+    return lambda: Histogramnd(sample, histo_range, n_bins)
+
+
+@benchmark(shape=[(512, 512), (2048, 2048)],
+           kernel_size=[3, 11],
+           dtype=["float32", "uint16"],
+           engine=["sort", "histogram"])
+def medfilt2d(shape, kernel_size, dtype, engine):
+    from silx.math.medianfilter import medfilt2d
+    if engine == "histogram" and dtype != "uint16":
+        raise SkipBenchmark("histogram engine only supports 8 and 16 bits")
+    image = _random(shape, dtype)
+    return lambda: medfilt2d(image, kernel_size, engine=engine)
+
+
+@benchmark(npoints=[10**5, 10**6],
+           dtype=["float32", "float64"],
+           method=["linear", "linear_omp"])
+def interp3d(npoints, dtype, method):
+    from silx.math.interpolate import interp3d
+    values = _random((128, 128, 128), dtype)
+    points = _random((npoints, 3), dtype) * 127
+    return lambda: interp3d(values, points, method=method)
+
+
+@benchmark(size=[64, 256],
+           num_threads=[1, None])
+def marchingcubes(size, num_threads):
+    from silx.math.marchingcubes import MarchingCubes
+    coords = numpy.linspace(-1, 1, size, dtype=numpy.float32)
+    z, y, x = numpy.meshgrid(coords, coords, coords, indexing="ij")
+    data = numpy.sin(8 * x) + numpy.cos(8 * y) + numpy.sin(8 * z) * x
+    return lambda: MarchingCubes(data, isolevel=0.5, num_threads=num_threads)
+
+
+# silx.io #####################################################################
+
+def _read_all(node):
+    """Read all the datasets of a h5py-like tree"""
+    import silx.io
+
+    for child in node.values():
+        if silx.io.is_group(child):
+            _read_all(child)
+        elif silx.io.is_dataset(child):
+            child[()]
+
+
+def _open_and_read(filename):
+    import silx.io
+
+    with silx.io.open(filename) as h5file:
+        _read_all(h5file)
+
+
+@benchmark(nb_scans=[10, 100], nb_points=[1000])
+def io_open_spec(nb_scans, nb_points):
+    import silx.io  # noqa
+    data = _random((nb_points, 4), "float64")
+    with _temp_dir() as tmp_dir:
+        filename = os.path.join(tmp_dir, "data.dat")
+        with open(filename, "w") as f:
+            f.write("#F %s\n#D Fri Jan 01 00:00:00 2021\n\n" % filename)
+            for scan in range(1, nb_scans + 1):
+                f.write("#S %d ascan x 0 1 %d 0.1\n" % (scan, nb_points))
+                f.write("#D Fri Jan 01 00:00:00 2021\n#N 4\n#L x  y  z  i0\n")
+                numpy.savetxt(f, data)
+                f.write("\n")
+        yield lambda: _open_and_read(filename)
+
+
+@benchmark(shape=[(1024, 1024), (2048, 2048)], dtype=["uint16", "float32"])
+def io_open_edf(shape, dtype):
+    import fabio.edfimage
+    import silx.io  # noqa
+    with _temp_dir() as tmp_dir:
+        filename = os.path.join(tmp_dir, "data.edf")
+        fabio.edfimage.EdfImage(data=_random(shape, dtype)).write(filename)
+        yield lambda: _open_and_read(filename)
+
+
+@benchmark(nb_datasets=[10, 1000], size=[1000, 10**6])
+def io_open_hdf5(nb_datasets, size):
+    import h5py
+    import silx.io  # noqa
+    data = _random(size, "float32")
+    with _temp_dir() as tmp_dir:
+        filename = os.path.join(tmp_dir, "data.h5")
+        with h5py.File(filename, "w") as h5file:
+            for index in range(nb_datasets):
+                h5file["group%d/data%d" % (index % 10, index)] = data
+        yield lambda: _open_and_read(filename)
+
+
+def _tree(nb_groups, nb_datasets, size):
+    """Returns a nested dict of arrays"""
+    data = _random(size, "float64")
+    return {"group%d" % group: {"data%d" % index: data
+                                for index in range(nb_datasets)}
+            for group in range(nb_groups)}
+
+
+@benchmark(nb_groups=[10, 100], nb_datasets=[10], size=[100, 10**5])
+def dicttoh5(nb_groups, nb_datasets, size):
+    from silx.io.dictdump import dicttoh5
+    tree = _tree(nb_groups, nb_datasets, size)
+    with _temp_dir() as tmp_dir:
+        filename = os.path.join(tmp_dir, "data.h5")
+        yield lambda: dicttoh5(tree, filename, mode="w")
+
+
+@benchmark(nb_groups=[10, 100], nb_datasets=[10], size=[100, 10**5])
+def h5todict(nb_groups, nb_datasets, size):
+    from silx.io.dictdump import dicttoh5, h5todict
+    with _temp_dir() as tmp_dir:
+        filename = os.path.join(tmp_dir, "data.h5")
+        dicttoh5(_tree(nb_groups, nb_datasets, size), filename, mode="w")
+        yield lambda: h5todict(filename)
+
+
+# silx.gui ####################################################################
+
+@benchmark(item=["image", "curve", "scatter"],
+           size=[10**5, 10**6],
+           backend=["matplotlib", "opengl"])
+def plot_render(item, size, backend):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from silx.gui import qt
+    from silx.gui.plot import PlotWidget
+
+    app = qt.QApplication.instance()
+    if app is None:
+        app = qt.QApplication([])
+
+    plot = PlotWidget(backend=backend)
+    plot.setAttribute(qt.Qt.WA_DeleteOnClose)
+    plot.resize(800, 600)
+    if item == "image":
+        side = int(numpy.sqrt(size))
+        plot.addImage(_random((side, side), "float32"))
+    elif item == "curve":
+        plot.addCurve(numpy.arange(size), _random(size, "float32"))
+    else:
+        plot.addScatter(numpy.arange(size), _random(size, "float32"),
+                        _random(size, "float32", seed=1))
+    plot.resetZoom()
+
+    def render():
+        plot._setDirtyPlot()
+        plot.grab()
+
+    try:
+        yield render
+    finally:
+        plot.close()
+        app.processEvents()
@@ -0,0 +1,304 @@
+# coding: utf-8
+# /*##########################################################################
+# Copyright (C) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Registration, execution and comparison of benchmarks.
+
+A benchmark is a function decorated with :func:`benchmark`. It receives one
+value for each of its parameters, prepares the data and returns the callable
+to time. It can also be a generator yielding this callable once, in which
+case the code following the `yield` is run after the measure (clean up of
+temporary files...).
+"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+
+import collections
+import fnmatch
+import itertools
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import types
+
+import numpy
+
+
+_logger = logging.getLogger(__name__)
+
+
+class SkipBenchmark(Exception):
+    """Exception raised by a benchmark to skip a case"""
+    pass
+
+
+class Benchmark(object):
+    """Description of a registered benchmark
+
+    :param str name: Name of the benchmark
+    :param callable function: Function preparing the benchmark
+    :param params: Mapping of parameter names to the list of values to test
+    """
+
+    def __init__(self, name, function, params):
+        self.name = name
+        self.function = function
+        self.params = collections.OrderedDict(params)
+
+    def cases(self, quick=False, overrides=None):
+        """Returns the parameters of each case of this benchmark.
+
+        :param bool quick: True to only use the first value of each parameter
+        :param dict overrides:
+            Values to use instead of the declared ones for some parameters
+        :rtype: List[collections.OrderedDict]
+        """
+        params = collections.OrderedDict()
+        for key, values in self.params.items():
+            if overrides is not None and key in overrides:
+                values = overrides[key]
+            params[key] = list(values)[:1] if quick else list(values)
+        return [collections.OrderedDict(zip(params.keys(), values))
+                for values in itertools.product(*params.values())]
+
+    def case_name(self, params):
+        """Returns the unique name of a case of this benchmark.
+
+        :param dict params: Parameters of the case
+        :rtype: str
+        """
+        if not params:
+            return self.name
+        return "%s[%s]" % (
+            self.name,
+            ",".join("%s=%s" % (key, value) for key, value in params.items()))
+
+
+_BENCHMARKS = collections.OrderedDict()
+"""Registered benchmarks by name"""
+
+
+def benchmark(name=None, **params):
+    """Decorator registering a benchmark function.
+
+    .. code-block:: python
+
+        @benchmark(size=[10**6, 10**7], dtype=["float32", "uint16"])
+        def min_max(size, dtype):
+            data = numpy.arange(size, dtype=dtype)
+            return lambda: combo.min_max(data)
+
+    :param str name: Name of the benchmark, default: the function's name
+    :param params: Lists of values of the parameters of the function.
+        All the combinations are measured. The first values are used by the
+        quick mode: they should be the cheapest.
+    """
+    def decorator(function):
+        benchmark_name = function.__name__ if name is None else name
+        _BENCHMARKS[benchmark_name] = Benchmark(benchmark_name, function, params)
+        return function
+    return decorator
+
+
+def get_benchmarks(patterns=None):
+    """Returns the registered benchmarks matching one of the patterns.
+
+    :param List[str] patterns: Unix shell-style wildcards, default: all
+    :rtype: List[Benchmark]
+    """
+    from . import cases  # noqa: Register the benchmarks of silx
+
+    if not patterns:
+        return list(_BENCHMARKS.values())
+    return [bench for name, bench in _BENCHMARKS.items()
+            if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)]
+
+
+def measure(function, min_time=0.2, repeat=5):
+    """Measure the execution time of a callable.
+
+    The callable is run `number` times per measure, `number` being chosen
+    so that a measure lasts at least `min_time` seconds.
+
+    :param callable function: The callable to time
+    :param float min_time: Minimum duration of one measure in seconds
+    :param int repeat: Number of measures
+    :returns: Statistics of the time of one call in seconds
+    :rtype: dict
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        duration = time.perf_counter() - start
+        if duration >= min_time or number >= 10**6:
+            break
+        number *= 10 if duration < min_time / 10 else 2
+
+    durations = [duration / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        durations.append((time.perf_counter() - start) / number)
+
+    return {
+        "min": float(numpy.min(durations)),
+        "median": float(numpy.median(durations)),
+        "max": float(numpy.max(durations)),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run_case(bench, params, min_time=0.2, repeat=5):
+    """Run a single case of a benchmark.
+
+    Benchmarks raising :class:`SkipBenchmark` or an :class:`ImportError`
+    during their setup (e.g., an optional dependency is missing) are
+    reported as skipped.
+
+    :param Benchmark bench: The benchmark
+    :param dict params: The parameters of the case
+    :param float min_time: Minimum duration of one measure in seconds
+    :param int repeat: Number of measures
+    :rtype: dict
+    """
+    result = {"params": dict(params)}
+    try:
+        setup = bench.function(**params)
+        if isinstance(setup, types.GeneratorType):
+            try:
+                function = next(setup)
+                result.update(measure(function, min_time, repeat))
+                next(setup, None)  # Run the clean up
+            finally:
+                setup.close()
+        else:
+            result.update(measure(setup, min_time, repeat))
+    except (SkipBenchmark, ImportError) as e:
+        _logger.debug("Backtrace", exc_info=True)
+        result["skipped"] = str(e)
+    except Exception as e:
+        _logger.error("Benchmark %s failed: %s",
+                      bench.case_name(params), e)
+        _logger.debug("Backtrace", exc_info=True)
+        result["error"] = str(e)
+    return result
+
+
+def _environment():
+    """Returns a description of the execution environment"""
+    import silx
+
+    if hasattr(os, "sched_getaffinity"):
+        cpu_count = len(os.sched_getaffinity(0))
+    else:
+        cpu_count = os.cpu_count()
+    return {
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "silx": silx.version,
+        "numpy": numpy.version.version,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": cpu_count,
+    }
+
+
+def run(benchmarks, quick=False, overrides=None, min_time=0.2, repeat=5,
+        callback=None):
+    """Run benchmarks and returns the results.
+
+    :param List[Benchmark] benchmarks: Benchmarks to run
+    :param bool quick: True to only run the first case of each benchmark
+    :param dict overrides: Parameter values to use instead of the declared ones
+    :param float min_time: Minimum duration of one measure in seconds
+    :param int repeat: Number of measures
+    :param callable callback:
+        Function called with (case name, result) after each case
+    :returns: The environment and a mapping of case names to results
+    :rtype: dict
+    """
+    results = collections.OrderedDict()
+    for bench in benchmarks:
+        for params in bench.cases(quick, overrides):
+            name = bench.case_name(params)
+            results[name] = run_case(bench, params, min_time, repeat)
+            if callback is not None:
+                callback(name, results[name])
+    return {"environment": _environment(), "results": results}
+
+
+def save(results, filename):
+    """Save results of :func:`run` as a JSON file.
+
+    :param dict results:
+    :param str filename:
+    """
+    with open(filename, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load(filename):
+    """Load results saved with :func:`save`.
+
+    :param str filename:
+    :rtype: dict
+    """
+    with open(filename, "r") as f:
+        return json.load(f, object_pairs_hook=collections.OrderedDict)
+
+
+def compare(results, baseline, threshold=0.1):
+    """Compare results with results of a baseline.
+
+    The median durations are compared, cases not measured by both are
+    ignored.
+
+    :param dict results: Results of :func:`run`
+    :param dict baseline: Results of a previous run used as reference
+    :param float threshold:
+        Relative increase of duration above which a case is a regression
+    :returns: List of (case name, baseline duration, duration, ratio,
+        is regression)
+    :rtype: List[tuple]
+    """
+    comparison = []
+    reference = baseline["results"]
+    for name, result in results["results"].items():
+        if name not in reference:
+            continue
+        if "median" not in result or "median" not in reference[name]:
+            continue
+        before = reference[name]["median"]
+        after = result["median"]
+        ratio = after / before if before > 0 else float("inf")
+        comparison.append((name, before, after, ratio, ratio > 1. + threshold))
+    return comparison
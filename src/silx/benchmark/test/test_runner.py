@@ -0,0 +1,120 @@
+# coding: utf-8
+# /*##########################################################################
+# Copyright (C) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Tests of the benchmark runner"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from .. import runner
+from ..__main__ import main
+
+
+class TestRunner(unittest.TestCase):
+    """Tests of benchmark registration, execution and comparison"""
+
+    def setUp(self):
+        self.events = []
+
+        @runner.benchmark(name="_test_sum", size=[10, 100], offset=[0, 1])
+        def sum_(size, offset):
+            self.events.append("setup")
+            data = list(range(offset, size + offset))
+            yield lambda: sum(data)
+            self.events.append("cleanup")
+
+        @runner.benchmark(name="_test_skip")
+        def skip():
+            raise runner.SkipBenchmark("not supported")
+
+        @runner.benchmark(name="_test_error")
+        def error():
+            raise RuntimeError("failure")
+
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for name in ("_test_sum", "_test_skip", "_test_error"):
+            del runner._BENCHMARKS[name]
+        shutil.rmtree(self.tmpdir)
+
+    def testCases(self):
+        bench, = runner.get_benchmarks(["_test_sum"])
+        cases = bench.cases()
+        self.assertEqual(len(cases), 4)
+        self.assertEqual(bench.case_name(cases[1]), "_test_sum[size=10,offset=1]")
+        self.assertEqual(bench.cases(quick=True), [{"size": 10, "offset": 0}])
+        cases = bench.cases(overrides={"offset": [5]})
+        self.assertEqual([case["offset"] for case in cases], [5, 5])
+
+    def testRun(self):
+        benchmarks = runner.get_benchmarks(["_test_*"])
+        self.assertEqual(len(benchmarks), 3)
+        results = runner.run(benchmarks, quick=True, min_time=0.001, repeat=2)
+        self.assertEqual(self.events, ["setup", "cleanup"])
+
+        results = results["results"]
+        self.assertEqual(list(results.keys()), [
+            "_test_sum[size=10,offset=0]", "_test_skip", "_test_error"])
+        result = results["_test_sum[size=10,offset=0]"]
+        self.assertEqual(result["repeat"], 2)
+        self.assertGreater(result["median"], 0)
+        self.assertEqual(results["_test_skip"]["skipped"], "not supported")
+        self.assertEqual(results["_test_error"]["error"], "failure")
+
+    def testSaveCompare(self):
+        filename = os.path.join(self.tmpdir, "results.json")
+        benchmarks = runner.get_benchmarks(["_test_sum"])
+        results = runner.run(benchmarks, min_time=0.001, repeat=2)
+        runner.save(results, filename)
+        baseline = runner.load(filename)
+        self.assertEqual(baseline, results)
+
+        name = "_test_sum[size=10,offset=0]"
+        del baseline["results"]["_test_sum[size=100,offset=0]"]
+        baseline["results"][name]["median"] /= 2
+        comparison = runner.compare(results, baseline, threshold=0.5)
+        self.assertEqual(len(comparison), 3)
+        regressions = [row[0] for row in comparison if row[4]]
+        self.assertEqual(regressions, [name])
+
+    def testMain(self):
+        filename = os.path.join(self.tmpdir, "results.json")
+        argv = ["silx.benchmark", "-k", "_test_sum", "-q",
+                "--min-time", "0.001", "--repeat", "2"]
+        self.assertEqual(main(argv + ["-o", filename]), 0)
+        self.assertTrue(os.path.exists(filename))
+
+        baseline = runner.load(filename)
+        for result in baseline["results"].values():
+            result["median"] = 1e-12
+        runner.save(baseline, filename)
+        self.assertEqual(main(argv + ["-b", filename]), 1)
+        self.assertEqual(main(["silx.benchmark", "-k", "_nothing"]), 2)
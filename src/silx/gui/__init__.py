@@ -46,4 +46,26 @@ See silx documentation: http://www.silx.org/doc/silx/latest/
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "23/05/2016"
+__date__ = "19/10/2026"
+
+
+from silx.utils._lazy import lazy_attributes as _lazy_attributes
+
+# Sub-packages are loaded on first access to avoid importing Qt
+__getattr__, __dir__ = _lazy_attributes(
+    __name__,
+    submodules=[
+        "colors",
+        "console",
+        "data",
+        "dialog",
+        "fit",
+        "hdf5",
+        "icons",
+        "plot",
+        "plot3d",
+        "printer",
+        "qt",
+        "utils",
+        "widgets",
+    ])
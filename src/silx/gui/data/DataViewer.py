@@ -39,7 +39,7 @@ from silx.gui.data.NumpyAxesSelector import NumpyAxesSelector
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "12/02/2019"
+__date__ = "19/10/2026"
 
 
 _logger = logging.getLogger(__name__)
@@ -507,6 +507,21 @@ class DataViewer(qt.QFrame):
         self.__updateDataInView()
         self.dataChanged.emit()
 
+    def updateData(self):
+        """Update the displayed view after the data was modified in place,
+        for example when frames or points were appended to a dataset which
+        is being written.
+
+        Unlike :meth:`setData`, the displayed view and the axes selection
+        are kept, so that only the displayed part of the data is read again.
+        """
+        if self.__data is None:
+            return
+        self._invalidateInfo()
+        self.__updateNumpySelectionAxis()
+        self.__updateDataInView()
+        self.dataChanged.emit()
+
     def __numpyAxisChanged(self):
         """
         Called when axis selection of the numpy-selector changed
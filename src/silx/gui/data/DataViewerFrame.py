@@ -27,7 +27,7 @@
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "12/02/2019"
+__date__ = "19/10/2026"
 
 from silx.gui import qt
 from .DataViewer import DataViewer
@@ -175,6 +175,13 @@ class DataViewerFrame(qt.QWidget):
         """
         self.__dataViewer.setData(data)
 
+    def updateData(self):
+        """Update the displayed view after the data was modified in place.
+
+        See :meth:`DataViewer.updateData`.
+        """
+        self.__dataViewer.updateData()
+
     def data(self):
         """Returns the data"""
         return self.__dataViewer.data()
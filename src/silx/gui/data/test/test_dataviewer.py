@@ -33,6 +33,7 @@ from contextlib import contextmanager
 
 import numpy
 from ..DataViewer import DataViewer
+from ..NumpyAxesSelector import NumpyAxesSelector
 from ..DataViews import DataView
 from .. import DataViews
 
@@ -173,6 +174,39 @@ class _TestAbstractDataViewer(TestCaseQt):
             widget = self.create_widget()
             widget.setData(dataset)
 
+    def test_update_data(self):
+        fd, tmp_name = tempfile.mkstemp(suffix=".h5")
+        os.close(fd)
+        try:
+            with h5py.File(tmp_name, "w") as h5file:
+                dataset = h5file.create_dataset(
+                    "data", data=numpy.arange(3 * 3 * 3).reshape(3, 3, 3),
+                    maxshape=(None, 3, 3))
+                widget = self.create_widget()
+                widget.setData(dataset)
+                widget.setDisplayMode(DataViews.RAW_MODE)
+                selector = widget.findChild(NumpyAxesSelector)
+                selection = slice(None), 2, slice(None)
+                selector.setSelection(selection)
+                self.assertEqual(selector.selectedData().shape, (3, 3))
+
+                # Grow the dataset like a file written in SWMR mode
+                dataset.resize((5, 3, 3))
+                dataset[3:] = numpy.arange(2 * 3 * 3).reshape(2, 3, 3)
+                listener = SignalListener()
+                widget.dataChanged.connect(listener)
+                widget.updateData()
+
+                self.assertEqual(listener.callCount(), 1)
+                self.assertEqual(widget.displayedView().modeId(), DataViews.RAW_MODE)
+                self.assertEqual(selector.selection(), selection)
+                self.assertEqual(selector.selectedData().shape, (5, 3))
+                numpy.testing.assert_array_equal(
+                    selector.selectedData(), dataset[:, 2, :])
+                widget.setData(None)
+        finally:
+            os.unlink(tmp_name)
+
     def test_data_event(self):
         listener = SignalListener()
         widget = self.create_widget()
@@ -27,7 +27,7 @@ text."""
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "06/06/2018"
+__date__ = "19/10/2026"
 
 import numpy
 
@@ -91,7 +91,16 @@ class Hdf5Formatter(qt.QObject):
         text = u" \u00D7 ".join(shape)
         return text
 
-    def humanReadableValue(self, dataset):
+    def humanReadableValue(self, dataset, maxBytes=None):
+        """Returns a short text representation of the value of a dataset.
+
+        Only scalars and very small datasets are read.
+
+        :param dataset: h5py-like dataset
+        :param Union[int,None] maxBytes: If provided, the data is not read
+            when it is larger than this number of bytes.
+        :rtype: str
+        """
         if dataset.shape is None:
             return "No data"
 
@@ -100,11 +109,13 @@ class Hdf5Formatter(qt.QObject):
             if dtype.fields is None:
                 return "Raw data"
 
-        if dataset.shape == tuple():
+        tooLarge = maxBytes is not None and dataset.size * dtype.itemsize > maxBytes
+
+        if dataset.shape == tuple() and not tooLarge:
             numpy_object = dataset[()]
             text = self.__formatter.toString(numpy_object, dtype=dataset.dtype)
         else:
-            if dataset.size < 5 and dataset.compression is None:
+            if dataset.size < 5 and dataset.compression is None and not tooLarge:
                 numpy_object = dataset[0:5]
                 text = self.__formatter.toString(numpy_object, dtype=dataset.dtype)
             else:
@@ -25,12 +25,15 @@
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "17/01/2019"
+__date__ = "19/10/2026"
 
 
 import logging
 import collections
 import enum
+import os
+
+import h5py
 
 from .. import qt
 from .. import icons
@@ -43,6 +46,8 @@ _logger = logging.getLogger(__name__)
 _formatter = TextFormatter()
 _hdf5Formatter = Hdf5Formatter(textFormatter=_formatter)
 # FIXME: The formatter should be an attribute of the Hdf5Model
+_contentCache = _utils.LruCache(maxSize=10000)
+"""Content of the value and description columns, per (file, path, mtime)"""
 
 
 class DescriptionType(enum.Enum):
@@ -62,6 +67,13 @@ class Hdf5Item(Hdf5Node):
     tree structure.
     """
 
+    PAGE_SIZE = 1000
+    """Groups with more children than this are populated incrementally, by
+    pages of this size (see :meth:`canFetchMore`)."""
+
+    VALUE_READ_BUDGET = 1024
+    """Maximum number of bytes read from a dataset to display its value"""
+
     def __init__(self, text, obj, parent, key=None, h5Class=None, linkClass=None, populateAll=False):
         """
         :param str text: text displayed
@@ -74,8 +86,11 @@ class Hdf5Item(Hdf5Node):
         self.__error = None
         self.__text = text
         self.__linkClass = linkClass
-        self.__description = None
+        self.__content = None
         self.__nx_class = None
+        self.__linkTable = None
+        self.__linkCount = None
+        self.__knownShape = None
         Hdf5Node.__init__(self, parent, populateAll=populateAll)
 
     def _getCanonicalName(self):
@@ -159,10 +174,42 @@ class Hdf5Item(Hdf5Node):
         """
         return _hdf5Formatter
 
+    def __getLinkTable(self):
+        """Returns the link table shared by the items of the same tree.
+
+        :rtype: _utils.LinkTable
+        """
+        parent = self.parent
+        if isinstance(parent, Hdf5Item):
+            return parent.__getLinkTable()
+        if self.__linkTable is None:
+            self.__linkTable = _utils.LinkTable()
+        return self.__linkTable
+
+    def __getLinkCount(self):
+        """Returns the number of links of the group.
+
+        The count is fixed at the first call, in order to keep the paging
+        consistent.
+
+        :rtype: int
+        """
+        if self.__linkCount is None:
+            self.__linkCount = len(self.obj) if self.isGroupObj() else 0
+        return self.__linkCount
+
+    def isPaged(self):
+        """Returns true if the children of this item are fetched by pages.
+
+        :rtype: bool
+        """
+        return self.__getLinkCount() > self.PAGE_SIZE
+
     def _expectedChildCount(self):
-        if self.isGroupObj():
-            return len(self.obj)
-        return 0
+        if self.isPaged():
+            # Children are fetched on demand
+            return 0
+        return self.__getLinkCount()
 
     def __initH5Object(self):
         """Lazy load of the HDF5 node. It is reached from the parent node
@@ -211,6 +258,7 @@ class Hdf5Item(Hdf5Node):
                 self.__obj = obj
                 if not self.isGroupObj():
                     try:
+                        self.__knownShape = obj.shape
                         # pre-fetch of the data
                         if obj.shape is None:
                             pass
@@ -228,50 +276,67 @@ class Hdf5Item(Hdf5Node):
 
         self.__key = None
 
+    def __createChild(self, name, h5Class, linkClass):
+        return Hdf5Item(text=name, obj=None, parent=self, key=name,
+                        h5Class=h5Class, linkClass=linkClass)
+
     def _populateChild(self, populateAll=False):
-        if self.isGroupObj():
-            keys = []
-            try:
-                for name in self.obj:
-                    keys.append(name)
-            except Exception:
-                lib_name = self.obj.__class__.__module__.split(".")[0]
-                _logger.error("Internal %s error. The file is corrupted.", lib_name)
-                _logger.debug("Backtrace", exc_info=True)
-                if keys == []:
-                    # If the file was open in READ_ONLY we still can reach something
-                    # https://github.com/silx-kit/silx/issues/2262
-                    try:
-                        for name in self.obj:
-                            keys.append(name)
-                    except Exception:
-                        lib_name = self.obj.__class__.__module__.split(".")[0]
-                        _logger.error("Internal %s error (second time). The file is corrupted.", lib_name)
-                        _logger.debug("Backtrace", exc_info=True)
-            for name in keys:
-                try:
-                    class_ = self.obj.get(name, getclass=True)
-                    link = self.obj.get(name, getclass=True, getlink=True)
-                    link = silx.io.utils.get_h5_class(class_=link)
-                except Exception:
-                    lib_name = self.obj.__class__.__module__.split(".")[0]
-                    _logger.error("Internal %s error", lib_name)
-                    _logger.debug("Backtrace", exc_info=True)
-                    class_ = None
-                    try:
-                        link = self.obj.get(name, getclass=True, getlink=True)
-                        link = silx.io.utils.get_h5_class(class_=link)
-                    except Exception:
-                        _logger.debug("Backtrace", exc_info=True)
-                        link = silx.io.utils.H5Type.HARD_LINK
-
-                h5class = None
-                if class_ is not None:
-                    h5class = silx.io.utils.get_h5_class(class_=class_)
-                    if h5class is None:
-                        _logger.error("Class %s unsupported", class_)
-                item = Hdf5Item(text=name, obj=None, parent=self, key=name, h5Class=h5class, linkClass=link)
-                self.appendChild(item)
+        if not self.isGroupObj():
+            return
+        if self.isPaged():
+            if populateAll:
+                # Prefetch the first page
+                for child in self.fetchChildren(0, self.PAGE_SIZE):
+                    self.appendChild(child)
+            return
+        links = self.__getLinkTable().links(self.obj)
+        for name, h5Class, linkClass in links:
+            self.appendChild(self.__createChild(name, h5Class, linkClass))
+
+    def canFetchMore(self):
+        if not self.isPaged():
+            return False
+        return self.childCount() < self.__getLinkCount()
+
+    def fetchChildren(self, start, count):
+        if not self.isGroupObj():
+            return []
+        links = self.__getLinkTable().links(self.obj)
+        # The listing is the reference if the group was modified meanwhile
+        self.__linkCount = len(links)
+        return [self.__createChild(*link) for link in links[start:start + count]]
+
+    def followedDataset(self):
+        """Returns the dataset to refresh while following a file written in
+        SWMR mode.
+
+        A SWMR reader can only see datasets growing, new objects are not
+        visible. So groups are not followed.
+
+        :returns: The dataset, or None if the item is not an already reached
+            dataset
+        :rtype: Union[h5py.Dataset,None]
+        """
+        if self.__key is not None or self.__isBroken:
+            # The object was not reached yet
+            return None
+        obj = self.__obj
+        if not isinstance(obj, h5py.Dataset):
+            return None
+        return obj
+
+    def updateShape(self, shape):
+        """Update the item after its dataset was refreshed.
+
+        :param Tuple[int] shape: The new shape of the dataset
+        :returns: True if the displayed content of the item changed
+        :rtype: bool
+        """
+        shape, self.__knownShape = self.__knownShape, shape
+        if shape is None or shape == self.__knownShape:
+            return False
+        self.__content = None
+        return True
 
     def hasChildren(self):
         """Retuens true of this node have chrild.
@@ -280,6 +345,8 @@ class Hdf5Item(Hdf5Node):
         """
         if not self.isGroupObj():
             return False
+        if self.canFetchMore():
+            return True
         return Hdf5Node.hasChildren(self)
 
     def _getDefaultIcon(self):
@@ -454,7 +521,9 @@ class Hdf5Item(Hdf5Node):
                 return ""
             if self.h5Class != silx.io.utils.H5Type.DATASET:
                 return ""
-            return self._getFormatter().humanReadableValue(self.obj)
+            if not self.isContentLoaded():
+                return "..."
+            return self.__content[0]
         return None
 
     _NEXUS_CLASS_TO_VALUE_CHILDREN = {
@@ -515,6 +584,16 @@ class Hdf5Item(Hdf5Node):
     }
     """Mapping from NeXus class to child names containing data to use as value"""
 
+    def __computeDataValue(self):
+        """Compute the data value of this item
+
+        :rtype: str
+        """
+        if self.__error is not None or self.h5Class != silx.io.utils.H5Type.DATASET:
+            return ""
+        return self._getFormatter().humanReadableValue(
+            self.obj, maxBytes=self.VALUE_READ_BUDGET)
+
     def __computeDataDescription(self):
         """Compute the data description of this item
 
@@ -524,21 +603,24 @@ class Hdf5Item(Hdf5Node):
             self.obj  # lazy loading of the object
             return DescriptionType.ERROR, self.__error
 
+        formatter = self._getFormatter()
         if self.h5Class == silx.io.utils.H5Type.DATASET:
-            return DescriptionType.VALUE, self._getFormatter().humanReadableValue(self.obj)
+            return DescriptionType.VALUE, formatter.humanReadableValue(
+                self.obj, maxBytes=self.VALUE_READ_BUDGET)
 
         elif self.isGroupObj() and self.nexusClassName:
             # For NeXus groups, try to find a title or name
             # By default, look for a title (most application definitions should have one)
             defaultSequence = ((DescriptionType.TITLE, 'title'),)
             sequence = self._NEXUS_CLASS_TO_VALUE_CHILDREN.get(self.nexusClassName, defaultSequence)
+            # Use the link table rather than the child items, which could
+            # be not yet fetched
+            datasets = set([name for name, h5Class, _ in self.__getLinkTable().links(self.obj)
+                            if h5Class == silx.io.utils.H5Type.DATASET])
             for kind, child_name in sequence:
-                for index in range(self.childCount()):
-                    child = self.child(index)
-                    if (isinstance(child, Hdf5Item) and
-                            child.h5Class == silx.io.utils.H5Type.DATASET and
-                            child.basename == child_name):
-                        return kind, self._getFormatter().humanReadableValue(child.obj)
+                if child_name in datasets:
+                    return kind, formatter.humanReadableValue(
+                        self.obj[child_name], maxBytes=self.VALUE_READ_BUDGET)
 
         description = self.obj.attrs.get("desc", None)
         if description is not None:
@@ -546,23 +628,63 @@ class Hdf5Item(Hdf5Node):
         else:
             return None, None
 
-    def __getDataDescription(self):
-        """Returns a cached version of the data description
+    def __getContentKey(self):
+        """Returns the key identifying the content of this item in the
+        cache, or None if it can't be cached.
+
+        :rtype: Union[Tuple[str,str,int,Union[tuple,None]],None]
+        """
+        obj = self.obj
+        if self.__isBroken or self.__error is not None:
+            return None
+        try:
+            filename = obj.file.filename
+            mtime = os.stat(filename).st_mtime_ns
+        except Exception:
+            return None
+        # The shape changes without the file mtime with SWMR
+        return filename, obj.name, mtime, getattr(obj, "shape", None)
+
+    def isContentLoaded(self):
+        """Returns true if the value and description columns are available.
 
-        As the data description have to reach inside the HDF5 tree, the result
-        is cached. A better implementation could be to use a MRU cache, to avoid
-        to allocate too much data.
+        The content of items which do not need file access (not stored
+        with :mod:`h5py`) is loaded at once.
 
-        :rtype: Tuple[kind, str]
+        :rtype: bool
+        """
+        if self.__content is None and not isinstance(self.obj, h5py.HLObject):
+            self.loadContent()
+        return self.__content is not None
+
+    def loadContent(self):
+        """Compute the content of the value and description columns.
+
+        The result is memoized per file, path, file modification time and
+        shape.
+        This method can be called from a thread other than the main one.
         """
-        if self.__description is None:
-            self.__description = self.__computeDataDescription()
-        return self.__description
+        if self.__content is not None:
+            return
+        key = self.__getContentKey()
+        content = None if key is None else _contentCache.get(key)
+        if content is None:
+            try:
+                content = self.__computeDataValue(), self.__computeDataDescription()
+            except Exception as e:
+                _logger.debug("Backtrace", exc_info=True)
+                content = "", (DescriptionType.ERROR, str(e))
+                key = None
+            if key is not None:
+                _contentCache.put(key, content)
+        self.__content = content
 
     def dataDescription(self, role):
         """Data for the description column"""
         if role == qt.Qt.DecorationRole:
-            kind, _label = self.__getDataDescription()
+            if not self.isContentLoaded():
+                return None
+            kind, _label = self.__content[1]
             if kind is not None:
                 icon = icons.getQIcon("description-%s" % kind.value)
                 return icon
@@ -570,14 +692,18 @@ class Hdf5Item(Hdf5Node):
         if role == qt.Qt.TextAlignmentRole:
             return qt.Qt.AlignTop | qt.Qt.AlignLeft
         if role == qt.Qt.DisplayRole:
-            _kind, label = self.__getDataDescription()
+            if not self.isContentLoaded():
+                return "..."
+            _kind, label = self.__content[1]
             return label
         if role == qt.Qt.ToolTipRole:
             if self.__error is not None:
                 self.obj  # lazy loading of the object
                 self.__initH5Object()
                 return self.__error
-            kind, label = self.__getDataDescription()
+            if not self.isContentLoaded():
+                return "Loading..."
+            kind, label = self.__content[1]
             if label is not None:
                 return "<b>%s</b><br/>%s" % (kind.value.capitalize(), label)
             else:
@@ -25,7 +25,7 @@
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "24/07/2018"
+__date__ = "19/10/2026"
 
 import weakref
 
@@ -159,6 +159,56 @@ class Hdf5Node(object):
             self.__child = []
             self._populateChild()
 
+    def canFetchMore(self):
+        """Returns true if more children can be fetched with
+        :meth:`fetchChildren`.
+
+        Nodes with a lot of children are not populated at once, their
+        children are fetched by pages and appended to the node.
+
+        :rtype: bool
+        """
+        return False
+
+    def fetchChildren(self, start, count):
+        """Create the nodes of the next children to fetch.
+
+        The created nodes are not appended to this node. This method can be
+        called from a thread other than the main one.
+
+        :param int start: Index of the first child to fetch
+        :param int count: Maximum number of children to fetch
+        :rtype: List[Hdf5Node]
+        """
+        return []
+
+    def loadedChildren(self):
+        """Returns the children already created, without populating the node.
+
+        :rtype: Union[List[Hdf5Node],None]
+        :returns: The list of children, or None if the node was not yet
+            populated
+        """
+        if self.__child is None:
+            return None
+        return list(self.__child)
+
+    def isContentLoaded(self):
+        """Returns true if the content displayed by the node is available.
+
+        Else :meth:`loadContent` have to be called before.
+
+        :rtype: bool
+        """
+        return True
+
+    def loadContent(self):
+        """Load the content displayed by the node.
+
+        This method can be called from a thread other than the main one.
+        """
+        pass
+
     def _expectedChildCount(self):
         """Returns the expected count of children
 
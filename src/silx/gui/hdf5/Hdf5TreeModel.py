@@ -25,12 +25,15 @@
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "12/03/2019"
+__date__ = "19/10/2026"
 
 
 import os
 import logging
 import functools
+
+import h5py
+
 from .. import qt
 from .. import icons
 from .Hdf5Node import Hdf5Node
@@ -124,6 +127,134 @@ class LoadingItemRunnable(qt.QRunnable):
         return True
 
 
+class FetchChildrenRunnable(qt.QRunnable):
+    """Runner to fetch a page of children of a node"""
+
+    class __Signals(qt.QObject):
+        """Signal holder"""
+        childrenReady = qt.Signal(object, int, object, object)
+        runnerFinished = qt.Signal(object)
+
+    def __init__(self, node, start, count):
+        """Constructor
+
+        :param Hdf5Node node: Node to fetch children from
+        :param int start: Index of the first child to fetch
+        :param int count: Maximum number of children to fetch
+        """
+        super(FetchChildrenRunnable, self).__init__()
+        self.node = node
+        self.start = start
+        self.count = count
+        self.signals = self.__Signals()
+
+    @property
+    def childrenReady(self):
+        return self.signals.childrenReady
+
+    @property
+    def runnerFinished(self):
+        return self.signals.runnerFinished
+
+    def run(self):
+        """Fetch the children. The result is sent as a signal."""
+        try:
+            children = self.node.fetchChildren(self.start, self.count)
+            error = None
+        except Exception as e:
+            _logger.debug("Backtrace", exc_info=True)
+            children = []
+            error = e
+
+        self.childrenReady.emit(self.node, self.start, children, error)
+        self.runnerFinished.emit(self)
+
+    def autoDelete(self):
+        return True
+
+
+class LoadContentRunnable(qt.QRunnable):
+    """Runner to load the content of nodes"""
+
+    class __Signals(qt.QObject):
+        """Signal holder"""
+        contentReady = qt.Signal(object)
+        runnerFinished = qt.Signal(object)
+
+    def __init__(self, nodes):
+        """Constructor
+
+        :param List[Hdf5Node] nodes: Nodes to load
+        """
+        super(LoadContentRunnable, self).__init__()
+        self.nodes = nodes
+        self.signals = self.__Signals()
+
+    @property
+    def contentReady(self):
+        return self.signals.contentReady
+
+    @property
+    def runnerFinished(self):
+        return self.signals.runnerFinished
+
+    def run(self):
+        """Load the content of each node. A signal is sent for each of them."""
+        for node in self.nodes:
+            try:
+                node.loadContent()
+            except Exception:
+                _logger.debug("Backtrace", exc_info=True)
+            self.contentReady.emit(node)
+        self.runnerFinished.emit(self)
+
+    def autoDelete(self):
+        return True
+
+
+class RefreshDatasetsRunnable(qt.QRunnable):
+    """Runner to refresh datasets of files written in SWMR mode"""
+
+    class __Signals(qt.QObject):
+        """Signal holder"""
+        datasetsRefreshed = qt.Signal(object)
+        runnerFinished = qt.Signal(object)
+
+    def __init__(self, datasets):
+        """Constructor
+
+        :param List[Tuple[Hdf5Node,h5py.Dataset]] datasets: Nodes and
+            datasets to refresh
+        """
+        super(RefreshDatasetsRunnable, self).__init__()
+        self.datasets = datasets
+        self.signals = self.__Signals()
+
+    @property
+    def datasetsRefreshed(self):
+        return self.signals.datasetsRefreshed
+
+    @property
+    def runnerFinished(self):
+        return self.signals.runnerFinished
+
+    def run(self):
+        """Refresh the datasets. The new shapes are sent as a signal."""
+        shapes = []
+        for node, dataset in self.datasets:
+            try:
+                dataset.refresh()
+                shapes.append((node, dataset.shape))
+            except Exception:
+                # The file could have been closed meanwhile
+                _logger.debug("Backtrace", exc_info=True)
+        self.datasetsRefreshed.emit(shapes)
+        self.runnerFinished.emit(self)
+
+    def autoDelete(self):
+        return True
+
+
 class Hdf5TreeModel(qt.QAbstractItemModel):
     """Tree model storing a list of :class:`h5py.File` like objects.
 
@@ -181,6 +312,10 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
     sigH5pyObjectSynchronized = qt.Signal(object, object)
     """Emitted when an item was synchronized."""
 
+    sigH5pyObjectUpdated = qt.Signal(object)
+    """Emitted when the shape of a dataset changed while following the files
+    written in SWMR mode."""
+
     def __init__(self, parent=None, ownFiles=True):
         """
         Constructor
@@ -209,6 +344,21 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         self.__animatedIcon = icons.getWaitIcon()
         self.__animatedIcon.iconChanged.connect(self.__updateLoadingItems)
         self.__runnerSet = set([])
+        self.__fetchingNodes = set([])
+        self.__loadingNodes = set([])
+        self.__contentQueue = []
+
+        # Load at once the content requested while painting the view
+        self.__contentTimer = qt.QTimer(self)
+        self.__contentTimer.setSingleShot(True)
+        self.__contentTimer.setInterval(0)
+        self.__contentTimer.timeout.connect(self.__loadContent)
+
+        # Periodic refresh of the files written in SWMR mode
+        self.__followTimer = qt.QTimer(self)
+        self.__followTimer.setInterval(1000)
+        self.__followTimer.timeout.connect(self.__followFiles)
+        self.__followRunner = None
 
         # store used icons to avoid the cache to release it
         self.__icons = []
@@ -479,8 +629,10 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         elif index.column() == self.SHAPE_COLUMN:
             return node.dataShape(role)
         elif index.column() == self.VALUE_COLUMN:
+            self.__requestContent(node, role)
             return node.dataValue(role)
         elif index.column() == self.DESCRIPTION_COLUMN:
+            self.__requestContent(node, role)
             return node.dataDescription(role)
         elif index.column() == self.NODE_COLUMN:
             return node.dataNode(role)
@@ -489,6 +641,144 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         else:
             return None
 
+    def __requestContent(self, node, role):
+        """Request the content of a node to be loaded in background.
+
+        :param Hdf5Node node:
+        :param int role: The requested role
+        """
+        if role not in (qt.Qt.DisplayRole, qt.Qt.DecorationRole, qt.Qt.ToolTipRole):
+            return
+        if node in self.__loadingNodes or node.isContentLoaded():
+            return
+        self.__loadingNodes.add(node)
+        self.__contentQueue.append(node)
+        self.__contentTimer.start()
+
+    def __loadContent(self):
+        """Load the content of the requested nodes in background"""
+        nodes, self.__contentQueue = self.__contentQueue, []
+        if len(nodes) == 0:
+            return
+        runnable = LoadContentRunnable(nodes)
+        runnable.contentReady.connect(self.__contentReady)
+        runnable.runnerFinished.connect(self.__releaseRunner)
+        self.__runnerSet.add(runnable)
+        qt.silxGlobalThreadPool().start(runnable)
+
+    def __contentReady(self, node):
+        """Called when the content of a node was loaded in background.
+
+        :param Hdf5Node node:
+        """
+        self.__loadingNodes.discard(node)
+        index = self.__indexFromNode(node)
+        if index is None:
+            # The node was removed meanwhile
+            return
+        index1 = self.createIndex(index.row(), self.VALUE_COLUMN, node)
+        index2 = self.createIndex(index.row(), self.DESCRIPTION_COLUMN, node)
+        self.dataChanged.emit(index1, index2)
+
+    def isFollowModeEnabled(self):
+        """Returns true if the files written in SWMR mode are followed.
+
+        :rtype: bool
+        """
+        return self.__followTimer.isActive()
+
+    def setFollowModeEnabled(self, enabled):
+        """Enable or disable the follow mode.
+
+        When enabled, the datasets of the files opened in SWMR mode which
+        are already loaded by the model are periodically refreshed in a
+        background thread. Only the rows of the datasets which shape changed
+        are updated. The changed datasets are notified with
+        :attr:`sigH5pyObjectUpdated`.
+
+        A SWMR reader can't see new objects, so the groups are not listed
+        again.
+
+        :param bool enabled:
+        """
+        if enabled:
+            self.__followTimer.start()
+        else:
+            self.__followTimer.stop()
+
+    def followInterval(self):
+        """Returns the interval between two refreshes of the follow mode.
+
+        :rtype: int
+        """
+        return self.__followTimer.interval()
+
+    def setFollowInterval(self, interval):
+        """Set the interval between two refreshes of the follow mode.
+
+        :param int interval: Interval in milliseconds
+        """
+        self.__followTimer.setInterval(interval)
+
+    def __followFiles(self):
+        """Refresh in background the loaded datasets of the files written in
+        SWMR mode"""
+        if self.__followRunner is not None:
+            # The previous refresh is not yet finished
+            return
+        datasets = []
+        for node in self.__root.loadedChildren() or []:
+            if not isinstance(node, Hdf5Item):
+                continue
+            try:
+                swmr = getattr(node.obj.file, "swmr_mode", False)
+            except Exception:
+                _logger.debug("Backtrace", exc_info=True)
+                continue
+            if swmr:
+                self.__collectFollowedDatasets(node, datasets)
+        if len(datasets) == 0:
+            return
+        runnable = RefreshDatasetsRunnable(datasets)
+        runnable.datasetsRefreshed.connect(self.__datasetsRefreshed)
+        runnable.runnerFinished.connect(self.__releaseFollowRunner)
+        self.__followRunner = runnable
+        qt.silxGlobalThreadPool().start(runnable)
+
+    def __collectFollowedDatasets(self, node, datasets):
+        """Collect the datasets already reached from a node and its loaded
+        children.
+
+        It does not access the file.
+
+        :param Hdf5Node node:
+        :param List[Tuple[Hdf5Node,h5py.Dataset]] datasets: The list to fill
+        """
+        dataset = node.followedDataset()
+        if dataset is not None:
+            datasets.append((node, dataset))
+        for child in node.loadedChildren() or []:
+            self.__collectFollowedDatasets(child, datasets)
+
+    def __datasetsRefreshed(self, shapes):
+        """Called when followed datasets were refreshed in background.
+
+        :param List[Tuple[Hdf5Node,Tuple[int]]] shapes: The refreshed
+            nodes with the new shapes of their datasets
+        """
+        for node, shape in shapes:
+            index = self.__indexFromNode(node)
+            if index is None:
+                # The node was removed meanwhile
+                continue
+            if node.updateShape(shape):
+                lastIndex = index.sibling(index.row(), len(self.COLUMN_IDS) - 1)
+                self.dataChanged.emit(index, lastIndex)
+                self.sigH5pyObjectUpdated.emit(node.obj)
+
+    def __releaseFollowRunner(self, runner):
+        self.__followRunner = None
+
     def columnCount(self, parent=qt.QModelIndex()):
         return len(self.COLUMN_IDS)
 
@@ -498,6 +788,102 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
             return 0
         return node.hasChildren()
 
+    def canFetchMore(self, parent):
+        node = self.nodeFromIndex(parent)
+        if node is None:
+            return False
+        return node.canFetchMore()
+
+    def fetchMore(self, parent):
+        """Fetch the children of a large group in a background thread.
+
+        Children are inserted by pages until the group is fully fetched.
+        Groups which are not from h5py (which lazy loading is not
+        thread-safe) are fetched page by page in the main thread.
+
+        :param qt.QModelIndex parent: Index of the item to fetch
+        """
+        node = self.nodeFromIndex(parent)
+        if node is None or node in self.__fetchingNodes:
+            return
+        if not node.canFetchMore():
+            return
+        # Reach the object from the main thread, the background thread
+        # only lists its links
+        if not isinstance(node.obj, h5py.Group):
+            self.__fetchMoreSync(parent)
+            return
+        runnable = FetchChildrenRunnable(node, node.childCount(), Hdf5Item.PAGE_SIZE)
+        runnable.childrenReady.connect(self.__childrenReady)
+        runnable.runnerFinished.connect(self.__releaseRunner)
+        self.__fetchingNodes.add(node)
+        self.__runnerSet.add(runnable)
+        qt.silxGlobalThreadPool().start(runnable)
+
+    def __indexFromNode(self, node):
+        """Returns the index of a node, or None if the node is not part of
+        this model anymore.
+
+        :param Hdf5Node node:
+        :rtype: Union[qt.QModelIndex,None]
+        """
+        if node is self.__root:
+            return qt.QModelIndex()
+        parent = node.parent
+        if parent is None or self.__indexFromNode(parent) is None:
+            return None
+        try:
+            row = parent.indexOfChild(node)
+        except ValueError:
+            return None
+        return self.createIndex(row, 0, node)
+
+    def __insertChildren(self, index, node, children):
+        """Append fetched children to a node"""
+        if len(children) == 0:
+            return
+        row = node.childCount()
+        self.beginInsertRows(index, row, row + len(children) - 1)
+        for child in children:
+            node.appendChild(child)
+        self.endInsertRows()
+
+    def __childrenReady(self, node, start, children, error):
+        """Called when a page of children was fetched in background.
+
+        :param Hdf5Node node: The fetched node
+        :param int start: Index of the first fetched child
+        :param List[Hdf5Node] children: The fetched children
+        :param Exception error: An exception, or None
+        """
+        self.__fetchingNodes.discard(node)
+        if error is not None:
+            _logger.error("Error while fetching children: %s", error)
+            return
+        index = self.__indexFromNode(node)
+        if index is None:
+            # The node was removed meanwhile
+            return
+        if start == node.childCount():
+            self.__insertChildren(index, node, children)
+        # else children were fetched synchronously meanwhile
+        if node.canFetchMore():
+            self.fetchMore(index)
+
+    def __fetchMoreSync(self, index):
+        """Fetch a page of children in the main thread.
+
+        :param qt.QModelIndex index: Index of the item to fetch
+        :returns: True if children were fetched
+        :rtype: bool
+        """
+        node = self.nodeFromIndex(index)
+        if not node.canFetchMore():
+            return False
+        children = node.fetchChildren(node.childCount(), Hdf5Item.PAGE_SIZE)
+        self.__insertChildren(index, node, children)
+        return len(children) > 0
+
     def rowCount(self, parent=qt.QModelIndex()):
         node = self.nodeFromIndex(parent)
         if node is None:
@@ -621,7 +1007,7 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         self.insertNode(row, Hdf5Item(text=text, obj=h5pyObject, parent=self.__root))
 
     def hasPendingOperations(self):
-        return len(self.__runnerSet) > 0
+        return len(self.__runnerSet) > 0 or len(self.__contentQueue) > 0
 
     def insertFileAsync(self, filename, row=-1, synchronizingNode=None):
         if not os.path.isfile(filename):
@@ -717,8 +1103,10 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
                     break
 
             parentIndex = foundIndices[-1]
-            for index in range(self.rowCount(parentIndex)):
-                index = self.index(index, 0, parentIndex)
+            row = 0
+            while row < self.rowCount(parentIndex) or self.__fetchMoreSync(parentIndex):
+                index = self.index(row, 0, parentIndex)
+                row += 1
                 obj = self.data(index, Hdf5TreeModel.H5PY_OBJECT_ROLE)
 
                 p = obj.name + "/"
@@ -28,12 +28,16 @@ package `silx.gui.hdf5` package.
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "17/01/2019"
+__date__ = "19/10/2026"
 
 
+import collections
 from html import escape
 import logging
 import os.path
+import threading
+
+import h5py
 
 import silx.io.utils
 import silx.io.url
@@ -459,3 +463,187 @@ class H5Node(object):
         """
         data_url = self.data_url
         return data_url.path()
+
+
+_H5L_TYPES = {
+    h5py.h5l.TYPE_HARD: silx.io.utils.H5Type.HARD_LINK,
+    h5py.h5l.TYPE_SOFT: silx.io.utils.H5Type.SOFT_LINK,
+    h5py.h5l.TYPE_EXTERNAL: silx.io.utils.H5Type.EXTERNAL_LINK,
+}
+"""Mapping from h5py low level link types to H5Type"""
+
+_H5O_TYPES = {
+    h5py.h5o.TYPE_GROUP: silx.io.utils.H5Type.GROUP,
+    h5py.h5o.TYPE_DATASET: silx.io.utils.H5Type.DATASET,
+}
+"""Mapping from h5py low level object types to H5Type"""
+
+
+def _listH5pyLinks(group):
+    """List the links of an h5py group using the low level API.
+
+    Link names and link types are retrieved in a single iteration over the
+    group, in the same order as the one used by h5py to iterate the group.
+
+    :param h5py.Group group: The group to inspect
+    :rtype: List[Tuple[str,Union[H5Type,None],H5Type]]
+    """
+    groupId = group.id
+    indexType = h5py.h5.INDEX_NAME
+    try:
+        order = groupId.get_create_plist().get_link_creation_order()
+    except Exception:
+        _logger.debug("Backtrace", exc_info=True)
+    else:
+        if order & h5py.h5p.CRT_ORDER_TRACKED:
+            indexType = h5py.h5.INDEX_CRT_ORDER
+
+    links = []
+
+    def visit(name, info):
+        links.append((name, info.type))
+
+    groupId.links.iterate(visit, idx_type=indexType, info=True)
+
+    result = []
+    for name, linkType in links:
+        try:
+            # Follows soft and external links
+            objType = h5py.h5o.get_info(groupId, name).type
+        except Exception:
+            # Broken link
+            h5Class = None
+        else:
+            h5Class = _H5O_TYPES.get(objType, None)
+            if h5Class is None:
+                _logger.error("Object type %s unsupported", objType)
+        linkClass = _H5L_TYPES.get(linkType, silx.io.utils.H5Type.HARD_LINK)
+        result.append((name.decode("utf-8"), h5Class, linkClass))
+    return result
+
+
+def _listGenericLinks(group):
+    """List the links of an h5py-like group using the high level API.
+
+    :param group: The h5py-like group to inspect
+    :rtype: List[Tuple[str,Union[H5Type,None],H5Type]]
+    """
+    lib_name = group.__class__.__module__.split(".")[0]
+    keys = []
+    try:
+        for name in group:
+            keys.append(name)
+    except Exception:
+        _logger.error("Internal %s error. The file is corrupted.", lib_name)
+        _logger.debug("Backtrace", exc_info=True)
+        if keys == []:
+            # If the file was open in READ_ONLY we still can reach something
+            # https://github.com/silx-kit/silx/issues/2262
+            try:
+                for name in group:
+                    keys.append(name)
+            except Exception:
+                _logger.error("Internal %s error (second time). The file is corrupted.", lib_name)
+                _logger.debug("Backtrace", exc_info=True)
+
+    result = []
+    for name in keys:
+        try:
+            class_ = group.get(name, getclass=True)
+            link = group.get(name, getclass=True, getlink=True)
+            link = silx.io.utils.get_h5_class(class_=link)
+        except Exception:
+            _logger.error("Internal %s error", lib_name)
+            _logger.debug("Backtrace", exc_info=True)
+            class_ = None
+            try:
+                link = group.get(name, getclass=True, getlink=True)
+                link = silx.io.utils.get_h5_class(class_=link)
+            except Exception:
+                _logger.debug("Backtrace", exc_info=True)
+                link = silx.io.utils.H5Type.HARD_LINK
+
+        h5Class = None
+        if class_ is not None:
+            h5Class = silx.io.utils.get_h5_class(class_=class_)
+            if h5Class is None:
+                _logger.error("Class %s unsupported", class_)
+        result.append((name, h5Class, link))
+    return result
+
+
+def listLinks(group):
+    """List the links of a group with the class of the linked objects.
+
+    For :mod:`h5py` groups, links are listed using the low level API which
+    avoids resolving each name twice. Other h5py-like groups are browsed
+    using the high level API.
+
+    :param group: An h5py-like group
+    :returns: List of `(name, h5Class, linkClass)`. `h5Class` is None for
+        broken links.
+    :rtype: List[Tuple[str,Union[H5Type,None],H5Type]]
+    """
+    if isinstance(group, h5py.Group):
+        try:
+            return _listH5pyLinks(group)
+        except Exception:
+            _logger.debug("Backtrace", exc_info=True)
+    return _listGenericLinks(group)
+
+
+class LinkTable(object):
+    """Thread-safe cache of the links of the groups of a file.
+
+    The links of a group are listed once with :func:`listLinks`, and then
+    reused, for example to populate the tree by pages.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__links = {}
+
+    def links(self, group):
+        """Returns the links of a group, listing them if not yet cached.
+
+        :param group: An h5py-like group
+        :rtype: List[Tuple[str,Union[H5Type,None],H5Type]]
+        """
+        key = group.file.filename, group.name
+        with self.__lock:
+            links = self.__links.get(key, None)
+        if links is None:
+            links = listLinks(group)
+            with self.__lock:
+                links = self.__links.setdefault(key, links)
+        return links
+
+
+class LruCache(object):
+    """Thread-safe cache keeping the most recently used items.
+
+    :param int maxSize: Maximum number of items kept in the cache
+    """
+
+    def __init__(self, maxSize):
+        self.__maxSize = maxSize
+        self.__lock = threading.Lock()
+        self.__items = collections.OrderedDict()
+
+    def get(self, key, default=None):
+        """Returns the value cached for this key, else `default`"""
+        with self.__lock:
+            try:
+                self.__items.move_to_end(key)
+            except KeyError:
+                return default
+            return self.__items[key]
+
+    def put(self, key, value):
+        """Store a value in the cache, dropping the least recently used
+        items above the maximum size"""
+        with self.__lock:
+            self.__items[key] = value
+            self.__items.move_to_end(key)
+            while len(self.__items) > self.__maxSize:
+                self.__items.popitem(last=False)
@@ -26,7 +26,7 @@
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "12/03/2019"
+__date__ = "19/10/2026"
 
 
 import time
@@ -41,6 +41,8 @@ from silx.gui.utils.testutils import TestCaseQt
 from silx.gui import hdf5
 from silx.gui.utils.testutils import SignalListener
 from silx.io import commonh5
+import silx.io.utils
+from silx.io import h5py_utils
 import weakref
 
 import h5py
@@ -363,6 +365,214 @@ class TestHdf5TreeModel(TestCaseQt):
         index = model.parent(index)
         self.assertEqual(index, qt.QModelIndex())
 
+    def testAsyncContent(self):
+        tmp = tempfile.mkdtemp()
+        filename = os.path.join(tmp, "content.h5")
+        with h5py.File(filename, "w") as h5file:
+            h5file["scalar"] = 10
+            h5file["large"] = numpy.string_("a" * 2000)
+            entry = h5file.create_group("entry")
+            entry.attrs["NX_class"] = "NXentry"
+            entry["title"] = "foo"
+
+        model = hdf5.Hdf5TreeModel()
+        listener = SignalListener()
+        model.dataChanged.connect(listener)
+        h5file = h5py.File(filename, "r")
+        try:
+            for name in ("scalar", "large", "entry"):
+                model.insertH5pyObject(h5file[name])
+            for row in range(3):
+                index = model.index(row, hdf5.Hdf5TreeModel.DESCRIPTION_COLUMN, qt.QModelIndex())
+                self.assertEqual(model.data(index), "...")
+
+            for _ in range(100):
+                if not model.hasPendingOperations():
+                    break
+                self.qWait(10)
+            self.assertEqual(listener.callCount(), 3)
+
+            def getData(row, column):
+                index = model.index(row, column, qt.QModelIndex())
+                return model.data(index)
+
+            self.assertEqual(getData(0, hdf5.Hdf5TreeModel.VALUE_COLUMN), "10")
+            # Read budget exceeded
+            self.assertEqual(getData(1, hdf5.Hdf5TreeModel.VALUE_COLUMN), "0D data")
+            self.assertEqual(getData(2, hdf5.Hdf5TreeModel.VALUE_COLUMN), "")
+            self.assertEqual(getData(2, hdf5.Hdf5TreeModel.DESCRIPTION_COLUMN), '"foo"')
+            self.assertFalse(model.hasPendingOperations())
+        finally:
+            model.clear()
+            h5file.close()
+            os.unlink(filename)
+            os.rmdir(tmp)
+
+    @contextmanager
+    def largeH5File(self):
+        tmp = tempfile.mkdtemp()
+        filename = os.path.join(tmp, "large.h5")
+        with h5py.File(filename, "w") as h5file:
+            for i in range(25):
+                h5file["%02d" % i] = i
+        pageSize = hdf5.Hdf5Item.Hdf5Item.PAGE_SIZE
+        hdf5.Hdf5Item.Hdf5Item.PAGE_SIZE = 10
+        try:
+            with h5py.File(filename, "r") as h5file:
+                yield h5file
+        finally:
+            hdf5.Hdf5Item.Hdf5Item.PAGE_SIZE = pageSize
+            os.unlink(filename)
+            os.rmdir(tmp)
+
+    def testFetchMore(self):
+        model = hdf5.Hdf5TreeModel()
+        with self.largeH5File() as h5file:
+            model.insertH5pyObject(h5file)
+            index = model.index(0, 0, qt.QModelIndex())
+            self.assertTrue(model.hasChildren(index))
+            self.assertTrue(model.canFetchMore(index))
+            self.assertEqual(model.rowCount(index), 0)
+
+            model.fetchMore(index)
+            for _ in range(100):
+                if not model.hasPendingOperations():
+                    break
+                self.qWait(10)
+            self.assertFalse(model.canFetchMore(index))
+            self.assertEqual(model.rowCount(index), 25)
+            names = [model.data(model.index(row, 0, index))
+                     for row in range(25)]
+            self.assertEqual(names, ["%02d" % i for i in range(25)])
+            model.clear()
+
+    def testFetchMoreCommonh5(self):
+        h5 = commonh5.File("/foo/bar/1.mock", "w")
+        for i in range(25):
+            h5.create_dataset("%02d" % i, data=numpy.int64(i))
+        pageSize = hdf5.Hdf5Item.Hdf5Item.PAGE_SIZE
+        hdf5.Hdf5Item.Hdf5Item.PAGE_SIZE = 10
+        try:
+            model = hdf5.Hdf5TreeModel()
+            model.insertH5pyObject(h5)
+            index = model.index(0, 0, qt.QModelIndex())
+            self.assertTrue(model.canFetchMore(index))
+
+            # Not thread-safe: fetched in the main thread, page by page
+            model.fetchMore(index)
+            self.assertFalse(model.hasPendingOperations())
+            self.assertEqual(model.rowCount(index), 10)
+            while model.canFetchMore(index):
+                model.fetchMore(index)
+            self.assertEqual(model.rowCount(index), 25)
+            names = [model.data(model.index(row, 0, index))
+                     for row in range(25)]
+            self.assertEqual(names, ["%02d" % i for i in range(25)])
+            model.clear()
+        finally:
+            hdf5.Hdf5Item.Hdf5Item.PAGE_SIZE = pageSize
+
+    def testIndexFromH5ObjectPaged(self):
+        model = hdf5.Hdf5TreeModel()
+        with self.largeH5File() as h5file:
+            model.insertH5pyObject(h5file)
+            index = model.indexFromH5Object(h5file["21"])
+            self.assertTrue(index.isValid())
+            self.assertEqual(model.data(index), "21")
+            self.assertEqual(model.rowCount(index.parent()), 25)
+            model.clear()
+
+    def testFollowMode(self):
+        if not h5py_utils.HAS_SWMR:
+            self.skipTest("SWMR not supported")
+        tmp = tempfile.mkdtemp()
+        filename = os.path.join(tmp, "swmr.h5")
+        writer = h5py.File(filename, "w", libver="latest")
+        model = hdf5.Hdf5TreeModel()
+        listener = SignalListener()
+        model.sigH5pyObjectUpdated.connect(listener)
+        try:
+            dataset = writer.create_dataset("data", shape=(2,), maxshape=(None,))
+            writer.swmr_mode = True
+            with h5py.File(filename, "r", libver="latest", swmr=True) as h5file:
+                model.insertH5pyObject(h5file)
+                rootIndex = model.index(0, 0, qt.QModelIndex())
+                index = model.index(0, hdf5.Hdf5TreeModel.SHAPE_COLUMN, rootIndex)
+                self.assertEqual(model.data(index), "2")
+
+                model.setFollowInterval(10)
+                model.setFollowModeEnabled(True)
+                self.assertTrue(model.isFollowModeEnabled())
+                dataset.resize((5,))
+                dataset.flush()
+                for _ in range(100):
+                    if listener.callCount() > 0:
+                        break
+                    self.qWait(10)
+                model.setFollowModeEnabled(False)
+                self.assertEqual(listener.callCount(), 1)
+                self.assertEqual(listener.arguments()[0][0].name, "/data")
+                self.assertEqual(model.data(index), "5")
+                model.clear()
+        finally:
+            writer.close()
+            os.unlink(filename)
+            os.rmdir(tmp)
+
+
+class TestListLinks(unittest.TestCase):
+
+    def testH5py(self):
+        tmp = tempfile.mkdtemp()
+        filename = os.path.join(tmp, "links.h5")
+        try:
+            with h5py.File(filename, "w") as h5file:
+                h5file["dataset"] = 1
+                h5file.create_group("group")
+                h5file["soft"] = h5py.SoftLink("/group")
+                h5file["broken"] = h5py.SoftLink("/nothing")
+                h5file["external"] = h5py.ExternalLink("nothing.h5", "/data")
+            with h5py.File(filename, "r") as h5file:
+                links = hdf5._utils.listLinks(h5file)
+                H5Type = silx.io.utils.H5Type
+                self.assertEqual(links, [
+                    ("broken", None, H5Type.SOFT_LINK),
+                    ("dataset", H5Type.DATASET, H5Type.HARD_LINK),
+                    ("external", None, H5Type.EXTERNAL_LINK),
+                    ("group", H5Type.GROUP, H5Type.HARD_LINK),
+                    ("soft", H5Type.GROUP, H5Type.SOFT_LINK),
+                ])
+                # Same result as the high level API
+                self.assertEqual(links, hdf5._utils._listGenericLinks(h5file))
+        finally:
+            os.unlink(filename)
+            os.rmdir(tmp)
+
+    def testCreationOrder(self):
+        tmp = tempfile.mkdtemp()
+        filename = os.path.join(tmp, "order.h5")
+        try:
+            with h5py.File(filename, "w", track_order=True) as h5file:
+                for name in ("b", "c", "a"):
+                    h5file[name] = 0
+            with h5py.File(filename, "r") as h5file:
+                links = hdf5._utils.listLinks(h5file)
+                self.assertEqual([link[0] for link in links], list(h5file))
+        finally:
+            os.unlink(filename)
+            os.rmdir(tmp)
+
+    def testCommonH5(self):
+        h5file = commonh5.File("/foo/bar/1.mock", "w")
+        h5file.create_group("group")
+        h5file.create_dataset("dataset", data=numpy.array(1))
+        links = hdf5._utils.listLinks(h5file)
+        H5Type = silx.io.utils.H5Type
+        self.assertEqual(links, [
+            ("group", H5Type.GROUP, H5Type.HARD_LINK),
+            ("dataset", H5Type.DATASET, H5Type.HARD_LINK),
+        ])
+
 
 @pytest.mark.usefixtures("useH5File")
 class TestHdf5TreeModelSignals(TestCaseQt):
@@ -26,14 +26,14 @@
 
 __authors__ = ["H. Payno"]
 __license__ = "MIT"
-__date__ = "04/03/2019"
+__date__ = "19/10/2026"
 
 
 from silx.gui import icons, qt
 from silx.gui.plot import Plot2D
 from silx.gui.utils import concurrent
 from silx.io.url import DataUrl
-from silx.io.utils import get_data
+from silx.io.utils import FilePool, get_data
 from collections import OrderedDict
 from silx.gui.widgets.FrameBrowser import HorizontalSliderWithBrowser
 import time
@@ -255,10 +255,12 @@ class UrlLoader(qt.QThread):
         assert isinstance(url, DataUrl)
         self.url = url
         self.data = None
+        self.pool = None
+        """Optional :class:`FilePool` used to keep files opened"""
 
     def run(self):
         try:
-            self.data = get_data(self.url)
+            self.data = get_data(self.url, pool=self.pool)
         except IOError:
             self.data = None
 
@@ -281,6 +283,7 @@ class ImageStack(qt.QMainWindow):
         super(ImageStack, self).__init__(parent)
         self.__n_prefetch = ImageStack.N_PRELOAD
         self._loadingThreads = []
+        self._filePool = FilePool()
         self.setWindowFlags(qt.Qt.Widget)
         self._current_url = None
         self._url_loader = UrlLoader
@@ -313,6 +316,7 @@ class ImageStack(qt.QMainWindow):
 
     def close(self) -> bool:
         self._freeLoadingThreads()
+        self._filePool.close()
         self._plot.close()
         super(ImageStack, self).close()
 
@@ -352,6 +356,7 @@ class ImageStack(qt.QMainWindow):
     def reset(self) -> None:
         """Clear the plot and remove any link to url"""
         self._freeLoadingThreads()
+        self._filePool.close()
         self._urls = None
         self._urlIndexes = None
         self._urlData = OrderedDict({})
@@ -381,6 +386,9 @@ class ImageStack(qt.QMainWindow):
         url_path = url.path()
         assert url_path in self._urlIndexes
         loader = self._url_loader(parent=self, url=url)
+        if isinstance(loader, UrlLoader):
+            # Share opened files between loaders
+            loader.pool = self._filePool
         loader.finished.connect(self._urlLoaded, qt.Qt.QueuedConnection)
         self._loadingThreads.append(loader)
         loader.start()
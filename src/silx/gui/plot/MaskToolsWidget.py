@@ -34,7 +34,7 @@ from __future__ import division
 
 __authors__ = ["T. Vincent", "P. Knobel"]
 __license__ = "MIT"
-__date__ = "08/12/2020"
+__date__ = "19/10/2026"
 
 import os
 import sys
@@ -194,6 +194,7 @@ class ImageMask(BaseMask):
             selection[:,:] = level
         else:
             selection[selection == level] = 0
+        self._setModifiedRegion((row, row + height + 1), (col, col + width + 1))
         self._notify()
 
     def updatePolygon(self, level, vertices, mask=True):
@@ -203,12 +204,15 @@ class ImageMask(BaseMask):
         :param vertices: Nx2 array of polygon corners as (row, col)
         :param bool mask: True to mask (default), False to unmask.
         """
-        fill = shapes.polygon_fill_mask(vertices, self._mask.shape)
+        (row, col), fill = shapes.polygon_fill_mask(
+            vertices, self._mask.shape, bbox=True)
+        height, width = fill.shape
+        selection = self._mask[row:row + height, col:col + width]
         if mask:
-            self._mask[fill != 0] = level
+            selection[fill != 0] = level
         else:
-            self._mask[numpy.logical_and(fill != 0,
-                                         self._mask == level)] = 0
+            selection[numpy.logical_and(fill != 0, selection == level)] = 0
+        self._setModifiedRegion((row, row + height), (col, col + width))
         self._notify()
 
     def updatePoints(self, level, rows, cols, mask=True):
@@ -232,6 +236,11 @@ class ImageMask(BaseMask):
         else:
             inMask = self._mask[rows, cols] == level
             self._mask[rows[inMask], cols[inMask]] = 0
+        if len(rows) == 0:
+            self._setModifiedRegion()
+        else:
+            self._setModifiedRegion((rows.min(), rows.max() + 1),
+                                    (cols.min(), cols.max() + 1))
         self._notify()
 
     def updateDisk(self, level, crow, ccol, radius, mask=True):
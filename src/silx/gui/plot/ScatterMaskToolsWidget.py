@@ -35,7 +35,7 @@ from __future__ import division
 
 __authors__ = ["P. Knobel"]
 __license__ = "MIT"
-__date__ = "15/02/2019"
+__date__ = "19/10/2026"
 
 
 import math
@@ -105,6 +105,12 @@ class ScatterMask(BaseMask):
             indices_stencil = numpy.zeros_like(self._mask, dtype=bool)
             indices_stencil[indices] = True
             self._mask[numpy.logical_and(self._mask == level, indices_stencil)] = 0
+        indices = numpy.asarray(indices)
+        if indices.size == 0:
+            self._setModifiedRegion()
+        elif indices.dtype.kind in 'iu':
+            indices = numpy.where(indices < 0, indices + len(self._mask), indices)
+            self._setModifiedRegion((indices.min(), indices.max() + 1))
         self._notify()
 
     # update shapes
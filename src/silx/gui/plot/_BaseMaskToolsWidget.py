@@ -29,7 +29,7 @@ from __future__ import division
 
 __authors__ = ["T. Vincent", "P. Knobel"]
 __license__ = "MIT"
-__date__ = "08/12/2020"
+__date__ = "19/10/2026"
 
 import os
 import weakref
@@ -43,6 +43,71 @@ from silx.gui.colors import rgba
 from .actions.mode import PanModeAction
 
 
+class _MaskDelta(object):
+    """Difference between two consecutive committed states of a mask.
+
+    Only the region of the mask which was modified is stored, either as
+    the list of changed elements (when few elements changed) or as two
+    dense arrays.
+
+    :param region: Tuple of slices of the modified region or None if
+        the whole mask (including its shape) has changed.
+    :param numpy.ndarray before: Mask values in the region before the change
+    :param numpy.ndarray after: Mask values in the region after the change
+    """
+
+    def __init__(self, region, before, after):
+        self.region = region
+        if region is None:
+            self.indices = None
+            self.before = numpy.array(before, copy=True)
+            self.after = numpy.array(after, copy=True)
+            return
+
+        changed = numpy.flatnonzero(before != after)
+        indexType = numpy.uint32 if before.size < 2**32 else numpy.intp
+        sparseSize = changed.size * (numpy.dtype(indexType).itemsize + 2)
+        if sparseSize < 2 * before.size:
+            self.indices = changed.astype(indexType)
+            self.before = before.ravel()[changed]
+            self.after = after.ravel()[changed]
+        else:
+            self.indices = None
+            self.before = numpy.array(before, copy=True)
+            self.after = numpy.array(after, copy=True)
+
+    def isEmpty(self):
+        """Returns True if this delta does not change anything"""
+        return self.indices is not None and self.indices.size == 0
+
+    @property
+    def nbytes(self):
+        """Memory used to store this delta"""
+        size = self.before.nbytes + self.after.nbytes
+        if self.indices is not None:
+            size += self.indices.nbytes
+        return size
+
+    def apply(self, mask, undo=False):
+        """Apply this delta to a mask array.
+
+        :param numpy.ndarray mask: The mask to update
+        :param bool undo: True to revert the change, False to apply it
+        :return: The updated mask, which is a new array if the whole mask
+            has changed
+        :rtype: numpy.ndarray
+        """
+        values = self.before if undo else self.after
+        if self.region is None:
+            return numpy.array(values, copy=True)
+        if self.indices is None:
+            mask[self.region] = values
+        else:
+            view = mask[self.region]
+            view[numpy.unravel_index(self.indices, view.shape)] = values
+        return mask
+
+
 class BaseMask(qt.QObject):
     """Base class for :class:`ImageMask` and :class:`ScatterMask`
 
@@ -55,6 +120,10 @@ class BaseMask(qt.QObject):
     The mask is updated using spatial selection methods: data located inside
     a selected area is masked with a specified mask level.
 
+    The undo history stores the differences between committed states.
+    Update operations can call :meth:`_setModifiedRegion` before
+    :meth:`_notify` to restrict the comparison to the modified region,
+    otherwise the whole mask is compared on :meth:`commit`.
     """
 
     sigChanged = qt.Signal()
@@ -70,14 +139,28 @@ class BaseMask(qt.QObject):
     """Signal emitted when redo becomes possible/impossible"""
 
     def __init__(self, dataItem=None):
-        self.historyDepth = 10
-        """Maximum number of operation stored in history list for undo"""
-        # Init lists for undo/redo
+        self.historyDepth = None
+        """Maximum number of operations stored in history for undo,
+        None (default) for no limit other than :attr:`historyMaxMemory`"""
+        self.historyMaxMemory = 128 * 2**20
+        """Maximum memory in bytes used by the undo/redo history.
+
+        The oldest operations are dropped when it is exceeded.
+        The last operation can always be undone.
+        """
+        # Init lists of deltas for undo/redo
         self._history = []
         self._redo = []
 
         # Store the mask
         self._mask = numpy.array((), dtype=numpy.uint8)
+        # Mask as of the last commit/undo/redo
+        self._committed = numpy.array(self._mask, copy=True)
+        # Region modified since last commit: None or list of [start, stop]
+        # bounds per dimension. _WHOLE_MASK if unknown.
+        self._modified = None
+        # Region of the current update operation, see _setModifiedRegion
+        self._pendingRegion = None
 
         # Store the plot item to be masked
         self._dataItem = None
@@ -86,6 +169,9 @@ class BaseMask(qt.QObject):
             self.reset(self.getDataValues().shape)
         super(BaseMask, self).__init__()
 
+    _WHOLE_MASK = "whole"
+    """Marker for a modification of the whole mask"""
+
     def setDataItem(self, item):
         """Set a data item
 
@@ -113,8 +199,31 @@ class BaseMask(qt.QObject):
         """
         raise NotImplementedError("To be implemented in subclass")
 
+    def _setModifiedRegion(self, *bounds):
+        """Declare the region modified by the current update operation.
+
+        To call before :meth:`_notify`.
+
+        :param bounds: (start, stop) indices for each dimension of the mask.
+            No argument means that nothing was modified.
+        """
+        self._pendingRegion = [list(bound) for bound in bounds]
+
     def _notify(self):
         """Notify of mask change."""
+        region, self._pendingRegion = self._pendingRegion, None
+        if region is None or (region and len(region) != self._mask.ndim):
+            self._modified = self._WHOLE_MASK
+        elif region and self._modified != self._WHOLE_MASK:
+            region = [(max(0, start), min(stop, size))
+                      for (start, stop), size in zip(region, self._mask.shape)]
+            if all(start < stop for start, stop in region):
+                if self._modified is None:
+                    self._modified = region
+                else:
+                    self._modified = [
+                        (min(start, previous[0]), max(stop, previous[1]))
+                        for (start, stop), previous in zip(region, self._modified)]
         self.sigChanged.emit()
 
     def getMask(self, copy=True):
@@ -142,50 +251,91 @@ class BaseMask(qt.QObject):
     # History control
     def resetHistory(self):
         """Reset history"""
-        self._history = [numpy.array(self._mask, copy=True)]
+        self._history = []
         self._redo = []
+        self._committed = numpy.array(self._mask, copy=True)
+        self._modified = None
         self.sigUndoable.emit(False)
         self.sigRedoable.emit(False)
 
+    def _getHistoryMemory(self):
+        """Returns the memory used by the undo/redo history in bytes"""
+        return sum(delta.nbytes for delta in self._history + self._redo)
+
+    def _computeDelta(self):
+        """Returns the delta between the committed mask and the current one
+
+        :rtype: Union[_MaskDelta,None]
+        """
+        if self._committed.shape != self._mask.shape:
+            return _MaskDelta(None, self._committed, self._mask)
+        if self._modified is None:
+            return None
+        if self._modified == self._WHOLE_MASK:
+            region = tuple(slice(None) for _ in self._mask.shape)
+        else:
+            region = tuple(slice(start, stop) for start, stop in self._modified)
+        delta = _MaskDelta(region, self._committed[region], self._mask[region])
+        return None if delta.isEmpty() else delta
+
     def commit(self):
-        """Append the current mask to history if changed"""
-        if (not self._history or self._redo or
-                not numpy.array_equal(self._mask, self._history[-1])):
-            if self._redo:
-                self._redo = []  # Reset redo as a new action as been performed
-                self.sigRedoable[bool].emit(False)
-
-            while len(self._history) >= self.historyDepth:
-                self._history.pop(0)
-            self._history.append(numpy.array(self._mask, copy=True))
-
-            if len(self._history) == 2:
+        """Append the current mask changes to history if changed"""
+        delta = self._computeDelta()
+        self._modified = None
+        if delta is not None:
+            self._committed = delta.apply(self._committed)
+        if self._redo:
+            self._redo = []  # Reset redo as a new action as been performed
+            self.sigRedoable[bool].emit(False)
+
+        if delta is not None:
+            self._history.append(delta)
+            memory = self._getHistoryMemory()
+            while len(self._history) > 1 and (
+                    memory > self.historyMaxMemory or
+                    (self.historyDepth is not None and
+                     len(self._history) >= self.historyDepth)):
+                memory -= self._history.pop(0).nbytes
+
+            if len(self._history) == 1:
                 self.sigUndoable.emit(True)
         self.sigStateChanged.emit()
 
+    def _restore(self, delta, undo):
+        """Apply a delta to both the current mask and the committed one.
+
+        Non-committed changes are lost.
+        """
+        if self._modified is not None:
+            self._mask = numpy.array(self._committed, copy=True)
+        self._committed = delta.apply(self._committed, undo=undo)
+        self._mask = delta.apply(self._mask, undo=undo)
+        self._notify()  # Do not store this change in history
+        self._modified = None
+
     def undo(self):
         """Restore previous mask if any"""
-        if len(self._history) > 1:
-            self._redo.append(self._history.pop())
-            self._mask = numpy.array(self._history[-1], copy=True)
-            self._notify()  # Do not store this change in history
+        if self._history:
+            delta = self._history.pop()
+            self._redo.append(delta)
+            self._restore(delta, undo=True)
 
             if len(self._redo) == 1:  # First redo
                 self.sigRedoable.emit(True)
-            if len(self._history) == 1:  # Last value in history
+            if not self._history:  # Last value in history
                 self.sigUndoable.emit(False)
             self.sigStateChanged.emit()
 
     def redo(self):
         """Restore previously undone modification if any"""
         if self._redo:
-            self._mask = self._redo.pop()
-            self._history.append(numpy.array(self._mask, copy=True))
-            self._notify()
+            delta = self._redo.pop()
+            self._history.append(delta)
+            self._restore(delta, undo=False)
 
             if not self._redo:  # No more redo
                 self.sigRedoable.emit(False)
-            if len(self._history) == 2:  # Something to undo
+            if len(self._history) == 1:  # Something to undo
                 self.sigUndoable.emit(True)
             self.sigStateChanged.emit()
 
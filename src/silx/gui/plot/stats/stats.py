@@ -29,7 +29,7 @@ It also include the implementation of the statistics themselves.
 
 __authors__ = ["H. Payno"]
 __license__ = "MIT"
-__date__ = "06/06/2018"
+__date__ = "19/10/2026"
 
 
 from collections import OrderedDict
@@ -42,8 +42,10 @@ import numpy.ma
 from .. import items
 from ..CurvesROIWidget import ROI
 from ..items.roi import RegionOfInterest
+from ..items.roi import RectangleROI, CircleROI, EllipseROI, PolygonROI
 
 from ....math.combo import min_max
+from ....image.shapes import polygon_fill_mask
 from silx.utils.proxy import docstring
 from ....utils.deprecation import deprecated
 
@@ -146,6 +148,105 @@ class Stats(OrderedDict):
         return context
 
 
+def _roiGeometry(roi):
+    """Returns a hashable description of the geometry of a 2D ROI.
+
+    :param RegionOfInterest roi:
+    :return: The geometry or None if this kind of ROI is not supported
+        by :func:`_imageRoiMask`
+    :rtype: Union[tuple,None]
+    """
+    if isinstance(roi, RectangleROI):
+        return ('rectangle',
+                tuple(map(float, roi.getOrigin())),
+                tuple(map(float, roi.getSize())))
+    if isinstance(roi, CircleROI):
+        return ('circle',
+                tuple(map(float, roi.getCenter())),
+                float(roi.getRadius()))
+    if isinstance(roi, EllipseROI):
+        return ('ellipse',
+                tuple(map(float, roi.getCenter())),
+                float(roi.getMajorRadius()),
+                float(roi.getMinorRadius()),
+                float(roi.getOrientation()))
+    if isinstance(roi, PolygonROI):
+        return ('polygon',
+                tuple(tuple(map(float, point)) for point in roi.getPoints()))
+    return None
+
+
+def _axisRange(coords, vmin, vmax):
+    """Returns the range of indices of coords within [vmin, vmax]
+
+    :rtype: slice
+    """
+    indices = numpy.nonzero(numpy.logical_and(coords >= vmin, coords <= vmax))[0]
+    if len(indices) == 0:
+        return slice(0, 0)
+    return slice(indices[0], indices[-1] + 1)
+
+
+@lru_cache(maxsize=16)
+def _imageRoiMask(geometry, shape, origin, scale):
+    """Rasterize a ROI on an image grid.
+
+    Results are cached, so computing statistics of the same ROI several
+    times does not rasterize it again.
+    The mask is limited to the bounding box of the ROI to keep the cache
+    small for large images.
+
+    :param tuple geometry: ROI geometry as returned by :func:`_roiGeometry`
+    :param Tuple[int,int] shape: Image shape (height, width)
+    :param Tuple[float,float] origin: Image origin (x, y)
+    :param Tuple[float,float] scale: Image scale (x, y)
+    :return: ((row, col) offset, read-only submask),
+        the submask is True for pixels inside the ROI
+    :rtype: Tuple[Tuple[int,int],numpy.ndarray]
+    """
+    height, width = shape
+    xcoords = origin[0] + scale[0] * numpy.arange(width)
+    ycoords = origin[1] + scale[1] * numpy.arange(height)
+    kind = geometry[0]
+
+    if kind == 'polygon':
+        points = numpy.array(geometry[1], dtype=numpy.float64).reshape(-1, 2)
+        if len(points) == 0:
+            return (0, 0), numpy.zeros((0, 0), dtype=bool)
+        # Vertices in the (x index, y index) space, like PolygonROI.contains
+        vertices = (points - origin) / scale
+        (col, row), submask = polygon_fill_mask(
+            vertices, (width, height), bbox=True)
+        submask = submask.T != 0
+    else:
+        if kind == 'rectangle':
+            (x0, y0), (w, h) = geometry[1:]
+            extent = (x0, x0 + w), (y0, y0 + h)
+        else:  # circle and ellipse
+            (cx, cy), radius = geometry[1], max(geometry[2:4])
+            extent = (cx - radius, cx + radius), (cy - radius, cy + radius)
+
+        cols = _axisRange(xcoords, min(extent[0]), max(extent[0]))
+        rows = _axisRange(ycoords, min(extent[1]), max(extent[1]))
+        row, col = rows.start, cols.start
+        x = xcoords[cols].reshape(1, -1)
+        y = ycoords[rows].reshape(-1, 1)
+
+        if kind == 'rectangle':
+            submask = numpy.ones((len(y), x.shape[1]), dtype=bool)
+        elif kind == 'circle':
+            submask = numpy.hypot(x - cx, y - cy) <= geometry[2]
+        else:
+            major, minor, delta = geometry[2:]
+            x, y = x - cx, y - cy
+            submask = (
+                (x*numpy.cos(delta) + y*numpy.sin(delta))**2/major**2 +
+                (x*numpy.sin(delta) - y*numpy.cos(delta))**2/minor**2) <= 1
+
+    submask.setflags(write=False)
+    return (row, col), submask
+
+
 class _StatsContext(object):
     """
     The context is designed to be a simple buffer and avoid repetition of
@@ -577,11 +678,20 @@ class _ImageContext(_StatsContext):
                                   ymin=YMinBound, ymax=YMaxBound):
                 mask = self.mask
             else:
-                for x in range(XMinBound, XMaxBound):
-                    for y in range(YMinBound, YMaxBound):
-                        _x = (x * self.scale[0]) + self.origin[0]
-                        _y = (y * self.scale[1]) + self.origin[1]
-                        mask[y, x] = not roi.contains((_x, _y))
+                geometry = _roiGeometry(roi)
+                if geometry is not None:
+                    (row, col), inside = _imageRoiMask(
+                        geometry, self.data.shape,
+                        tuple(self.origin), tuple(self.scale))
+                    mask = numpy.ones(self.data.shape, dtype=bool)
+                    height, width = inside.shape
+                    mask[row:row + height, col:col + width] = ~inside
+                else:
+                    for x in range(XMinBound, XMaxBound):
+                        for y in range(YMinBound, YMaxBound):
+                            _x = (x * self.scale[0]) + self.origin[0]
+                            _y = (y * self.scale[1]) + self.origin[1]
+                            mask[y, x] = not roi.contains((_x, _y))
                 self._set_mask_validity(xmin=XMinBound, xmax=XMaxBound,
                                         ymin=YMinBound, ymax=YMaxBound)
         self.values = numpy.ma.array(self.data, mask=mask)
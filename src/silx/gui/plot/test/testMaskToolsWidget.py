@@ -26,7 +26,7 @@
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "17/01/2018"
+__date__ = "19/10/2026"
 
 
 import logging
@@ -38,7 +38,7 @@ import numpy
 from silx.gui import qt
 from silx.test.utils import temp_dir
 from silx.utils.testutils import ParametricTestCase
-from silx.gui.utils.testutils import getQToolButtonFromAction
+from silx.gui.utils.testutils import getQToolButtonFromAction, TestCaseQt
 from silx.gui.plot import PlotWindow, MaskToolsWidget
 from .utils import PlotWidgetTestCase
 
@@ -302,3 +302,97 @@ class TestMaskToolsWidget(PlotWidgetTestCase, ParametricTestCase):
         self._drag()
 
         self.assertGreater(len(l), 0)
+
+
+class TestImageMaskHistory(TestCaseQt):
+    """Test undo/redo history of ImageMask"""
+
+    def setUp(self):
+        super(TestImageMaskHistory, self).setUp()
+        self.mask = MaskToolsWidget.ImageMask()
+        self.mask.reset((100, 200))
+        self.mask.commit()
+
+    def tearDown(self):
+        self.mask = None
+        super(TestImageMaskHistory, self).tearDown()
+
+    def testUndoRedo(self):
+        states = [self.mask.getMask()]
+        self.mask.updateRectangle(1, 10, 20, 5, 30)
+        self.mask.commit()
+        states.append(self.mask.getMask())
+        self.mask.updatePolygon(2, [(50, 50), (90, 60), (60, 190)])
+        self.mask.commit()
+        states.append(self.mask.getMask())
+        self.mask.updateDisk(3, 12, 30, 4)
+        self.mask.commit()
+        states.append(self.mask.getMask())
+        self.mask.invert(3)
+        self.mask.commit()
+        states.append(self.mask.getMask())
+
+        for state in reversed(states[:-1]):
+            self.mask.undo()
+            self.assertTrue(numpy.array_equal(self.mask.getMask(), state))
+        self.mask.undo()  # Nothing to undo
+        self.assertTrue(numpy.array_equal(self.mask.getMask(), states[0]))
+
+        for state in states[1:]:
+            self.mask.redo()
+            self.assertTrue(numpy.array_equal(self.mask.getMask(), state))
+
+    def testNoChange(self):
+        self.mask.updateRectangle(1, 10, 20, 5, 30, mask=False)
+        self.mask.commit()
+        self.assertEqual(len(self.mask._history), 0)
+
+        self.mask.updatePoints(1, numpy.array([], dtype=int), numpy.array([], dtype=int))
+        self.mask.commit()
+        self.assertEqual(len(self.mask._history), 0)
+
+    def testUncommittedChangesDiscarded(self):
+        self.mask.updateRectangle(1, 10, 20, 5, 30)
+        self.mask.commit()
+        reference = self.mask.getMask()
+        self.mask.updateRectangle(2, 0, 0, 50, 50)
+        self.mask.commit()
+        self.mask.updateRectangle(3, 0, 0, 90, 90)  # Not committed
+        self.mask.undo()
+        self.assertTrue(numpy.array_equal(self.mask.getMask(), reference))
+
+    def testSetMaskShape(self):
+        self.mask.updateRectangle(1, 10, 20, 5, 30)
+        self.mask.commit()
+        reference = self.mask.getMask()
+        self.mask.setMask(numpy.ones((10, 10)))
+        self.mask.commit()
+        self.mask.undo()
+        self.assertTrue(numpy.array_equal(self.mask.getMask(), reference))
+        self.mask.redo()
+        self.assertTrue(numpy.array_equal(self.mask.getMask(), numpy.ones((10, 10))))
+
+    def testLimits(self):
+        self.mask.historyMaxMemory = 100 * 200 * 2 * 3  # 3 dense deltas
+        for level in range(1, 6):
+            self.mask.updateRectangle(level, 0, 0, 100, 200)
+            self.mask.commit()
+        self.assertEqual(len(self.mask._history), 3)
+
+        self.mask.historyMaxMemory = 0  # Always keep last operation
+        self.mask.updateRectangle(1, 0, 0, 100, 200)
+        self.mask.commit()
+        self.assertEqual(len(self.mask._history), 1)
+
+        self.mask.historyMaxMemory = 2**30
+        self.mask.historyDepth = 3
+        for level in range(1, 6):
+            self.mask.updateDisk(level, 50, 50, 5)
+            self.mask.commit()
+        self.assertEqual(len(self.mask._history), 2)
+        # Few changes in a large region are stored sparse
+        self.mask.updatePoints(7, numpy.array([0, 99]), numpy.array([0, 199]))
+        self.mask.commit()
+        self.assertIsNotNone(self.mask._history[-1].indices)
+        self.mask.undo()
+        self.assertEqual(self.mask.getMask()[0, 0], 1)
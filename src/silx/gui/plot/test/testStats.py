@@ -995,6 +995,38 @@ class TestStatsROI(TestStatsBase, TestCaseQt):
         self.assertEqual(_stats['com'].calculate(self.histoContext), com)
 
 
+class TestImageRoiMask(TestCaseQt, ParametricTestCase):
+    """Test the cached rasterization of ROIs against ROI.contains"""
+
+    def testPolygonEdges(self):
+        # Vertices on pixel centers, so that edges go through pixels
+        vertices = numpy.array([(2, 1), (8, 1), (8, 6), (5, 9), (2, 6)],
+                               dtype=numpy.float64)
+        shape = 12, 10
+        for origin, scale in (((0., 0.), (1., 1.)), ((10., 5.), (2., 0.5))):
+            with self.subTest(origin=origin, scale=scale):
+                roi = PolygonROI()
+                roi.setPoints(numpy.array(origin) + vertices * numpy.array(scale))
+                geometry = stats._roiGeometry(roi)
+                for _ in range(2):  # Computed, then from the cache
+                    (row, col), submask = stats._imageRoiMask(
+                        geometry, shape, origin, scale)
+                    mask = numpy.zeros(shape, dtype=bool)
+                    mask[row:row + submask.shape[0],
+                         col:col + submask.shape[1]] = submask
+
+                    expected = numpy.array(
+                        [[roi.contains((origin[0] + scale[0] * j,
+                                        origin[1] + scale[1] * i))
+                          for j in range(shape[1])]
+                         for i in range(shape[0])])
+                    self.assertTrue(numpy.array_equal(mask, expected))
+                    # Pixels on the top and left edges are inside,
+                    # pixels on the right edge are not
+                    self.assertTrue(mask[1, 2] and mask[4, 2])
+                    self.assertFalse(mask[4, 8])
+
+
 class TestAdvancedROIImageContext(TestCaseQt):
     """Test stats result on an image context with different scale and
     origins"""
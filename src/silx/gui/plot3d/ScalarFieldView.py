@@ -32,7 +32,7 @@ from __future__ import absolute_import
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "14/06/2018"
+__date__ = "19/10/2026"
 
 import re
 import logging
@@ -211,7 +211,8 @@ class Isosurface(qt.QObject):
             st = time.time()
             vertices, normals, indices = MarchingCubes(
                 self._data,
-                isolevel=self._level)
+                isolevel=self._level,
+                num_threads=None)
             _logger.info('Computed iso-surface in %f s.', time.time() - st)
 
             if len(vertices) == 0:
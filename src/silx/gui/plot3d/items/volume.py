@@ -29,7 +29,7 @@ from __future__ import absolute_import
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "24/04/2018"
+__date__ = "19/10/2026"
 
 import logging
 import time
@@ -367,7 +367,8 @@ class Isosurface(Item3D):
                 st = time.time()
                 vertices, normals, indices = MarchingCubes(
                     data,
-                    isolevel=self._level)
+                    isolevel=self._level,
+                    num_threads=None)
                 _logger.info('Computed iso-surface in %f s.', time.time() - st)
 
                 if len(vertices) != 0:
@@ -29,21 +29,135 @@ from __future__ import absolute_import, division, unicode_literals
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "11/01/2018"
+__date__ = "19/10/2026"
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import string
+import threading
 import numpy
 
 from ... import _glutils
 from ..._glutils import gl
+from ...utils.concurrent import submitToQtMainThread
 
 from .function import Colormap
 from .primitives import Box, Geometry, PlaneInGroup
 from . import transform, utils
 
 
+_logger = logging.getLogger(__name__)
+
+
+_executors = {}
+"""Thread pools computing the textures, by name"""
+
+
+def _getExecutor(name='texture'):
+    """Returns a thread pool computing textures.
+
+    Each pool uses a single thread so that volumes are read one at a time,
+    the downsampled textures and the bricks being computed by different
+    pools.
+
+    :param str name: Name of the thread pool: 'texture' or 'bricks'
+    :rtype: ThreadPoolExecutor
+    """
+    executor = _executors.get(name)
+    if executor is None:  # Lazy-loading
+        executor = ThreadPoolExecutor(max_workers=1)
+        _executors[name] = executor
+    return executor
+
+
+def _asVolume(data, copy):
+    """Returns data as a 3D array to use as texture.
+
+    numpy arrays and sequences are converted to a C-contiguous array.
+    Other array-likes (e.g., h5py.Dataset) are kept as is to be read
+    lazily.
+
+    :param data: 3D array-like
+    :param bool copy: True to copy numpy arrays
+    :rtype: Union[numpy.ndarray,object]
+    """
+    if (isinstance(data, numpy.ndarray) or
+            not hasattr(data, 'shape') or not hasattr(data, '__getitem__')):
+        data = numpy.array(data, copy=copy, order='C')
+    assert len(data.shape) == 3
+    return data
+
+
+def _planeBricks(shape, size, normal, point):
+    """Returns the indices of the bricks of a volume crossed by a plane.
+
+    A plane going through a face shared by two bricks only selects the
+    brick before the plane.
+
+    :param List[int] shape: Shape of the volume (dim0, dim1, dim2)
+    :param int size: Size of the bricks in voxels
+    :param normal: Normal of the plane (x, y, z)
+    :param point: A point of the plane (x, y, z)
+    :return: Array of brick indices (dim0, dim1, dim2)
+    :rtype: numpy.ndarray of shape (N, 3)
+    """
+    shape = numpy.array(shape)
+    counts = -(-shape // size)
+    indices = numpy.indices(counts).reshape(3, -1).T
+    lower = indices * size
+    upper = numpy.minimum(lower + size, shape)
+    normal = numpy.array(normal, dtype=numpy.float64)[::-1]
+    point = numpy.array(point, dtype=numpy.float64)[::-1]
+    distances = numpy.dot(0.5 * (lower + upper) - point, normal)
+    radius = numpy.dot(0.5 * (upper - lower), numpy.abs(normal))
+    return indices[numpy.logical_and(distances >= -radius, distances < radius)]
+
+
+class _BrickCache(object):
+    """Cache of bricks keeping the most recently used ones.
+
+    It is only used from the thread computing the bricks.
+
+    :param int maxSize: Maximum size in bytes of the cached bricks
+    """
+
+    def __init__(self, maxSize):
+        self._maxSize = maxSize
+        self._size = 0
+        self._bricks = OrderedDict()
+
+    def get(self, key):
+        brick = self._bricks.get(key)
+        if brick is not None:
+            self._bricks.move_to_end(key)
+        return brick
+
+    def set(self, key, brick):
+        """Store a brick as returned by :meth:`CutPlane._readBrick`"""
+        self._bricks[key] = brick
+        self._size += brick[2].nbytes
+        while self._size > self._maxSize and len(self._bricks) > 1:
+            _key, old = self._bricks.popitem(last=False)
+            self._size -= old[2].nbytes
+
+
 class ColormapMesh3D(Geometry):
-    """A 3D mesh with color from a 3D texture."""
+    """A 3D mesh with color from a 3D texture.
+
+    If data does not fit in a 3D texture or is larger than
+    :attr:`maxTextureBytes`, a downsampled version of data is used.
+    It is computed in a background thread: a subsampled preview of data
+    is displayed first, then it is replaced by the averaged downsampled
+    data. Nothing is displayed until the preview is available.
+
+    Data which is not a numpy array (e.g., h5py.Dataset) is read lazily,
+    by the background thread.
+
+    Data can be a part of a larger volume, with origin the index in the
+    volume of its first voxel and factors the downsampling factors of
+    data, i.e., the size in voxels of the volume of each voxel of data.
+    """
 
     _shaders = ("""
     attribute vec3 position;
@@ -96,13 +210,25 @@ class ColormapMesh3D(Geometry):
     }
     """))
 
+    maxTextureBytes = 512 * 2**20
+    """Maximum size in bytes of the 3D texture"""
+
+    previewSize = 64
+    """Maximum size along any dimension of the preview of downsampled data"""
+
     def __init__(self, position, normal, data, copy=True,
-                 mode='triangles', indices=None, colormap=None):
+                 mode='triangles', indices=None, colormap=None,
+                 origin=(0, 0, 0), factors=(1, 1, 1)):
         assert mode in self._TRIANGLE_MODES
-        data = numpy.array(data, copy=copy, order='C')
-        assert data.ndim == 3
-        self._data = data
+        self._data = _asVolume(data, copy)
+        self._origin = tuple(origin)
+        self._dataFactors = tuple(factors)
         self._texture = None
+        self._textureShape = self._data.shape
+        self._textureFactors = 1, 1, 1
+        self._textureLock = threading.Lock()
+        self._textureLevel = None  # Data to upload and its factors
+        self._cancelEvent = None  # Cancels the background computation
         self._update_texture = True
         self._update_texture_filter = False
         self._alpha = 1.
@@ -119,14 +245,99 @@ class ColormapMesh3D(Geometry):
         """Offset to add to texture coordinates"""
 
     def setData(self, data, copy=True):
-        data = numpy.array(data, copy=copy, order='C')
-        assert data.ndim == 3
-        self._data = data
+        self._cancelTextureLoading()
+        self._data = _asVolume(data, copy)
         self._update_texture = True
 
     def getData(self, copy=True):
         return numpy.array(self._data, copy=copy)
 
+    def _getTextureFactor(self, maxSize):
+        """Returns the downsampling factor needed to use data as texture
+
+        :param int maxSize: Maximum texture size along any dimension
+        :rtype: int
+        """
+        shape = self._data.shape
+        factor = 1
+        while True:
+            levelShape = [max(1, size // factor) for size in shape]
+            if ((max(levelShape) <= maxSize and
+                    4 * numpy.prod(levelShape) <= self.maxTextureBytes) or
+                    max(levelShape) == 1):
+                return factor
+            factor *= 2
+
+    def _setTextureLevel(self, data, factors, cancelEvent=None):
+        """Set the data to upload as texture at next :meth:`prepareGL2`
+
+        :param numpy.ndarray data: The texture data
+        :param List[int] factors: The downsampling factors of data
+        :param threading.Event cancelEvent:
+            The event of the computation providing data, if any
+        :return: False if the computation was cancelled, True otherwise
+        :rtype: bool
+        """
+        with self._textureLock:
+            if cancelEvent is not None and cancelEvent.is_set():
+                return False
+            self._textureLevel = data, factors
+        return True
+
+    def _cancelTextureLoading(self):
+        """Stop the computation of the texture in background, if any"""
+        with self._textureLock:
+            if self._cancelEvent is not None:
+                self._cancelEvent.set()
+                self._cancelEvent = None
+            self._textureLevel = None
+
+    def _loadTexture(self, factor):
+        """Compute the texture in a background thread.
+
+        :param int factor: The downsampling factor of the texture
+        :return: Future of the computation
+        :rtype: concurrent.futures.Future
+        """
+        self._cancelTextureLoading()
+        cancelEvent = threading.Event()
+        self._cancelEvent = cancelEvent
+        return _getExecutor().submit(
+            self._computeTextureLevels, self._data, factor, cancelEvent)
+
+    def _computeTextureLevels(self, data, factor, cancelEvent):
+        """Compute a preview then the downsampled data to use as texture.
+
+        This is run in a background thread.
+
+        :param data: 3D array-like
+        :param int factor: The downsampling factor of the texture
+        :param threading.Event cancelEvent: Event set to stop the computation
+        """
+        shape = data.shape
+        try:
+            step = max(factor, int(numpy.ceil(max(shape) / self.previewSize)))
+            if step > factor:  # Preview with the center voxel of blocks
+                steps = tuple(max(1, min(step, size)) for size in shape)
+                preview = numpy.array(
+                    data[tuple(slice(s // 2, (size // s) * s, s)
+                               for size, s in zip(shape, steps))],
+                    dtype=numpy.float32, order='C')
+                if self._setTextureLevel(preview, steps, cancelEvent):
+                    submitToQtMainThread(self.notify)
+
+            level = utils.downsampleVolume(data, factor, cancelEvent=cancelEvent)
+        except Exception:
+            _logger.error('Cannot load data %s for 3D texture', shape,
+                          exc_info=True)
+            return
+        if level is None:
+            return  # Cancelled
+        if self._setTextureLevel(level[0], level[1], cancelEvent):
+            _logger.info('Data %s downsampled to %s for 3D texture',
+                         shape, level[0].shape)
+            submitToQtMainThread(self.notify)
+
     @property
     def interpolation(self):
         """The texture interpolation mode: 'linear' or 'nearest'"""
@@ -157,8 +368,36 @@ class ColormapMesh3D(Geometry):
         """Broadcast colormap changes"""
         self.notify(*args, **kwargs)
 
+    def _release(self):
+        """Stop the computation of the texture, discard the texture and stop
+        listening to the colormap.
+
+        This method must be called with a current OpenGL context.
+        """
+        self._cancelTextureLoading()
+        self._colormap.removeListener(self._cmapChanged)
+        if self._texture is not None:
+            self._texture.discard()
+            self._texture = None
+
     def prepareGL2(self, ctx):
-        if self._texture is None or self._update_texture:
+        if self._update_texture:
+            self._update_texture = False
+            if self._texture is not None:
+                self._texture.discard()
+                self._texture = None
+
+            factor = self._getTextureFactor(
+                gl.glGetInteger(gl.GL_MAX_3D_TEXTURE_SIZE))
+            if factor == 1 and isinstance(self._data, numpy.ndarray):
+                self._setTextureLevel(self._data, (1, 1, 1))
+            else:
+                self._loadTexture(factor)
+
+        with self._textureLock:
+            level, self._textureLevel = self._textureLevel, None
+
+        if level is not None:
             if self._texture is not None:
                 self._texture.discard()
 
@@ -166,15 +405,18 @@ class ColormapMesh3D(Geometry):
                 filter_ = gl.GL_NEAREST
             else:
                 filter_ = gl.GL_LINEAR
-            self._update_texture = False
             self._update_texture_filter = False
+            data, factors = level
+            self._textureFactors = tuple(
+                numpy.multiply(factors, self._dataFactors))
+            self._textureShape = data.shape
             self._texture = _glutils.Texture(
-                gl.GL_R32F, self._data, gl.GL_RED,
+                gl.GL_R32F, data, gl.GL_RED,
                 minFilter=filter_,
                 magFilter=filter_,
                 wrap=gl.GL_CLAMP_TO_EDGE)
 
-        if self._update_texture_filter:
+        if self._texture is not None and self._update_texture_filter:
             self._update_texture_filter = False
             if self.interpolation == 'nearest':
                 filter_ = gl.GL_NEAREST
@@ -186,6 +428,9 @@ class ColormapMesh3D(Geometry):
         super(ColormapMesh3D, self).prepareGL2(ctx)
 
     def renderGL2(self, ctx):
+        if self._texture is None:
+            return  # Texture is not yet available
+
         fragment = self._shaders[1].substitute(
             sceneDecl=ctx.fragDecl,
             scenePreCall=ctx.fragCallPre,
@@ -211,10 +456,13 @@ class ColormapMesh3D(Geometry):
                                  safe=True)
         gl.glUniform1f(program.uniforms['alpha'], self._alpha)
 
-        shape = self._data.shape
-        scales = 1./shape[2], 1./shape[1], 1./shape[0]
+        # Texture covers whole blocks of downsampled data
+        extent = numpy.multiply(self._textureShape, self._textureFactors)
+        scales = 1. / extent[::-1]
+        offset = (numpy.array(self.textureOffset) -
+                  scales * numpy.array(self._origin[::-1]))
         gl.glUniform3f(program.uniforms['dataScale'], *scales)
-        gl.glUniform3f(program.uniforms['texCoordsOffset'], *self.textureOffset)
+        gl.glUniform3f(program.uniforms['texCoordsOffset'], *offset)
 
         gl.glUniform1i(program.uniforms['data'], self._texture.texUnit)
 
@@ -228,7 +476,26 @@ class ColormapMesh3D(Geometry):
 
 
 class CutPlane(PlaneInGroup):
-    """A cutting plane in a 3D texture"""
+    """A cutting plane in a 3D texture
+
+    When data is too large to be used as a single texture, the plane is
+    first displayed with a downsampled texture.
+    Once the plane stays still, the bricks of data it crosses are read in a
+    background thread at the finest resolution fitting in
+    :attr:`maxBrickBytes` and are displayed instead.
+    """
+
+    brickSize = 64
+    """Size in voxels of the textures of the bricks"""
+
+    maxBrickBytes = 256 * 2**20
+    """Maximum size in bytes of the bricks displayed at once"""
+
+    brickCacheBytes = 512 * 2**20
+    """Maximum size in bytes of the bricks kept in memory"""
+
+    refineDelay = 0.3
+    """Delay in seconds the plane must stay still before loading bricks"""
 
     def __init__(self, point=(0., 0., 0.), normal=(0., 0., 1.)):
         self._data = None
@@ -236,22 +503,160 @@ class CutPlane(PlaneInGroup):
         self._alpha = 1.
         self._interpolation = 'linear'
         self._colormap = Colormap()
+        self._brickMeshes = []
+        self._releasedMeshes = []  # Meshes to release in the GL context
+        self._bricksLock = threading.Lock()
+        self._bricks = None  # Bricks computed for a plane: (key, bricks)
+        self._bricksKey = None  # Plane for which bricks are displayed
+        self._bricksCancelEvent = None
+        self._brickCache = _BrickCache(self.brickCacheBytes)
         super(CutPlane, self).__init__(point, normal)
 
     def setData(self, data, copy=True):
+        self._resetBricks()
+        self._brickCache = _BrickCache(self.brickCacheBytes)
+
         if data is None:
             self._data = None
             if self._mesh is not None:
                 self._children.remove(self._mesh)
+                self._releasedMeshes.append(self._mesh)
             self._mesh = None
 
         else:
-            data = numpy.array(data, copy=copy, order='C')
-            assert data.ndim == 3
+            data = _asVolume(data, copy)
             self._data = data
             if self._mesh is not None:
                 self._mesh.setData(data, copy=False)
 
+    def _resetBricks(self):
+        """Stop loading bricks and remove the displayed ones"""
+        self._cancelBricksLoading()
+        self._bricksKey = None
+        for mesh in self._brickMeshes:
+            self._children.remove(mesh)
+        self._releasedMeshes.extend(self._brickMeshes)
+        self._brickMeshes = []
+
+    def _cancelBricksLoading(self):
+        """Stop the computation of the bricks in background, if any"""
+        with self._bricksLock:
+            if self._bricksCancelEvent is not None:
+                self._bricksCancelEvent.set()
+                self._bricksCancelEvent = None
+            self._bricks = None
+
+    def _loadBricks(self, planeKey, factor):
+        """Compute the bricks crossed by the plane in a background thread.
+
+        :param planeKey: The plane (normal, point) as tuples
+        :param int factor: The downsampling factor of the whole volume texture
+        :return: Future of the computation
+        :rtype: concurrent.futures.Future
+        """
+        self._cancelBricksLoading()
+        cancelEvent = threading.Event()
+        self._bricksCancelEvent = cancelEvent
+        return _getExecutor('bricks').submit(
+            self._computeBricks, self._data, self._brickCache,
+            planeKey, factor, cancelEvent)
+
+    @staticmethod
+    def _readBrick(data, start, size, factor):
+        """Read a brick of data and downsample it.
+
+        :param data: 3D array-like
+        :param List[int] start: Index of the first voxel of the brick
+        :param int size: Size of the brick in voxels of data
+        :param int factor: Downsampling factor
+        :return: (start, downsampling factors, brick data as float32)
+        """
+        region = data[tuple(slice(begin, begin + size) for begin in start)]
+        if factor == 1:
+            return (tuple(start), (1, 1, 1),
+                    numpy.array(region, dtype=numpy.float32, order='C'))
+        brick, factors = utils.downsampleVolume(region, factor)
+        return tuple(start), factors, brick
+
+    def _computeBricks(self, data, cache, planeKey, factor, cancelEvent):
+        """Read the bricks of data crossed by the plane.
+
+        This is run in a background thread.
+
+        :param data: 3D array-like
+        :param _BrickCache cache: Cache of the bricks of data
+        :param planeKey: The plane (normal, point) as tuples
+        :param int factor: The downsampling factor of the whole volume texture
+        :param threading.Event cancelEvent: Event set to stop the computation
+        """
+        if cancelEvent.wait(self.refineDelay):
+            return  # Cancelled: the plane has moved
+
+        normal, point = planeKey
+        brickBytes = 4 * self.brickSize ** 3
+        level = 1
+        while level < factor:
+            size = self.brickSize * level
+            indices = _planeBricks(data.shape, size, normal, point)
+            if len(indices) * brickBytes <= self.maxBrickBytes:
+                break
+            level *= 2
+        else:
+            return  # Bricks do not improve the downsampled texture
+
+        bricks = []
+        try:
+            for index in indices:
+                if cancelEvent.is_set():
+                    return
+                start = tuple(int(i) for i in index * size)
+                brick = cache.get((level, start))
+                if brick is None:
+                    brick = self._readBrick(data, start, size, level)
+                    cache.set((level, start), brick)
+                bricks.append(brick)
+        except Exception:
+            _logger.error('Cannot load bricks of data %s', data.shape,
+                          exc_info=True)
+            return
+
+        with self._bricksLock:
+            if cancelEvent.is_set():
+                return
+            self._bricks = planeKey, bricks
+        _logger.info('%d bricks of data %s loaded with factor %d',
+                     len(bricks), data.shape, level)
+        submitToQtMainThread(self.notify)
+
+    def _createBrickMeshes(self, bricks):
+        """Display bricks instead of the downsampled texture.
+
+        :param list bricks: Bricks as returned by :meth:`_readBrick`
+        """
+        boxVertices = Box.getVertices(copy=True)
+        lineIndices = Box.getLineIndices(copy=False)
+        for start, factors, brick in bricks:
+            stop = numpy.array(start) + numpy.multiply(factors, brick.shape)
+            lower = numpy.array(start[::-1], dtype=numpy.float32)
+            upper = numpy.array(stop[::-1], dtype=numpy.float32)
+            vertices = utils.boxPlaneIntersect(
+                lower + boxVertices * (upper - lower), lineIndices,
+                self.plane.normal, self.plane.point)
+            if len(vertices) == 0:
+                continue
+            mesh = ColormapMesh3D(vertices,
+                                  normal=self.plane.normal,
+                                  data=brick,
+                                  copy=False,
+                                  mode='fan',
+                                  colormap=self.colormap,
+                                  origin=start,
+                                  factors=factors)
+            mesh.alpha = self._alpha
+            mesh.interpolation = self.interpolation
+            self._brickMeshes.append(mesh)
+        self._children[1:1] = self._brickMeshes
+
     def getData(self, copy=True):
         return None if self._mesh is None else self._mesh.getData(copy=copy)
 
@@ -264,6 +669,8 @@ class CutPlane(PlaneInGroup):
         self._alpha = float(alpha)
         if self._mesh is not None:
             self._mesh.alpha = alpha
+        for mesh in self._brickMeshes:
+            mesh.alpha = alpha
 
     @property
     def colormap(self):
@@ -281,9 +688,15 @@ class CutPlane(PlaneInGroup):
             self._interpolation = interpolation
             if self._mesh is not None:
                 self._mesh.interpolation = interpolation
+            for mesh in self._brickMeshes:
+                mesh.interpolation = interpolation
             self.notify()
 
     def prepareGL2(self, ctx):
+        for mesh in self._releasedMeshes:
+            mesh._release()
+        self._releasedMeshes = []
+
         if self.isValid:
 
             contourVertices = self.contourVertices
@@ -300,11 +713,13 @@ class CutPlane(PlaneInGroup):
                 self._children.insert(0, self._mesh)
 
             if self._mesh is not None:
+                self._prepareBricks(contourVertices)
                 if (contourVertices is None or
                         len(contourVertices) == 0):
                     self._mesh.visible = False
                 else:
-                    self._mesh.visible = True
+                    # Bricks replace the downsampled texture when available
+                    self._mesh.visible = not self._brickMeshes
                     self._mesh.setAttribute('normal', self.plane.normal)
                     self._mesh.setAttribute('position', contourVertices)
 
@@ -321,12 +736,41 @@ class CutPlane(PlaneInGroup):
                         break
 
             if needTextureOffset:
-                self._mesh.textureOffset = self.plane.normal * 1e-6
+                textureOffset = self.plane.normal * 1e-6
             else:
-                self._mesh.textureOffset = 0., 0., 0.
+                textureOffset = 0., 0., 0.
+            for mesh in [self._mesh] + self._brickMeshes:
+                if mesh is not None:
+                    mesh.textureOffset = textureOffset
 
         super(CutPlane, self).prepareGL2(ctx)
 
+    def _prepareBricks(self, contourVertices):
+        """Update the bricks displayed for the current plane.
+
+        :param contourVertices: The vertices of the plane in the data volume
+        """
+        planeKey = (tuple(float(v) for v in self.plane.normal),
+                    tuple(float(v) for v in self.plane.point))
+        if planeKey != self._bricksKey:
+            self._resetBricks()
+            self._bricksKey = planeKey
+            if contourVertices is not None and len(contourVertices) != 0:
+                factor = self._mesh._getTextureFactor(
+                    gl.glGetInteger(gl.GL_MAX_3D_TEXTURE_SIZE))
+                if factor > 1:
+                    self._loadBricks(planeKey, factor)
+
+        with self._bricksLock:
+            bricks, self._bricks = self._bricks, None
+
+        if bricks is not None and bricks[0] == planeKey:
+            for mesh in self._brickMeshes:
+                self._children.remove(mesh)
+            self._releasedMeshes.extend(self._brickMeshes)
+            self._brickMeshes = []
+            self._createBrickMeshes(bricks[1])
+
     def renderGL2(self, ctx):
         with self.viewport.light.turnOff():
             super(CutPlane, self).renderGL2(ctx)
@@ -0,0 +1,238 @@
+# coding: utf-8
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ###########################################################################*/
+"""Test the background computation of cut plane textures and bricks"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+
+import os
+import tempfile
+import threading
+import unittest
+
+import h5py
+import numpy
+
+from silx.gui.utils.testutils import TestCaseQt, SignalListener
+from silx.gui.plot3d.scene import utils
+from silx.gui.plot3d.scene.cutplane import (
+    ColormapMesh3D, CutPlane, _planeBricks)
+
+
+class _RecordingMesh(ColormapMesh3D):
+    """ColormapMesh3D recording the texture levels it receives"""
+
+    def __init__(self, *args, **kwargs):
+        self.levels = []
+        super(_RecordingMesh, self).__init__(*args, **kwargs)
+
+    def _setTextureLevel(self, data, factors, cancelEvent=None):
+        self.levels.append((data, factors))
+        return super(_RecordingMesh, self)._setTextureLevel(
+            data, factors, cancelEvent)
+
+
+class TestColormapMesh3DTexture(TestCaseQt):
+    """Test the texture computed in background by ColormapMesh3D"""
+
+    def setUp(self):
+        super(TestColormapMesh3DTexture, self).setUp()
+        fd, self.filename = tempfile.mkstemp(suffix=".h5")
+        os.close(fd)
+        self.data = numpy.random.random((20, 24, 32)).astype(numpy.float32)
+        self.h5file = h5py.File(self.filename, "w")
+        self.h5file["data"] = self.data
+
+    def tearDown(self):
+        self.h5file.close()
+        os.unlink(self.filename)
+        super(TestColormapMesh3DTexture, self).tearDown()
+
+    def createMesh(self, data):
+        position = numpy.array(((0., 0., 0.), (1., 0., 0.), (0., 1., 0.)),
+                               dtype=numpy.float32)
+        return _RecordingMesh(position, normal=(0., 0., 1.), data=data)
+
+    def testLazyDataset(self):
+        """Test that a dataset is kept and read in background"""
+        dataset = self.h5file["data"]
+        mesh = self.createMesh(dataset)
+        mesh.previewSize = 8
+        self.assertIs(mesh._data, dataset)
+
+        listener = SignalListener()
+        mesh.addListener(listener)
+        mesh._loadTexture(2).result()
+        for _ in range(100):
+            if listener.callCount() >= 2:
+                break
+            self.qWait(10)
+        self.assertEqual(listener.callCount(), 2)
+
+        # Preview first
+        preview, steps = mesh.levels[0]
+        self.assertEqual(steps, (4, 4, 4))
+        numpy.testing.assert_array_equal(preview, self.data[2::4, 2::4, 2::4])
+
+        # Then data averaged by blocks
+        level, factors = mesh.levels[1]
+        refLevel, refFactors = utils.downsampleVolume(self.data, 2)
+        self.assertEqual(factors, refFactors)
+        numpy.testing.assert_allclose(level, refLevel)
+        self.assertIs(mesh._textureLevel[0], level)
+
+    def testCancel(self):
+        """Test that setting new data drops the texture being computed"""
+        mesh = self.createMesh(self.h5file["data"])
+        future = mesh._loadTexture(2)
+        mesh.setData(numpy.zeros((2, 2, 2), dtype=numpy.float32))
+        future.result()
+        self.assertIsNone(mesh._textureLevel)
+
+
+class TestPlaneBricks(unittest.TestCase):
+    """Test the selection of the bricks crossed by a plane"""
+
+    def testAxisAligned(self):
+        """Test planes normal to the axes"""
+        shape = 20, 24, 32
+        indices = _planeBricks(shape, 8, (0., 0., 1.), (0., 0., 10.))
+        self.assertEqual(len(indices), 12)
+        self.assertTrue(numpy.all(indices[:, 0] == 1))
+
+        # Plane on the face shared by bricks: only the brick before it
+        indices = _planeBricks(shape, 8, (1., 0., 0.), (16., 0., 0.))
+        self.assertEqual(len(indices), 9)
+        self.assertTrue(numpy.all(indices[:, 2] == 1))
+
+        indices = _planeBricks(shape, 8, (0., 0., 1.), (0., 0., 30.))
+        self.assertEqual(len(indices), 0)
+
+    def testOblique(self):
+        """Test a plane crossing the diagonal of the volume"""
+        indices = _planeBricks((16, 16, 16), 8, (1., 1., 1.), (6., 6., 6.))
+        # All bricks but the one opposite to the origin
+        self.assertEqual(len(indices), 7)
+        self.assertNotIn((1, 1, 1), [tuple(index) for index in indices])
+
+
+class TestCutPlaneBricks(TestCaseQt):
+    """Test the bricks loaded in background by CutPlane"""
+
+    def setUp(self):
+        super(TestCutPlaneBricks, self).setUp()
+        fd, self.filename = tempfile.mkstemp(suffix=".h5")
+        os.close(fd)
+        self.data = numpy.random.random((20, 24, 32)).astype(numpy.float32)
+        self.h5file = h5py.File(self.filename, "w")
+        self.h5file["data"] = self.data
+
+        self.cutPlane = CutPlane()
+        self.cutPlane.brickSize = 8
+        self.cutPlane.refineDelay = 0.
+        self.cutPlane.setData(self.h5file["data"], copy=False)
+        self.planeKey = (0., 0., 1.), (0., 0., 10.)
+
+    def tearDown(self):
+        self.cutPlane = None
+        self.h5file.close()
+        os.unlink(self.filename)
+        super(TestCutPlaneBricks, self).tearDown()
+
+    def computeBricks(self, cancelEvent=None):
+        """Compute the bricks of the plane and returns them"""
+        if cancelEvent is None:
+            cancelEvent = threading.Event()
+        self.cutPlane._computeBricks(
+            self.cutPlane._data, self.cutPlane._brickCache,
+            self.planeKey, 4, cancelEvent)
+        self.qapp.processEvents()
+        bricks = self.cutPlane._bricks
+        self.cutPlane._bricks = None
+        return bricks
+
+    def testFullResolution(self):
+        """Test bricks at full resolution fitting in the budget"""
+        self.cutPlane.maxBrickBytes = 12 * 8**3 * 4
+        key, bricks = self.computeBricks()
+        self.assertEqual(key, self.planeKey)
+        self.assertEqual(len(bricks), 12)
+        for start, factors, brick in bricks:
+            self.assertEqual(factors, (1, 1, 1))
+            region = tuple(slice(begin, begin + 8) for begin in start)
+            numpy.testing.assert_array_equal(brick, self.data[region])
+
+        # Bricks are reused from the cache
+        _key, cached = self.computeBricks()
+        for brick, cachedBrick in zip(bricks, cached):
+            self.assertIs(brick, cachedBrick)
+
+    def testDownsampled(self):
+        """Test downsampled bricks when full resolution is too large"""
+        self.cutPlane.maxBrickBytes = 4 * 8**3 * 4
+        _key, bricks = self.computeBricks()
+        self.assertEqual(len(bricks), 4)
+        for start, factors, brick in bricks:
+            self.assertEqual(factors, (2, 2, 2))
+            region = tuple(slice(begin, begin + 16) for begin in start)
+            refBrick, _factors = utils.downsampleVolume(self.data[region], 2)
+            numpy.testing.assert_allclose(brick, refBrick)
+
+    def testBrickMeshes(self):
+        """Test the meshes displaying the bricks"""
+        self.cutPlane.maxBrickBytes = 4 * 8**3 * 4
+        self.cutPlane.plane.normal = self.planeKey[0]
+        self.cutPlane.plane.point = self.planeKey[1]
+        _key, bricks = self.computeBricks()
+        self.cutPlane._createBrickMeshes(bricks)
+
+        meshes = self.cutPlane._brickMeshes
+        self.assertEqual(len(meshes), 4)
+        for mesh, (start, factors, brick) in zip(meshes, bricks):
+            self.assertIn(mesh, self.cutPlane._children)
+            self.assertEqual(mesh._origin, start)
+            self.assertEqual(mesh._dataFactors, factors)
+            position = mesh.getAttribute('position')
+            self.assertTrue(numpy.all(position[:, 2] == 10.))
+            stop = numpy.array(start) + 2 * numpy.array(brick.shape)
+            self.assertTrue(numpy.all(position >= start[::-1]))
+            self.assertTrue(numpy.all(position <= stop[::-1]))
+
+        self.cutPlane.setData(None)
+        self.assertEqual(self.cutPlane._brickMeshes, [])
+        self.assertEqual(len(self.cutPlane._releasedMeshes), 4)
+
+    def testTooLarge(self):
+        """Test that no bricks are loaded when no level fits in the budget"""
+        self.cutPlane.maxBrickBytes = 8**3 * 4
+        self.assertIsNone(self.computeBricks())
+
+    def testCancel(self):
+        """Test that a cancelled computation publishes no bricks"""
+        cancelEvent = threading.Event()
+        cancelEvent.set()
+        self.assertIsNone(self.computeBricks(cancelEvent))
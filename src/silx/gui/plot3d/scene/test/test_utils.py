@@ -27,9 +27,10 @@ from __future__ import absolute_import, division, unicode_literals
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "17/01/2018"
+__date__ = "19/10/2026"
 
 
+import threading
 import unittest
 from silx.utils.testutils import ParametricTestCase
 
@@ -256,3 +257,44 @@ class TestTriangleNormals(ParametricTestCase):
 
         testnormals = utils.trianglesNormal(positions)
         self.assertTrue(numpy.allclose(testnormals, normals))
+
+
+# downsampleVolume ############################################################
+
+class TestDownsampleVolume(ParametricTestCase):
+    """Test downsampleVolume function."""
+
+    def test(self):
+        """Test with different factors and slab sizes"""
+        data = numpy.random.random((7, 9, 10)).astype(numpy.float32)
+
+        for factor, blockSize in ((1, 2**20), (2, 1), (2, 2**20), (4, 1000)):
+            with self.subTest(factor=factor, blockSize=blockSize):
+                result, factors = utils.downsampleVolume(
+                    data, factor, blockSize=blockSize)
+                self.assertEqual(factors, (factor,) * 3)
+                shape = tuple(size // factor for size in data.shape)
+                self.assertEqual(result.shape, shape)
+                reference = data[:shape[0] * factor,
+                                 :shape[1] * factor,
+                                 :shape[2] * factor].reshape(
+                    shape[0], factor, shape[1], factor, shape[2], factor)
+                self.assertTrue(numpy.allclose(
+                    result, reference.mean(axis=(1, 3, 5))))
+
+    def testLargeFactor(self):
+        """Test with a factor larger than data"""
+        data = numpy.random.random((3, 20, 40)).astype(numpy.float32)
+        result, factors = utils.downsampleVolume(data, 8)
+        self.assertEqual(factors, (3, 8, 8))
+        self.assertEqual(result.shape, (1, 2, 5))
+        self.assertTrue(numpy.allclose(
+            result[0, 0, 0], data[:, :8, :8].mean()))
+
+    def testCancel(self):
+        """Test cancelling the computation"""
+        data = numpy.random.random((4, 4, 4)).astype(numpy.float32)
+        cancelEvent = threading.Event()
+        cancelEvent.set()
+        self.assertIsNone(
+            utils.downsampleVolume(data, 2, cancelEvent=cancelEvent))
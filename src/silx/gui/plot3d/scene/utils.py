@@ -23,15 +23,15 @@
 #
 # ###########################################################################*/
 """
-This module provides functions to generate indices, to check intersection
-and to handle planes.
+This module provides functions to generate indices, to check intersection,
+to downsample volumes and to handle planes.
 """
 
 from __future__ import absolute_import, division, unicode_literals
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "25/07/2016"
+__date__ = "19/10/2026"
 
 
 import logging
@@ -544,6 +544,49 @@ def segmentVolumeIntersect(segment, nbins):
     return bins
 
 
+def downsampleVolume(data, factor, blockSize=16 * 2**20, cancelEvent=None):
+    """Downsample a 3D array by averaging blocks of factor^3 voxels.
+
+    The downsampling factor is clipped to the size of each dimension.
+    Trailing voxels which do not fill a whole block are discarded.
+
+    Data is read by slabs of slices, so it can be any 3D array-like
+    supporting slicing (e.g., h5py.Dataset) without loading it in memory.
+
+    :param data: 3D array-like
+    :param int factor: Downsampling factor
+    :param int blockSize: Approximate size in bytes of the slabs
+    :param threading.Event cancelEvent:
+        Optional event checked between slabs to stop the computation
+    :return: (downsampled data as float32,
+        downsampling factors as (dim0, dim1, dim2)),
+        or None if the computation was cancelled
+    :rtype: Union[List[Union[numpy.ndarray,List[int]]],None]
+    """
+    shape = data.shape
+    assert len(shape) == 3
+    factors = tuple(max(1, min(factor, size)) for size in shape)
+    depth, height, width = [size // f for size, f in zip(shape, factors)]
+    result = numpy.empty((depth, height, width), dtype=numpy.float32)
+
+    sliceSize = factors[0] * shape[1] * shape[2] * 4
+    nbSlices = max(1, blockSize // max(1, sliceSize))
+    for start in range(0, depth, nbSlices):
+        if cancelEvent is not None and cancelEvent.is_set():
+            return None
+        stop = min(start + nbSlices, depth)
+        slab = numpy.asarray(
+            data[start * factors[0]:stop * factors[0],
+                 :height * factors[1],
+                 :width * factors[2]],
+            dtype=numpy.float32)
+        result[start:stop] = slab.reshape(
+            stop - start, factors[0],
+            height, factors[1],
+            width, factors[2]).mean(axis=(1, 3, 5))
+    return result, factors
+
+
 # Plane #######################################################################
 
 class Plane(event.Notifier):
@@ -0,0 +1,200 @@
+# coding: utf-8
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Multithreaded CPU kernels for parallel-beam backprojection and projection.
+
+Both kernels use the same pixel-driven geometry as the OpenCL backprojector
+(:mod:`silx.opencl.backprojection`): for a pixel (row, col) of the slice and a
+projection angle theta, the detector position is::
+
+    h = axis[theta] + (col - center_x) * cos(theta) - (row - center_y) * sin(theta)
+
+and the sinogram is linearly interpolated at h.
+:func:`project` is the exact adjoint of :func:`backproject`.
+"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+
+cimport cython
+from cython.parallel import prange
+from libc.math cimport floor
+
+import os
+import numpy
+
+
+cdef int DEFAULT_NUM_THREADS
+if hasattr(os, 'sched_getaffinity'):
+    DEFAULT_NUM_THREADS = len(os.sched_getaffinity(0))
+elif os.cpu_count() is not None:
+    DEFAULT_NUM_THREADS = os.cpu_count()
+else:  # Fallback
+    DEFAULT_NUM_THREADS = 1
+
+
+def _get_num_threads(num_threads):
+    if num_threads is None or num_threads <= 0:
+        num_threads = int(os.environ.get("OMP_NUM_THREADS", DEFAULT_NUM_THREADS))
+    return max(1, num_threads)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def backproject(float[:, :, ::1] sinos not None,
+                float[::1] cos_angles not None,
+                float[::1] sin_angles not None,
+                float[::1] axis_positions not None,
+                float[:, :, ::1] output not None,
+                double center_x,
+                double center_y,
+                int angle_block=64,
+                num_threads=None):
+    """Backproject a stack of sinograms.
+
+    Slice rows are distributed over threads and projection angles are
+    processed by blocks, so that the sinogram lines of a block stay in cache
+    while a row is accumulated.
+
+    :param sinos: Stack of sinograms (n_slices, n_angles, n_bins)
+    :param cos_angles: Cosine of the projection angles (n_angles,)
+    :param sin_angles: Sine of the projection angles (n_angles,)
+    :param axis_positions: Position of the rotation axis on the detector
+        for each angle (n_angles,)
+    :param output: Stack of slices (n_slices, n_rows, n_columns), overwritten
+    :param float center_x: Column of the slice on the rotation axis
+    :param float center_y: Row of the slice on the rotation axis
+    :param int angle_block: Number of angles processed together
+    :param int num_threads: Number of threads to use (default: all CPUs)
+    """
+    cdef:
+        int n_slices = sinos.shape[0]
+        int n_angles = sinos.shape[1]
+        int n_bins = sinos.shape[2]
+        int n_rows = output.shape[1]
+        int n_cols = output.shape[2]
+        int nthreads = _get_num_threads(num_threads)
+        int line, slc, row, col, angle, block, n_blocks, angle_start, angle_end
+        int xm, xp
+        float x, y, h, acc, frac
+
+    if output.shape[0] != n_slices:
+        raise ValueError("Number of slices and of sinograms do not match")
+    if (cos_angles.shape[0] != n_angles or sin_angles.shape[0] != n_angles or
+            axis_positions.shape[0] != n_angles):
+        raise ValueError("Angles do not match the number of projections")
+    if angle_block < 1 or angle_block > n_angles:
+        angle_block = max(1, n_angles)
+    n_blocks = (n_angles + angle_block - 1) // angle_block
+
+    for line in prange(n_slices * n_rows, nogil=True, schedule="static",
+                       num_threads=nthreads):
+        slc = line // n_rows
+        row = line - slc * n_rows
+        y = row - center_y
+        for col in range(n_cols):
+            output[slc, row, col] = 0.0
+        for block in range(n_blocks):
+            angle_start = block * angle_block
+            angle_end = min(angle_start + angle_block, n_angles)
+            for col in range(n_cols):
+                x = col - center_x
+                acc = 0.0
+                for angle in range(angle_start, angle_end):
+                    h = (axis_positions[angle] + x * cos_angles[angle] -
+                         y * sin_angles[angle])
+                    if h < 0.0 or h >= n_bins:
+                        continue
+                    xm = <int> floor(h)
+                    xp = min(xm + 1, n_bins - 1)
+                    frac = h - xm
+                    acc = acc + (sinos[slc, angle, xm] * (1.0 - frac) +
+                                 sinos[slc, angle, xp] * frac)
+                output[slc, row, col] += acc
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def project(float[:, :, ::1] slices not None,
+            float[::1] cos_angles not None,
+            float[::1] sin_angles not None,
+            float[::1] axis_positions not None,
+            float[:, :, ::1] output not None,
+            double center_x,
+            double center_y,
+            num_threads=None):
+    """Project a stack of slices (adjoint of :func:`backproject`).
+
+    Each (slice, angle) sinogram line is computed by a single thread.
+
+    :param slices: Stack of slices (n_slices, n_rows, n_columns)
+    :param cos_angles: Cosine of the projection angles (n_angles,)
+    :param sin_angles: Sine of the projection angles (n_angles,)
+    :param axis_positions: Position of the rotation axis on the detector
+        for each angle (n_angles,)
+    :param output: Stack of sinograms (n_slices, n_angles, n_bins), overwritten
+    :param float center_x: Column of the slice on the rotation axis
+    :param float center_y: Row of the slice on the rotation axis
+    :param int num_threads: Number of threads to use (default: all CPUs)
+    """
+    cdef:
+        int n_slices = slices.shape[0]
+        int n_rows = slices.shape[1]
+        int n_cols = slices.shape[2]
+        int n_angles = output.shape[1]
+        int n_bins = output.shape[2]
+        int nthreads = _get_num_threads(num_threads)
+        int line, slc, row, col, angle, b
+        int xm, xp
+        float x, y, h, value, frac
+
+    if output.shape[0] != n_slices:
+        raise ValueError("Number of slices and of sinograms do not match")
+    if (cos_angles.shape[0] != n_angles or sin_angles.shape[0] != n_angles or
+            axis_positions.shape[0] != n_angles):
+        raise ValueError("Angles do not match the number of projections")
+
+    for line in prange(n_slices * n_angles, nogil=True, schedule="static",
+                       num_threads=nthreads):
+        slc = line // n_angles
+        angle = line - slc * n_angles
+        for b in range(n_bins):
+            output[slc, angle, b] = 0.0
+        for row in range(n_rows):
+            y = row - center_y
+            for col in range(n_cols):
+                h = (axis_positions[angle] + (col - center_x) * cos_angles[angle] -
+                     y * sin_angles[angle])
+                if h < 0.0 or h >= n_bins:
+                    continue
+                value = slices[slc, row, col]
+                xm = <int> floor(h)
+                xp = min(xm + 1, n_bins - 1)
+                frac = h - xm
+                output[slc, angle, xm] += value * (1.0 - frac)
+                output[slc, angle, xp] += value * frac
@@ -1,6 +1,6 @@
 # coding: utf-8
 # /*##########################################################################
-# Copyright (C) 2017 European Synchrotron Radiation Facility
+# Copyright (C) 2017-2026 European Synchrotron Radiation Facility
 #
 # Permission is hereby granted, free of charge, to any person obtaining a copy
 # of this software and associated documentation files (the "Software"), to deal
@@ -21,5 +21,183 @@
 # THE SOFTWARE.
 #
 # ############################################################################*/
+"""This module provides (filtered) backprojection of parallel-beam sinograms.
 
-from silx.opencl.backprojection import *
+:class:`Backprojection` is the OpenCL implementation from
+:mod:`silx.opencl.backprojection` when OpenCL is available, and
+:class:`CpuBackprojection` otherwise.
+"""
+
+__authors__ = ["P. Paleo", "J. Kieffer"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+import logging
+
+import numpy
+
+from .tomography import SinoFilter as _SinoFilter
+from ._backprojection import backproject as _backproject
+
+_logger = logging.getLogger(__name__)
+
+
+class CpuBackprojection(object):
+    """Multithreaded CPU (filtered) backprojection.
+
+    It provides the same API and geometry as
+    :class:`silx.opencl.backprojection.Backprojection`, and also accepts
+    stacks of sinograms (n_slices, n_angles, n_bins).
+
+    :param sino_shape: shape of the sinogram (n_angles, n_bins).
+    :param slice_shape: Optional, shape of the reconstructed slice. By
+                        default, it is a square slice where the dimension
+                        is the number of bins.
+    :param axis_position: Optional, axis position. Default is
+                          `(shape[1]-1)/2.0`.
+    :param angles: Optional, a list of custom angles in radian.
+    :param filter_name: Optional, name of the filter for FBP. Default is
+                        the Ram-Lak filter.
+    :param extra_options: Advanced extra options in the form of a dict.
+        Current options are: cutoff, gpu_offset_x, gpu_offset_y,
+        fft_backend, angle_block, slice_batch
+    :param int num_threads: Number of threads, default is all CPUs.
+    """
+
+    def __init__(self, sino_shape, slice_shape=None, axis_position=None,
+                 angles=None, filter_name=None, extra_options=None,
+                 num_threads=None, **kwargs):
+        if kwargs:
+            _logger.debug("Ignored OpenCL parameters: %s", list(kwargs.keys()))
+        if len(sino_shape) != 2:
+            raise ValueError("Expected a 2D sinogram shape, got %s" % (sino_shape,))
+        self.shape = tuple(sino_shape)
+        self.num_projs, self.num_bins = self.shape
+        if slice_shape is None:
+            self.slice_shape = (self.num_bins, self.num_bins)
+        else:
+            self.slice_shape = tuple(slice_shape)
+        if axis_position:
+            self.axis_pos = numpy.float32(axis_position)
+        else:
+            self.axis_pos = numpy.float32((self.num_bins - 1.) / 2)
+        self.num_threads = num_threads
+
+        self.extra_options = {
+            "cutoff": 1.,
+            "gpu_offset_x": 0.,
+            "gpu_offset_y": 0.,
+            "fft_backend": None,
+            "angle_block": 64,
+            "slice_batch": 8,
+        }
+        if extra_options is not None:
+            self.extra_options.update(extra_options)
+
+        self.angles = angles
+        if self.angles is None:
+            self.angles = numpy.linspace(0, numpy.pi, self.num_projs, False)
+        self._cos = numpy.ascontiguousarray(numpy.cos(self.angles), dtype=numpy.float32)
+        self._sin = numpy.ascontiguousarray(numpy.sin(self.angles), dtype=numpy.float32)
+        self._axes = numpy.full(self.num_projs, self.axis_pos, dtype=numpy.float32)
+
+        self.filter_name = filter_name or "ram-lak"
+        self.sino_filter = _SinoFilter(
+            self.shape,
+            filter_name=self.filter_name,
+            batch_size=self.extra_options["slice_batch"],
+            backend=self.extra_options["fft_backend"],
+            extra_options={"cutoff": self.extra_options["cutoff"]},
+        )
+
+    def _check_input(self, sino):
+        sino = numpy.asarray(sino)
+        if sino.ndim not in (2, 3) or sino.shape[-2:] != self.shape:
+            raise ValueError("Expected sinogram shape %s, got %s" %
+                             (self.shape, sino.shape))
+        return sino
+
+    def _get_output(self, sino, output):
+        shape = sino.shape[:-2] + self.slice_shape
+        if output is None:
+            return numpy.empty(shape, dtype=numpy.float32)
+        if output.shape != shape:
+            raise ValueError("Expected output shape %s, got %s" %
+                             (shape, output.shape))
+        return output
+
+    def _backproject_stack(self, sinos, output):
+        """Backproject a 3D stack of (filtered) float32 sinograms"""
+        direct = (output.dtype == numpy.float32 and
+                  output.flags["C_CONTIGUOUS"])
+        result = output if direct else numpy.empty(output.shape, numpy.float32)
+        _backproject(
+            numpy.ascontiguousarray(sinos, dtype=numpy.float32),
+            self._cos, self._sin, self._axes, result,
+            self.axis_pos - self.extra_options["gpu_offset_x"],
+            self.axis_pos - self.extra_options["gpu_offset_y"],
+            angle_block=self.extra_options["angle_block"],
+            num_threads=self.num_threads)
+        if not direct:
+            output[...] = result
+
+    def backprojection(self, sino, output=None):
+        """Perform the backprojection on an input sinogram
+
+        :param sino: sinogram (n_angles, n_bins) or stack of sinograms
+            (n_slices, n_angles, n_bins).
+        :param output: optional, output slice(s).
+            If provided, the result will be written in this array.
+        :return: backprojection of sinogram
+        """
+        sino = self._check_input(sino)
+        res = self._get_output(sino, output)
+        if sino.ndim == 2:
+            self._backproject_stack(sino[numpy.newaxis], res[numpy.newaxis])
+        else:
+            self._backproject_stack(sino, res)
+        return res
+
+    def filtered_backprojection(self, sino, output=None):
+        """
+        Compute the filtered backprojection (FBP) on a sinogram.
+
+        Stacks of sinograms are processed by batches of
+        `extra_options["slice_batch"]` sinograms.
+
+        :param sino: sinogram (n_angles, n_bins) or stack of sinograms
+            (n_slices, n_angles, n_bins).
+        :param output: optional, output slice(s).
+            If nothing is provided, a new numpy array is returned.
+        """
+        sino = self._check_input(sino)
+        res = self._get_output(sino, output)
+        sinos = sino if sino.ndim == 3 else sino[numpy.newaxis]
+        slices = res if res.ndim == 3 else res[numpy.newaxis]
+        batch = self.sino_filter.batch_size
+        filtered = numpy.empty((min(batch, len(sinos)),) + self.shape, numpy.float32)
+        for start in range(0, len(sinos), batch):
+            stop = min(start + batch, len(sinos))
+            buffer_ = filtered[:stop - start]
+            self.sino_filter(sinos[start:stop], output=buffer_)
+            self._backproject_stack(buffer_, slices[start:stop])
+        return res
+
+    __call__ = filtered_backprojection
+
+
+try:
+    from silx.opencl.common import ocl as _ocl
+except ImportError:
+    _ocl = None
+
+if _ocl is not None:
+    try:
+        from silx.opencl.backprojection import *  # noqa
+    except ImportError:
+        _ocl = None
+
+if _ocl is None:
+    # pyopencl missing, or no OpenCL platform/device available
+    _logger.debug("OpenCL backprojection not available, using CPU implementation")
+    Backprojection = CpuBackprojection
@@ -28,6 +28,8 @@ The main implementation is done by :class:`MarchingSquaresMergeImpl`. It was
 designed to speed up the computation of iso surface using Cython and OpenMP.
 It also provides features like support of mask, and cache of min/max per tiles
 which is very efficient to find many iso contours from image gradient.
+Many levels can be requested at once, in which case the tiles of all the
+levels are processed in a single parallel sweep.
 
 Utilitary functions are provided as facade for simple use.
 :meth:`find_contours` to find iso contours from an image and using the same
@@ -38,16 +40,21 @@ points of the iso contours.
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "02/07/2018"
+__date__ = "19/10/2026"
 
 
+import numpy
+
 from ._mergeimpl import MarchingSquaresMergeImpl
 
 
-def _factory(engine, image, mask):
+def _factory(engine, image, mask, level):
     """Factory to create the marching square implementation from the engine
     name"""
     if engine == "merge":
+        if numpy.ndim(level) != 0:
+            # The min/max cache skips tiles when processing many levels
+            return MarchingSquaresMergeImpl(image, mask, use_minmax_cache=True)
         return MarchingSquaresMergeImpl(image, mask)
     elif engine == "skimage":
         from _skimage import MarchingSquaresSciKitImage
@@ -64,6 +71,7 @@ def find_pixels(image, level, mask=None):
     iso contour algorithm.
 
     The result is returned as a numpy array storing a list of coordinates y/x.
+    If a sequence of levels is provided, a list of such arrays is returned.
 
     .. code-block:: python
 
@@ -74,17 +82,18 @@ def find_pixels(image, level, mask=None):
         pixels = silx.image.marchingsquares.find_pixels(image, 0.5, mask=mask)
 
     :param numpy.ndarray image: Image to process
-    :param float level: Level of the requested iso contours.
+    :param Union[float,List[float]] level: Level of the requested iso
+        contours, or a sequence of levels.
     :param numpy.ndarray mask: An optional mask (a non-zero value invalidate
         the pixels of the image)
-    :returns: An array of coordinates in y/x
-    :rtype: numpy.ndarray
+    :returns: An array of coordinates in y/x, or a list of such arrays
+    :rtype: Union[numpy.ndarray,List[numpy.ndarray]]
     """
     assert(image is not None)
     if mask is not None:
         assert(image.shape == mask.shape)
     engine = "merge"
-    impl = _factory(engine, image, mask)
+    impl = _factory(engine, image, mask, level)
     return impl.find_pixels(level)
 
 
@@ -93,6 +102,8 @@ def find_contours(image, level, mask=None):
     Find the iso contours at the given `level`.
 
     The result is returned as a list of polygons.
+    If a sequence of levels is provided, a list of such lists is returned,
+    all the levels being processed in a single parallel sweep.
 
     .. code-block:: python
 
@@ -103,15 +114,17 @@ def find_contours(image, level, mask=None):
         polygons = silx.image.marchingsquares.find_contours(image, 0.5, mask=mask)
 
     :param numpy.ndarray image: Image to process
-    :param float level: Level of the requested iso contours.
+    :param Union[float,List[float]] level: Level of the requested iso
+        contours, or a sequence of levels.
     :param numpy.ndarray mask: An optional mask (a non-zero value invalidate
         the pixels of the image)
-    :returns: A list of array containing y-x coordinates of points
-    :rtype: List[numpy.ndarray]
+    :returns: A list of array containing y-x coordinates of points, or a list
+        of such lists
+    :rtype: Union[List[numpy.ndarray],List[List[numpy.ndarray]]]
     """
     assert(image is not None)
     if mask is not None:
         assert(image.shape == mask.shape)
     engine = "merge"
-    impl = _factory(engine, image, mask)
+    impl = _factory(engine, image, mask, level)
     return impl.find_contours(level)
@@ -27,7 +27,7 @@ Marching squares implementation based on a merge of segements and polygons.
 
 __authors__ = ["Almar Klein", "Jerome Kieffer", "Valentin Valls"]
 __license__ = "MIT"
-__date__ = "23/04/2018"
+__date__ = "19/10/2026"
 
 import numpy
 cimport numpy as cnumpy
@@ -140,56 +140,110 @@ cdef class _MarchingSquaresAlgorithm(object):
 
         :param level: The level expected.
         """
+        self.marching_squares_levels(&level, 1, &self._final_context)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    cdef void marching_squares_levels(self,
+                                      cnumpy.float64_t *levels,
+                                      int nb_levels,
+                                      TileContext **results) nogil:
+        """
+        Execute the marching squares on many levels at once.
+
+        The tiles of all the levels are processed in a single OpenMP sweep,
+        then the contexts of each level are reduced one level after the
+        other.
+
+        :param levels: Array of the levels expected
+        :param nb_levels: Number of levels
+        :param results: Array receiving the final context of each level
+        """
         cdef:
-            TileContext** contexts
+            TileContext*** contexts
             TileContext** valid_contexts
-            int nb_contexts, nb_valid_contexts
-            int i, j
-            TileContext* context
+            cnumpy.float64_t* valid_levels
+            int* nb_valid_contexts
+            int nb_contexts, nb_jobs
+            int i, j, l
             int dim_x, dim_y
 
-        contexts = self.create_contexts(level, &dim_x, &dim_y, &nb_valid_contexts)
+        contexts = <TileContext ***>libc.stdlib.malloc(nb_levels * sizeof(TileContext**))
+        nb_valid_contexts = <int *>libc.stdlib.malloc(nb_levels * sizeof(int))
+        nb_jobs = 0
+        for l in range(nb_levels):
+            contexts[l] = self.create_contexts(levels[l], &dim_x, &dim_y, &nb_valid_contexts[l])
+            nb_jobs += nb_valid_contexts[l]
         nb_contexts = dim_x * dim_y
 
-        if nb_valid_contexts == 0:
-            # shortcut
-            self._final_context = new TileContext()
-            libc.stdlib.free(contexts)
-            return
-
+        # flatten the tiles of all the levels
+        valid_contexts = <TileContext **>libc.stdlib.malloc(nb_jobs * sizeof(TileContext*))
+        valid_levels = <cnumpy.float64_t *>libc.stdlib.malloc(nb_jobs * sizeof(cnumpy.float64_t))
         j = 0
-        valid_contexts = <TileContext **>libc.stdlib.malloc(nb_valid_contexts * sizeof(TileContext*))
-        for i in xrange(nb_contexts):
-            if contexts[i] != NULL:
-                valid_contexts[j] = contexts[i]
-                j += 1
+        for l in range(nb_levels):
+            for i in range(nb_contexts):
+                if contexts[l][i] != NULL:
+                    valid_contexts[j] = contexts[l][i]
+                    valid_levels[j] = levels[l]
+                    j += 1
 
         # openmp
-        for i in prange(nb_valid_contexts, nogil=True):
-            self.marching_squares_mp(valid_contexts[i], level)
+        for i in prange(nb_jobs, nogil=True):
+            self.marching_squares_mp(valid_contexts[i], valid_levels[i])
+
+        # the reduction of each level is already parallel
+        for l in range(nb_levels):
+            results[l] = self.reduction(dim_x, dim_y, contexts[l], nb_valid_contexts[l])
+
+        for l in range(nb_levels):
+            libc.stdlib.free(contexts[l])
+        libc.stdlib.free(contexts)
+        libc.stdlib.free(nb_valid_contexts)
+        libc.stdlib.free(valid_contexts)
+        libc.stdlib.free(valid_levels)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    cdef TileContext* reduction(self,
+                                int dim_x,
+                                int dim_y,
+                                TileContext **contexts,
+                                int nb_valid_contexts) nogil:
+        """
+        Reduce the contexts of a level into a single one.
+
+        :param dim_x: Number of contexts in the x dimension
+        :param dim_y: Number of contexts in the y dimension
+        :param contexts: Array of contexts, `NULL` for skipped tiles
+        :param nb_valid_contexts: Number of non-`NULL` contexts
+        :return: The final context
+        """
+        cdef:
+            int i
+
+        if nb_valid_contexts == 0:
+            # shortcut
+            return new TileContext()
 
         if nb_valid_contexts == 1:
             # shortcut
-            self._final_context = valid_contexts[0]
-            libc.stdlib.free(valid_contexts)
-            libc.stdlib.free(contexts)
-            return
+            for i in range(dim_x * dim_y):
+                if contexts[i] != NULL:
+                    return contexts[i]
 
         if self._force_sequencial_reduction:
-            self.sequencial_reduction(nb_valid_contexts, valid_contexts)
+            return self.sequencial_reduction(dim_x * dim_y, contexts)
         # FIXME can only be used if compiled with openmp
         # elif copenmp.omp_get_num_threads() <= 1:
-        #     self._sequencial_reduction(nb_valid_contexts, valid_contexts)
-        else:
-            self.reduction_2d(dim_x, dim_y, contexts)
-
-        libc.stdlib.free(valid_contexts)
-        libc.stdlib.free(contexts)
+        #     return self._sequencial_reduction(dim_x * dim_y, contexts)
+        return self.reduction_2d(dim_x, dim_y, contexts)
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.cdivision(True)
-    cdef void reduction_2d(self, int dim_x, int dim_y, TileContext **contexts) nogil:
+    cdef TileContext* reduction_2d(self, int dim_x, int dim_y, TileContext **contexts) nogil:
         """
         Reduce the problem merging first neighbours together in a recursive
         process. Optimized with OpenMP.
@@ -197,6 +251,7 @@ cdef class _MarchingSquaresAlgorithm(object):
         :param dim_x: Number of contexts in the x dimension
         :param dim_y: Number of contexts in the y dimension
         :param contexts: Array of contexts
+        :return: The final context
         """
         cdef:
             int x1, y1, x2, y2, i1, i2
@@ -230,7 +285,7 @@ cdef class _MarchingSquaresAlgorithm(object):
                         x2 = x2 + delta + delta
             delta <<= 1
 
-        self._final_context = contexts[0]
+        return contexts[0]
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
@@ -264,23 +319,26 @@ cdef class _MarchingSquaresAlgorithm(object):
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.cdivision(True)
-    cdef void sequencial_reduction(self,
-                                   int nb_contexts,
-                                   TileContext **contexts) nogil:
+    cdef TileContext* sequencial_reduction(self,
+                                           int nb_contexts,
+                                           TileContext **contexts) nogil:
         """
         Reduce the problem sequencially without taking care of the topology
 
         :param nb_contexts: Number of contexts
         :param contexts: Array of contexts
+        :return: The final context
         """
         cdef:
             int i
+            TileContext* final_context
         # merge
-        self._final_context = new TileContext()
+        final_context = new TileContext()
         for i in xrange(nb_contexts):
             if contexts[i] != NULL:
-                self.merge_context(self._final_context, contexts[i])
+                self.merge_context(final_context, contexts[i])
                 del contexts[i]
+        return final_context
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
@@ -1081,6 +1139,15 @@ cdef class MarchingSquaresMergeImpl(object):
         for level in levels:
             polygons = ms.find_contours(level=level)
 
+    .. code-block:: python
+
+        # Many levels processed together in a single parallel sweep
+        shape = 1000, 1000
+        image = numpy.random.random(shape)
+        ms = MarchingSquaresMergeImpl(image, use_minmax_cache=True)
+        levels = numpy.arange(0, 1, 0.05)
+        polygons_per_level = ms.find_contours(level=levels)
+
     .. code-block:: python
 
         # Efficient cache using multi requests
@@ -1249,71 +1316,130 @@ cdef class MarchingSquaresMergeImpl(object):
             context_y = icontext // context_dim_x
             self._compute_minmax_on_block(context_x, context_y, icontext)
 
+    cdef _init_algo(self, _MarchingSquaresAlgorithm algo):
+        """
+        Share the image, the mask and the min/max cache with an algorithm.
+        """
+        if self._use_minmax_cache and self._min_cache == NULL:
+            self._create_minmax_cache()
+        algo._image_ptr = self._image_ptr
+        algo._mask_ptr = self._mask_ptr
+        algo._dim_x = self._dim_x
+        algo._dim_y = self._dim_y
+        algo._group_size = self._group_size
+        algo._use_minmax_cache = self._use_minmax_cache
+        algo._force_sequencial_reduction = COMPILED_WITH_OPENMP == 0
+        if self._use_minmax_cache:
+            algo._min_cache = self._min_cache
+            algo._max_cache = self._max_cache
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
-    @cython.cdivision(True)
+    cdef TileContext** _process_levels(self, _MarchingSquaresAlgorithm algo, levels):
+        """
+        Execute the marching squares on many levels at once.
+
+        :param algo: The algorithm to use
+        :param levels: 1d-array of levels, not empty
+        :return: A malloc-ed array containing the final context of each level
+        """
+        cdef:
+            cnumpy.float64_t[::1] c_levels
+            TileContext** contexts
+            int nb_levels
+
+        c_levels = numpy.ascontiguousarray(levels, dtype=numpy.float64)
+        nb_levels = len(c_levels)
+        contexts = <TileContext **>libc.stdlib.malloc(nb_levels * sizeof(TileContext*))
+        algo.marching_squares_levels(&c_levels[0], nb_levels, contexts)
+        return contexts
+
     def find_pixels(self, level):
         """
         Compute the pixels from the image over the requested iso contours
         at this `level`. Pixels are those over the bound of the segments.
 
-        :param float level: Level of the requested iso contours.
-        :returns: An array of y-x coordinates.
-        :rtype: numpy.ndarray
+        If a sequence of levels is provided, they are all processed together
+        in a single parallel sweep, and a list of results is returned in the
+        same order.
+
+        :param Union[float,List[float]] level: Level of the requested iso
+            contours, or a sequence of levels.
+        :returns: An array of y-x coordinates, or a list of such arrays
+        :rtype: Union[numpy.ndarray,List[numpy.ndarray]]
         """
-        if self._use_minmax_cache and self._min_cache == NULL:
-            self._create_minmax_cache()
+        cdef:
+            _MarchingSquaresPixels algo
+            TileContext** contexts
+            size_t i
 
         if self._pixels_algo is None:
-            algo = _MarchingSquaresPixels()
-            algo._image_ptr = self._image_ptr
-            algo._mask_ptr = self._mask_ptr
-            algo._dim_x = self._dim_x
-            algo._dim_y = self._dim_y
-            algo._group_size = self._group_size
-            algo._use_minmax_cache = self._use_minmax_cache
-            algo._force_sequencial_reduction = COMPILED_WITH_OPENMP == 0
-            if self._use_minmax_cache:
-                algo._min_cache = self._min_cache
-                algo._max_cache = self._max_cache
-            self._pixels_algo = algo
-        else:
-            algo = self._pixels_algo
+            self._pixels_algo = _MarchingSquaresPixels()
+            self._init_algo(self._pixels_algo)
+        algo = self._pixels_algo
 
-        algo.marching_squares(level)
-        pixels = algo.extract_pixels()
-        return pixels
+        if numpy.ndim(level) == 0:
+            algo.marching_squares(level)
+            return algo.extract_pixels()
+
+        levels = numpy.array(level, dtype=numpy.float64).ravel()
+        if len(levels) == 0:
+            return []
+        contexts = self._process_levels(algo, levels)
+        try:
+            result = []
+            for i in range(len(levels)):
+                algo._final_context = contexts[i]
+                contexts[i] = NULL
+                result.append(algo.extract_pixels())
+        finally:
+            for i in range(len(levels)):
+                if contexts[i] != NULL:
+                    del contexts[i]
+            libc.stdlib.free(contexts)
+        return result
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
-    @cython.cdivision(True)
     def find_contours(self, level=None):
         """
         Compute the list of polygons of the iso contours at this `level`.
 
-        :param float level: Level of the requested iso contours.
-        :returns: A list of array containg y-x coordinates of points
-        :rtype: List[numpy.ndarray]
+        If a sequence of levels is provided, they are all processed together
+        in a single parallel sweep, and a list of results is returned in the
+        same order.
+
+        :param Union[float,List[float]] level: Level of the requested iso
+            contours, or a sequence of levels.
+        :returns: A list of array containg y-x coordinates of points, or a
+            list of such lists
+        :rtype: Union[List[numpy.ndarray],List[List[numpy.ndarray]]]
         """
-        if self._use_minmax_cache and self._min_cache == NULL:
-            self._create_minmax_cache()
+        cdef:
+            _MarchingSquaresContours algo
+            TileContext** contexts
+            size_t i
 
         if self._contours_algo is None:
-            algo = _MarchingSquaresContours()
-            algo._image_ptr = self._image_ptr
-            algo._mask_ptr = self._mask_ptr
-            algo._dim_x = self._dim_x
-            algo._dim_y = self._dim_y
-            algo._group_size = self._group_size
-            algo._use_minmax_cache = self._use_minmax_cache
-            algo._force_sequencial_reduction = COMPILED_WITH_OPENMP == 0
-            if self._use_minmax_cache:
-                algo._min_cache = self._min_cache
-                algo._max_cache = self._max_cache
-            self._contours_algo = algo
-        else:
-            algo = self._contours_algo
+            self._contours_algo = _MarchingSquaresContours()
+            self._init_algo(self._contours_algo)
+        algo = self._contours_algo
 
-        algo.marching_squares(level)
-        polygons = algo.extract_polygons()
-        return polygons
+        if numpy.ndim(level) == 0:
+            algo.marching_squares(level)
+            return algo.extract_polygons()
+
+        levels = numpy.array(level, dtype=numpy.float64).ravel()
+        if len(levels) == 0:
+            return []
+        contexts = self._process_levels(algo, levels)
+        try:
+            result = []
+            for i in range(len(levels)):
+                algo._final_context = contexts[i]
+                contexts[i] = NULL
+                result.append(algo.extract_polygons())
+        finally:
+            for i in range(len(levels)):
+                if contexts[i] != NULL:
+                    del contexts[i]
+            libc.stdlib.free(contexts)
+        return result
@@ -25,7 +25,7 @@
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "17/04/2018"
+__date__ = "19/10/2026"
 
 import unittest
 import numpy
@@ -36,11 +36,12 @@ class MockMarchingSquares(object):
 
     last = None
 
-    def __init__(self, image, mask=None):
+    def __init__(self, image, mask=None, use_minmax_cache=False):
         MockMarchingSquares.last = self
         self.events = []
         self.events.append(("image", image))
         self.events.append(("mask", mask))
+        self.use_minmax_cache = use_minmax_cache
 
     def find_pixels(self, level):
         self.events.append(("find_pixels", level))
@@ -90,3 +91,11 @@ class TestFunctionalApi(unittest.TestCase):
         self.assertEqual(events[1][1][0, 0], 0)
         self.assertEqual(events[2][0], "find_pixels")
         self.assertEqual(events[2][1], level)
+
+    def test_many_levels_find_contours(self):
+        image = numpy.ones((2, 2), dtype=numpy.float32)
+        levels = [0.5, 2.5]
+        silx.image.marchingsquares.find_contours(image=image, level=levels)
+        last = MockMarchingSquares.last
+        self.assertTrue(last.use_minmax_cache)
+        self.assertEqual(last.events[2], ("find_contours", levels))
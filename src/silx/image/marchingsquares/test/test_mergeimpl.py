@@ -262,3 +262,31 @@ class TestMergeImplContours(unittest.TestCase):
         polygons = ms.find_contours(0.5)
         self.assertEqual(len(polygons), 11)
         self.assertEqual(self.count_closed_polygons(polygons), 3)
+
+    def test_many_levels(self):
+        x, y = numpy.ogrid[-numpy.pi:numpy.pi:100j, -numpy.pi:numpy.pi:100j]
+        image = numpy.sin(numpy.exp((numpy.sin(x)**3 + numpy.cos(y)**2)))
+        mask = numpy.zeros(image.shape, dtype=numpy.int8)
+        mask[40:60, 10:30] = 1
+        levels = [-2., 0.1, 0.5, 0.9]
+        for use_minmax_cache in (False, True):
+            ms = MarchingSquaresMergeImpl(image, mask, group_size=30,
+                                          use_minmax_cache=use_minmax_cache)
+            all_polygons = ms.find_contours(levels)
+            all_pixels = ms.find_pixels(levels)
+            self.assertEqual(len(all_polygons), len(levels))
+            self.assertEqual(len(all_pixels), len(levels))
+            self.assertEqual(all_polygons[0], [])
+            for level, polygons, pixels in zip(levels, all_polygons, all_pixels):
+                expected = ms.find_contours(level)
+                self.assertEqual(len(polygons), len(expected))
+                self.assertEqual(
+                    sorted(p.tobytes() for p in polygons),
+                    sorted(p.tobytes() for p in expected))
+                numpy.testing.assert_array_equal(pixels, ms.find_pixels(level))
+
+    def test_no_levels(self):
+        image = numpy.ones((10, 10), dtype=numpy.float32)
+        ms = MarchingSquaresMergeImpl(image)
+        self.assertEqual(ms.find_contours([]), [])
+        self.assertEqual(ms.find_pixels([]), [])
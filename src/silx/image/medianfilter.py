@@ -24,16 +24,18 @@
 
 """
 This module provides :func:`medfilt2d`, a 2D median filter function
-with the choice between 2 implementations: 'cpp' and 'opencl'.
+with the choice between 3 implementations: 'cpp', 'histogram' and 'opencl'.
 """
 
 __authors__ = ["H. Payno"]
 __license__ = "MIT"
-__date__ = "04/05/2017"
+__date__ = "19/10/2026"
 
 
 import logging
 
+import numpy
+
 from silx.math import medianfilter as medianfilter_cpp
 from silx.opencl import ocl as _ocl
 if _ocl is not None:
@@ -45,7 +47,7 @@ else:  # No OpenCL device or pyopencl not installed
 _logger = logging.getLogger(__name__)
 
 
-MEDFILT_ENGINES = ['cpp', 'opencl']
+MEDFILT_ENGINES = ['cpp', 'histogram', 'opencl']
 
 
 def medfilt2d(image, kernel_size=3, engine='cpp'):
@@ -65,12 +67,16 @@ def medfilt2d(image, kernel_size=3, engine='cpp'):
         Default: (3, 3)
     :type kernel_size: A int or a list of 2 int (kernel_height, kernel_width)
     :param engine: the type of implementation to use.
-        Valid values are: 'cpp' (default) and 'opencl'
+        Valid values are: 'cpp' (default), 'histogram' and 'opencl'.
+        'histogram' is a sliding histogram implementation for uint8 and
+        uint16 images, which is much faster for large kernels.
 
     :returns: the array with the median value for each pixel.
 
     .. note::  if the opencl implementation is requested but
         is not present or fails, the cpp implementation is called.
+        The same applies if the histogram implementation is requested
+        for an unsupported data type.
 
     """
     if engine not in MEDFILT_ENGINES:
@@ -85,6 +91,17 @@ def medfilt2d(image, kernel_size=3, engine='cpp'):
         return medianfilter_cpp.medfilt(data=image,
                                         kernel_size=kernel_size,
                                         conditional=False)
+    elif engine == 'histogram':
+        if image.dtype not in (numpy.uint8, numpy.uint16):
+            _logger.warning('histogram median filter not available for %s. '
+                            'Launching cpp implementation.', image.dtype)
+            return medianfilter_cpp.medfilt(data=image,
+                                            kernel_size=kernel_size,
+                                            conditional=False)
+        return medianfilter_cpp.medfilt(data=numpy.ascontiguousarray(image),
+                                        kernel_size=kernel_size,
+                                        conditional=False,
+                                        engine='histogram')
     elif engine == 'opencl':
         if medfilt_opencl is None:
             wrn = 'opencl median filter not available. '
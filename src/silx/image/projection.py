@@ -1,6 +1,6 @@
 # coding: utf-8
 # /*##########################################################################
-# Copyright (C) 2017 European Synchrotron Radiation Facility
+# Copyright (C) 2017-2026 European Synchrotron Radiation Facility
 #
 # Permission is hereby granted, free of charge, to any person obtaining a copy
 # of this software and associated documentation files (the "Software"), to deal
@@ -21,5 +21,112 @@
 # THE SOFTWARE.
 #
 # ############################################################################*/
+"""This module provides tomographic projection (Radon transform) of slices.
 
-from silx.opencl.projection import *
+:class:`Projection` is the OpenCL implementation from
+:mod:`silx.opencl.projection` when OpenCL is available, and
+:class:`CpuProjection` otherwise.
+"""
+
+__authors__ = ["P. Paleo", "J. Kieffer"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+import logging
+
+import numpy
+
+from ._backprojection import project as _project
+
+_logger = logging.getLogger(__name__)
+
+
+class CpuProjection(object):
+    """Multithreaded CPU projector, adjoint of
+    :class:`silx.image.backprojection.CpuBackprojection`.
+
+    :param slice_shape: shape of the slice: (num_rows, num_columns).
+    :param angles: Either an integer number of angles, or a list of custom
+                   angles values in radian.
+    :param axis_position: Optional, axis position on the detector.
+                          Default is `(detector_width-1)/2.0`.
+    :param detector_width: Optional, detector width in pixels.
+                           Default is the number of columns of the slice.
+    :param normalize: Optional, normalization. If set, the sinograms are
+                      multiplied by the factor pi/(2*nprojs).
+    :param int num_threads: Number of threads, default is all CPUs.
+    """
+
+    def __init__(self, slice_shape, angles, axis_position=None,
+                 detector_width=None, normalize=False, num_threads=None,
+                 **kwargs):
+        if kwargs:
+            _logger.debug("Ignored OpenCL parameters: %s", list(kwargs.keys()))
+        self.shape = tuple(slice_shape)
+        self.dwidth = detector_width or self.shape[1]
+        if axis_position is None:
+            axis_position = (self.dwidth - 1) / 2.
+        self.axis_pos = axis_position
+        self.normalize = normalize
+        self.num_threads = num_threads
+
+        if not numpy.iterable(angles):
+            if angles is None:
+                self.nprojs = self.shape[0]
+            else:
+                self.nprojs = angles
+            angles = numpy.linspace(start=0, stop=numpy.pi,
+                                    num=self.nprojs, endpoint=False)
+        else:
+            self.nprojs = len(angles)
+        self.angles = numpy.asarray(angles, dtype=numpy.float32)
+        self._cos = numpy.ascontiguousarray(numpy.cos(self.angles), dtype=numpy.float32)
+        self._sin = numpy.ascontiguousarray(numpy.sin(self.angles), dtype=numpy.float32)
+        self._axes = numpy.full(self.nprojs, self.axis_pos, dtype=numpy.float32)
+
+    def projection(self, image, dst=None):
+        """Perform the projection on an input image
+
+        :param image: Image (num_rows, num_columns) or stack of images
+            (n_slices, num_rows, num_columns) to project
+        :param dst: Optional output array
+        :return: A sinogram (or a stack of sinograms)
+        """
+        image = numpy.asarray(image)
+        if image.ndim not in (2, 3) or image.shape[-2:] != self.shape:
+            raise ValueError("Expected image shape %s, got %s" %
+                             (self.shape, image.shape))
+        images = image if image.ndim == 3 else image[numpy.newaxis]
+        sinos = numpy.empty((len(images), self.nprojs, self.dwidth), numpy.float32)
+        _project(
+            numpy.ascontiguousarray(images, dtype=numpy.float32),
+            self._cos, self._sin, self._axes, sinos,
+            (self.shape[1] - 1) / 2., (self.shape[0] - 1) / 2.,
+            num_threads=self.num_threads)
+        if self.normalize:
+            sinos *= numpy.pi / (2 * self.nprojs)
+        if image.ndim == 2:
+            sinos = sinos[0]
+        if dst is None:
+            return sinos
+        dst[...] = sinos
+        return dst
+
+    __call__ = projection
+
+
+try:
+    from silx.opencl.common import ocl as _ocl
+except ImportError:
+    _ocl = None
+
+if _ocl is not None:
+    try:
+        from silx.opencl.projection import *  # noqa
+    except ImportError:
+        _ocl = None
+
+if _ocl is None:
+    # pyopencl missing, or no OpenCL platform/device available
+    _logger.debug("OpenCL projection not available, using CPU implementation")
+    Projection = CpuProjection
@@ -24,7 +24,7 @@
 
 __authors__ = ["J. Kieffer"]
 __license__ = "MIT"
-__date__ = "05/04/2018"
+__date__ = "19/10/2026"
 
 from numpy.distutils.misc_util import Configuration
 
@@ -37,7 +37,14 @@ def configuration(parent_package='', top_path=None):
                          language='c')
     config.add_extension('shapes',
                          sources=["shapes.pyx"],
-                         language='c')
+                         language='c',
+                         extra_link_args=['-fopenmp'],
+                         extra_compile_args=['-fopenmp'])
+    config.add_extension('_backprojection',
+                         sources=["_backprojection.pyx"],
+                         language='c',
+                         extra_link_args=['-fopenmp'],
+                         extra_compile_args=['-fopenmp'])
     config.add_subpackage('marchingsquares')
     return config
 
@@ -27,7 +27,7 @@
 - :func:`circle_fill` function generates coordinates of a circle in an image.
 - :func:`draw_line` function generates coordinates of a line in an image.
 - :func:`polygon_fill_mask` function generates a mask from a set of points
-  defining a polygon.
+  defining a polygon, either full frame or limited to its bounding box.
 
 The :class:`Polygon` class provides checking if a point is inside a polygon.
 
@@ -37,10 +37,11 @@ for 2D coordinates.
 
 __authors__ = ["Jérôme Kieffer", "T. Vincent"]
 __license__ = "MIT"
-__date__ = "15/02/2019"
+__date__ = "19/10/2026"
 __status__ = "dev"
 
 
+from cython.parallel import prange
 cimport cython
 import numpy
 from libc.math cimport ceil, fabs
@@ -102,9 +103,101 @@ cdef class Polygon(object):
             pt1x, pt1y = pt2x, pt2y
         return is_inside
 
+    def _bounding_box(self, int height, int width):
+        """Returns the region of a (height, width) mask covered by the polygon
+
+        :return: (row_min, row_max, col_min, col_max) clipped to the mask,
+            (0, 0, 0, 0) if there is no overlap
+        """
+        cdef int row_min, row_max, col_min, col_max
+        if self.nvert == 0:
+            return 0, 0, 0, 0
+        vertices = numpy.asarray(self.vertices)
+        row_min = max(int(numpy.floor(vertices[:, 0].min())), 0)
+        row_max = min(int(numpy.floor(vertices[:, 0].max())) + 1, height)
+        col_min = max(int(numpy.floor(vertices[:, 1].min())), 0)
+        col_max = min(int(numpy.floor(vertices[:, 1].max())) + 1, width)
+        if row_min >= row_max or col_min >= col_max:
+            return 0, 0, 0, 0
+        return row_min, row_max, col_min, col_max
+
     @cython.cdivision(True)
     @cython.wraparound(False)
     @cython.boundscheck(False)
+    cdef void _fill(self,
+                    unsigned char[:, :] mask,
+                    int row_offset,
+                    int col_offset) nogil:
+        """Fill the polygon in a mask covering part of the image
+
+        Rows are processed in parallel.
+
+        :param mask: The mask to fill, initialized with zeros
+        :param int row_offset: Row in the image of the first row of the mask
+        :param int col_offset: Column in the image of the first column
+            of the mask
+        """
+        cdef float[:, :] vertices = self.vertices
+        cdef int nvert = self.nvert
+        cdef int height = mask.shape[0]
+        cdef int width = mask.shape[1]
+        cdef int col_min, col_max  # mask subpart to update
+        cdef int index, col, local_row  # Loop indixes
+        cdef float row
+        cdef float pt1x, pt1y, pt2x, pt2y  # segment end points
+        cdef int xinters, is_inside, current
+
+        for local_row in prange(height):
+            # For each line of the image, mark intersection of all segments
+            # in the line and then run a xor scan to fill inner parts
+            # Adapted from http://alienryderflex.com/polygon_fill/
+            row = local_row + row_offset
+            pt1x = vertices[nvert-1, 1]
+            pt1y = vertices[nvert-1, 0]
+            col_min = width - 1
+            col_max = 0
+            is_inside = 0  # Init with whether first col is inside or not
+
+            for index in range(nvert):
+                pt2x = vertices[index, 1]
+                pt2y = vertices[index, 0]
+
+                if ((pt1y <= row and row < pt2y) or
+                        (pt2y <= row and row < pt1y)):
+                    # Intersection casted to int so that ]x, x+1] => x
+                    xinters = (<int>ceil(pt1x + (row - pt1y) *
+                               (pt2x - pt1x) / (pt2y - pt1y))) - 1 - col_offset
+
+                    # Update column range to patch
+                    if xinters < col_min:
+                        col_min = xinters
+                    if xinters > col_max:
+                        col_max = xinters
+
+                    if xinters < 0:
+                        # Add an intersection to init value of xor scan
+                        is_inside = is_inside ^ 1
+                    elif xinters < width:
+                        # Mark intersection in mask
+                        mask[local_row, xinters] ^= 1
+                    # else: do not consider intersection on the right
+
+                pt1x = pt2x
+                pt1y = pt2y
+
+            if col_min < col_max:
+                # Clip column range to mask
+                if col_min < 0:
+                    col_min = 0
+                if col_max > width - 1:
+                    col_max = width - 1
+
+                # xor exclusive scan
+                for col in range(col_min, col_max + 1):
+                    current = mask[local_row, col]
+                    mask[local_row, col] = is_inside
+                    is_inside = current ^ is_inside
+
     def make_mask(self, int height, int width):
         """Create a mask array representing the filled polygon
 
@@ -112,81 +205,47 @@ cdef class Polygon(object):
         :param int width: Width of the mask array
         :return: 2D array (height, width)
         """
-        cdef unsigned char[:, :] mask = numpy.zeros((height, width),
-                                                    dtype=numpy.uint8)
-        cdef int row_min, row_max, col_min, col_max  # mask subpart to update
-        cdef int row, col, index  # Loop indixes
-        cdef float pt1x, pt1y, pt2x, pt2y  # segment end points
-        cdef int xinters, is_inside, current
+        mask = numpy.zeros((height, width), dtype=numpy.uint8)
+        row_min, row_max, col_min, col_max = self._bounding_box(height, width)
+        if row_min < row_max:
+            self._fill(mask[row_min:row_max, col_min:col_max], row_min, col_min)
+        return mask
+
+    def make_submask(self, int height, int width):
+        """Create a mask of the filled polygon limited to its bounding box
+
+        This avoids allocating and filling a full mask for a small polygon
+        in a large image.
+
+        :param int height: Height of the full mask
+        :param int width: Width of the full mask
+        :return: ((row, col) offset of the submask in the full mask, submask).
+            The submask is empty if the polygon does not overlap the mask.
+        :rtype: Tuple[Tuple[int,int],numpy.ndarray]
+        """
+        row_min, row_max, col_min, col_max = self._bounding_box(height, width)
+        mask = numpy.zeros((row_max - row_min, col_max - col_min),
+                           dtype=numpy.uint8)
+        if row_min < row_max:
+            self._fill(mask, row_min, col_min)
+        return (row_min, col_min), mask
+
 
-        row_min = max(int(min(self.vertices[:, 0])), 0)
-        row_max = min(int(max(self.vertices[:, 0])) + 1, height)
-
-        # Can be replaced by prange(row_min, row_max, nogil=True)
-        with nogil:
-            for row in range(row_min, row_max):
-                # For each line of the image, mark intersection of all segments
-                # in the line and then run a xor scan to fill inner parts
-                # Adapted from http://alienryderflex.com/polygon_fill/
-                pt1x = self.vertices[self.nvert-1, 1]
-                pt1y = self.vertices[self.nvert-1, 0]
-                col_min = width - 1
-                col_max = 0
-                is_inside = 0  # Init with whether first col is inside or not
-
-                for index in range(self.nvert):
-                    pt2x = self.vertices[index, 1]
-                    pt2y = self.vertices[index, 0]
-
-                    if ((pt1y <= row and row < pt2y) or
-                            (pt2y <= row and row < pt1y)):
-                        # Intersection casted to int so that ]x, x+1] => x
-                        xinters = (<int>ceil(pt1x + (row - pt1y) *
-                                   (pt2x - pt1x) / (pt2y - pt1y))) - 1
-
-                        # Update column range to patch
-                        if xinters < col_min:
-                            col_min = xinters
-                        if xinters > col_max:
-                            col_max = xinters
-
-                        if xinters < 0:
-                            # Add an intersection to init value of xor scan
-                            is_inside ^= 1
-                        elif xinters < width:
-                            # Mark intersection in mask
-                            mask[row, xinters] ^= 1
-                        # else: do not consider intersection on the right
-
-                    pt1x, pt1y = pt2x, pt2y
-
-                if col_min < col_max:
-                    # Clip column range to mask
-                    if col_min < 0:
-                        col_min = 0
-                    if col_max > width - 1:
-                        col_max = width - 1
-
-                    # xor exclusive scan
-                    for col in range(col_min, col_max + 1):
-                        current = mask[row, col]
-                        mask[row, col] = is_inside
-                        is_inside = current ^ is_inside
-
-        # Ensures the result is exported as numpy array and not memory view.
-        return numpy.asarray(mask)
-
-
-def polygon_fill_mask(vertices, shape):
+def polygon_fill_mask(vertices, shape, bbox=False):
     """Return a mask of boolean, True for pixels inside a polygon.
 
     :param vertices: Strip of segments end points (row, column) or (y, x)
     :type vertices: numpy.ndarray like container of dimension Nx2
     :param shape: size of the mask as (height, width)
     :type shape: 2-tuple of int
-    :return: Mask corresponding to the polygon
+    :param bool bbox: True to return only the part of the mask covered by
+        the bounding box of the polygon, see :meth:`Polygon.make_submask`.
+    :return: Mask corresponding to the polygon, or ((row, col), submask)
+        if bbox is True.
     :rtype: numpy.ndarray of dimension shape
     """
+    if bbox:
+        return Polygon(vertices).make_submask(shape[0], shape[1])
     return Polygon(vertices).make_mask(shape[0], shape[1])
 
 
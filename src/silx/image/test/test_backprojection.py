@@ -0,0 +1,124 @@
+# coding: utf-8
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""
+Tests of the CPU (filtered) backprojection and projection
+"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+import importlib
+import unittest
+from unittest import mock
+import numpy
+from silx.image.backprojection import CpuBackprojection
+from silx.image.projection import CpuProjection
+from silx.image.tomography import SinoFilter
+from silx.math.fft.fftw import __have_fftw__
+from silx.opencl.common import ocl
+
+
+def _gaussian(shape, center, sigma):
+    y, x = numpy.mgrid[:shape[0], :shape[1]]
+    dist2 = (x - center[1]) ** 2 + (y - center[0]) ** 2
+    return numpy.exp(-dist2 / (2 * sigma ** 2)).astype(numpy.float32)
+
+
+class TestCpuBackprojection(unittest.TestCase):
+
+    def setUp(self):
+        self.image = _gaussian((64, 64), (25, 35), 5.)
+        self.projector = CpuProjection(self.image.shape, 180)
+        self.sino = self.projector(self.image)
+
+    def tearDown(self):
+        self.image = self.projector = self.sino = None
+
+    def testReconstruction(self):
+        fbp = CpuBackprojection(self.sino.shape, extra_options={"fft_backend": "numpy"})
+        rec = fbp.filtered_backprojection(self.sino)
+        self.assertEqual(rec.shape, self.image.shape)
+        error = numpy.linalg.norm(rec - self.image) / numpy.linalg.norm(self.image)
+        self.assertLess(error, 0.1)
+
+    def testAdjoint(self):
+        bp = CpuBackprojection(self.sino.shape)
+        x = numpy.random.random(self.image.shape).astype(numpy.float32)
+        y = numpy.random.random(self.sino.shape).astype(numpy.float32)
+        lhs = numpy.sum(self.projector(x).astype(numpy.float64) * y)
+        rhs = numpy.sum(x * bp.backprojection(y).astype(numpy.float64))
+        self.assertAlmostEqual(lhs / rhs, 1., places=3)
+
+    def testStack(self):
+        fbp = CpuBackprojection(self.sino.shape,
+                                extra_options={"slice_batch": 2, "fft_backend": "numpy"})
+        ref = fbp(self.sino)
+        stack = numpy.array([self.sino * i for i in range(5)])
+        output = numpy.zeros((5,) + self.image.shape, dtype=numpy.float64)
+        res = fbp(stack, output=output)
+        self.assertIs(res, output)
+        for i in range(5):
+            self.assertTrue(numpy.allclose(res[i], ref * i, atol=1e-6))
+
+    def testNumThreads(self):
+        ref = CpuBackprojection(self.sino.shape, num_threads=1).backprojection(self.sino)
+        res = CpuBackprojection(self.sino.shape, num_threads=4,
+                                extra_options={"angle_block": 7}).backprojection(self.sino)
+        self.assertTrue(numpy.allclose(res, ref, rtol=1e-5))
+
+    @unittest.skipUnless(__have_fftw__, "pyfftw is missing")
+    def testFftBackends(self):
+        ref = SinoFilter(self.sino.shape, backend="numpy")(self.sino)
+        res = SinoFilter(self.sino.shape, backend="fftw")(self.sino)
+        self.assertTrue(numpy.allclose(res, ref, atol=1e-6))
+
+    @unittest.skipUnless(ocl, "PyOpenCl is missing")
+    def testVsOpenCL(self):
+        from silx.opencl.backprojection import Backprojection
+        ocl_fbp = Backprojection(self.sino.shape, devicetype="cpu")
+        ref = ocl_fbp.filtered_backprojection(self.sino)
+        res = CpuBackprojection(self.sino.shape)(self.sino)
+        self.assertTrue(numpy.allclose(res, ref, atol=1e-3 * abs(ref).max()))
+
+
+class TestFallback(unittest.TestCase):
+    """Test the selection of the CPU implementation without OpenCL device"""
+
+    def testNoOpenCLDevice(self):
+        import silx.image.backprojection
+        import silx.image.projection
+        modules = silx.image.backprojection, silx.image.projection
+        try:
+            with mock.patch("silx.opencl.common.ocl", None):
+                for module in modules:
+                    importlib.reload(module)
+            self.assertIs(silx.image.backprojection.Backprojection,
+                          silx.image.backprojection.CpuBackprojection)
+            self.assertIs(silx.image.projection.Projection,
+                          silx.image.projection.CpuProjection)
+        finally:
+            for module in modules:
+                importlib.reload(module)
@@ -28,7 +28,7 @@
 
 __authors__ = ["H. Payno"]
 __license__ = "MIT"
-__date__ = "11/05/2017"
+__date__ = "19/10/2026"
 
 import unittest
 from silx.image import medianfilter
@@ -62,3 +62,19 @@ class TestMedianFilterEngines(unittest.TestCase):
             kernel_size=TestMedianFilterEngines.KERNEL,
             engine='opencl')
         self.assertTrue(numpy.array_equal(res, TestMedianFilterEngines.IMG))
+
+    def testHistogramMedFilt2d(self):
+        """test histogram engine for medfilt2d"""
+        image = TestMedianFilterEngines.IMG.astype(numpy.uint16)
+        res = medianfilter.medfilt2d(
+            image=image,
+            kernel_size=TestMedianFilterEngines.KERNEL,
+            engine='histogram')
+        self.assertTrue(numpy.array_equal(res, image))
+
+        # Fallback to cpp for other types
+        res = medianfilter.medfilt2d(
+            image=TestMedianFilterEngines.IMG,
+            kernel_size=TestMedianFilterEngines.KERNEL,
+            engine='histogram')
+        self.assertTrue(numpy.array_equal(res, TestMedianFilterEngines.IMG))
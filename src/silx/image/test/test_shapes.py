@@ -27,7 +27,7 @@
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "15/02/2019"
+__date__ = "19/10/2026"
 
 
 import logging
@@ -150,6 +150,51 @@ class TestPolygonFill(ParametricTestCase):
                     _logger.debug('ref:\n%s', str(ref_mask))
                 self.assertTrue(is_equal)
 
+    def test_bbox(self):
+        """Test polygon fill limited to the bounding box"""
+        tests = {
+            # test name: (vertices, mask shape, (row, col), expected submask)
+            'concave polygon': (
+                [(1, 1), (4, 3), (1, 5), (2, 3)], (6, 8), (1, 1),
+                [[0, 0, 0, 0, 0],
+                 [0, 1, 1, 1, 0],
+                 [0, 0, 1, 0, 0],
+                 [0, 0, 0, 0, 0]]),
+            'partly outside': (
+                [(-1, -1), (4, 3), (1, 5), (2, 3)], (8, 6), (0, 0),
+                [[1, 0, 0, 0, 0, 0],
+                 [0, 1, 0, 0, 0, 0],
+                 [0, 0, 1, 1, 1, 0],
+                 [0, 0, 0, 1, 0, 0],
+                 [0, 0, 0, 0, 0, 0]]),
+            'fully outside': (
+                [(10, 10), (14, 13), (11, 15)], (8, 6), (0, 0),
+                numpy.zeros((0, 0))),
+            }
+
+        for test_name, (vertices, mask_shape, offset, expected) in tests.items():
+            with self.subTest(msg=test_name):
+                (row, col), submask = shapes.polygon_fill_mask(
+                    vertices, mask_shape, bbox=True)
+                self.assertEqual((row, col), offset)
+                self.assertTrue(numpy.array_equal(submask, expected))
+
+    def test_bbox_random(self):
+        """Test polygon fill limited to the bounding box against is_inside"""
+        vertices = numpy.random.uniform(-20, 120, (12, 2))
+        mask_shape = 100, 90
+        (row, col), submask = shapes.polygon_fill_mask(
+            vertices, mask_shape, bbox=True)
+        mask = numpy.zeros(mask_shape, dtype=numpy.uint8)
+        mask[row:row + submask.shape[0],
+             col:col + submask.shape[1]] = submask
+
+        polygon = shapes.Polygon(vertices)
+        expected = numpy.array(
+            [[polygon.is_inside(r, c) for c in range(mask_shape[1])]
+             for r in range(mask_shape[0])], dtype=numpy.uint8)
+        self.assertTrue(numpy.array_equal(mask, expected))
+
 
 class TestDrawLine(ParametricTestCase):
     """basic draw line test"""
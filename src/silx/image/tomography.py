@@ -27,7 +27,7 @@ This module contains utilitary functions for tomography
 
 __author__ = ["P. Paleo"]
 __license__ = "MIT"
-__date__ = "12/09/2017"
+__date__ = "19/10/2026"
 
 
 import numpy as np
@@ -36,6 +36,8 @@ from functools import lru_cache
 from itertools import product
 from bisect import bisect
 from silx.math.fit import leastsq
+from silx.math.fft.fft import FFT
+from silx.math.fft.fftw import __have_fftw__
 
 # ------------------------------------------------------------------------------
 # -------------------- Filtering-related functions -----------------------------
@@ -164,6 +166,109 @@ def get_next_power(n, powers=None):
     return powers[idx]
 
 
+class SinoFilter(object):
+    """Filtering of sinograms in the Fourier domain on CPU, as done for FBP.
+
+    This is the CPU counterpart of :class:`silx.opencl.sinofilter.SinoFilter`.
+    Stacks of sinograms are filtered by batches, one FFT per batch.
+
+    :param sino_shape: Shape of one sinogram (n_angles, n_bins)
+    :param str filter_name: Name of the filter. Default is "ram-lak".
+    :param int batch_size: Number of sinograms filtered at once
+    :param str backend: FFT backend, "fftw" or "numpy".
+        Default is "fftw" when available.
+    :param dict extra_options: Advanced extra options.
+        Current options are: cutoff, fftw_threads
+    """
+
+    powers = generate_powers()
+
+    def __init__(self, sino_shape, filter_name=None, batch_size=1,
+                 backend=None, extra_options=None):
+        if len(sino_shape) != 2:
+            raise ValueError("Invalid sinogram number of dimensions: "
+                             "expected 2 dimensions")
+        self.extra_options = {
+            "cutoff": 1.,
+            "fftw_threads": 1,
+        }
+        if extra_options is not None:
+            self.extra_options.update(extra_options)
+        self.sino_shape = tuple(sino_shape)
+        self.n_angles, self.dwidth = self.sino_shape
+        self.dwidth_padded = get_next_power(2 * self.dwidth, powers=self.powers)
+        self.batch_size = max(1, int(batch_size))
+        self._sino_padded = np.zeros(
+            (self.batch_size, self.n_angles, self.dwidth_padded), np.float32)
+
+        if backend is None:
+            backend = "fftw" if __have_fftw__ else "numpy"
+        kwargs = {}
+        if backend == "fftw":
+            kwargs["num_threads"] = self.extra_options["fftw_threads"]
+        self.fft_backend = backend
+        self.fft = FFT(template=self._sino_padded, axes=(-1,),
+                       backend=backend, **kwargs)
+
+        self.filter_name = filter_name or "ram-lak"
+        filter_f = compute_fourier_filter(
+            self.dwidth_padded,
+            self.filter_name,
+            cutoff=self.extra_options["cutoff"],
+        )[:self.dwidth_padded // 2 + 1]  # R2C
+        self.set_filter(filter_f, normalize=True)
+
+    def set_filter(self, h_filt, normalize=True):
+        """
+        Set a filter for sinogram filtering.
+
+        :param h_filt: Filter. Each line of the sinogram will be filtered with
+            this filter. It has to be the Real-to-Complex Fourier Transform
+            of some real filter, padded to 2*sinogram_width.
+        :param normalize: Whether to normalize the filter with pi/num_angles.
+        """
+        if h_filt.size != self.dwidth_padded // 2 + 1:
+            raise ValueError("Invalid filter size: expected %d, got %d" %
+                             (self.dwidth_padded // 2 + 1, h_filt.size))
+        self.filter_f = np.array(h_filt, dtype=np.complex128)
+        if normalize:
+            self.filter_f *= pi / self.n_angles
+        self.filter_f = self.filter_f.astype(np.complex64)
+
+    def _filter_batch(self, sinos, output):
+        count = sinos.shape[0]
+        self._sino_padded[:count, :, :self.dwidth] = sinos
+        self._sino_padded[count:] = 0
+        sino_f = self.fft.fft(self._sino_padded)
+        sino_f *= self.filter_f
+        result = self.fft.ifft(sino_f)
+        output[:] = result[:count, :, :self.dwidth]
+
+    def filter_sino(self, sino, output=None):
+        """Filter a sinogram or a stack of sinograms.
+
+        :param numpy.ndarray sino: Sinogram (n_angles, n_bins) or stack of
+            sinograms (n_sinos, n_angles, n_bins)
+        :param numpy.ndarray output: Optional output array with the same shape
+        :return: Filtered sinogram(s) as float32
+        :rtype: numpy.ndarray
+        """
+        sino = np.asarray(sino)
+        if sino.shape[-2:] != self.sino_shape or sino.ndim not in (2, 3):
+            raise ValueError("Expected sinogram shape %s, got %s" %
+                             (self.sino_shape, sino.shape))
+        if output is None:
+            output = np.empty(sino.shape, dtype=np.float32)
+        sinos = sino if sino.ndim == 3 else sino[np.newaxis]
+        outputs = output if output.ndim == 3 else output[np.newaxis]
+        for start in range(0, sinos.shape[0], self.batch_size):
+            stop = start + self.batch_size
+            self._filter_batch(sinos[start:stop], outputs[start:stop])
+        return output
+
+    __call__ = filter_sino
+
+
 # ------------------------------------------------------------------------------
 # ------------- Functions for determining the center of rotation  --------------
 # ------------------------------------------------------------------------------
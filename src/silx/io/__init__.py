@@ -31,21 +31,53 @@ See silx documentation: http://www.silx.org/doc/silx/latest/
 
 __authors__ = ["P. Knobel"]
 __license__ = "MIT"
-__date__ = "11/12/2017"
+__date__ = "19/10/2026"
 
 
-from .utils import open  # pylint:disable=redefined-builtin
-from .utils import save1D
+from silx.utils._lazy import lazy_attributes as _lazy_attributes
 
-from .utils import is_dataset
-from .utils import is_file
-from .utils import is_group
-from .utils import is_softlink
-from .utils import supported_extensions
-from .utils import get_data
+# Content is loaded on first access to avoid importing h5py, fabio...
+__getattr__, __dir__ = _lazy_attributes(
+    __name__,
+    attributes={
+        "open": ".utils",
+        "save1D": ".utils",
+        "is_dataset": ".utils",
+        "is_file": ".utils",
+        "is_group": ".utils",
+        "is_softlink": ".utils",
+        "supported_extensions": ".utils",
+        "get_data": ".utils",
+        "get_data_many": ".utils",
+        "FilePool": ".utils",
+    },
+    submodules=[
+        "commonh5",
+        "configdict",
+        "convert",
+        "dictdump",
+        "fabioh5",
+        "h5py_utils",
+        "nxdata",
+        "octaveh5",
+        "rawh5",
+        "specfile",
+        "specfilewrapper",
+        "spech5",
+        "spectoh5",
+        "url",
+        "utils",
+    ])
 
 # avoid to import open with "import *"
-__all = locals().keys()
-__all = filter(lambda x: not x.startswith("_"), __all)
-__all = filter(lambda x: x != "open", __all)
-__all__ = list(__all)
+__all__ = [
+    "save1D",
+    "is_dataset",
+    "is_file",
+    "is_group",
+    "is_softlink",
+    "supported_extensions",
+    "get_data",
+    "get_data_many",
+    "FilePool",
+]
@@ -0,0 +1,394 @@
+# coding: utf-8
+# /*##########################################################################
+# Copyright (C) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""CPU implementation of the CBF byte-offset compression.
+
+This module is the CPU counterpart of
+:class:`silx.opencl.codec.byte_offset.ByteOffset`.
+
+Each value is stored as the difference with the previous one, on 1 byte
+when possible, else on 2, 4 or 8 bytes (little endian), each level being
+introduced by the escape value of the previous one (-128, -32768, -2**31).
+
+The `*_many` functions process a batch of frames in parallel: the GIL is
+released and frames are distributed over threads.
+
+Usage:
+
+>>> from silx.io import byte_offset
+>>> raw = byte_offset.encode(image)
+>>> data = byte_offset.decode(raw, size=image.size).reshape(image.shape)
+"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+
+import os
+cimport cython
+from cython.parallel import prange
+from libc.stdint cimport int8_t, uint8_t, int32_t, int64_t, uint64_t
+
+import numpy
+
+__all__ = ["decode", "decode_many", "encode", "encode_many"]
+
+
+cdef int DEFAULT_NUM_THREADS
+if hasattr(os, 'sched_getaffinity'):
+    DEFAULT_NUM_THREADS = len(os.sched_getaffinity(0))
+elif os.cpu_count() is not None:
+    DEFAULT_NUM_THREADS = os.cpu_count()
+else:  # Fallback
+    DEFAULT_NUM_THREADS = 1
+
+
+def _get_num_threads(num_threads):
+    if num_threads is None or num_threads <= 0:
+        num_threads = int(os.environ.get("OMP_NUM_THREADS", DEFAULT_NUM_THREADS))
+    return max(1, num_threads)
+
+
+# Supported output data types
+ctypedef fused output_types:
+    int32_t
+    float
+    double
+
+# Supported input data types for compression
+ctypedef fused input_types:
+    int32_t
+    int64_t
+
+
+cdef inline int64_t _read(const int8_t *raw, Py_ssize_t pos, int nbytes) nogil:
+    """Read a little endian signed integer of nbytes bytes"""
+    cdef:
+        uint64_t value = 0
+        int k
+    for k in range(nbytes):
+        value |= (<uint64_t> (<uint8_t> raw[pos + k])) << (8 * k)
+    if nbytes < 8 and (value >> (8 * nbytes - 1)) & 1:
+        value |= (~(<uint64_t> 0)) << (8 * nbytes)  # Sign extension
+    return <int64_t> value
+
+
+cdef inline void _write(int8_t *raw, Py_ssize_t pos, int64_t value, int nbytes) nogil:
+    """Write a little endian signed integer of nbytes bytes"""
+    cdef int k
+    for k in range(nbytes):
+        raw[pos + k] = <int8_t> (<uint8_t> ((<uint64_t> value) >> (8 * k)))
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _decode(const int8_t *raw, Py_ssize_t raw_size,
+                        output_types *output, Py_ssize_t size) nogil:
+    """Decompress up to size values.
+
+    :return: The number of decompressed values or -1 if the stream is
+        truncated in the middle of a value.
+    """
+    cdef:
+        Py_ssize_t pos = 0, index = 0
+        int64_t current = 0, delta
+
+    while index < size and pos < raw_size:
+        delta = raw[pos]
+        if delta != -128:
+            pos += 1
+        else:
+            if pos + 3 > raw_size:
+                return -1
+            delta = _read(raw, pos + 1, 2)
+            if delta != -32768:
+                pos += 3
+            else:
+                if pos + 7 > raw_size:
+                    return -1
+                delta = _read(raw, pos + 3, 4)
+                if delta != -2147483648LL:
+                    pos += 7
+                else:
+                    if pos + 15 > raw_size:
+                        return -1
+                    delta = _read(raw, pos + 7, 8)
+                    pos += 15
+        current += delta
+        output[index] = <output_types> current
+        index += 1
+    return index
+
+
+cdef inline int _compressed_size(int64_t delta) nogil:
+    if -128 < delta < 128:
+        return 1
+    elif -32768 < delta < 32768:
+        return 3
+    elif -2147483648LL < delta < 2147483648LL:
+        return 7
+    else:
+        return 15
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _compressed_length(const input_types *data, Py_ssize_t size) nogil:
+    """Returns the size in bytes of the compressed data"""
+    cdef:
+        Py_ssize_t index, length = 0
+        int64_t previous = 0
+    for index in range(size):
+        length += _compressed_size(<int64_t> data[index] - previous)
+        previous = data[index]
+    return length
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _encode(const input_types *data, Py_ssize_t size, int8_t *raw) nogil:
+    cdef:
+        Py_ssize_t index, pos = 0
+        int64_t previous = 0, delta
+        int nbytes
+    for index in range(size):
+        delta = <int64_t> data[index] - previous
+        previous = data[index]
+        nbytes = _compressed_size(delta)
+        if nbytes == 1:
+            raw[pos] = <int8_t> delta
+        elif nbytes == 3:
+            raw[pos] = -128
+            _write(raw, pos + 1, delta, 2)
+        elif nbytes == 7:
+            raw[pos] = -128
+            _write(raw, pos + 1, -32768, 2)
+            _write(raw, pos + 3, delta, 4)
+        else:
+            raw[pos] = -128
+            _write(raw, pos + 1, -32768, 2)
+            _write(raw, pos + 3, -2147483648LL, 4)
+            _write(raw, pos + 7, delta, 8)
+        pos += nbytes
+
+
+def _as_stream(raw):
+    """Returns the compressed stream as a contiguous 1D array of int8"""
+    if isinstance(raw, numpy.ndarray):
+        return numpy.ascontiguousarray(raw).view(numpy.int8).ravel()
+    return numpy.frombuffer(raw, dtype=numpy.int8)
+
+
+_OUTPUT_DTYPES = numpy.dtype(numpy.int32), numpy.dtype(numpy.float32), numpy.dtype(numpy.float64)
+"""Supported decompressed data types, matching output_types"""
+
+
+def _as_input(data):
+    """Returns the data to compress as a contiguous 1D int32 or int64 array"""
+    data = numpy.asarray(data)
+    if data.dtype.kind not in "biu":
+        raise ValueError("Unsupported data type %s, only integers can be "
+                         "compressed" % data.dtype)
+    if (data.dtype == numpy.uint64 and data.size > 0 and
+            data.max() > numpy.iinfo(numpy.int64).max):
+        raise ValueError("uint64 values above %d can't be compressed" %
+                         numpy.iinfo(numpy.int64).max)
+    if data.dtype.kind in "iu" and (data.dtype.itemsize > 4 or data.dtype == numpy.uint32):
+        dtype = numpy.int64
+    else:
+        dtype = numpy.int32
+    return numpy.ascontiguousarray(data, dtype=dtype).ravel()
+
+
+def _check_dtype(dtype):
+    """Raise a ValueError if dtype is not a supported output type"""
+    if numpy.dtype(dtype) not in _OUTPUT_DTYPES:
+        raise ValueError("Unsupported output dtype %s, expected one of %s" %
+                         (numpy.dtype(dtype), ", ".join(str(d) for d in _OUTPUT_DTYPES)))
+
+
+def _check_output(out, shape, dtype):
+    if out is None:
+        _check_dtype(dtype)
+        return numpy.empty(shape, dtype=dtype)
+    if out.shape != shape or not out.flags["C_CONTIGUOUS"]:
+        raise ValueError("Expected a C-contiguous output of shape %s, got %s" %
+                         (shape, out.shape))
+    _check_dtype(out.dtype)
+    return out
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _decode_batch(Py_ssize_t[::1] addresses,
+                  Py_ssize_t[::1] lengths,
+                  output_types[:, ::1] output,
+                  Py_ssize_t[::1] counts,
+                  int num_threads):
+    cdef:
+        Py_ssize_t frame
+        Py_ssize_t size = output.shape[1]
+    for frame in prange(output.shape[0], nogil=True, schedule="dynamic",
+                        num_threads=num_threads):
+        if size == 0:
+            counts[frame] = 0
+        else:
+            counts[frame] = _decode(<const int8_t *> <size_t> addresses[frame],
+                                    lengths[frame],
+                                    &output[frame, 0],
+                                    size)
+
+
+def decode(raw, size=None, dtype=numpy.int32, out=None):
+    """Decompress a byte-offset stream.
+
+    :param raw: The compressed stream (bytes or 1D array of char)
+    :param int size: Number of values to decompress.
+        Default: all the values of the stream.
+    :param dtype: Output type: numpy.int32 (default), numpy.float32
+        or numpy.float64
+    :param numpy.ndarray out: Optional C-contiguous 1D array where to
+        store the result
+    :return: 1D array of decompressed values
+    :rtype: numpy.ndarray
+    :raises ValueError: if the stream is corrupted or too short, or if
+        the output type is not supported
+    """
+    return decode_many([raw], size, dtype,
+                       None if out is None else out.reshape(1, -1),
+                       num_threads=1)[0]
+
+
+def decode_many(raws, size=None, dtype=numpy.int32, out=None, num_threads=None):
+    """Decompress many byte-offset streams in parallel.
+
+    :param raws: Sequence of compressed streams (bytes or 1D arrays of char)
+    :param int size: Number of values of each frame.
+        Default: all the values of the stream (only for a single stream).
+    :param dtype: Output type: numpy.int32 (default), numpy.float32
+        or numpy.float64
+    :param numpy.ndarray out: Optional C-contiguous array of shape
+        (len(raws), size) where to store the result
+    :param int num_threads: Number of threads, default is all CPUs
+    :return: 2D array (len(raws), size) of decompressed values
+    :rtype: numpy.ndarray
+    :raises ValueError: if a stream is corrupted or too short, or if
+        the output type is not supported
+    """
+    streams = [_as_stream(raw) for raw in raws]
+    truncate = size is None
+    if truncate:
+        if len(streams) != 1:
+            raise ValueError("size is mandatory to decompress many streams")
+        # There is at most one value per byte
+        size = len(streams[0])
+        if out is not None:
+            size = min(size, out.size)
+            out = out.reshape(1, -1)[:, :size]
+    output = _check_output(out, (len(streams), size), dtype)
+
+    addresses = numpy.array([stream.ctypes.data for stream in streams],
+                            dtype=numpy.intp)
+    lengths = numpy.array([len(stream) for stream in streams], dtype=numpy.intp)
+    counts = numpy.zeros(len(streams), dtype=numpy.intp)
+    if len(streams) > 0:
+        _decode_batch(addresses, lengths, output, counts,
+                      min(len(streams), _get_num_threads(num_threads)))
+
+    if numpy.any(counts < 0):
+        raise ValueError("Stream #%d is truncated" % numpy.argmax(counts < 0))
+    if truncate:
+        return output[:, :counts[0]] if out is not None else output[:, :counts[0]].copy()
+    if numpy.any(counts < size):
+        raise ValueError("Stream #%d contains less than %d values" %
+                         (numpy.argmax(counts < size), size))
+    return output
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _encode_batch(Py_ssize_t[::1] addresses, Py_ssize_t size, bint is_int64,
+                  int num_threads):
+    cdef:
+        Py_ssize_t frame, nb_frames = addresses.shape[0]
+        Py_ssize_t[::1] offsets = numpy.zeros(nb_frames + 1, dtype=numpy.intp)
+        int8_t[::1] raw
+
+    for frame in prange(nb_frames, nogil=True, num_threads=num_threads):
+        if is_int64:
+            offsets[frame + 1] = _compressed_length[int64_t](
+                <const int64_t *> <size_t> addresses[frame], size)
+        else:
+            offsets[frame + 1] = _compressed_length[int32_t](
+                <const int32_t *> <size_t> addresses[frame], size)
+    for frame in range(nb_frames):
+        offsets[frame + 1] += offsets[frame]
+
+    raw = numpy.empty(max(1, offsets[nb_frames]), dtype=numpy.int8)
+    for frame in prange(nb_frames, nogil=True, num_threads=num_threads):
+        if is_int64:
+            _encode[int64_t](<const int64_t *> <size_t> addresses[frame],
+                             size, &raw[offsets[frame]])
+        else:
+            _encode[int32_t](<const int32_t *> <size_t> addresses[frame],
+                             size, &raw[offsets[frame]])
+    return numpy.asarray(raw), numpy.asarray(offsets)
+
+
+def encode(data):
+    """Compress data with the byte-offset algorithm.
+
+    :param numpy.ndarray data: Array of integers (flattened)
+    :return: The compressed stream
+    :rtype: bytes
+    :raises ValueError: if data is not an array of integers,
+        or contains uint64 values not representable as int64
+    """
+    return encode_many([data], num_threads=1)[0]
+
+
+def encode_many(frames, num_threads=None):
+    """Compress many frames in parallel with the byte-offset algorithm.
+
+    :param frames: Sequence of arrays of integers with the same size
+        or an array where the first dimension indexes the frames
+    :param int num_threads: Number of threads, default is all CPUs
+    :return: List of compressed streams
+    :rtype: List[bytes]
+    :raises ValueError: if frames are not arrays of integers,
+        or contain uint64 values not representable as int64
+    """
+    frames = [_as_input(frame) for frame in frames]
+    if len(frames) == 0:
+        return []
+    if len(set(frame.size for frame in frames)) != 1:
+        raise ValueError("All frames must have the same size")
+    is_int64 = any(frame.dtype == numpy.int64 for frame in frames)
+    if is_int64:
+        frames = [frame.astype(numpy.int64, copy=False) for frame in frames]
+    addresses = numpy.array([frame.ctypes.data for frame in frames],
+                            dtype=numpy.intp)
+    raw, offsets = _encode_batch(addresses, frames[0].size, is_int64,
+                                 min(len(frames), _get_num_threads(num_threads)))
+    return [raw[start:stop].tobytes() for start, stop in zip(offsets[:-1], offsets[1:])]
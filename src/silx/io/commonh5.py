@@ -42,7 +42,11 @@ from . import utils
 
 __authors__ = ["V. Valls", "P. Knobel"]
 __license__ = "MIT"
-__date__ = "02/07/2018"
+__date__ = "19/10/2026"
+
+
+_MISSING = object()
+"""Returned by the path index when a path is known not to exist"""
 
 
 class _MappingProxyType(abc.MutableMapping):
@@ -330,6 +334,18 @@ class Dataset(Node):
                 raise ValueError("Scalar can only be reached with an ellipsis or an empty tuple")
         return self._get_data().__getitem__(item)
 
+    def read_direct(self, dest, source_sel=None, dest_sel=None):
+        """Read data into an existing array, as provided by `h5py.Dataset`.
+
+        The data is converted to the type of `dest` on the fly.
+
+        :param numpy.ndarray dest: Array where to store the data
+        :param source_sel: Selection in this dataset, default: all
+        :param dest_sel: Selection in `dest`, default: all
+        """
+        data = self[() if source_sel is None else source_sel]
+        dest[Ellipsis if dest_sel is None else dest_sel] = data
+
     def __str__(self):
         basename = self.name.split("/")[-1]
         return '<HDF5-like dataset "%s": shape %s, type "%s">' % \
@@ -633,8 +649,32 @@ class Group(Node):
 
         :param Node node: Child to add to this group
         """
-        self._get_items()[node.basename] = node
+        items = self._get_items()
+        previous = items.get(node.basename)
+        items[node.basename] = node
         node._set_parent(self)
+        if previous is not None and previous is not node:
+            self._invalidate_path_index()
+
+    def _invalidate_path_index(self):
+        """Drop the path index of the file containing this group, if any."""
+        root = self.file
+        if root is not None:
+            root._clear_path_index()
+
+    def _lookup_path_index(self, name):
+        """Resolve an absolute name using the path index of the file.
+
+        :param str name: Name of the item
+        :return: The node, :data:`_MISSING` if the name is known not to exist,
+            or None if the index can't be used for this name.
+        """
+        if not name.startswith("/"):
+            return None
+        root = self.file
+        if root is None:
+            return None
+        return root._lookup_path_index(name[1:])
 
     @property
     def h5_class(self):
@@ -648,32 +688,36 @@ class Group(Node):
         """If getlink is True and name points to an existing SoftLink, this
         SoftLink is returned. In all other situations, we try to return a
         Group or Dataset, or we raise a KeyError if we fail."""
-        if "/" not in name:
-            result = self._get_items()[name]
-        elif name.startswith("/"):
-            root = self.file
-            if name == "/":
-                return root
-            result = root._get(name[1:], getlink)
-        else:
-            path = name.split("/")
-            result = self
-            for item_name in path:
-                if isinstance(result, SoftLink):
-                    # traverse links
-                    l_name, l_target = result.name, result.path
-                    result = result.file.get(l_target)
-                    if result is None:
-                        raise KeyError(
-                            "Unable to open object (broken SoftLink %s -> %s)" %
-                            (l_name, l_target))
-                if not item_name:
-                    # trailing "/" in name (legal for accessing Groups only)
-                    if isinstance(result, Group):
-                        continue
-                if not isinstance(result, Group):
-                    raise KeyError("Unable to open object (Component not found)")
-                result = result._get_items()[item_name]
+        result = self._lookup_path_index(name)
+        if result is _MISSING:
+            raise KeyError("Unable to open object (Component not found)")
+        elif result is None:
+            if "/" not in name:
+                result = self._get_items()[name]
+            elif name.startswith("/"):
+                root = self.file
+                if name == "/":
+                    return root
+                result = root._get(name[1:], getlink)
+            else:
+                path = name.split("/")
+                result = self
+                for item_name in path:
+                    if isinstance(result, SoftLink):
+                        # traverse links
+                        l_name, l_target = result.name, result.path
+                        result = result.file.get(l_target)
+                        if result is None:
+                            raise KeyError(
+                                "Unable to open object (broken SoftLink %s -> %s)" %
+                                (l_name, l_target))
+                    if not item_name:
+                        # trailing "/" in name (legal for accessing Groups only)
+                        if isinstance(result, Group):
+                            continue
+                    if not isinstance(result, Group):
+                        raise KeyError("Unable to open object (Component not found)")
+                    result = result._get_items()[item_name]
 
         if isinstance(result, SoftLink) and not getlink:
             link = result
@@ -801,6 +845,10 @@ class Group(Node):
         if "/" not in name:
             return name in self._get_items()
 
+        result = self._lookup_path_index(name)
+        if result is not None:
+            return result is not _MISSING
+
         if name.startswith("/"):
             # h5py allows to access any valid full path from any group
             node = self.file
@@ -866,8 +914,7 @@ class Group(Node):
         :param func: Callable (function, method or callable object)
         :type func: callable
         """
-        origin_name = self.name
-        return self._visit(func, origin_name, visit_links)
+        return self._visit(func, "", visit_links)
 
     def visititems(self, func, visit_links=False):
         """Recursively visit names and objects in this group.
@@ -878,32 +925,50 @@ class Group(Node):
         :param bool visit_links: If *False*, ignore links. If *True*,
             call `func(name)` for links and recurse into target groups.
         """
-        origin_name = self.name
-        return self._visit(func, origin_name, visit_links,
-                           visititems=True)
+        return self._visit(func, "", visit_links, visititems=True)
 
-    def _visit(self, func, origin_name,
+    def _visit(self, func, prefix,
                visit_links=False, visititems=False):
         """
 
-        :param origin_name: name of first group that initiated the recursion
-            This is used to compute the relative path from each item's
-            absolute path.
+        :param str prefix: Path of this group relative to the group which
+            initiated the recursion, with a trailing "/" (or an empty string
+            for that group). Names are built by concatenation, without
+            reading back the absolute name of each item.
         """
-        for member in self.values():
+        for basename, member in self.items():
             ret = None
+            relative_name = prefix + basename
             if not isinstance(member, SoftLink) or visit_links:
-                relative_name = member.name[len(origin_name):]
-                # remove leading slash and unnecessary trailing slash
-                relative_name = relative_name.strip("/")
                 if visititems:
                     ret = func(relative_name, member)
                 else:
                     ret = func(relative_name)
+            if ret is None and isinstance(member, Group):
+                ret = member._visit(func, relative_name + "/",
+                                    visit_links, visititems)
             if ret is not None:
                 return ret
-            if isinstance(member, Group):
-                member._visit(func, origin_name, visit_links, visititems)
+
+    def __delitem__(self, name):
+        """Remove a child from this group.
+
+        :param str name: name of a member or a path through members using '/'
+            separator.
+        """
+        if not self._is_editable():
+            raise RuntimeError("File is not editable")
+        elements = name.rstrip("/").rsplit("/", 1)
+        if len(elements) == 1:
+            parent = self
+        else:
+            parent = self._get(elements[0] or "/", getlink=False)
+        basename = elements[-1]
+        if not isinstance(parent, Group) or basename not in parent._get_items():
+            raise KeyError("Unable to delete object (Component not found)")
+        node = parent._get_items().pop(basename)
+        self._invalidate_path_index()
+        node._set_parent(None)
 
     def create_group(self, name):
         """Create and return a new subgroup.
@@ -1019,7 +1084,7 @@ class File(Group):
     """This class is the special :class:`Group` that is the root node
     of the tree structure. It mimics `h5py.File`."""
 
-    def __init__(self, name=None, mode=None, attrs=None):
+    def __init__(self, name=None, mode=None, attrs=None, path_index=True):
         """
         Constructor
 
@@ -1030,6 +1095,9 @@ class File(Group):
             - "w": File is editable. Methods :meth:`create_dataset` and
                 :meth:`create_group` are available.
         :param dict attrs: Default attributes
+        :param bool path_index: If true (default), paths resolved from the
+            root are memorized in a flat path-to-node index, so that
+            accessing or testing an absolute path does not walk the tree.
         """
         Group.__init__(self, name="", parent=None, attrs=attrs)
         self._file_name = name
@@ -1037,6 +1105,50 @@ class File(Group):
             mode = "r"
         assert(mode in ["r", "w"])
         self._mode = mode
+        self.__path_index = {} if path_index else None
+
+    def _clear_path_index(self):
+        """Forget all the paths memorized by the path index."""
+        if self.__path_index is not None:
+            self.__path_index.clear()
+
+    def _lookup_path_index(self, name):
+        """Resolve a name relative to the root using the path index.
+
+        Only paths made of hard links are memorized. The index is filled
+        while resolving paths, and it is dropped when a node of the tree
+        is replaced or removed.
+
+        :param str name: Name of the item, absolute or relative to the root
+        :return: The node, :data:`_MISSING` if the name is known not to exist,
+            or None if the index can't be used for this name.
+        """
+        index = self.__path_index
+        if index is None:
+            return None
+        if name.startswith("/"):
+            name = name[1:]
+        if name == "" or name.endswith("/") or "//" in name:
+            return None
+        node = index.get(name)
+        if node is not None:
+            return node
+
+        parent_name, _, basename = name.rpartition("/")
+        if parent_name == "":
+            parent = self
+        else:
+            parent = self._lookup_path_index(parent_name)
+            if parent is None or parent is _MISSING:
+                return parent
+        if not isinstance(parent, Group):
+            # Soft link or dataset: let the tree walk handle it
+            return None
+        node = parent._get_items().get(basename)
+        if node is None:
+            return _MISSING
+        index[name] = node
+        return node
 
     @property
     def filename(self):
@@ -44,11 +44,13 @@ from .utils import is_file as is_h5_file_like
 from .utils import open as h5open
 from .utils import h5py_read_dataset
 from .utils import H5pyAttributesReadWrapper
+from .utils import _open_url_file, _get_url_dataset
+from .url import DataUrl
 from silx.utils.deprecation import deprecated_warning
 
 __authors__ = ["P. Knobel"]
 __license__ = "MIT"
-__date__ = "17/07/2018"
+__date__ = "19/10/2026"
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +76,129 @@ def _prepare_hdf5_write_value(array_like):
         return array
 
 
+def _get_dataset_layout(dataset):
+    """Returns the arguments of ``create_dataset`` reproducing the storage
+    of a chunked dataset, or None.
+
+    :param dataset: h5py-like dataset
+    :rtype: Union[dict,None]
+    """
+    if not isinstance(dataset, h5py.Dataset) or dataset.chunks is None:
+        return None
+    layout = {"chunks": dataset.chunks}
+    for name in ("compression", "compression_opts", "shuffle", "fletcher32", "scaleoffset"):
+        value = getattr(dataset, name)
+        if value:
+            layout[name] = value
+    return layout
+
+
+def _memmap_dataset(dataset):
+    """Returns a read-only memory map of a dataset, or None if the dataset
+    is not stored contiguously and uncompressed in a plain HDF5 file.
+
+    :param dataset: h5py-like dataset
+    :rtype: Union[numpy.memmap,None]
+    """
+    if not isinstance(dataset, h5py.Dataset):
+        return None
+    if (dataset.shape is None or len(dataset.shape) == 0 or dataset.size == 0 or
+            dataset.chunks is not None or dataset.dtype.hasobject or
+            dataset.external or dataset.is_virtual):
+        return None
+    h5file = dataset.file
+    if h5file.driver not in ("sec2", "stdio") or h5file.userblock_size != 0:
+        return None
+    offset = dataset.id.get_offset()
+    if offset is None:
+        return None
+    return numpy.memmap(h5file.filename, dtype=dataset.dtype, mode="r",
+                        shape=dataset.shape, offset=offset)
+
+
+class LazyDataset(object):
+    """Proxy to a dataset of a file, which is only read on access.
+
+    It is returned by :func:`h5todict` for datasets which are not loaded.
+    The file is opened on each access, unless a
+    :class:`~silx.io.utils.FilePool` is provided.
+
+    Example::
+
+        ddict = h5todict("results.h5", lazy=True)
+        data = numpy.array(ddict["image"])  # Read the full dataset
+        line = ddict["image"][10]  # Read a single line
+
+    :param Union[str,DataUrl] url: URL of the dataset
+    :param tuple shape: Shape of the dataset
+    :param numpy.dtype dtype: Data type of the dataset
+    :param bool asarray: True to read scalars as arrays, False to read them
+        as scalars
+    :param Union[silx.io.utils.FilePool,None] pool: Pool of files used to
+        read the data
+    :param Union[dict,None] layout: Arguments of ``create_dataset`` to
+        reproduce the storage of the dataset, used by :func:`dicttoh5`
+    """
+
+    def __init__(self, url, shape, dtype, asarray=True, pool=None, layout=None):
+        if not isinstance(url, DataUrl):
+            url = DataUrl(url)
+        self.__url = url
+        self.__shape = shape
+        self.__dtype = dtype
+        self.__asarray = asarray
+        self.__pool = pool
+        self.layout = layout
+
+    @property
+    def url(self):
+        """URL of the dataset (:class:`DataUrl`)"""
+        return self.__url
+
+    @property
+    def shape(self):
+        return self.__shape
+
+    @property
+    def dtype(self):
+        return self.__dtype
+
+    @property
+    def ndim(self):
+        return len(self.__shape)
+
+    @property
+    def size(self):
+        return int(numpy.prod(self.__shape, dtype=numpy.int64))
+
+    def __len__(self):
+        if len(self.__shape) == 0:
+            raise TypeError("Attempt to take len() of scalar dataset")
+        return self.__shape[0]
+
+    def __getitem__(self, item):
+        with _open_url_file(self.__url, self.__pool) as h5:
+            dataset = _get_url_dataset(h5, self.__url)
+            return h5py_read_dataset(dataset, index=item)
+
+    def load(self):
+        """Read the whole dataset.
+
+        :rtype: Union[numpy.ndarray,numpy.generic,str,bytes]
+        """
+        data = self[()]
+        if self.__asarray:
+            data = numpy.array(data, copy=False)
+        return data
+
+    def __array__(self, dtype=None):
+        return numpy.asarray(self[()], dtype=dtype)
+
+    def __repr__(self):
+        return "<LazyDataset %s: shape %s, type \"%s\">" % (
+            self.__url.path(), self.__shape, self.__dtype.str)
+
+
 class _SafeH5FileWrite:
     """Context manager returning a :class:`h5py.File` object.
 
@@ -208,6 +333,11 @@ def dicttoh5(treedict, h5file, h5path='/',
     :param create_dataset_args: Dictionary of args you want to pass to
         ``h5f.create_dataset``. This allows you to specify filters and
         compression parameters. Don't specify ``name`` and ``data``.
+        It can also be a callable returning such a dictionary (or None) per
+        dataset, called with the HDF5 path of the dataset and its value.
+        By default, datasets read from a HDF5 file (:class:`h5py.Dataset`
+        or :class:`LazyDataset`) are written with the same chunking and
+        compression.
     :param update_mode: Can be ``add`` (default), ``modify`` or ``replace``.
 
         * ``add``: Extend the existing HDF5 tree when possible. Existing HDF5
@@ -244,6 +374,15 @@ def dicttoh5(treedict, h5file, h5path='/',
 
         dicttoh5(city_area, "cities.h5", h5path="/area",
                  create_dataset_args=create_ds_args)
+
+        # Compress only large datasets
+        def create_ds_args(name, value):
+            if numpy.size(value) > 1000:
+                return {"chunks": True, "compression": "gzip"}
+            return None
+
+        dicttoh5(city_area, "cities.h5", h5path="/area",
+                 create_dataset_args=create_ds_args)
     """
 
     if overwrite_data is not None:
@@ -348,42 +487,55 @@ def dicttoh5(treedict, h5file, h5path='/',
                         del h5f[h5name]
 
                 # Create dataset
+                if callable(create_dataset_args):
+                    dataset_args = create_dataset_args(h5name, value)
+                else:
+                    dataset_args = create_dataset_args
+                if dataset_args is None:
+                    # Preserve the storage of datasets read from HDF5
+                    if isinstance(value, LazyDataset):
+                        dataset_args = value.layout
+                    else:
+                        dataset_args = _get_dataset_layout(value)
                 # can't apply filters on scalars (datasets with shape == ())
-                if data.shape == () or create_dataset_args is None:
+                if data.shape == () or dataset_args is None:
                     h5f.create_dataset(h5name,
                                        data=data)
                 else:
                     h5f.create_dataset(h5name,
                                        data=data,
-                                       **create_dataset_args)
+                                       **dataset_args)
                 if attrs_backup:
                     h5f[h5name].attrs.update(attrs_backup)
 
-        # Loop over all attributes
+        # Group the attributes per HDF5 item
+        attributes = OrderedDict()
         for key, value in _iter_treedict(attributes=True):
             if len(key) != 2:
                 raise ValueError("HDF5 attribute must be described by 2 values")
-            h5name = h5path + key[0]
-            attr_name = key[1]
+            attributes.setdefault(h5path + key[0], []).append((key[1], value))
 
+        # Loop over all attributes, accessing each HDF5 item once
+        for h5name, items in attributes.items():
             if h5name not in h5f:
                 # Create an empty group to store the attribute
                 h5f.create_group(h5name)
 
             h5a = h5f[h5name].attrs
-            exists = attr_name in h5a
-
-            if value is None:
-                # Delete HDF5 attribute
-                if exists and change_allowed:
-                    del h5a[attr_name]
-                    exists = False
-            else:
-                # Add/modify HDF5 attribute
-                if exists and not change_allowed:
-                    continue
-                data = _prepare_hdf5_write_value(value)
-                h5a[attr_name] = data
+            for attr_name, value in items:
+                exists = attr_name in h5a
+
+                if value is None:
+                    # Delete HDF5 attribute
+                    if exists and change_allowed:
+                        del h5a[attr_name]
+                        exists = False
+                else:
+                    # Add/modify HDF5 attribute
+                    if exists and not change_allowed:
+                        continue
+                    data = _prepare_hdf5_write_value(value)
+                    h5a[attr_name] = data
 
 
 def _has_nx_class(treedict, key=""):
@@ -526,13 +678,43 @@ def _handle_error(mode: str, exception, msg: str, *args) -> None:
         raise ValueError("Unsupported error handling: %s" % mode)
 
 
+def _read_dataset(dataset, asarray, lazy, lazy_threshold, pool):
+    """Read a dataset for :func:`h5todict`.
+
+    :returns: The data, a memory map or a :class:`LazyDataset`
+    """
+    if not lazy and lazy_threshold is not None and dataset.shape is not None:
+        nbytes = dataset.size * dataset.dtype.itemsize
+        if nbytes > lazy_threshold:
+            data = _memmap_dataset(dataset)
+            if data is not None:
+                return data
+            lazy = True
+
+    if lazy and dataset.shape is not None:
+        url = DataUrl(file_path=dataset.file.filename,
+                      data_path=dataset.name,
+                      scheme="silx")
+        return LazyDataset(url, dataset.shape, dataset.dtype,
+                           asarray=asarray, pool=pool,
+                           layout=_get_dataset_layout(dataset))
+
+    data = h5py_read_dataset(dataset)
+    if asarray:  # Convert HDF5 dataset to numpy array
+        data = numpy.array(data, copy=False)
+    return data
+
+
 def h5todict(h5file,
              path="/",
              exclude_names=None,
              asarray=True,
              dereference_links=True,
              include_attributes=False,
-             errors='raise'):
+             errors='raise',
+             lazy=False,
+             lazy_threshold=None,
+             pool=None):
     """Read a HDF5 file and return a nested dictionary with the complete file
     structure and all data.
 
@@ -575,6 +757,14 @@ def h5todict(h5file,
         - 'raise' (default): Raise an exception
         - 'log': Log as errors
         - 'ignore': Ignore errors
+    :param bool lazy: True to return all datasets as :class:`LazyDataset`
+        proxies, which are read on access. False (default) to read them.
+    :param Union[int,None] lazy_threshold: Datasets larger than this number
+        of bytes are not read: they are memory-mapped when stored contiguous
+        and uncompressed in a HDF5 file, else returned as
+        :class:`LazyDataset`. Default is None (read all datasets).
+    :param Union[silx.io.utils.FilePool,None] pool: Pool of files used by
+        :class:`LazyDataset` to read the data
     :return: Nested dictionary
     """
     h5file, path = _normalize_h5_path(h5file, path)
@@ -633,19 +823,21 @@ def h5todict(h5file,
                                       exclude_names=exclude_names,
                                       asarray=asarray,
                                       dereference_links=dereference_links,
-                                      include_attributes=include_attributes)
+                                      include_attributes=include_attributes,
+                                      errors=errors,
+                                      lazy=lazy,
+                                      lazy_threshold=lazy_threshold,
+                                      pool=pool)
             else:
                 # Child is an HDF5 dataset
                 try:
-                    data = h5py_read_dataset(h5obj)
+                    data = _read_dataset(h5obj, asarray, lazy, lazy_threshold, pool)
                 except OSError:
                     _handle_error(errors,
                                   OSError,
                                   'Cannot retrieve dataset "%s"',
                                   h5name)
                 else:
-                    if asarray:  # Convert HDF5 dataset to numpy array
-                        data = numpy.array(data, copy=False)
                     ddict[key] = data
                     # Read the attributes of the child
                     if include_attributes:
@@ -32,6 +32,8 @@ Following functions help you check the validity of a existing NXdata group:
  - :func:`is_valid_nxdata`
  - :func:`is_NXentry_with_default_NXdata`
  - :func:`is_NXroot_with_default_NXdata`
+ - :func:`probe_nxdata`, a faster check only reading attributes
+ - :func:`classify_nxdata_groups`, to validate all the NXdata groups of a file
 
 To help you write a NXdata group, you can use :func:`save_NXdata`.
 
@@ -57,10 +59,15 @@ Functions
 
 .. autofunction:: is_NXroot_with_default_NXdata
 
+.. autofunction:: probe_nxdata
+
+.. autofunction:: classify_nxdata_groups
+
 .. autofunction:: save_NXdata
 
 """
 from .parse import NXdata, get_default, is_valid_nxdata, InvalidNXdataError, \
-    is_NXentry_with_default_NXdata, is_NXroot_with_default_NXdata, is_group_with_default_NXdata
+    is_NXentry_with_default_NXdata, is_NXroot_with_default_NXdata, is_group_with_default_NXdata, \
+    probe_nxdata, classify_nxdata_groups
 from ._utils import get_attr_as_unicode, get_attr_as_string, nxdata_logger
 from .write import save_NXdata
@@ -38,10 +38,16 @@ Other public functions:
  - :func:`is_NXroot_with_default_NXdata`
  - :func:`is_NXentry_with_default_NXdata`
  - :func:`is_group_with_default_NXdata`
+ - :func:`probe_nxdata`
+ - :func:`classify_nxdata_groups`
 
 """
 
+import collections
 import json
+import os
+import threading
+
 import numpy
 
 from silx.io.utils import is_group, is_file, is_dataset, h5py_read_dataset
@@ -53,7 +59,7 @@ from ._utils import get_attr_as_unicode, INTERPDIM, nxdata_logger, \
 
 __authors__ = ["P. Knobel"]
 __license__ = "MIT"
-__date__ = "24/03/2020"
+__date__ = "19/10/2026"
 
 
 class InvalidNXdataError(Exception):
@@ -130,6 +136,188 @@ class _SilxStyle(object):
         doc="NXdata signal scale type (None, 'linear' or 'log'). str")
 
 
+_VALIDATION_CACHE_SIZE = 1024
+"""Maximum number of validation results kept in cache"""
+
+_validation_cache = collections.OrderedDict()
+_validation_cache_lock = threading.Lock()
+
+
+def _get_validation_key(group):
+    """Returns the key identifying a group in the validation cache, or None
+    if its validation can't be cached.
+
+    Only groups from files opened read-only are cached. The key is made of
+    the file identity, the path of the group and the file modification time.
+
+    :param group: h5py-like group
+    :rtype: Union[tuple,None]
+    """
+    try:
+        h5file = group.file
+        if h5file.mode != "r":
+            return None
+        stat = os.stat(h5file.filename)
+        name = group.name
+    except Exception:
+        return None
+    return stat.st_dev, stat.st_ino, name, stat.st_mtime_ns
+
+
+def _find_issues(group):
+    """Returns the list of error messages for each error found in a NXdata
+    group.
+
+    :param group: h5py-like group
+    :rtype: List[str]
+    """
+    issues = []
+    if get_attr_as_unicode(group, "NX_class") != "NXdata":
+        issues.append("Group has no attribute @NX_class='NXdata'")
+        return issues
+
+    signal_name = get_signal_name(group)
+    if signal_name is None:
+        issues.append("No @signal attribute on the NXdata group, "
+                      "and no dataset with a @signal=1 attr found")
+        # very difficult to do more consistency tests without signal
+        return issues
+
+    elif signal_name not in group or not is_dataset(group[signal_name]):
+        issues.append("Cannot find signal dataset '%s'" % signal_name)
+        return issues
+
+    auxiliary_signals_names = get_auxiliary_signals_names(group)
+    issues += validate_auxiliary_signals(group,
+                                         signal_name,
+                                         auxiliary_signals_names)
+
+    if "axes" in group.attrs:
+        axes_names = get_attr_as_unicode(group, "axes")
+        if isinstance(axes_names, (str, bytes)):
+            axes_names = [axes_names]
+
+        issues += validate_number_of_axes(group, signal_name,
+                                          num_axes=len(axes_names))
+
+        # Test consistency of @uncertainties
+        uncertainties_names = get_uncertainties_names(group, signal_name)
+        if uncertainties_names is not None:
+            if len(uncertainties_names) != len(axes_names):
+                if len(uncertainties_names) < len(axes_names):
+                    # ignore the field to avoid index error in the axes loop
+                    uncertainties_names = None
+                    issues.append("@uncertainties does not define the same " +
+                                  "number of fields than @axes. Field ignored")
+                else:
+                    issues.append("@uncertainties does not define the same " +
+                                  "number of fields than @axes")
+
+        # Test individual axes
+        is_scatter = True  # true if all axes have the same size as the signal
+        signal_size = 1
+        for dim in group[signal_name].shape:
+            signal_size *= dim
+        polynomial_axes_names = []
+        for i, axis_name in enumerate(axes_names):
+
+            if axis_name == ".":
+                continue
+            if axis_name not in group or not is_dataset(group[axis_name]):
+                issues.append("Could not find axis dataset '%s'" % axis_name)
+                continue
+
+            axis_size = 1
+            for dim in group[axis_name].shape:
+                axis_size *= dim
+
+            if len(group[axis_name].shape) != 1:
+                # I don't know how to interpret n-D axes
+                issues.append("Axis %s is not 1D" % axis_name)
+                continue
+            else:
+                # for a  1-d axis,
+                fg_idx = group[axis_name].attrs.get("first_good", 0)
+                lg_idx = group[axis_name].attrs.get("last_good", len(group[axis_name]) - 1)
+                axis_len = lg_idx + 1 - fg_idx
+
+            if axis_len != signal_size:
+                if axis_len not in group[signal_name].shape + (1, 2):
+                    issues.append(
+                            "Axis %s number of elements does not " % axis_name +
+                            "correspond to the length of any signal dimension,"
+                            " it does not appear to be a constant or a linear calibration," +
+                            " and this does not seem to be a scatter plot.")
+                    continue
+                elif axis_len in (1, 2):
+                    polynomial_axes_names.append(axis_name)
+                is_scatter = False
+            else:
+                if not is_scatter:
+                    issues.append(
+                            "Axis %s number of elements is equal " % axis_name +
+                            "to the length of the signal, but this does not seem" +
+                            " to be a scatter (other axes have different sizes)")
+                    continue
+
+            # Test individual uncertainties
+            errors_name = axis_name + "_errors"
+            if errors_name not in group and uncertainties_names is not None:
+                errors_name = uncertainties_names[i]
+                if errors_name in group and axis_name not in polynomial_axes_names:
+                    if group[errors_name].shape != group[axis_name].shape:
+                        issues.append(
+                                "Errors '%s' does not have the same " % errors_name +
+                                "dimensions as axis '%s'." % axis_name)
+
+    # test dimensions of errors associated with signal
+
+    signal_errors = signal_name + "_errors"
+    if "errors" in group and is_dataset(group["errors"]):
+        errors = "errors"
+    elif signal_errors in group and is_dataset(group[signal_errors]):
+        errors = signal_errors
+    else:
+        errors = None
+    if errors:
+        if group[errors].shape != group[signal_name].shape:
+            # In principle just the same size should be enough but
+            # NeXus documentation imposes to have the same shape
+            issues.append(
+                    "Dataset containing standard deviations must " +
+                    "have the same dimensions as the signal.")
+    return issues
+
+
+def _get_issues(group):
+    """Returns the list of issues of a NXdata group, using the validation
+    cache when possible.
+
+    :param group: h5py-like group
+    :rtype: List[str]
+    :raise TypeError: if group is not a h5py-like group
+    """
+    if not is_group(group):
+        raise TypeError("group must be a h5py-like group")
+
+    key = _get_validation_key(group)
+    if key is not None:
+        with _validation_cache_lock:
+            issues = _validation_cache.get(key)
+            if issues is not None:
+                _validation_cache.move_to_end(key)
+                return list(issues)
+
+    issues = _find_issues(group)
+
+    if key is not None:
+        with _validation_cache_lock:
+            _validation_cache[key] = tuple(issues)
+            while len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+                _validation_cache.popitem(last=False)
+    return issues
+
+
 class NXdata(object):
     """NXdata parser.
 
@@ -222,122 +410,7 @@ class NXdata(object):
 
     def _validate(self):
         """Fill :attr:`issues` with error messages for each error found."""
-        if not is_group(self.group):
-            raise TypeError("group must be a h5py-like group")
-        if get_attr_as_unicode(self.group, "NX_class") != "NXdata":
-            self.issues.append("Group has no attribute @NX_class='NXdata'")
-            return
-
-        signal_name = get_signal_name(self.group)
-        if signal_name is None:
-            self.issues.append("No @signal attribute on the NXdata group, "
-                               "and no dataset with a @signal=1 attr found")
-            # very difficult to do more consistency tests without signal
-            return
-
-        elif signal_name not in self.group or not is_dataset(self.group[signal_name]):
-            self.issues.append("Cannot find signal dataset '%s'" % signal_name)
-            return
-
-        auxiliary_signals_names = get_auxiliary_signals_names(self.group)
-        self.issues += validate_auxiliary_signals(self.group,
-                                                  signal_name,
-                                                  auxiliary_signals_names)
-
-        if "axes" in self.group.attrs:
-            axes_names = get_attr_as_unicode(self.group, "axes")
-            if isinstance(axes_names, (str, bytes)):
-                axes_names = [axes_names]
-
-            self.issues += validate_number_of_axes(self.group, signal_name,
-                                                   num_axes=len(axes_names))
-
-            # Test consistency of @uncertainties
-            uncertainties_names = get_uncertainties_names(self.group, signal_name)
-            if uncertainties_names is not None:
-                if len(uncertainties_names) != len(axes_names):
-                    if len(uncertainties_names) < len(axes_names):
-                        # ignore the field to avoid index error in the axes loop
-                        uncertainties_names = None
-                        self.issues.append("@uncertainties does not define the same " +
-                                           "number of fields than @axes. Field ignored")
-                    else:
-                        self.issues.append("@uncertainties does not define the same " +
-                                           "number of fields than @axes")
-
-            # Test individual axes
-            is_scatter = True  # true if all axes have the same size as the signal
-            signal_size = 1
-            for dim in self.group[signal_name].shape:
-                signal_size *= dim
-            polynomial_axes_names = []
-            for i, axis_name in enumerate(axes_names):
-
-                if axis_name == ".":
-                    continue
-                if axis_name not in self.group or not is_dataset(self.group[axis_name]):
-                    self.issues.append("Could not find axis dataset '%s'" % axis_name)
-                    continue
-
-                axis_size = 1
-                for dim in self.group[axis_name].shape:
-                    axis_size *= dim
-
-                if len(self.group[axis_name].shape) != 1:
-                    # I don't know how to interpret n-D axes
-                    self.issues.append("Axis %s is not 1D" % axis_name)
-                    continue
-                else:
-                    # for a  1-d axis,
-                    fg_idx = self.group[axis_name].attrs.get("first_good", 0)
-                    lg_idx = self.group[axis_name].attrs.get("last_good", len(self.group[axis_name]) - 1)
-                    axis_len = lg_idx + 1 - fg_idx
-
-                if axis_len != signal_size:
-                    if axis_len not in self.group[signal_name].shape + (1, 2):
-                        self.issues.append(
-                                "Axis %s number of elements does not " % axis_name +
-                                "correspond to the length of any signal dimension,"
-                                " it does not appear to be a constant or a linear calibration," +
-                                " and this does not seem to be a scatter plot.")
-                        continue
-                    elif axis_len in (1, 2):
-                        polynomial_axes_names.append(axis_name)
-                    is_scatter = False
-                else:
-                    if not is_scatter:
-                        self.issues.append(
-                                "Axis %s number of elements is equal " % axis_name +
-                                "to the length of the signal, but this does not seem" +
-                                " to be a scatter (other axes have different sizes)")
-                        continue
-
-                # Test individual uncertainties
-                errors_name = axis_name + "_errors"
-                if errors_name not in self.group and uncertainties_names is not None:
-                    errors_name = uncertainties_names[i]
-                    if errors_name in self.group and axis_name not in polynomial_axes_names:
-                        if self.group[errors_name].shape != self.group[axis_name].shape:
-                            self.issues.append(
-                                    "Errors '%s' does not have the same " % errors_name +
-                                    "dimensions as axis '%s'." % axis_name)
-
-        # test dimensions of errors associated with signal
-
-        signal_errors = signal_name + "_errors"
-        if "errors" in self.group and is_dataset(self.group["errors"]):
-            errors = "errors"
-        elif signal_errors in self.group and is_dataset(self.group[signal_errors]):
-            errors = signal_errors
-        else:
-            errors = None
-        if errors:
-            if self.group[errors].shape != self.group[signal_name].shape:
-                # In principle just the same size should be enough but
-                # NeXus documentation imposes to have the same shape
-                self.issues.append(
-                        "Dataset containing standard deviations must " +
-                        "have the same dimensions as the signal.")
+        self.issues = _get_issues(self.group)
 
     @property
     def signal_dataset_name(self):
@@ -877,8 +950,73 @@ def is_valid_nxdata(group):   # noqa
     :raise TypeError: if group is not a h5py group, a spech5 group,
         or a fabioh5 group
     """
-    nxd = NXdata(group)
-    return nxd.is_valid
+    return not _get_issues(group)
+
+
+def probe_nxdata(group):
+    """Quickly check if a h5py group looks like a valid NX_data group.
+
+    Only attributes and the names of the group members are checked, the
+    shapes of the datasets are not read. A group for which this function
+    returns False is not a valid NXdata, while a group for which it returns
+    True can still be invalid (see :func:`is_valid_nxdata`).
+
+    :param group: h5py-like group
+    :return: False if this group is not a valid NXdata group.
+    :raise TypeError: if group is not a h5py-like group
+    """
+    if not is_group(group):
+        raise TypeError("group must be a h5py-like group")
+    if get_attr_as_unicode(group, "NX_class") != "NXdata":
+        return False
+
+    key = _get_validation_key(group)
+    if key is not None:
+        with _validation_cache_lock:
+            issues = _validation_cache.get(key)
+        if issues is not None:
+            return not issues
+
+    signal_name = get_signal_name(group)
+    if signal_name is None:
+        return False
+    names = [signal_name]
+    names += get_auxiliary_signals_names(group)
+    axes_names = get_attr_as_unicode(group, "axes", default=[])
+    if isinstance(axes_names, (str, bytes)):
+        axes_names = [axes_names]
+    names += [name for name in axes_names if name != "."]
+    for name in names:
+        if name not in group or not is_dataset(group[name]):
+            return False
+    return True
+
+
+def classify_nxdata_groups(group):
+    """Validate all the NX_data groups contained in a group.
+
+    The group hierarchy is traversed once, and the validation result of each
+    group with @NX_class=NXdata is cached for files opened read-only, so that
+    later calls to :func:`is_valid_nxdata`, :func:`get_default` or
+    :class:`NXdata` on these groups do not validate them again.
+
+    :param group: h5py-like group, usually a file
+    :return: Mapping of the path of each NXdata group to its validity
+    :rtype: Dict[str,bool]
+    :raise TypeError: if group is not a h5py-like group
+    """
+    if not is_group(group):
+        raise TypeError("group must be a h5py-like group")
+
+    result = {}
+
+    def classify(name, obj):
+        if is_group(obj) and get_attr_as_unicode(obj, "NX_class") == "NXdata":
+            result[obj.name] = not _get_issues(obj)
+
+    classify(group.name, group)
+    group.visititems(classify)
+    return result
 
 
 def is_group_with_default_NXdata(group, validate=True):
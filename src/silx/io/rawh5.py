@@ -25,13 +25,18 @@
 This module contains wrapper from file format to h5py. The exposed layout is
 as close as possible to the original file format.
 """
+import logging
+import os
+import struct
+import zipfile
+
 import numpy
 from . import commonh5
-import logging
+from . import utils
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "21/09/2017"
+__date__ = "19/10/2026"
 
 
 _logger = logging.getLogger(__name__)
@@ -50,18 +55,74 @@ class _FreeDataset(commonh5.Dataset):
             _logger.warning(msg)
 
 
+def _memmap_npy(filename, fileobj):
+    """Returns a read-only memory map of a npy array stored in a file.
+
+    :param str filename: Name of the file containing the array
+    :param fileobj: File object positioned at the start of the npy array
+    :returns: The memory map, or None if the array can't be memory mapped
+    :rtype: Union[numpy.memmap,None]
+    """
+    version = numpy.lib.format.read_magic(fileobj)
+    if version == (1, 0):
+        shape, fortran_order, dtype = numpy.lib.format.read_array_header_1_0(fileobj)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = numpy.lib.format.read_array_header_2_0(fileobj)
+    else:
+        return None
+    if dtype.hasobject or 0 in shape:
+        return None
+    return numpy.memmap(filename, dtype=dtype, mode="r",
+                        offset=fileobj.tell(), shape=shape,
+                        order="F" if fortran_order else "C")
+
+
+def _memmap_npz_member(filename, info):
+    """Returns a read-only memory map of a npy member of a npz file.
+
+    Only members stored without compression can be memory mapped.
+
+    :param str filename: Name of the npz file
+    :param zipfile.ZipInfo info: Description of the member
+    :returns: The memory map, or None if the member can't be memory mapped
+    :rtype: Union[numpy.memmap,None]
+    """
+    if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return None
+    with open(filename, "rb") as f:
+        # The local file header can have a different extra field than the
+        # central directory
+        f.seek(info.header_offset)
+        header = f.read(30)
+        if len(header) != 30 or header[:4] != b"PK\x03\x04":
+            return None
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        f.seek(info.header_offset + 30 + name_length + extra_length)
+        return _memmap_npy(filename, f)
+
+
 class NumpyFile(commonh5.File):
     """
     Expose a numpy file `npy`, or `npz` as an h5py.File-like.
 
+    Arrays stored without compression are memory mapped, so that only the
+    accessed part of the data is read from the file.
+
     :param str name: Filename to load
     """
     def __init__(self, name=None):
         commonh5.File.__init__(self, name=name, mode="w")
-        np_file = numpy.load(name)
+        try:
+            np_file = numpy.load(name, mmap_mode="r")
+        except ValueError:
+            # Arrays containing Python objects can't be memory mapped
+            np_file = numpy.load(name)
         if hasattr(np_file, "close"):
             # For npz (created using  by numpy.savez, numpy.savez_compressed)
-            for key, value in np_file.items():
+            for key in np_file.files:
+                value = self.__memmap_member(name, np_file.zip, key)
+                if value is None:
+                    value = np_file[key]
                 self[key] = _FreeDataset(None, data=value)
             np_file.close()
         else:
@@ -69,3 +130,44 @@ class NumpyFile(commonh5.File):
             value = np_file
             dataset = _FreeDataset("data", data=value)
             self.add_node(dataset)
+
+    @staticmethod
+    def __memmap_member(filename, zip_file, key):
+        """Returns a memory map of a npz member, else None"""
+        try:
+            info = zip_file.getinfo(key + ".npy")
+        except KeyError:
+            return None
+        try:
+            return _memmap_npz_member(filename, info)
+        except (IOError, ValueError):
+            _logger.debug("Backtrace", exc_info=True)
+            return None
+
+
+class VolFile(commonh5.File):
+    """
+    Expose a raw volume file `vol` as an h5py.File-like.
+
+    The shape of the volume is read from the `.vol.info` file written by
+    PyHST. The volume is memory mapped, so that only the accessed part of
+    the data is read from the file.
+
+    :param str name: Filename to load
+    :param Union[str,None] info_file: Name of the `.vol.info` file.
+        By default, `name` with the `.info` extension.
+    :param numpy.dtype dtype: Data type of the volume elements
+        (default: float32)
+    :raises IOError: If the info file does not exist
+    :raises ValueError: If the info file or the volume is not valid
+    """
+    def __init__(self, name=None, info_file=None, dtype=numpy.float32):
+        commonh5.File.__init__(self, name=name, mode="w")
+        if info_file is None:
+            info_file = name + ".info"
+        if not os.path.exists(info_file):
+            raise IOError("Info file %s does not exist" % info_file)
+        shape = utils._read_vol_info_shape(info_file)
+        value = numpy.memmap(name, dtype=dtype, mode="r", shape=shape)
+        dataset = _FreeDataset("data", data=value)
+        self.add_node(dataset)
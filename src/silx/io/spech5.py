@@ -198,7 +198,7 @@ from . import commonh5
 
 __authors__ = ["P. Knobel", "D. Naudet"]
 __license__ = "MIT"
-__date__ = "17/07/2018"
+__date__ = "19/10/2026"
 
 logger1 = logging.getLogger(__name__)
 
@@ -568,9 +568,11 @@ class SpecH5(commonh5.File, SpecH5Group):
                  "creator": to_h5py_utf8("silx spech5 %s" % silx_version)}
         commonh5.File.__init__(self, filename, attrs=attrs)
 
-        for scan_key in self._sf.keys():
-            scan = self._sf[scan_key]
-            scan_group = ScanGroup(scan_key, parent=self, scan=scan)
+        # Scan groups are only filled when accessed: the keys come from
+        # the scan index, the scan headers and data are read on demand
+        for scan_index, scan_key in enumerate(self._sf.keys()):
+            scan_group = ScanGroup(scan_key, parent=self,
+                                   scan_index=scan_index)
             self.add_node(scan_group)
 
     def close(self):
@@ -578,16 +580,44 @@ class SpecH5(commonh5.File, SpecH5Group):
         self._sf = None
 
 
-class ScanGroup(commonh5.Group, SpecH5Group):
-    def __init__(self, scan_key, parent, scan):
+class ScanGroup(commonh5.LazyLoadableGroup, SpecH5Group):
+    def __init__(self, scan_key, parent, scan=None, scan_index=None):
         """
 
         :param parent: parent Group
         :param str scan_key: Scan key (e.g. "1.1")
-        :param scan: specfile.Scan object
+        :param scan: specfile.Scan object. If None, the scan is read from
+            the :class:`SpecH5` file containing this group when its content
+            is first accessed.
+        :param int scan_index: Index of the scan in the SpecFile, used to
+            read the scan on demand. By default, the scan key is used.
+        """
+        commonh5.LazyLoadableGroup.__init__(
+            self, scan_key, parent=parent,
+            attrs={"NX_class": to_h5py_utf8("NXentry")})
+        self.__scan = scan
+        self.__scan_index = scan_index
+
+    def _get_scan(self):
+        """Returns the specfile.Scan object exposed by this group.
+
+        :rtype: specfile.Scan
         """
-        commonh5.Group.__init__(self, scan_key, parent=parent,
-                                attrs={"NX_class": to_h5py_utf8("NXentry")})
+        if self.__scan is not None:
+            return self.__scan
+        h5file = self.file
+        if h5file is None or h5file._sf is None:
+            raise RuntimeError("Unable to read scan %s (file closed)" %
+                               self.basename)
+        if self.__scan_index is None:
+            return h5file._sf[self.basename]
+        return h5file._sf[self.__scan_index]
+
+    def _create_child(self):
+        scan = self._get_scan()
+        # The children keep what they need from the scan
+        self.__scan = None
+        scan_key = self.basename
 
         # take title in #S after stripping away scan number and spaces
         s_hdr_line = scan.scan_header_dict["S"]
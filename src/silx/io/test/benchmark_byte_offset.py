@@ -0,0 +1,130 @@
+# coding: utf-8
+# /*##########################################################################
+# Copyright (C) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Benchmark of the CPU byte-offset codec against fabio and OpenCL"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+import logging
+import time
+import unittest
+
+import numpy
+
+from silx.io import byte_offset
+
+try:
+    import fabio.compression
+except ImportError:
+    fabio = None
+
+from silx.opencl.common import ocl
+if ocl:
+    from silx.opencl.codec.byte_offset import ByteOffset
+
+_logger = logging.getLogger(__name__)
+_logger.setLevel(logging.DEBUG)
+
+
+class TestBenchmarkByteOffset(unittest.TestCase):
+    """Benchmark of the decompression of a stack of Pilatus-like frames"""
+
+    SHAPE = 1679, 1475
+    NB_FRAMES = 32
+
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        self.frames = []
+        for _ in range(self.NB_FRAMES):
+            frame = rng.poisson(100, self.SHAPE).astype(numpy.int32)
+            frame.flat[rng.randint(0, frame.size, 2000)] = 1000000
+            self.frames.append(frame)
+        self.raws = byte_offset.encode_many(self.frames)
+        self.size = self.frames[0].size
+
+    def tearDown(self):
+        self.frames = self.raws = None
+
+    def _log(self, name, duration):
+        _logger.info("%s: %.3f s, %.1f frames/s",
+                     name, duration, self.NB_FRAMES / duration)
+
+    def test_benchmark_decode(self):
+        t0 = time.perf_counter()
+        for raw in self.raws:
+            byte_offset.decode(raw, self.size)
+        self._log("silx.io.byte_offset.decode", time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        byte_offset.decode_many(self.raws, self.size)
+        self._log("silx.io.byte_offset.decode_many", time.perf_counter() - t0)
+
+        if fabio is not None:
+            t0 = time.perf_counter()
+            for raw in self.raws:
+                fabio.compression.decByteOffset(raw, size=self.size)
+            self._log("fabio", time.perf_counter() - t0)
+
+        if ocl:
+            codec = ByteOffset(dec_size=self.size)
+            codec.decode(self.raws[0]).get()  # Warm-up
+            t0 = time.perf_counter()
+            for raw in self.raws:
+                codec.decode(raw).get()
+            self._log("OpenCL decode", time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            for frame in codec.decode_stream(self.raws):
+                pass
+            self._log("OpenCL decode_stream", time.perf_counter() - t0)
+
+    def test_benchmark_encode(self):
+        t0 = time.perf_counter()
+        for frame in self.frames:
+            byte_offset.encode(frame)
+        self._log("silx.io.byte_offset.encode", time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        byte_offset.encode_many(self.frames)
+        self._log("silx.io.byte_offset.encode_many", time.perf_counter() - t0)
+
+        if fabio is not None:
+            t0 = time.perf_counter()
+            for frame in self.frames:
+                fabio.compression.compByteOffset(frame)
+            self._log("fabio", time.perf_counter() - t0)
+
+        if ocl:
+            codec = ByteOffset()
+            codec.encode_to_bytes(self.frames[0])  # Warm-up
+            t0 = time.perf_counter()
+            for frame in self.frames:
+                codec.encode_to_bytes(frame)
+            self._log("OpenCL encode", time.perf_counter() - t0)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main()
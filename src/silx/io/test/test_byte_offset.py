@@ -0,0 +1,139 @@
+# coding: utf-8
+# /*##########################################################################
+# Copyright (C) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Tests of the CPU byte-offset codec"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+import unittest
+
+import numpy
+
+from silx.io import byte_offset
+
+try:
+    import fabio.compression
+except ImportError:
+    fabio = None
+
+
+class TestByteOffset(unittest.TestCase):
+
+    @staticmethod
+    def _create_test_data(shape, nexcept, lam=200, seed=0):
+        """Create an image with some large values"""
+        rng = numpy.random.RandomState(seed)
+        ref = rng.poisson(lam, shape).astype(numpy.int32)
+        flat = ref.reshape(-1)
+        flat[rng.randint(0, flat.size, nexcept)] = rng.randint(-1000000, 1000000, nexcept)
+        return ref
+
+    def test_round_trip(self):
+        ref = self._create_test_data((91, 97), 229)
+        raw = byte_offset.encode(ref)
+        self.assertIsInstance(raw, bytes)
+        res = byte_offset.decode(raw, size=ref.size)
+        self.assertEqual(res.dtype, numpy.int32)
+        self.assertTrue(numpy.array_equal(res, ref.ravel()))
+
+        # Without size, the whole stream is decoded
+        self.assertTrue(numpy.array_equal(byte_offset.decode(raw), ref.ravel()))
+
+        res = byte_offset.decode(numpy.frombuffer(raw, numpy.int8),
+                                 size=ref.size, dtype=numpy.float32)
+        self.assertEqual(res.dtype, numpy.float32)
+        self.assertTrue(numpy.array_equal(res, ref.ravel()))
+
+        out = numpy.zeros(ref.size, dtype=numpy.float64)
+        res = byte_offset.decode(raw, size=ref.size, out=out)
+        self.assertTrue(numpy.array_equal(out, ref.ravel()))
+
+    def test_large_differences(self):
+        """Test the 32 and 64 bits escapes"""
+        ref = numpy.array([0, 127, -1, -129, 32767, -32768, 2**31 - 1,
+                           -2**31, 2**31 - 1, 5], dtype=numpy.int64)
+        res = byte_offset.decode(byte_offset.encode(ref), size=ref.size,
+                                 dtype=numpy.float64)
+        self.assertTrue(numpy.array_equal(res, ref))
+
+    @unittest.skipIf(fabio is None, "fabio is not available")
+    def test_fabio(self):
+        """Compare with the implementation of fabio"""
+        ref = self._create_test_data((512, 517), 2729)
+        raw = fabio.compression.compByteOffset(ref)
+        self.assertEqual(byte_offset.encode(ref), raw)
+        self.assertTrue(numpy.array_equal(byte_offset.decode(raw, ref.size),
+                                          ref.ravel()))
+
+    def test_many(self):
+        frames = [self._create_test_data((64, 65), 100 * i, seed=i)
+                  for i in range(10)]
+        raws = byte_offset.encode_many(frames, num_threads=4)
+        self.assertEqual(raws, [byte_offset.encode(frame) for frame in frames])
+
+        res = byte_offset.decode_many(raws, size=frames[0].size, num_threads=4)
+        self.assertEqual(res.shape, (10, frames[0].size))
+        self.assertTrue(numpy.array_equal(res, numpy.array(frames).reshape(10, -1)))
+
+        out = numpy.empty((10, frames[0].size), dtype=numpy.float32)
+        res = byte_offset.decode_many(raws, size=frames[0].size, out=out)
+        self.assertIs(res, out)
+        self.assertTrue(numpy.array_equal(out, numpy.array(frames).reshape(10, -1)))
+
+    def test_errors(self):
+        raw = byte_offset.encode(numpy.array([0, 1000, 2], dtype=numpy.int32))
+        with self.assertRaises(ValueError):  # Truncated in the middle of a value
+            byte_offset.decode(raw[:2], size=3)
+        with self.assertRaises(ValueError):  # Not enough values
+            byte_offset.decode(raw, size=4)
+        with self.assertRaises(ValueError):
+            byte_offset.decode_many([raw, raw])
+        with self.assertRaises(ValueError):
+            byte_offset.encode_many([numpy.zeros(3, dtype=numpy.int32),
+                                     numpy.zeros(4, dtype=numpy.int32)])
+
+    def test_unsupported_dtypes(self):
+        raw = byte_offset.encode(numpy.arange(5, dtype=numpy.int32))
+        with self.assertRaises(ValueError):
+            byte_offset.decode(raw, dtype=numpy.int64)
+        with self.assertRaises(ValueError):
+            byte_offset.decode(raw, out=numpy.empty(5, dtype=numpy.uint8))
+        with self.assertRaises(ValueError):
+            byte_offset.encode(numpy.arange(5, dtype=numpy.float32))
+        raw = byte_offset.encode(numpy.array([True, False]))
+        self.assertEqual(list(byte_offset.decode(raw)), [1, 0])
+
+    def test_uint64_overflow(self):
+        data = numpy.array([2**64 - 1, 2**63 + 5], dtype=numpy.uint64)
+        with self.assertRaises(ValueError):
+            byte_offset.encode(data)
+        with self.assertRaises(ValueError):
+            byte_offset.encode_many([data[:1], data[1:]])
+
+        # Values representable as int64 are supported
+        data = numpy.array([2**63 - 1, 0, 5], dtype=numpy.uint64)
+        raw = byte_offset.encode(data)
+        result = byte_offset.decode(raw, dtype=numpy.float64)
+        self.assertEqual(list(result), [float(2**63 - 1), 0., 5.])
@@ -99,6 +99,12 @@ class _TestCommonFeatures(unittest.TestCase):
         self.assertEqual(class_, h5py.Dataset)
         self.assertEqual(classlink, h5py.HardLink)
 
+    def test_read_direct(self):
+        node = self.h5["group/dataset"]
+        out = numpy.zeros((), dtype=numpy.float64)
+        node.read_direct(out)
+        self.assertEqual(out, 50)
+
     def test_soft_link(self):
         node = self.h5["link/soft_link"]
         self.assertEqual(node.name, "/link/soft_link")
@@ -235,6 +241,13 @@ class TestSpecificCommonH5(unittest.TestCase):
         except RuntimeError:
             pass
 
+    def test_read_direct_selection(self):
+        f = commonh5.File(name="Foo", mode="w")
+        node = f.create_dataset("foo", data=numpy.arange(12).reshape(3, 4))
+        out = numpy.zeros((2, 4), dtype=numpy.float32)
+        node.read_direct(out, source_sel=numpy.s_[1, :2], dest_sel=numpy.s_[1, 2:])
+        numpy.testing.assert_array_equal(out, [[0, 0, 0, 0], [0, 0, 4, 5]])
+
     def test_create_dataset(self):
         f = commonh5.File(name="Foo", mode="w")
         node = f.create_dataset("foo", data=numpy.array([1]))
@@ -283,3 +296,62 @@ class TestSpecificCommonH5(unittest.TestCase):
         group["a"] = 10
         group["b"] = commonh5.SoftLink(None, path="/" + self.id() + "/a")
         self.assertEqual(group["b"].dtype.kind, "i")
+
+    def test_path_index(self):
+        f = commonh5.File(name="Foo", mode="w")
+        group = f.create_group("a/b")
+        dataset = group.create_dataset("c", data=numpy.array(1))
+        f["link"] = commonh5.SoftLink(None, path="/a/b")
+        self.assertIs(f["/a/b/c"], dataset)
+        self.assertIs(f["a/b/c"], dataset)
+        self.assertIs(group["/a/b/c"], dataset)
+        self.assertIn("/a/b/c", f)
+        self.assertNotIn("/a/b/d", f)
+        self.assertIsNone(f.get("/a/b/d"))
+        self.assertIs(f["/link/c"], dataset)
+        self.assertIsInstance(f.get("/link", getlink=True), commonh5.SoftLink)
+
+        # Children added after a lookup are found
+        other = group.create_dataset("d", data=numpy.array(2))
+        self.assertIs(f["/a/b/d"], other)
+
+        # Replacing a node drops memorized paths
+        new_group = commonh5.Group("b")
+        f["a"].add_node(new_group)
+        self.assertIs(f["/a/b"], new_group)
+        self.assertNotIn("/a/b/c", f)
+
+    def test_path_index_disabled(self):
+        f = commonh5.File(name="Foo", mode="w", path_index=False)
+        dataset = f.create_group("a").create_dataset("b", data=numpy.array(1))
+        self.assertIs(f["/a/b"], dataset)
+        self.assertNotIn("/a/c", f)
+
+    def test_delitem(self):
+        f = commonh5.File(name="Foo", mode="w")
+        f.create_group("a/b")
+        self.assertIn("/a/b", f)
+        del f["/a/b"]
+        self.assertNotIn("/a/b", f)
+        self.assertIn("/a", f)
+        with self.assertRaises(KeyError):
+            del f["a/b"]
+        readonly = commonh5.File(name="Foo", mode="r")
+        readonly.add_node(commonh5.Group("a"))
+        with self.assertRaises(RuntimeError):
+            del readonly["a"]
+
+    def test_visit(self):
+        f = commonh5.File(name="Foo", mode="w")
+        f.create_group("a/b").create_dataset("c", data=numpy.array(1))
+        f["a/link"] = commonh5.SoftLink(None, path="/a/b")
+        names = []
+        f["a"].visit(names.append)
+        self.assertEqual(names, ["b", "b/c"])
+        items = []
+        f.visititems(lambda name, obj: items.append((name, obj.name)),
+                     visit_links=True)
+        self.assertEqual(items, [("a", "/a"), ("a/b", "/a/b"),
+                                 ("a/b/c", "/a/b/c"), ("a/link", "/a/link")])
+        self.assertEqual(f.visit(lambda name: name if name.endswith("c") else None),
+                         "a/b/c")
@@ -25,7 +25,7 @@
 
 __authors__ = ["P. Knobel"]
 __license__ = "MIT"
-__date__ = "17/01/2018"
+__date__ = "19/10/2026"
 
 from collections import OrderedDict
 import numpy
@@ -46,6 +46,7 @@ from ..dictdump import h5todict, load
 from ..dictdump import logger as dictdump_logger
 from ..utils import is_link
 from ..utils import h5py_read_dataset
+from ..utils import FilePool
 
 
 def tree():
@@ -583,6 +584,106 @@ class TestH5ToDict(H5DictTestCase):
         numpy.testing.assert_array_equal(ddict[("", "attr_2utf8")], adict[("", "attr_2utf8")])
 
 
+class TestLazyH5ToDict(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.h5_fname = os.path.join(self.tempdir, "lazy.h5")
+        with h5py.File(self.h5_fname, "w") as h5f:
+            h5f["scalar"] = 10
+            h5f["contiguous"] = numpy.arange(1000)
+            h5f.create_dataset("chunked", data=numpy.arange(1000),
+                               chunks=(100,), compression="gzip")
+            h5f["group/small"] = numpy.arange(3)
+
+    def tearDown(self):
+        if os.path.exists(self.h5_fname):
+            os.unlink(self.h5_fname)
+        os.rmdir(self.tempdir)
+
+    def testLazy(self):
+        ddict = h5todict(self.h5_fname, lazy=True)
+        data = ddict["chunked"]
+        self.assertIsInstance(data, dictdump.LazyDataset)
+        self.assertEqual(data.shape, (1000,))
+        self.assertEqual(data.dtype, numpy.arange(1).dtype)
+        self.assertEqual(len(data), 1000)
+        self.assertEqual(data[10], 10)
+        numpy.testing.assert_array_equal(data[5:8], [5, 6, 7])
+        numpy.testing.assert_array_equal(numpy.array(data), numpy.arange(1000))
+        self.assertEqual(data.layout["chunks"], (100,))
+        self.assertEqual(data.layout["compression"], "gzip")
+
+        self.assertIsInstance(ddict["group"]["small"], dictdump.LazyDataset)
+        numpy.testing.assert_array_equal(ddict["group"]["small"].load(), [0, 1, 2])
+        self.assertEqual(ddict["scalar"].load(), 10)
+
+    def testLazyWithPool(self):
+        with FilePool() as pool:
+            ddict = h5todict(self.h5_fname, lazy=True, pool=pool)
+            self.assertEqual(len(pool), 0)
+            numpy.testing.assert_array_equal(ddict["group"]["small"].load(), [0, 1, 2])
+            self.assertEqual(ddict["chunked"][999], 999)
+            self.assertEqual(len(pool), 1)
+
+    def testLazyThreshold(self):
+        ddict = h5todict(self.h5_fname, lazy_threshold=100)
+        # Large contiguous dataset is memory-mapped
+        self.assertIsInstance(ddict["contiguous"], numpy.memmap)
+        numpy.testing.assert_array_equal(ddict["contiguous"], numpy.arange(1000))
+        # Large chunked dataset is left lazy
+        self.assertIsInstance(ddict["chunked"], dictdump.LazyDataset)
+        # Small datasets are read
+        self.assertIsInstance(ddict["group"]["small"], numpy.ndarray)
+        self.assertNotIsInstance(ddict["group"]["small"], numpy.memmap)
+        self.assertEqual(ddict["scalar"], 10)
+
+    def testRoundTripPreservesChunks(self):
+        ddict = h5todict(self.h5_fname, lazy=True)
+        filename = os.path.join(self.tempdir, "copy.h5")
+        try:
+            dicttoh5(ddict, filename)
+            with h5py.File(filename, "r") as h5f:
+                self.assertEqual(h5f["chunked"].chunks, (100,))
+                self.assertEqual(h5f["chunked"].compression, "gzip")
+                self.assertIsNone(h5f["contiguous"].chunks)
+                numpy.testing.assert_array_equal(h5f["chunked"][()], numpy.arange(1000))
+        finally:
+            os.unlink(filename)
+
+
+class TestDictToH5DatasetArgs(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.h5_fname = os.path.join(self.tempdir, "args.h5")
+
+    def tearDown(self):
+        if os.path.exists(self.h5_fname):
+            os.unlink(self.h5_fname)
+        os.rmdir(self.tempdir)
+
+    def testPerKeyArgs(self):
+        calls = []
+
+        def create_dataset_args(name, value):
+            calls.append(name)
+            if name.endswith("large"):
+                return {"chunks": (10,), "compression": "gzip"}
+            return None
+
+        ddict = {"large": numpy.arange(100),
+                 "group": {"small": numpy.arange(3)},
+                 ("group", "attr1"): 1,
+                 ("group", "attr2"): "a"}
+        dicttoh5(ddict, self.h5_fname, create_dataset_args=create_dataset_args)
+        self.assertEqual(sorted(calls), ["/group/small", "/large"])
+        with h5py.File(self.h5_fname, "r") as h5f:
+            self.assertEqual(h5f["large"].chunks, (10,))
+            self.assertEqual(h5f["large"].compression, "gzip")
+            self.assertIsNone(h5f["group/small"].chunks)
+            self.assertEqual(h5f["group"].attrs["attr1"], 1)
+            self.assertEqual(h5f["group"].attrs["attr2"], "a")
+
+
 class TestDictToNx(H5DictTestCase):
     def setUp(self):
         self.tempdir = tempfile.mkdtemp()
@@ -613,3 +613,11 @@ class TestFabioH5WithFileSeries(unittest.TestCase):
         frameData = _TestableFrameData("foo", reader)
         self.assertEqual(frameData.dtype.kind, "i")
         self.assertEqual(frameData.shape, (10, 3, 2))
+
+    def testFrameDataReadDirect(self):
+        file_series = fabioh5._FileSeries(self.edf_filenames)
+        reader = fabioh5.FabioReader(file_series=file_series)
+        frameData = _TestableFrameData("foo", reader)
+        out = numpy.zeros((3, 2), dtype=numpy.float32)
+        frameData.read_direct(out, source_sel=4)
+        numpy.testing.assert_array_equal(out, [[4, 11], [12, 13], [14, 15]])
@@ -25,9 +25,10 @@
 
 __authors__ = ["P. Knobel"]
 __license__ = "MIT"
-__date__ = "24/03/2020"
+__date__ = "19/10/2026"
 
 
+import os
 import tempfile
 import unittest
 import h5py
@@ -463,6 +464,90 @@ class TestLegacyNXdata(unittest.TestCase):
                          ["yaxis", None])
 
 
+class TestValidationCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.h5fname = os.path.join(self.tmpdir, "nxdata_cache.h5")
+        with h5py.File(self.h5fname, "w") as h5f:
+            entry = h5f.create_group("entry")
+            entry.attrs["NX_class"] = "NXentry"
+            entry.attrs["default"] = "valid"
+
+            g = entry.create_group("valid")
+            g.attrs["NX_class"] = "NXdata"
+            g.attrs["signal"] = "image"
+            g.attrs["axes"] = numpy.array(["y", "x"], dtype=text_dtype)
+            g.create_dataset("image", data=numpy.arange(4 * 6).reshape((4, 6)))
+            g.create_dataset("y", data=numpy.arange(4))
+            g.create_dataset("x", data=numpy.arange(6))
+
+            g = entry.create_group("bad_shape")
+            g.attrs["NX_class"] = "NXdata"
+            g.attrs["signal"] = "image"
+            g.attrs["axes"] = numpy.array(["y", "x"], dtype=text_dtype)
+            g.create_dataset("image", data=numpy.arange(4 * 6).reshape((4, 6)))
+            g.create_dataset("y", data=numpy.arange(5))
+            g.create_dataset("x", data=numpy.arange(6))
+
+            g = entry.create_group("missing_axis")
+            g.attrs["NX_class"] = "NXdata"
+            g.attrs["signal"] = "image"
+            g.attrs["axes"] = numpy.array(["y", "x"], dtype=text_dtype)
+            g.create_dataset("image", data=numpy.arange(4 * 6).reshape((4, 6)))
+            g.create_dataset("y", data=numpy.arange(4))
+
+            entry.create_group("not_nxdata")
+        self._cache = nxdata.parse._validation_cache
+        self._cache.clear()
+
+    def tearDown(self):
+        self._cache.clear()
+        os.unlink(self.h5fname)
+        os.rmdir(self.tmpdir)
+
+    def testCache(self):
+        with h5py.File(self.h5fname, "r") as h5f:
+            self.assertTrue(nxdata.is_valid_nxdata(h5f["/entry/valid"]))
+            self.assertEqual(len(self._cache), 1)
+            self.assertFalse(nxdata.is_valid_nxdata(h5f["/entry/bad_shape"]))
+            self.assertEqual(len(self._cache), 2)
+            # Cached results are used
+            self.assertTrue(nxdata.is_valid_nxdata(h5f["/entry/valid"]))
+            nxd = nxdata.get_default(h5f["/entry"])
+            self.assertIsNotNone(nxd)
+            self.assertEqual(nxd.signal.shape, (4, 6))
+            nxd = nxdata.NXdata(h5f["/entry/bad_shape"])
+            self.assertFalse(nxd.is_valid)
+            self.assertNotEqual(nxd.issues, [])
+            self.assertEqual(len(self._cache), 2)
+
+    def testNoCacheForWritableFile(self):
+        with h5py.File(self.h5fname, "a") as h5f:
+            self.assertTrue(nxdata.is_valid_nxdata(h5f["/entry/valid"]))
+            self.assertEqual(len(self._cache), 0)
+
+    def testProbe(self):
+        with h5py.File(self.h5fname, "r") as h5f:
+            self.assertTrue(nxdata.probe_nxdata(h5f["/entry/valid"]))
+            # Shapes are not checked
+            self.assertTrue(nxdata.probe_nxdata(h5f["/entry/bad_shape"]))
+            self.assertFalse(nxdata.probe_nxdata(h5f["/entry/missing_axis"]))
+            self.assertFalse(nxdata.probe_nxdata(h5f["/entry/not_nxdata"]))
+            # Use the cached validation once available
+            nxdata.is_valid_nxdata(h5f["/entry/bad_shape"])
+            self.assertFalse(nxdata.probe_nxdata(h5f["/entry/bad_shape"]))
+
+    def testClassify(self):
+        with h5py.File(self.h5fname, "r") as h5f:
+            result = nxdata.classify_nxdata_groups(h5f)
+            self.assertEqual(result, {
+                "/entry/valid": True,
+                "/entry/bad_shape": False,
+                "/entry/missing_axis": False,
+            })
+            self.assertEqual(len(self._cache), 3)
+
+
 class TestSaveNXdata(unittest.TestCase):
     def setUp(self):
         tmp = tempfile.NamedTemporaryFile(prefix="nxdata",
@@ -26,7 +26,7 @@
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "21/09/2017"
+__date__ = "19/10/2026"
 
 
 import unittest
@@ -34,6 +34,7 @@ import tempfile
 import numpy
 import shutil
 from ..import rawh5
+from .. import utils
 
 
 class TestNumpyFile(unittest.TestCase):
@@ -83,3 +84,59 @@ class TestNumpyFile(unittest.TestCase):
         h5 = rawh5.NumpyFile(filename)
         self.assertIn("a/b/c", h5)
         self.assertIn("a/b/e", h5)
+
+    def testNumpyFileMemmap(self):
+        filename = "%s/%s.npy" % (self.tmpDirectory, self.id())
+        c = numpy.asfortranarray(numpy.random.rand(5, 6))
+        numpy.save(filename, c)
+        h5 = rawh5.NumpyFile(filename)
+        self.assertIsInstance(h5["data"][()], numpy.memmap)
+        numpy.testing.assert_array_equal(h5["data"][1:3, 2], c[1:3, 2])
+
+    def testNumpyZFileMemmap(self):
+        filename = "%s/%s.npz" % (self.tmpDirectory, self.id())
+        a = numpy.arange(12).reshape(3, 4)
+        numpy.savez(filename, a=a, b=numpy.zeros((0, 2)), c=numpy.array(2.5))
+        h5 = rawh5.NumpyFile(filename)
+        self.assertIsInstance(h5["a"][()], numpy.memmap)
+        numpy.testing.assert_array_equal(h5["a"][()], a)
+        self.assertEqual(h5["b"].shape, (0, 2))
+        self.assertEqual(h5["c"][()], 2.5)
+
+    def testCompressedNumpyZFile(self):
+        filename = "%s/%s.npz" % (self.tmpDirectory, self.id())
+        a = numpy.arange(12).reshape(3, 4)
+        numpy.savez_compressed(filename, a=a)
+        h5 = rawh5.NumpyFile(filename)
+        self.assertNotIsInstance(h5["a"][()], numpy.memmap)
+        numpy.testing.assert_array_equal(h5["a"][()], a)
+
+
+class TestVolFile(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpDirectory = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpDirectory)
+
+    def testVolFile(self):
+        filename = "%s/%s.vol" % (self.tmpDirectory, self.id())
+        data = numpy.arange(2 * 3 * 4, dtype=numpy.float32).reshape(2, 3, 4)
+        data.tofile(filename)
+        with open(filename + ".info", "w") as f:
+            f.write("! PyHST_SLAVE VOLUME INFO FILE\n")
+            f.write("NUM_X =  4\nNUM_Y =  3\nNUM_Z =  2\n")
+
+        with utils.open(filename) as h5:
+            self.assertIsInstance(h5, rawh5.VolFile)
+            self.assertEqual(h5["data"].shape, (2, 3, 4))
+            numpy.testing.assert_array_equal(h5["data"][1, :, 2], data[1, :, 2])
+
+    def testVolFileWithoutInfo(self):
+        filename = "%s/%s.vol" % (self.tmpDirectory, self.id())
+        numpy.zeros(10, dtype=numpy.float32).tofile(filename)
+        with self.assertRaises(IOError):
+            rawh5.VolFile(filename)
@@ -22,6 +22,7 @@
 #
 # ############################################################################*/
 """Tests for spech5"""
+import numpy
 from numpy import array_equal
 import os
 import io
@@ -397,6 +398,27 @@ class TestSpecH5(unittest.TestCase):
         self.assertEqual(self.sfh5["1.2"].attrs,
                          {"NX_class": "NXentry", })
 
+    def testLazyScanGroup(self):
+        sfh5 = SpecH5(self.fname)
+        created = []
+        create_child = spech5.ScanGroup._create_child
+
+        def _create_child(group):
+            created.append(group.name)
+            create_child(group)
+
+        spech5.ScanGroup._create_child = _create_child
+        try:
+            self.assertIn("1000.1", sfh5)
+            self.assertEqual(created, [])
+            self.assertEqual(sfh5["/1000.1"].attrs["NX_class"], "NXentry")
+            self.assertEqual(created, [])
+            self.assertIn("/1000.1/title", sfh5)
+            self.assertEqual(created, ["/1000.1"])
+        finally:
+            spech5.ScanGroup._create_child = create_child
+            sfh5.close()
+
     def testMcaAbsent(self):
         def access_absent_mca():
             """This must raise a KeyError, because scan 1.1 has no MCA"""
@@ -462,6 +484,13 @@ class TestSpecH5(unittest.TestCase):
         # attrs
         self.assertEqual(mca_0_data.attrs, {"interpretation": "spectrum"})
 
+    def testMcaDataReadDirect(self):
+        mca_0_data = self.sfh5["/1.2/measurement/mca_0/data"]
+        out = numpy.zeros(mca_0_data.shape[1:], dtype=numpy.float32)
+        mca_0_data.read_direct(out, source_sel=1)
+        self.assertAlmostEqual(out.sum(), 12.1, places=4)
+        numpy.testing.assert_allclose(out, mca_0_data[1])
+
     def testMotorPosition(self):
         positioners_group = self.sfh5["/1.1/instrument/positioners"]
         # MRTSlit DOWN position is defined in #P0 san header line
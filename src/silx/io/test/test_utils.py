@@ -31,6 +31,7 @@ import shutil
 import tempfile
 import unittest
 import sys
+import threading
 
 from .. import utils
 from ..._version import calc_hexversion
@@ -612,6 +613,133 @@ class TestGetData(unittest.TestCase):
         url = "silx:/foo/bar"
         self.assertRaises(IOError, utils.get_data, url)
 
+    def test_pool(self):
+        h5_url = "silx:%s?/group/group/array" % self.h5_filename
+        edf_url = "fabio:%s?slice=1" % self.edf_multiframe_filename
+        with utils.FilePool(max_size=1) as pool:
+            for _ in range(2):
+                data = utils.get_data(h5_url, pool=pool)
+                self.assertEqual(data[0], 1)
+                self.assertEqual(len(pool), 1)
+            with pool.open(self.h5_filename) as h5:
+                self.assertIn("group", h5)
+                h5_file = h5
+
+            data = utils.get_data(edf_url, pool=pool)
+            self.assertEqual(data.shape, (2, 2))
+            self.assertEqual(len(pool), 1)
+            # Least recently used file was closed
+            self.assertFalse(bool(h5_file.id))
+
+            url = "silx:%s?/group/group/missing" % self.h5_filename
+            self.assertRaises(ValueError, utils.get_data, url, pool=pool)
+            pool.close(self.h5_filename)
+            self.assertEqual(len(pool), 0)
+
+    def test_pool_slow_open(self):
+        opening = threading.Event()
+        release = threading.Event()
+
+        class SlowPool(utils.FilePool):
+            @staticmethod
+            def _open(filename, scheme):
+                if scheme == "fabio":
+                    opening.set()
+                    release.wait(10)
+                return utils.FilePool._open(filename, scheme)
+
+        h5_url = "silx:%s?/group/group/array" % self.h5_filename
+        edf_url = "fabio:%s?slice=1" % self.edf_multiframe_filename
+        with SlowPool() as pool:
+            utils.get_data(h5_url, pool=pool)
+            thread = threading.Thread(target=utils.get_data, args=(edf_url, pool))
+            thread.start()
+            try:
+                self.assertTrue(opening.wait(10))
+                # The opened file is still reachable while the other opens
+                self.assertEqual(utils.get_data(h5_url, pool=pool)[0], 1)
+            finally:
+                release.set()
+                thread.join()
+            self.assertEqual(len(pool), 2)
+
+    def test_pool_modified_file(self):
+        filename = os.path.join(self.tmp_directory, "modified.edf")
+        url = "fabio:%s" % filename
+        with utils.FilePool() as pool:
+            fabio.edfimage.EdfImage(numpy.zeros((2, 2))).write(filename)
+            self.assertEqual(utils.get_data(url, pool=pool).shape, (2, 2))
+            fabio.edfimage.EdfImage(numpy.zeros((3, 3))).write(filename)
+            self.assertEqual(utils.get_data(url, pool=pool).shape, (3, 3))
+
+    def test_out(self):
+        url = "silx:%s?path=/group/group/array2d&slice=1" % self.h5_filename
+        out = numpy.zeros(5, dtype=numpy.float32)
+        data = utils.get_data(url, out=out)
+        self.assertIs(data, out)
+        numpy.testing.assert_array_equal(out, [6, 7, 8, 9, 10])
+
+        url = "silx:%s?/group/group/scalar" % self.h5_filename
+        out = numpy.zeros((), dtype=numpy.uint8)
+        utils.get_data(url, out=out)
+        self.assertEqual(out, 50)
+
+        url = "fabio:%s?slice=1" % self.edf_multiframe_filename
+        out = numpy.zeros((2, 2), dtype=numpy.float64)
+        utils.get_data(url, out=out)
+        numpy.testing.assert_array_equal(out, [[10, 50], [50, 10]])
+
+        url = "silx:%s?/scan_0/instrument/detector_0/data" % self.edf_filename
+        out = numpy.zeros((2, 2), dtype=numpy.float32)
+        utils.get_data(url, out=out)
+        numpy.testing.assert_array_equal(out, [[10, 50], [50, 10]])
+
+    def test_h5py_read_dataset_out(self):
+        with h5py.File(self.h5_filename, mode="r") as h5:
+            dataset = h5["group/group/array2d"]
+            out = numpy.zeros((2, 5), dtype=numpy.int8)
+            utils.h5py_read_dataset(dataset, out=out)
+            numpy.testing.assert_array_equal(out, dataset[()])
+
+            # Not contiguous
+            out = numpy.zeros((5, 2), dtype=numpy.float64).T
+            utils.h5py_read_dataset(dataset, index=numpy.s_[:, :], out=out)
+            numpy.testing.assert_array_equal(out, dataset[()])
+
+            out = numpy.zeros((3,), dtype=numpy.float64)
+            utils.h5py_read_dataset(dataset, index=numpy.s_[1, 2:], out=out)
+            numpy.testing.assert_array_equal(out, [8, 9, 10])
+
+    def test_get_data_many(self):
+        urls = [
+            "silx:%s?path=/group/group/array2d&slice=1" % self.h5_filename,
+            "fabio:%s?slice=1" % self.edf_multiframe_filename,
+            "silx:%s?path=/group/group/array2d&slice=0,1:3" % self.h5_filename,
+            "silx:%s?path=/group/group/array2d&slice=-2" % self.h5_filename,
+            "silx:%s?/group/group/scalar" % self.h5_filename,
+            "silx:%s?path=/group/group/array&slice=..." % self.h5_filename,
+            "silx:%s?path=/group/group/array&slice=1" % self.h5_filename,
+            "silx:%s?path=/group/group/array&slice=2" % self.h5_filename,
+        ]
+        for pool in (None, utils.FilePool()):
+            with self.subTest(pool=pool):
+                result = utils.get_data_many(urls, pool=pool)
+                self.assertEqual(len(result), len(urls))
+                for url, data in zip(urls, result):
+                    expected = utils.get_data(url)
+                    numpy.testing.assert_array_equal(data, expected)
+                    self.assertIs(type(data), type(expected))
+                    self.assertEqual(data.dtype, expected.dtype)
+                if pool is not None:
+                    self.assertEqual(len(pool), 2)
+                    pool.close()
+
+    def test_get_data_many_errors(self):
+        urls = ["silx:%s?/group/group/array" % self.h5_filename,
+                "silx:%s?/group/group/missing" % self.h5_filename]
+        self.assertRaises(ValueError, utils.get_data_many, urls)
+        self.assertRaises(IOError, utils.get_data_many, ["silx:/foo/bar"])
+
 
 def _h5_py_version_older_than(version):
     v_majeur, v_mineur, v_micro = [int(i) for i in h5py.version.version.split('.')[:3]]
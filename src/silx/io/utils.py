@@ -25,11 +25,13 @@
 
 __authors__ = ["P. Knobel", "V. Valls"]
 __license__ = "MIT"
-__date__ = "03/12/2020"
+__date__ = "19/10/2026"
 
+import contextlib
 import enum
 import os.path
 import sys
+import threading
 import time
 import logging
 import collections
@@ -102,6 +104,8 @@ def supported_extensions(flat_formats=True):
         extensions.append("*.npy")
 
     formats["Numpy binary files"] = set(extensions)
+    if flat_formats:
+        formats["Raw volume files"] = set(["*.vol"])
     formats["Coherent X-Ray Imaging files"] = set(["*.cxi"])
     return formats
 
@@ -462,6 +466,7 @@ def _open_local_file(filename):
     - SPEC files exposed as a NeXus layout
     - raster files exposed as a NeXus layout (if `fabio` is installed)
     - Numpy files ('npy' and 'npz' files)
+    - Raw volume files ('vol' files with a '.vol.info' file)
 
     The file is opened in read-only mode.
 
@@ -484,6 +489,14 @@ def _open_local_file(filename):
                 debugging_info.append((sys.exc_info(),
                                       "File '%s' can't be read as a numpy file." % filename))
 
+        if extension == ".vol":
+            try:
+                from . import rawh5
+                return rawh5.VolFile(filename)
+            except (IOError, ValueError) as e:
+                debugging_info.append((sys.exc_info(),
+                                      "File '%s' can't be read as a raw volume file." % filename))
+
         if h5py.is_hdf5(filename):
             try:
                 return h5py.File(filename, "r")
@@ -569,6 +582,7 @@ def open(filename):  # pylint:disable=redefined-builtin
     - SPEC files exposed as a NeXus layout
     - raster files exposed as a NeXus layout (if `fabio` is installed)
     - Numpy files ('npy' and 'npz' files)
+    - Raw volume files ('vol' files with a '.vol.info' file)
 
     The filename can be trailled an HDF5 path using the separator `::`. In this
     case the object returned is a proxy to the target node, implementing the
@@ -780,7 +794,250 @@ def is_link(obj):
     return t in {H5Type.SOFT_LINK, H5Type.EXTERNAL_LINK}
 
 
-def get_data(url):
+class FilePool(object):
+    """Thread-safe pool of opened files, used to read many data from the same
+    files without paying the cost of opening them on each access.
+
+    The least recently used files are closed when more than `max_size` files
+    are opened. A file which was modified since it was opened (modification
+    time or size changed) is reopened.
+
+    The pool can be used as a context manager, which closes all the files at
+    exit.
+
+    .. code-block:: python
+
+        with FilePool() as pool:
+            for url in urls:
+                data = silx.io.get_data(url, pool=pool)
+
+    :param int max_size: Maximum number of files kept opened
+    """
+
+    class _Entry(object):
+        """An opened file of the pool"""
+
+        def __init__(self, handle, stat):
+            self.handle = handle
+            self.stat = stat
+            self.lock = threading.RLock()
+            self.users = 0
+            self.discarded = False
+
+        def close(self):
+            close = getattr(self.handle, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    logger.debug("Error while closing file", exc_info=True)
+            self.handle = None
+
+    def __init__(self, max_size=16):
+        self.__maxSize = max(1, int(max_size))
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__entries)
+
+    @staticmethod
+    def _stat(filename):
+        """Returns the information used to check if a file was modified"""
+        stat = os.stat(filename)
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _open(filename, scheme):
+        """Open a file for the given scheme"""
+        if scheme == "fabio":
+            import fabio
+            return fabio.open(filename)
+        return open(filename)
+
+    def __discard(self, entry):
+        """Close an entry as soon as it is not in use.
+
+        It must be called with the pool lock acquired.
+        """
+        entry.discarded = True
+        if entry.users == 0:
+            entry.close()
+
+    def __lookup(self, key, stat):
+        """Returns the valid entry of a file, else None.
+
+        It must be called with the pool lock acquired.
+        """
+        entry = self.__entries.pop(key, None)
+        if entry is not None and entry.stat != stat:
+            logger.debug("File %s was modified, reopen it", key[1])
+            self.__discard(entry)
+            entry = None
+        return entry
+
+    def __register(self, key, entry):
+        """Mark an entry as used and as the most recently used one.
+
+        It must be called with the pool lock acquired.
+        """
+        self.__entries[key] = entry  # Most recently used at the end
+        entry.users += 1
+        while len(self.__entries) > self.__maxSize:
+            _, older = self.__entries.popitem(last=False)
+            self.__discard(older)
+
+    def __acquire(self, filename, scheme):
+        key = scheme, os.path.abspath(filename)
+        stat = self._stat(filename)
+        with self.__lock:
+            entry = self.__lookup(key, stat)
+            if entry is not None:
+                self.__register(key, entry)
+                return entry
+
+        # Open the file without the pool lock, so that a slow opening does
+        # not block the access to the files already opened
+        new_entry = self._Entry(self._open(filename, scheme), stat)
+
+        with self.__lock:
+            entry = self.__lookup(key, stat)
+            if entry is None:
+                entry, new_entry = new_entry, None
+            # else the file was opened meanwhile by another thread
+            self.__register(key, entry)
+        if new_entry is not None:
+            new_entry.close()
+        return entry
+
+    def __release(self, entry):
+        with self.__lock:
+            entry.users -= 1
+            if entry.discarded and entry.users == 0:
+                entry.close()
+
+    @contextlib.contextmanager
+    def open(self, filename, scheme="silx"):
+        """Context manager providing an opened file from the pool.
+
+        The file is not closed at exit, but access to it is locked until then.
+
+        :param str filename: Path of the file
+        :param str scheme: "silx" to open it with :meth:`silx.io.open` or
+            "fabio" to open it with :meth:`fabio.open`
+        """
+        entry = self.__acquire(filename, scheme)
+        try:
+            with entry.lock:
+                yield entry.handle
+        finally:
+            self.__release(entry)
+
+    def close(self, filename=None):
+        """Close files of the pool.
+
+        Files still in use are closed when they are released.
+
+        :param Union[str,None] filename: The file to close, default: all
+        """
+        with self.__lock:
+            if filename is None:
+                keys = list(self.__entries.keys())
+            else:
+                path = os.path.abspath(filename)
+                keys = [key for key in self.__entries.keys() if key[1] == path]
+            for key in keys:
+                self.__discard(self.__entries.pop(key))
+
+
+def _check_url(url):
+    """Returns the URL as a valid DataUrl of an existing file
+
+    :param Union[str,silx.io.url.DataUrl] url:
+    :rtype: silx.io.url.DataUrl
+    :raises ValueError: If the URL is not valid
+    :raises IOError: If the file is not found
+    """
+    if not isinstance(url, silx.io.url.DataUrl):
+        url = silx.io.url.DataUrl(url)
+
+    if not url.is_valid():
+        raise ValueError("URL '%s' is not valid" % url.path())
+
+    if not os.path.exists(url.file_path()):
+        raise IOError("File '%s' not found" % url.file_path())
+
+    if url.scheme() not in ("silx", "fabio"):
+        raise ValueError("Scheme '%s' not supported" % url.scheme())
+    return url
+
+
+@contextlib.contextmanager
+def _open_url_file(url, pool):
+    """Context manager providing the file of an URL, using the pool if any"""
+    with contextlib.ExitStack() as stack:
+        if url.scheme() == "fabio":
+            import fabio
+            try:
+                if pool is None:
+                    # There is no explicit close
+                    h5 = fabio.open(url.file_path())
+                else:
+                    h5 = stack.enter_context(pool.open(url.file_path(), "fabio"))
+            except Exception:
+                logger.debug("Error while opening %s with fabio", url.file_path(), exc_info=True)
+                raise IOError("Error while opening %s with fabio (use debug for more information)" % url.path())
+        elif pool is None:
+            h5 = stack.enter_context(open(url.file_path()))
+        else:
+            h5 = stack.enter_context(pool.open(url.file_path()))
+        yield h5
+
+
+def _get_url_dataset(h5, url):
+    """Returns the dataset targeted by an URL of silx scheme"""
+    data_path = url.data_path()
+    if data_path not in h5:
+        raise ValueError("Data path from URL '%s' not found" % url.path())
+    data = h5[data_path]
+
+    if not silx.io.is_dataset(data):
+        raise ValueError("Data path from URL '%s' is not a dataset" % url.path())
+    return data
+
+
+def _get_url_frame_index(url):
+    """Returns the frame index of an URL of fabio scheme"""
+    data_slice = url.data_slice()
+    if data_slice is None:
+        data_slice = (0,)
+    if data_slice is None or len(data_slice) != 1:
+        raise ValueError("Fabio slice expect a single frame, but %s found" % data_slice)
+    index = data_slice[0]
+    if not isinstance(index, int):
+        raise ValueError("Fabio slice expect a single integer, but %s found" % data_slice)
+    return index
+
+
+def _read_fabio_frame(fabio_file, url):
+    """Returns the frame targeted by an URL of fabio scheme"""
+    index = _get_url_frame_index(url)
+    if fabio_file.nframes == 1:
+        if index != 0:
+            raise ValueError("Only a single frame available. Slice %s out of range" % index)
+        return fabio_file.data
+    else:
+        return fabio_file.getframe(index).data
+
+
+def get_data(url, pool=None, out=None):
     """Returns a numpy data from an URL.
 
     Examples:
@@ -806,6 +1063,11 @@ def get_data(url):
     .. seealso:: :class:`silx.io.url.DataUrl`
 
     :param Union[str,silx.io.url.DataUrl]: A data URL
+    :param Union[FilePool,None] pool: A pool of files to reuse opened files.
+        By default, the file is opened and closed on each call.
+    :param Union[numpy.ndarray,None] out: Array where to store the data,
+        converted to its dtype. Its shape must match the data.
+        It is returned when provided.
     :rtype: Union[numpy.ndarray, numpy.generic]
     :raises ImportError: If the mandatory library to read the file is not
         available.
@@ -814,64 +1076,150 @@ def get_data(url):
         :meth:`fabio.open` or :meth:`silx.io.open`. In this last case more
         informations are displayed in debug mode.
     """
-    if not isinstance(url, silx.io.url.DataUrl):
-        url = silx.io.url.DataUrl(url)
+    url = _check_url(url)
 
-    if not url.is_valid():
-        raise ValueError("URL '%s' is not valid" % url.path())
+    with _open_url_file(url, pool) as h5:
+        if url.scheme() == "fabio":
+            data = _read_fabio_frame(h5, url)
+            if out is None:
+                return data
+            out[...] = data
+            return out
 
-    if not os.path.exists(url.file_path()):
-        raise IOError("File '%s' not found" % url.file_path())
-
-    if url.scheme() == "silx":
-        data_path = url.data_path()
+        data = _get_url_dataset(h5, url)
         data_slice = url.data_slice()
+        if data_slice is not None:
+            return h5py_read_dataset(data, index=data_slice, out=out)
+        else:
+            # works for scalar and array
+            return h5py_read_dataset(data, out=out)
 
-        with open(url.file_path()) as h5:
-            if data_path not in h5:
-                raise ValueError("Data path from URL '%s' not found" % url.path())
-            data = h5[data_path]
-
-            if not silx.io.is_dataset(data):
-                raise ValueError("Data path from URL '%s' is not a dataset" % url.path())
 
-            if data_slice is not None:
-                data = h5py_read_dataset(data, index=data_slice)
-            else:
-                # works for scalar and array
-                data = h5py_read_dataset(data)
+def _slice_bounds(data_slice, shape):
+    """Returns the (start, stop) bounds of a slicing on each axis.
 
-    elif url.scheme() == "fabio":
-        import fabio
-        data_slice = url.data_slice()
-        if data_slice is None:
-            data_slice = (0,)
-        if data_slice is None or len(data_slice) != 1:
-            raise ValueError("Fabio slice expect a single frame, but %s found" % data_slice)
-        index = data_slice[0]
-        if not isinstance(index, int):
-            raise ValueError("Fabio slice expect a single integer, but %s found" % data_slice)
-
-        try:
-            fabio_file = fabio.open(url.file_path())
-        except Exception:
-            logger.debug("Error while opening %s with fabio", url.file_path(), exc_info=True)
-            raise IOError("Error while opening %s with fabio (use debug for more information)" % url.path())
+    :returns: The bounds or None if the slicing is not a simple hyperslab
+    :rtype: Union[List[Tuple[int,int]],None]
+    """
+    if not isinstance(data_slice, tuple):
+        data_slice = data_slice,
+    if len(data_slice) > len(shape):
+        return None
 
-        if fabio_file.nframes == 1:
-            if index != 0:
-                raise ValueError("Only a single frame available. Slice %s out of range" % index)
-            data = fabio_file.data
+    bounds = []
+    for index, length in zip(data_slice, shape):
+        if isinstance(index, int):
+            if index < 0:
+                index += length
+            if not 0 <= index < length:
+                return None
+            bounds.append((index, index + 1))
+        elif isinstance(index, slice):
+            start, stop, step = index.indices(length)
+            if step != 1 or stop <= start:
+                return None
+            bounds.append((start, stop))
         else:
-            data = fabio_file.getframe(index).data
+            return None
+    bounds.extend((0, length) for length in shape[len(data_slice):])
+    return bounds
 
-        # There is no explicit close
-        fabio_file = None
 
-    else:
-        raise ValueError("Scheme '%s' not supported" % url.scheme())
+def _read_many(dataset, urls):
+    """Read the data of many URLs of the same dataset.
 
-    return data
+    The data is read with a single hyperslab covering all the URLs when
+    it does not read much more data than requested.
+
+    :returns: List of data in the same order as the URLs
+    """
+    shape = dataset.shape
+    slices = [url.data_slice() for url in urls]
+    bounds = [None if s is None else _slice_bounds(s, shape) for s in slices]
+
+    batch = (len(urls) > 1 and len(shape) > 0 and
+             dataset.dtype.kind not in "OSU" and
+             all(b is not None for b in bounds))
+    if batch:
+        box = [(min(b[axis][0] for b in bounds), max(b[axis][1] for b in bounds))
+               for axis in range(len(shape))]
+        box_size = numpy.prod([stop - start for start, stop in box])
+        requested = sum(numpy.prod([stop - start for start, stop in b]) for b in bounds)
+        batch = box_size <= 2 * requested
+
+    if not batch:
+        return [h5py_read_dataset(dataset) if s is None
+                else h5py_read_dataset(dataset, index=s)
+                for s in slices]
+
+    block = h5py_read_dataset(
+        dataset, index=tuple(slice(start, stop) for start, stop in box))
+    result = []
+    for data_slice in slices:
+        if data_slice is None:
+            result.append(block)
+            continue
+        if not isinstance(data_slice, tuple):
+            data_slice = data_slice,
+        local = []
+        for index, (offset, _), length in zip(data_slice, box, shape):
+            if isinstance(index, int):
+                local.append((index % length) - offset)
+            else:
+                start, stop, _ = index.indices(length)
+                local.append(slice(start - offset, stop - offset))
+        data = block[tuple(local)]
+        if isinstance(data, numpy.ndarray):
+            # Do not keep a view on the whole block
+            data = data.copy()
+        # else a numpy scalar, as returned by get_data
+        result.append(data)
+    return result
+
+
+def get_data_many(urls, pool=None):
+    """Returns the data of many URLs.
+
+    URLs are grouped by file, so that each file is opened once, and by
+    dataset, so that the data of a dataset is read at once when possible
+    (e.g., consecutive frames of a stack).
+
+    .. code-block:: python
+
+        urls = ["silx:/users/foo/stack.h5::/data[%d]" % i for i in range(100)]
+        frames = silx.io.get_data_many(urls)
+
+    :param List[Union[str,silx.io.url.DataUrl]] urls: Data URLs
+    :param Union[FilePool,None] pool: A pool of files to reuse opened files.
+    :returns: The data in the same order as the URLs
+    :rtype: List[Union[numpy.ndarray, numpy.generic]]
+    :raises: Same exceptions as :func:`get_data`
+    """
+    urls = [_check_url(url) for url in urls]
+
+    groups = collections.OrderedDict()
+    for position, url in enumerate(urls):
+        key = url.scheme(), os.path.abspath(url.file_path())
+        groups.setdefault(key, []).append(position)
+
+    result = [None] * len(urls)
+    for positions in groups.values():
+        with _open_url_file(urls[positions[0]], pool) as h5:
+            if urls[positions[0]].scheme() == "fabio":
+                for position in positions:
+                    result[position] = _read_fabio_frame(h5, urls[position])
+                continue
+
+            datasets = collections.OrderedDict()
+            for position in positions:
+                datasets.setdefault(urls[position].data_path(), []).append(position)
+            for dataset_positions in datasets.values():
+                dataset_urls = [urls[position] for position in dataset_positions]
+                dataset = _get_url_dataset(h5, dataset_urls[0])
+                for position, data in zip(dataset_positions,
+                                          _read_many(dataset, dataset_urls)):
+                    result[position] = data
+    return result
 
 
 def rawfile_to_h5_external_dataset(bin_file, output_url, shape, dtype,
@@ -908,6 +1256,34 @@ def rawfile_to_h5_external_dataset(bin_file, output_url, shape, dtype,
                                 external=external)
 
 
+def _read_vol_info_shape(info_file):
+    """Returns the shape of a volume from its .vol.info file.
+
+    :param str info_file: .vol.info file name written by pyhst
+    :rtype: Tuple[int,int,int]
+    :raises ValueError: If fails to read shape from the .vol.info file
+    """
+    ddict = {}
+    with builtin_open(info_file, "r") as _file:
+        lines = _file.readlines()
+        for line in lines:
+            if not '=' in line:
+                continue
+            l = line.rstrip().replace(' ', '')
+            l = l.split('#')[0]
+            key, value = l.split('=')
+            ddict[key.lower()] = value
+
+    if 'num_x' not in ddict or 'num_y' not in ddict or 'num_z' not in ddict:
+        raise ValueError(
+            'Unable to retrieve volume shape from %s' % info_file)
+
+    dimX = int(ddict['num_x'])
+    dimY = int(ddict['num_y'])
+    dimZ = int(ddict['num_z'])
+    return (dimZ, dimY, dimX)
+
+
 def vol_to_h5_external_dataset(vol_file, output_url, info_file=None,
                                vol_dtype=numpy.float32, overwrite=False):
     """
@@ -932,28 +1308,7 @@ def vol_to_h5_external_dataset(vol_file, output_url, info_file=None,
                          'specify .vol.info file' % _info_file)
             return
 
-    def info_file_to_dict():
-        ddict = {}
-        with builtin_open(info_file, "r") as _file:
-            lines = _file.readlines()
-            for line in lines:
-                if not '=' in line:
-                    continue
-                l = line.rstrip().replace(' ', '')
-                l = l.split('#')[0]
-                key, value = l.split('=')
-                ddict[key.lower()] = value
-        return ddict
-
-    ddict = info_file_to_dict()
-    if 'num_x' not in ddict or 'num_y' not in ddict or 'num_z' not in ddict:
-        raise ValueError(
-            'Unable to retrieve volume shape from %s' % info_file)
-
-    dimX = int(ddict['num_x'])
-    dimY = int(ddict['num_y'])
-    dimZ = int(ddict['num_z'])
-    shape = (dimZ, dimY, dimX)
+    shape = _read_vol_info_shape(_info_file)
 
     return rawfile_to_h5_external_dataset(bin_file=vol_file,
                                           output_url=output_url,
@@ -1039,6 +1394,13 @@ class H5pyDatasetReadWrapper:
         self._encoding = encoding
         self._dset = dset
 
+    def is_decoded(self):
+        """Returns True if strings are decoded on read
+
+        :rtype: bool
+        """
+        return bool(self._encoding)
+
     def __getitem__(self, args):
         value = self._dset[args]
         if self._encoding:
@@ -1107,16 +1469,36 @@ class H5pyAttributesReadWrapper:
             yield k, self[k]
 
 
-def h5py_read_dataset(dset, index=tuple(), decode_ascii=False):
+def h5py_read_dataset(dset, index=tuple(), decode_ascii=False, out=None):
     """Read data from dataset object. UTF-8 strings will be
     decoded while ASCII strings will only be decoded when
     `decode_ascii=True`.
 
+    When `out` is provided, the data is read into this array, converted to
+    its dtype, and it is returned. It uses `read_direct` when available
+    (h5py and silx datasets), and a copy otherwise.
+
     :param h5py.Dataset dset:
     :param index: slicing (all by default)
     :param bool decode_ascii:
+    :param Union[numpy.ndarray,None] out:
+        Array where to store the data, its shape must match the selection
+    :rtype: Union[numpy.ndarray,numpy.generic,str,bytes]
     """
-    return H5pyDatasetReadWrapper(dset, decode_ascii=decode_ascii)[index]
+    wrapper = H5pyDatasetReadWrapper(dset, decode_ascii=decode_ascii)
+    if out is None:
+        return wrapper[index]
+
+    if isinstance(index, tuple) and len(index) == 0:
+        index = None
+    direct = (not wrapper.is_decoded() and
+              hasattr(dset, "read_direct") and
+              (out.flags.c_contiguous or not isinstance(dset, h5py.Dataset)))
+    if direct:
+        dset.read_direct(out, source_sel=index)
+    else:
+        out[...] = wrapper[() if index is None else index]
+    return out
 
 
 def h5py_read_attribute(attrs, name, decode_ascii=False):
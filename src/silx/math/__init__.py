@@ -32,8 +32,32 @@ See silx documentation: http://www.silx.org/doc/silx/latest/
 
 __authors__ = ["D. Naudet", "V.A. Sole", "P. Knobel"]
 __license__ = "MIT"
-__date__ = "11/05/2017"
+__date__ = "19/10/2026"
 
-from .histogram import Histogramnd  # noqa
-from .histogram import HistogramndLut  # noqa
-from .medianfilter import medfilt, medfilt1d, medfilt2d
+from silx.utils._lazy import lazy_attributes as _lazy_attributes
+
+# Content is loaded on first access to avoid importing compiled modules
+__getattr__, __dir__ = _lazy_attributes(
+    __name__,
+    attributes={
+        "Histogramnd": ".histogram",
+        "HistogramndLut": ".histogram",
+        "medfilt": ".medianfilter",
+        "medfilt1d": ".medianfilter",
+        "medfilt2d": ".medianfilter",
+    },
+    submodules=[
+        "calibration",
+        "chistogramnd",
+        "chistogramnd_lut",
+        "colormap",
+        "combo",
+        "fft",
+        "fit",
+        "histogram",
+        "interpolate",
+        "marchingcubes",
+        "medianfilter",
+    ])
+
+__all__ = ["Histogramnd", "HistogramndLut", "medfilt", "medfilt1d", "medfilt2d"]
@@ -26,20 +26,38 @@
 
 It provides a :class:`MarchingCubes` class allowing to build an isosurface
 from data provided as a 3D data set or slice by slice.
+A 3D data set can be processed by slabs of slices in parallel, and read
+by slabs from an array-like (e.g., a :class:`h5py.Dataset`).
+
+The :func:`simplify` function reduces the number of triangles of
+an isosurface.
 """
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "16/08/2017"
+__date__ = "19/10/2026"
+
 
+from concurrent.futures import ThreadPoolExecutor
+import os
 
 import numpy
 cimport numpy as cnumpy
 cimport cython
+from cython.operator cimport dereference as deref
 
 cimport silx.math.mc as mc
 
 
+cdef int DEFAULT_NUM_THREADS
+if hasattr(os, 'sched_getaffinity'):
+    DEFAULT_NUM_THREADS = len(os.sched_getaffinity(0))
+elif os.cpu_count() is not None:
+    DEFAULT_NUM_THREADS = os.cpu_count()
+else:  # Fallback
+    DEFAULT_NUM_THREADS = 1
+
+
 # From numpy_common.pxi to avoid warnings while compiling C code
 # See this thread:
 # https://mail.python.org/pipermail//cython-devel/2012-March/002137.html
@@ -91,6 +109,11 @@ cdef class MarchingCubes:
 
     >>> vertices, normals, indices = MarchingCubes(data, isolevel=1.)
 
+    Example with a 3D data set processed with 4 threads:
+
+    >>> vertices, normals, indices = MarchingCubes(
+    ...     data, isolevel=1., num_threads=4)
+
     Example of code for processing a list of images:
 
     >>> mc = MarchingCubes(isolevel=1.)  # Create object with iso-level=1
@@ -109,11 +132,13 @@ cdef class MarchingCubes:
     :param bool invert_normals:
         True (default) for normals oriented in direction of gradient descent
     :param sampling: Sampling along each dimension (depth, height, width)
+    :param int num_threads:
+        Number of threads used to process data, see :meth:`process`
     """
     cdef mc.MarchingCubes[float, float] * c_mc  # Pointer to the C++ instance
 
     def __cinit__(self, data=None, isolevel=None,
-                  invert_normals=True, sampling=(1, 1, 1)):
+                  invert_normals=True, sampling=(1, 1, 1), num_threads=1):
         self.c_mc = new mc.MarchingCubes[float, float](isolevel)
         self.c_mc.invert_normals = bool(invert_normals)
         self.c_mc.sampling[0] = sampling[0]
@@ -121,7 +146,7 @@ cdef class MarchingCubes:
         self.c_mc.sampling[2] = sampling[2]
 
         if data is not None:
-            self.process(data)
+            self.process(data, num_threads=num_threads)
 
     def __dealloc__(self):
         del self.c_mc
@@ -140,15 +165,45 @@ cdef class MarchingCubes:
         else:
             raise IndexError("Index out of range")
 
-    def process(self, data):
+    def process(self, data, num_threads=1, block_size=64 * 2**20):
         """Compute an isosurface from a 3D scalar field.
 
         This builds vertices, normals and indices arrays.
         Vertices and normals coordinates are in the same order as input array,
         i.e., (dim 0, dim 1, dim 2).
 
-        :param numpy.ndarray data: 3D scalar field
+        When using more than one thread or when data is an array-like with
+        a shape supporting slicing (e.g., h5py.Dataset or numpy.memmap),
+        data is processed by slabs of slices which are read with slicing.
+        This allows to process a :class:`h5py.Dataset` without loading it
+        in memory.
+        The resulting isosurface is the same, with vertices shared by
+        consecutive slabs merged, but vertices and triangles are stored
+        in a different order.
+
+        :param data: 3D scalar field as a numpy.ndarray or an array-like
+            supporting slicing (e.g., a h5py.Dataset)
+        :param int num_threads: Number of slabs processed in parallel,
+            None to use all CPUs. Default: 1
+        :param int block_size: Approximate size in bytes of the slabs
+            of slices when processing by slabs.
         """
+        if num_threads is None or num_threads <= 0:
+            num_threads = DEFAULT_NUM_THREADS
+
+        if isinstance(data, numpy.memmap):
+            lazy = True
+        elif isinstance(data, numpy.ndarray):
+            lazy = False
+        else:
+            lazy = hasattr(data, 'shape') and hasattr(data, '__getitem__')
+            if not lazy:  # e.g., nested lists
+                data = numpy.ascontiguousarray(data, dtype='=f4')
+
+        if lazy or num_threads > 1:
+            self._process_slabs(data, num_threads, block_size)
+            return
+
         # Make sure data is a 3D contiguous array of native endian float32
         data = numpy.ascontiguousarray(data, dtype='=f4')
         assert data.ndim == 3
@@ -161,6 +216,81 @@ cdef class MarchingCubes:
 
         self.c_mc.process(&c_data[0], depth, height, width)
 
+    def _process_slabs(self, data, int num_threads, block_size):
+        """Compute an isosurface by processing slabs of slices in parallel.
+
+        :param data: 3D scalar field supporting slicing
+        :param int num_threads: Number of threads
+        :param int block_size: Approximate size in bytes of the slabs
+        """
+        assert len(data.shape) == 3
+        depth, height, width = data.shape
+        step = self.c_mc.sampling[0]
+
+        # Number of layers of cubes
+        nb_layers = max(depth - 1, 0) // step
+        slab_layers = max(1, min(
+            -(-nb_layers // num_threads),
+            block_size // max(1, height * width * 4) - 2))
+
+        def process_slab(first):
+            """Process the layers of cubes of a slab"""
+            last = min(first + slab_layers, nb_layers)
+            start = max(first - 1, 0)
+            slab_mc = MarchingCubes(isolevel=self.isolevel,
+                                    invert_normals=self.invert_normals,
+                                    sampling=self.sampling)
+            slab_mc._process_slab(
+                data[start * step:last * step + 1:step],
+                first * step,
+                first > 0)
+            return slab_mc
+
+        slabs = range(0, nb_layers, slab_layers)
+        if num_threads > 1 and len(slabs) > 1:
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                results = list(executor.map(process_slab, slabs))
+        else:
+            results = [process_slab(first) for first in slabs]
+
+        self.c_mc.set_slice_size(height, width)  # Also resets the isosurface
+        cdef MarchingCubes slab_mc
+        for slab_mc in results:
+            self.c_mc.append(deref(slab_mc.c_mc))
+        self.c_mc.finish_process()
+        self.c_mc.depth = depth
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def _process_slab(self, slab, unsigned int depth, bint has_previous):
+        """Compute the isosurface of a slab of slices
+
+        :param slab: The slices, starting with the slice before the slab
+            if has_previous is True
+        :param int depth: Index of the first slice of the slab in the volume
+        :param bool has_previous: Whether or not slab starts with the
+            slice preceding the slab
+        """
+        # Make sure slab is a 3D contiguous array of native endian float32
+        slab = numpy.ascontiguousarray(slab, dtype='=f4')
+        cdef float[:, :, ::1] c_slab = slab
+        cdef unsigned int first = 1 if has_previous else 0
+        cdef unsigned int index
+        cdef unsigned int nb_slices = c_slab.shape[0]
+        cdef float * previous = &c_slab[0, 0, 0] if has_previous else NULL
+
+        assert nb_slices >= first + 2
+        self.c_mc.set_slice_size(c_slab.shape[1], c_slab.shape[2])
+        with nogil:
+            self.c_mc.start_slice(depth,
+                                  previous,
+                                  &c_slab[first, 0, 0],
+                                  &c_slab[first + 1, 0, 0])
+            for index in range(first, nb_slices - 1):
+                self.c_mc.process_slice(&c_slab[index, 0, 0],
+                                        &c_slab[index + 1, 0, 0])
+            # Keep the cache of the last slice to merge slabs
+
     def process_slice(self, slice0, slice1):
         """Process a new slice to build the isosurface.
 
@@ -244,3 +374,148 @@ cdef class MarchingCubes:
         """
         return numpy.array(self.c_mc.indices,
                            dtype=numpy.uint32).reshape(-1, 3)
+
+
+def _cluster_mesh(vertices, indices, origin, cell_size):
+    """Cluster vertices on a regular grid and returns resulting triangles
+
+    :return: (cluster index of each vertex, number of clusters,
+        indices of the triangles which are kept)
+    """
+    cells = numpy.floor((vertices - origin) / cell_size).astype(numpy.int64)
+    cells -= cells.min(axis=0)
+    dims = cells.max(axis=0) + 1
+    cell_ids = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    _, labels = numpy.unique(cell_ids, return_inverse=True)
+    labels = labels.reshape(-1)
+    nb_clusters = labels.max() + 1 if len(labels) else 0
+
+    triangles = labels[indices]
+    # Remove degenerated triangles
+    kept = numpy.nonzero(numpy.logical_and(
+        numpy.logical_and(triangles[:, 0] != triangles[:, 1],
+                          triangles[:, 1] != triangles[:, 2]),
+        triangles[:, 0] != triangles[:, 2]))[0]
+    # Remove duplicated triangles
+    keys = numpy.sort(triangles[kept], axis=1)
+    if nb_clusters < 2**21:  # Use a single int64 as key
+        keys = (keys[:, 0] * nb_clusters + keys[:, 1]) * nb_clusters + keys[:, 2]
+        _, unique = numpy.unique(keys, return_index=True)
+    else:
+        _, unique = numpy.unique(keys, axis=0, return_index=True)
+    return labels, nb_clusters, kept[numpy.sort(unique)]
+
+
+def simplify(vertices, normals, indices, nb_triangles):
+    """Reduce the number of triangles of a mesh.
+
+    This implements vertex clustering on a regular grid where each cluster
+    is replaced by the position minimizing the quadric error with the
+    planes of the triangles of the cluster, see:
+
+    Lindstrom, P. Out-of-core simplification of large polygonal models.
+    Proceedings of SIGGRAPH 2000, 259-262.
+
+    The grid size is chosen so that the number of triangles is less or
+    equal to nb_triangles and as close to it as possible.
+
+    >>> vertices, normals, indices = MarchingCubes(data, isolevel=1.)
+    >>> vertices, normals, indices = simplify(
+    ...     vertices, normals, indices, nb_triangles=10000)
+
+    :param numpy.ndarray vertices: Vertex coordinates (nb_vertices, 3)
+    :param numpy.ndarray normals: Normals at vertices (nb_vertices, 3)
+    :param numpy.ndarray indices: Triangle indices (nb_triangles, 3)
+    :param int nb_triangles: Maximum number of triangles of the result
+    :return: (vertices, normals, indices) of the simplified mesh
+    :rtype: List[numpy.ndarray]
+    """
+    vertices = numpy.asarray(vertices, dtype=numpy.float64).reshape(-1, 3)
+    normals = numpy.asarray(normals, dtype=numpy.float64).reshape(-1, 3)
+    indices = numpy.asarray(indices, dtype=numpy.int64).reshape(-1, 3)
+
+    if len(indices) <= nb_triangles or len(vertices) == 0:
+        return (numpy.array(vertices, dtype=numpy.float32),
+                numpy.array(normals, dtype=numpy.float32),
+                numpy.array(indices, dtype=numpy.uint32))
+
+    origin = vertices.min(axis=0)
+    extent = max(float((vertices.max(axis=0) - origin).max()), 1e-6)
+
+    # Look for the smallest cell size providing at most nb_triangles
+    # Bounds are expressed as number of cells along the longest dimension
+    low, high = 1, 2
+    clustering = _cluster_mesh(vertices, indices, origin, extent)
+    while True:
+        result = _cluster_mesh(vertices, indices, origin, extent / high)
+        if len(result[2]) > nb_triangles:
+            break
+        low, clustering = high, result
+        if high >= len(vertices):  # Cannot reach nb_triangles
+            break
+        high *= 2
+    while high - low > 1:
+        middle = (low + high) // 2
+        result = _cluster_mesh(vertices, indices, origin, extent / middle)
+        if len(result[2]) > nb_triangles:
+            high = middle
+        else:
+            low, clustering = middle, result
+    labels, nb_clusters, kept = clustering
+
+    # Area weighted quadrics of triangle planes accumulated per cluster
+    points = vertices[indices]
+    plane_normals = numpy.cross(points[:, 1] - points[:, 0],
+                                points[:, 2] - points[:, 0])
+    norms = numpy.linalg.norm(plane_normals, axis=1)
+    areas = 0.5 * norms
+    norms[norms == 0] = 1
+    plane_normals /= norms[:, numpy.newaxis]
+    offsets = - numpy.sum(plane_normals * points[:, 0], axis=1)
+
+    corner_labels = labels[indices].reshape(-1)
+    quadric_a = numpy.zeros((nb_clusters, 3, 3), dtype=numpy.float64)
+    quadric_b = numpy.zeros((nb_clusters, 3), dtype=numpy.float64)
+    for i in range(3):
+        quadric_b[:, i] = numpy.bincount(
+            corner_labels,
+            weights=numpy.repeat(areas * offsets * plane_normals[:, i], 3),
+            minlength=nb_clusters)
+        for j in range(i, 3):
+            quadric_a[:, i, j] = numpy.bincount(
+                corner_labels,
+                weights=numpy.repeat(
+                    areas * plane_normals[:, i] * plane_normals[:, j], 3),
+                minlength=nb_clusters)
+            quadric_a[:, j, i] = quadric_a[:, i, j]
+
+    # Minimize quadric error around clusters center with a truncated
+    # pseudo-inverse to handle flat and sharp-edged clusters
+    counts = numpy.bincount(labels, minlength=nb_clusters)
+    centers = numpy.empty((nb_clusters, 3), dtype=numpy.float64)
+    new_normals = numpy.empty((nb_clusters, 3), dtype=numpy.float64)
+    for i in range(3):
+        centers[:, i] = numpy.bincount(
+            labels, weights=vertices[:, i], minlength=nb_clusters) / counts
+        new_normals[:, i] = numpy.bincount(
+            labels, weights=normals[:, i], minlength=nb_clusters)
+
+    residuals = - (numpy.einsum('kij,kj->ki', quadric_a, centers) + quadric_b)
+    u, singular_values, vh = numpy.linalg.svd(quadric_a)
+    threshold = 1e-3 * singular_values[:, :1]
+    inverse = numpy.zeros_like(singular_values)
+    mask = numpy.logical_and(singular_values > threshold, singular_values > 0)
+    inverse[mask] = 1. / singular_values[mask]
+    new_vertices = centers + numpy.einsum(
+        'kji,kj,klj,kl->ki', vh, inverse, u, residuals)
+
+    norms = numpy.linalg.norm(new_normals, axis=1)
+    norms[norms == 0] = 1
+    new_normals /= norms[:, numpy.newaxis]
+
+    # Remove unused clusters
+    triangles = labels[indices[kept]]
+    used, new_indices = numpy.unique(triangles, return_inverse=True)
+    return (new_vertices[used].astype(numpy.float32),
+            new_normals[used].astype(numpy.float32),
+            new_indices.reshape(-1, 3).astype(numpy.uint32))
@@ -126,9 +126,38 @@ public:
     void process_slice(const FloatIn * slice0,
                        const FloatIn * slice1);
 
+    /** Start processing slice by slice from a given slice.
+     *
+     * This allows to process a volume by slabs of slices:
+     * The isosurface of a slab starting at a given depth is built by
+     * calling start_slice and then process_slice for the following slices.
+     * Provided the previous slice, vertices and normals are the same as
+     * when processing the whole volume.
+     *
+     * @param depth Index of slice in the whole volume
+     * @param previous The slice before slice or NULL if slice is the first one
+     * @param slice The first slice of the slab
+     * @param next The slice following slice
+     */
+    void start_slice(const unsigned int depth,
+                     const FloatIn * previous,
+                     const FloatIn * slice,
+                     const FloatIn * next);
+
     /** Clear marching cube processing internal cache. */
     void finish_process();
 
+    /** Append the isosurface computed by another instance.
+     *
+     * If other was started with start_slice on the last slice processed
+     * by this instance (without calling finish_process on this instance),
+     * vertices shared by both isosurfaces are merged.
+     * Triangle indices of other are updated accordingly.
+     *
+     * @param other The isosurface to append
+     */
+    void append(const MarchingCubes<FloatIn, FloatOut> & other);
+
     /** Reset all internal data and counters. */
     void reset();
 
@@ -163,10 +192,12 @@ private:
      *
      * Bootstrap cache edge_indices
      *
+     * @param previous The slice before the first one or NULL
      * @param slice The first slice of the data
      * @param next The second slice
      */
-    void first_slice(const FloatIn * slice,
+    void first_slice(const FloatIn * previous,
+                     const FloatIn * slice,
                      const FloatIn * next);
 
     /** Process an edge
@@ -226,6 +257,13 @@ private:
      * WARNING: direction 0 for x, 1 for y and 2 for z
      */
     std::map<unsigned int, unsigned int> * edge_indices;
+
+    /** Map from edge index to vertex index for the slice given to
+     * start_slice.
+     *
+     * This is used to merge vertices in append.
+     */
+    std::map<unsigned int, unsigned int> first_edge_indices;
 };
 
 
@@ -248,6 +286,7 @@ MarchingCubes<FloatIn, FloatOut>::MarchingCubes(const FloatIn level)
 template <typename FloatIn, typename FloatOut>
 MarchingCubes<FloatIn, FloatOut>::~MarchingCubes()
 {
+    this->finish_process();
 }
 
 template <typename FloatIn, typename FloatOut>
@@ -258,6 +297,7 @@ MarchingCubes<FloatIn, FloatOut>::reset()
     this->vertices.clear();
     this->normals.clear();
     this->indices.clear();
+    this->first_edge_indices.clear();
     if (this->edge_indices != 0) {
         delete this->edge_indices;
         this->edge_indices = 0;
@@ -275,6 +315,73 @@ MarchingCubes<FloatIn, FloatOut>::finish_process()
 }
 
 
+template <typename FloatIn, typename FloatOut>
+void
+MarchingCubes<FloatIn, FloatOut>::start_slice(const unsigned int depth,
+                                              const FloatIn * previous,
+                                              const FloatIn * slice,
+                                              const FloatIn * next)
+{
+    this->finish_process();
+    this->depth = depth;
+    this->first_slice(previous, slice, next);
+    this->first_edge_indices = *this->edge_indices;
+}
+
+
+template <typename FloatIn, typename FloatOut>
+void
+MarchingCubes<FloatIn, FloatOut>::append(
+    const MarchingCubes<FloatIn, FloatOut> & other)
+{
+    const unsigned int nb_vertices = other.vertices.size() / 3;
+    std::vector<unsigned int> new_indices(nb_vertices);
+    std::vector<bool> is_merged(nb_vertices, false);
+    std::map<unsigned int, unsigned int>::const_iterator it, found;
+
+    /* Look-up vertices of the first slice of other in the last slice */
+    if (this->edge_indices != 0) {
+        for (it = other.first_edge_indices.begin();
+             it != other.first_edge_indices.end(); it++) {
+            found = this->edge_indices->find(it->first);
+            if (found != this->edge_indices->end()) {
+                new_indices[it->second] = found->second;
+                is_merged[it->second] = true;
+            }
+        }
+    }
+
+    /* Copy other vertices which are not merged */
+    for (unsigned int index=0; index < nb_vertices; index++) {
+        if (! is_merged[index]) {
+            new_indices[index] = this->vertices.size() / 3;
+            this->vertices.insert(this->vertices.end(),
+                                  &other.vertices[3 * index],
+                                  &other.vertices[3 * index + 3]);
+            this->normals.insert(this->normals.end(),
+                                 &other.normals[3 * index],
+                                 &other.normals[3 * index + 3]);
+        }
+    }
+
+    this->indices.reserve(this->indices.size() + other.indices.size());
+    for (std::vector<unsigned int>::const_iterator index = other.indices.begin();
+         index != other.indices.end(); index++) {
+        this->indices.push_back(new_indices[*index]);
+    }
+
+    /* Keep cache of the last slice of other to merge the next one */
+    this->finish_process();
+    if (other.edge_indices != 0) {
+        this->edge_indices = new std::map<unsigned int, unsigned int>();
+        for (it = other.edge_indices->begin();
+             it != other.edge_indices->end(); it++) {
+            (*this->edge_indices)[it->first] = new_indices[it->second];
+        }
+    }
+}
+
+
 template <typename FloatIn, typename FloatOut>
 void
 MarchingCubes<FloatIn, FloatOut>::process(const FloatIn * data,
@@ -325,7 +432,7 @@ MarchingCubes<FloatIn, FloatOut>::process_slice(const FloatIn * slice0,
 
     if (this->edge_indices == 0) {
         /* No previously processed slice, bootstrap */
-        this->first_slice(slice0, slice1);
+        this->first_slice(0, slice0, slice1);
     }
 
     /* Keep reference to cache from previous slice */
@@ -425,7 +532,8 @@ MarchingCubes<FloatIn, FloatOut>::process_slice(const FloatIn * slice0,
 
 template <typename FloatIn, typename FloatOut>
 void
-MarchingCubes<FloatIn, FloatOut>::first_slice(const FloatIn * slice,
+MarchingCubes<FloatIn, FloatOut>::first_slice(const FloatIn * previous,
+                                              const FloatIn * slice,
                                               const FloatIn * next)
 {
     assert(slice != NULL);
@@ -435,6 +543,10 @@ MarchingCubes<FloatIn, FloatOut>::first_slice(const FloatIn * slice,
 
     unsigned int row, col;
 
+    /* Compute normals with the previous slice if any as in process_slice,
+     * otherwise use the next slice */
+    const FloatIn * normal_next = (previous != 0) ? 0 : next;
+
     /* Loop over slice, and add isosurface vertices in the slice plane */
     for (row=0; row < this->height; row += this->sampling[HEIGHT_IDX]) {
         unsigned int line_index = row * this->width;
@@ -449,7 +561,7 @@ MarchingCubes<FloatIn, FloatOut>::first_slice(const FloatIn * slice,
                 FloatIn value = slice[item_index + this->sampling[WIDTH_IDX]];
 
                 this->process_edge(value0, value, this->depth, row, col, 0,
-                                   0, slice, next);
+                                   previous, slice, normal_next);
             }
 
             if (row < (height - this->sampling[HEIGHT_IDX])) {
@@ -457,7 +569,7 @@ MarchingCubes<FloatIn, FloatOut>::first_slice(const FloatIn * slice,
                 FloatIn value = slice[item_index + this->width * this->sampling[HEIGHT_IDX]];
 
                 this->process_edge(value0, value, this->depth, row, col, 1,
-                                   0, slice, next);
+                                   previous, slice, normal_next);
             }
         }
     }
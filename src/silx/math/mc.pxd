@@ -36,8 +36,13 @@ cdef extern from "mc.hpp":
         void set_slice_size(unsigned int height,
                             unsigned int width)
         void process_slice(FloatIn * slice0,
-                           FloatIn * slice1) except +
-        void finish_process()
+                           FloatIn * slice1) nogil except +
+        void start_slice(unsigned int depth,
+                         FloatIn * previous,
+                         FloatIn * slice,
+                         FloatIn * next) nogil except +
+        void finish_process() nogil
+        void append(MarchingCubes[FloatIn, FloatOut] & other) except +
         void reset()
 
         unsigned int depth
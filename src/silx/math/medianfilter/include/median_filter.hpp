@@ -281,4 +281,259 @@ void median_filter(
     }
 }
 
+// Returns the index of a window element along one dimension according to the
+// border mode, or -1 if it is outside the data (for SHRINK and CONSTANT modes)
+inline int border_index(int index, int length, MODE mode){
+    if (index >= 0 && index < length){
+        return index;
+    }
+    switch(mode){
+        case NEAREST:
+            return std::min(std::max(index, 0), length - 1);
+        case REFLECT:
+            return reflect(index, length);
+        case MIRROR:
+            return (length == 1) ? 0 : mirror(index, length);
+        default:  // SHRINK, CONSTANT
+            return -1;
+    }
+}
+
+
+// Process one line (along the last dimension) of a N-dimensional array.
+// line is the flat index of the line over the ndim-1 first dimensions.
+template<typename T>
+void median_filter_nd(
+    const T* input,
+    T* output,
+    const int* kernel_dim,  // ndim values
+    const int* image_dim,   // ndim values
+    int ndim,
+    long line,
+    bool conditional,
+    int pMode,
+    T cval) {
+
+    assert(ndim > 0);
+    MODE mode = static_cast<MODE>(pMode);
+
+    std::vector<int> position(ndim, 0);  // Coordinates of the current pixel
+    std::vector<long> strides(ndim, 1);
+    long window_length = 1;
+    for(int dim=ndim - 1; dim >= 0; dim--){
+        if (dim < ndim - 1){
+            strides[dim] = strides[dim + 1] * image_dim[dim + 1];
+        }
+        window_length *= kernel_dim[dim];
+    }
+    long remaining = line;
+    for(int dim=ndim - 2; dim >= 0; dim--){
+        position[dim] = remaining % image_dim[dim];
+        remaining /= image_dim[dim];
+    }
+    const long line_offset = line * image_dim[ndim - 1];
+
+    std::vector<T> window_values(window_length);
+    std::vector<int> offset(ndim);  // Position in the window
+
+    for(int x_pixel=0; x_pixel < image_dim[ndim - 1]; x_pixel++){
+        position[ndim - 1] = x_pixel;
+        typename std::vector<T>::iterator it = window_values.begin();
+
+        for(int dim=0; dim < ndim; dim++){
+            offset[dim] = -(kernel_dim[dim] - 1) / 2;
+        }
+        for(long element=0; element < window_length; element++){
+            long index = 0;
+            bool outside = false;
+            for(int dim=0; dim < ndim; dim++){
+                int coord = border_index(position[dim] + offset[dim], image_dim[dim], mode);
+                if (coord < 0){
+                    outside = true;
+                    break;
+                }
+                index += coord * strides[dim];
+            }
+
+            T value;
+            bool valid = true;
+            if (outside){
+                valid = (mode == CONSTANT);
+                value = cval;
+            }else{
+                value = input[index];
+            }
+            if (valid && value == value) {  // Ignore NaNs
+                *it = value;
+                ++it;
+            }
+
+            // Move to the next element of the window
+            for(int dim=ndim - 1; dim >= 0; dim--){
+                offset[dim]++;
+                if (offset[dim] <= kernel_dim[dim] / 2){
+                    break;
+                }
+                offset[dim] = -(kernel_dim[dim] - 1) / 2;
+            }
+        }
+
+        int window_size = std::distance(window_values.begin(), it);
+        T* result = output + line_offset + x_pixel;
+        if (window_size == 0) {
+            *result = NotANumber<T>();
+        } else {
+            const T currentPixelValue = input[line_offset + x_pixel];
+            if (conditional == true){
+                T min = 0;
+                T max = 0;
+                getMinMax(window_values, min, max, window_values.begin() + window_size);
+                if ((currentPixelValue == max) || (currentPixelValue == min)){
+                    *result = median<T>(window_values, window_size);
+                }else{
+                    *result = currentPixelValue;
+                }
+            }else{
+                *result = median<T>(window_values, window_size);
+            }
+        }
+    }
+}
+
+
+// Median along the first axis of a (n_frames, n_pixels) C-contiguous array
+// for the pixels in [start, stop).
+// NaNs are ignored as in median_filter.
+template<typename T>
+void median_along_first_axis(
+    const T* input,
+    T* output,
+    int n_frames,
+    long n_pixels,
+    long start,
+    long stop) {
+
+    std::vector<T> values(n_frames);
+    for(long pixel=start; pixel < stop; pixel++){
+        int count = 0;
+        for(int frame=0; frame < n_frames; frame++){
+            T value = input[frame * n_pixels + pixel];
+            if (value == value) {  // Ignore NaNs
+                values[count] = value;
+                count++;
+            }
+        }
+        if (count == 0){
+            output[pixel] = NotANumber<T>();
+        }else{
+            output[pixel] = median<T>(values, count);
+        }
+    }
+}
+
+// Median filter of 2D images of unsigned integers of nbits bits (8 or 16)
+// with a sliding histogram (Huang's algorithm), for rows in [y_start, y_end).
+// A two-level (coarse/fine) histogram is used to find the median, so that
+// the cost per pixel is proportional to the kernel height.
+template<typename T>
+void median_filter_histogram(
+    const T* input,
+    T* output,
+    const int* kernel_dim,  // two values : 0:height, 1:width
+    const int* image_dim,   // two values : 0:height, 1:width
+    int y_start,
+    int y_end,
+    bool conditional,
+    int pMode,
+    T cval,
+    int nbits) {
+
+    assert(nbits <= 16);
+    MODE mode = static_cast<MODE>(pMode);
+    const int height = image_dim[0];
+    const int width = image_dim[1];
+    const int halfKernel_y = (kernel_dim[0] - 1) / 2;
+    const int halfKernel_x = (kernel_dim[1] - 1) / 2;
+    const int fine_bits = nbits / 2;
+    const int nb_coarse = 1 << (nbits - fine_bits);
+    const int nb_fine = 1 << fine_bits;
+
+    std::vector<int> fine(1 << nbits);
+    std::vector<int> coarse(nb_coarse);
+    std::vector<int> rows(kernel_dim[0]);  // -1 for rows outside the image
+    int count = 0;
+
+    // Add (delta=1) or remove (delta=-1) a column of the window
+    #define UPDATE_HISTOGRAM(column, delta) {                              \
+        int index_x = border_index(column, width, mode);                  \
+        for (int k = 0; k < kernel_dim[0]; k++) {                         \
+            T value;                                                      \
+            if (rows[k] >= 0 && index_x >= 0) {                           \
+                value = input[rows[k] * width + index_x];                 \
+            } else if (mode == CONSTANT) {                                \
+                value = cval;                                             \
+            } else {                                                      \
+                continue;                                                 \
+            }                                                             \
+            fine[value] += delta;                                         \
+            coarse[value >> fine_bits] += delta;                          \
+            count += delta;                                               \
+        }                                                                 \
+    }
+
+    for (int y_pixel = y_start; y_pixel < y_end; y_pixel++) {
+        for (int k = 0; k < kernel_dim[0]; k++) {
+            rows[k] = border_index(y_pixel - halfKernel_y + k, height, mode);
+        }
+        std::fill(fine.begin(), fine.end(), 0);
+        std::fill(coarse.begin(), coarse.end(), 0);
+        count = 0;
+        for (int column = -halfKernel_x; column < halfKernel_x; column++) {
+            UPDATE_HISTOGRAM(column, 1);
+        }
+
+        for (int x_pixel = 0; x_pixel < width; x_pixel++) {
+            if (x_pixel > 0) {
+                UPDATE_HISTOGRAM(x_pixel - halfKernel_x - 1, -1);
+            }
+            UPDATE_HISTOGRAM(x_pixel + halfKernel_x, 1);
+
+            T* result = output + y_pixel * width + x_pixel;
+            if (count == 0) {
+                *result = 0;
+                continue;
+            }
+            const T currentPixelValue = input[y_pixel * width + x_pixel];
+            if (conditional == true) {
+                int min_bin = 0;
+                while (coarse[min_bin] == 0) min_bin++;
+                min_bin *= nb_fine;
+                while (fine[min_bin] == 0) min_bin++;
+                int max_bin = nb_coarse - 1;
+                while (coarse[max_bin] == 0) max_bin--;
+                max_bin = max_bin * nb_fine + nb_fine - 1;
+                while (fine[max_bin] == 0) max_bin--;
+                if (currentPixelValue != min_bin && currentPixelValue != max_bin) {
+                    *result = currentPixelValue;
+                    continue;
+                }
+            }
+            // Same convention as median(): element of rank count / 2
+            int rank = count / 2;
+            int bin = 0;
+            while (rank >= coarse[bin]) {
+                rank -= coarse[bin];
+                bin++;
+            }
+            bin *= nb_fine;
+            while (rank >= fine[bin]) {
+                rank -= fine[bin];
+                bin++;
+            }
+            *result = static_cast<T>(bin);
+        }
+    }
+    #undef UPDATE_HISTOGRAM
+}
+
 #endif // MEDIAN_FILTER
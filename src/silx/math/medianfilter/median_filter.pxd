@@ -38,5 +38,33 @@ cdef extern from "median_filter.hpp":
                                       bool conditional,
                                       T cval) nogil;
 
+    cdef extern void median_filter_nd[T](const T* input,
+                                         T* output,
+                                         int* kernel_dim,
+                                         int* image_dim,
+                                         int ndim,
+                                         long line,
+                                         bool conditional,
+                                         int mode,
+                                         T cval) nogil;
+
+    cdef extern void median_along_first_axis[T](const T* input,
+                                                T* output,
+                                                int n_frames,
+                                                long n_pixels,
+                                                long start,
+                                                long stop) nogil;
+
+    cdef extern void median_filter_histogram[T](const T* input,
+                                                T* output,
+                                                int* kernel_dim,
+                                                int* image_dim,
+                                                int y_start,
+                                                int y_end,
+                                                bool conditional,
+                                                int mode,
+                                                T cval,
+                                                int nbits) nogil;
+
     cdef extern int reflect(int index, int length_max);
     cdef extern int mirror(int index, int length_max);
@@ -22,12 +22,13 @@
 # THE SOFTWARE.
 #
 # ###########################################################################*/
-"""This module provides median filter function for 1D and 2D arrays.
+"""This module provides median filter functions for N-dimensional arrays
+and the median of a stack of frames.
 """
 
 __authors__ = ["H. Payno", "J. Kieffer"]
 __license__ = "MIT"
-__date__ = "02/05/2017"
+__date__ = "19/10/2026"
 
 
 from cython.parallel import prange
@@ -38,6 +39,7 @@ cimport numpy as cnumpy
 from libcpp cimport bool
 
 import numbers
+import os
 
 ctypedef unsigned long uint64
 ctypedef unsigned int uint32
@@ -47,11 +49,34 @@ ctypedef unsigned short uint16
 MODES = {'nearest': 0, 'reflect': 1, 'mirror': 2, 'shrink': 3, 'constant': 4}
 
 
+# Data types supported by the median filters
+ctypedef fused medfilt_types:
+    float
+    double
+    cnumpy.int64_t
+    cnumpy.uint64_t
+    cnumpy.int32_t
+    cnumpy.uint32_t
+    cnumpy.int16_t
+    cnumpy.uint16_t
+
+MEDFILT_ENGINES = ('sort', 'histogram')
+
+# Data types supported by the histogram median filter
+ctypedef fused histogram_types:
+    cnumpy.uint8_t
+    cnumpy.uint16_t
+
+_SUPPORTED_DTYPES = (numpy.float64, numpy.float32, numpy.int64, numpy.uint64,
+                     numpy.int32, numpy.uint32, numpy.int16, numpy.uint16)
+
+
 def medfilt1d(data,
               kernel_size=3,
               bool conditional=False,
               mode='nearest',
-              cval=0):
+              cval=0,
+              engine='sort'):
     """Function computing the median filter of the given input.
 
     Behavior at boundaries: the algorithm is reducing the size of the
@@ -73,17 +98,24 @@ def medfilt1d(data,
     :param str mode: the algorithm used to determine how values at borders
         are determined: 'nearest', 'reflect', 'mirror', 'shrink', 'constant'
     :param cval: Value used outside borders in 'constant' mode
+    :param str engine: The implementation to use:
+
+        - 'sort' (default): selection of the median of each window
+        - 'histogram': sliding histogram, only for 1D and 2D arrays of
+          uint8 or uint16. Its cost is proportional to the kernel height
+          instead of the kernel size, which is faster for large kernels.
 
     :returns: the array with the median value for each pixel.
     """
-    return medfilt(data, kernel_size, conditional, mode, cval)
+    return medfilt(data, kernel_size, conditional, mode, cval, engine)
 
 
 def medfilt2d(image,
               kernel_size=3,
               bool conditional=False,
               mode='nearest',
-              cval=0):
+              cval=0,
+              engine='sort'):
     """Function computing the median filter of the given input.
     Behavior at boundaries: the algorithm is reducing the size of the
     window/kernel for pixels at boundaries (there is no mirroring).
@@ -105,17 +137,24 @@ def medfilt2d(image,
     :param str mode: the algorithm used to determine how values at borders
         are determined: 'nearest', 'reflect', 'mirror', 'shrink', 'constant'
     :param cval: Value used outside borders in 'constant' mode
+    :param str engine: The implementation to use:
+
+        - 'sort' (default): selection of the median of each window
+        - 'histogram': sliding histogram, only for 1D and 2D arrays of
+          uint8 or uint16. Its cost is proportional to the kernel height
+          instead of the kernel size, which is faster for large kernels.
 
     :returns: the array with the median value for each pixel.
     """
-    return medfilt(image, kernel_size, conditional, mode, cval)
+    return medfilt(image, kernel_size, conditional, mode, cval, engine)
 
 
 def medfilt(data,
             kernel_size=3,
             bool conditional=False,
             mode='nearest',
-            cval=0):
+            cval=0,
+            engine='sort'):
     """Function computing the median filter of the given input.
     Behavior at boundaries: the algorithm is reducing the size of the
     window/kernel for pixels at boundaries (there is no mirroring).
@@ -128,15 +167,22 @@ def medfilt(data,
     the highest of the 2 central sorted values is taken.
 
     :param numpy.ndarray data: the array for which we want to apply
-        the median filter. Should be 1d or 2d.
+        the median filter.
     :param kernel_size: the dimension of the kernel.
-    :type kernel_size: For 1D should be an int for 2D should be a tuple or
-        a list of (kernel_height, kernel_width)
+    :type kernel_size: Either an int used for all dimensions or a tuple
+        or a list with one size per dimension,
+        e.g., (kernel_height, kernel_width) for 2D
     :param bool conditional: True if we want to apply a conditional median
         filtering.
     :param str mode: the algorithm used to determine how values at borders
         are determined: 'nearest', 'reflect', 'mirror', 'shrink', 'constant'
     :param cval: Value used outside borders in 'constant' mode
+    :param str engine: The implementation to use:
+
+        - 'sort' (default): selection of the median of each window
+        - 'histogram': sliding histogram, only for 1D and 2D arrays of
+          uint8 or uint16. Its cost is proportional to the kernel height
+          instead of the kernel size, which is faster for large kernels.
 
     :returns: the array with the median value for each pixel.
     """
@@ -144,9 +190,12 @@ def medfilt(data,
         err = 'Requested mode %s is unknown.' % mode
         raise ValueError(err)
 
-    if data.ndim > 2:
+    if engine not in MEDFILT_ENGINES:
+        raise ValueError('Requested engine %s is unknown.' % engine)
+
+    if data.ndim == 0:
         raise ValueError(
-            "Invalid data shape. Dimension of the array should be 1 or 2")
+            "Invalid data shape. Dimension of the array should be at least 1")
 
     # Handle case of scalar kernel size
     if isinstance(kernel_size, numbers.Integral):
@@ -154,6 +203,24 @@ def medfilt(data,
 
     assert len(kernel_size) == data.ndim
 
+    if data.ndim > 2:
+        if engine != 'sort':
+            raise ValueError("Engine %s only supports 1D and 2D arrays" % engine)
+        if data.dtype.type not in _SUPPORTED_DTYPES:
+            raise ValueError("%s type is not managed by the median filter" % data.dtype)
+        data = numpy.ascontiguousarray(data)
+        output_buffer = numpy.zeros_like(data)
+        if data.size == 0:
+            return output_buffer
+        _median_filter_nd(data.reshape(-1),
+                          output_buffer.reshape(-1),
+                          numpy.array(kernel_size, dtype=numpy.int32),
+                          numpy.array(data.shape, dtype=numpy.int32),
+                          conditional,
+                          MODES[mode],
+                          data.dtype.type(cval))
+        return output_buffer
+
     # Convert 1D arrays to 2D
     reshaped = False
     if len(data.shape) == 1:
@@ -165,6 +232,20 @@ def medfilt(data,
     output_buffer = numpy.zeros_like(data)
     check(data, output_buffer)
 
+    if engine == 'histogram':
+        if data.dtype not in (numpy.uint8, numpy.uint16):
+            raise ValueError(
+                "%s type is not managed by the histogram median filter" % data.dtype)
+        _median_filter_histogram(data,
+                                 output_buffer,
+                                 numpy.array(kernel_size, dtype=numpy.int32),
+                                 conditional,
+                                 MODES[mode],
+                                 data.dtype.type(cval))
+        if reshaped:
+            output_buffer.shape = -1  # Convert to 1D array
+        return output_buffer
+
     ker_dim = numpy.array(kernel_size, dtype=numpy.int32)
 
     if data.dtype == numpy.float64:
@@ -494,3 +575,173 @@ def _median_filter_uint16(
                                                 conditional,
                                                 mode,
                                                 cval)
+
+
+@cython.cdivision(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def _median_filter_nd(medfilt_types[::1] input_buffer not None,
+                      medfilt_types[::1] output_buffer not None,
+                      cnumpy.int32_t[::1] kernel_size not None,
+                      cnumpy.int32_t[::1] shape not None,
+                      bool conditional,
+                      int mode,
+                      medfilt_types cval):
+    """Median filter of a N-dimensional array provided as flat buffers"""
+    cdef:
+        long line
+        long nb_lines = input_buffer.shape[0] // shape[shape.shape[0] - 1]
+
+    for line in prange(nb_lines, nogil=True):
+        median_filter.median_filter_nd(
+            &input_buffer[0],
+            &output_buffer[0],
+            <int*> &kernel_size[0],
+            <int*> &shape[0],
+            shape.shape[0],
+            line,
+            conditional,
+            mode,
+            cval)
+
+
+@cython.cdivision(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def _median_along_first_axis(medfilt_types[:, ::1] input_buffer not None,
+                             medfilt_types[::1] output_buffer not None,
+                             int num_threads):
+    """Median along the first axis of a (n_frames, n_pixels) array"""
+    cdef:
+        long chunk, start, stop
+        long n_pixels = input_buffer.shape[1]
+        long chunk_size = 1024
+        long n_chunks = (n_pixels + chunk_size - 1) // chunk_size
+
+    if n_pixels == 0 or input_buffer.shape[0] == 0:
+        return
+    for chunk in prange(n_chunks, nogil=True, schedule="dynamic",
+                        num_threads=num_threads):
+        start = chunk * chunk_size
+        stop = min(start + chunk_size, n_pixels)
+        median_filter.median_along_first_axis(
+            &input_buffer[0, 0],
+            &output_buffer[0],
+            input_buffer.shape[0],
+            n_pixels,
+            start,
+            stop)
+
+
+def median_stack(frames, axis=0, out=None, block_size=64 * 2 ** 20,
+                 num_threads=None):
+    """Compute the median of a stack of frames along one axis, pixel-wise.
+
+    This is typically used to compute a temporal median of a stack of
+    frames, e.g., for dark current estimation or zinger removal.
+
+    The frames are processed by blocks of rows, so `frames` can be any
+    array-like supporting slicing (e.g., a h5py dataset) and is not loaded
+    in memory at once.
+
+    Not-a-Number (NaN) float values are ignored.
+    If all values are NaNs, it evaluates to NaN.
+
+    In event of an even number of valid values, the highest of the 2
+    central sorted values is taken (as for :func:`medfilt`).
+
+    :param frames: Stack of frames (numpy array, h5py dataset...)
+    :param int axis: The axis along which to compute the median.
+        Only the first axis is supported for array-likes which are not
+        numpy arrays.
+    :param numpy.ndarray out: Optional C-contiguous array where to store
+        the result
+    :param int block_size: Approximate size in bytes of the blocks of
+        data processed at once
+    :param int num_threads: Number of threads, default is all CPUs
+    :return: Array with the median of each pixel
+    :rtype: numpy.ndarray
+    """
+    if isinstance(frames, numpy.ndarray):
+        frames = numpy.moveaxis(frames, axis, 0)
+    elif axis != 0:
+        raise ValueError("Only axis 0 is supported for non-numpy arrays")
+
+    shape = tuple(frames.shape)
+    if len(shape) < 1:
+        raise ValueError("frames must have at least 1 dimension")
+    dtype = numpy.dtype(frames.dtype)
+    if dtype.type not in _SUPPORTED_DTYPES:
+        raise ValueError("%s type is not managed by the median filter" % dtype)
+
+    frame_shape = shape[1:]
+    if out is None:
+        out = numpy.empty(frame_shape, dtype=dtype)
+    elif (out.shape != frame_shape or out.dtype != dtype or
+            not out.flags['C_CONTIGUOUS']):
+        raise ValueError("out must be a C-contiguous array of shape %s and type %s" %
+                         (frame_shape, dtype))
+
+    if num_threads is None or num_threads <= 0:
+        num_threads = int(os.environ.get("OMP_NUM_THREADS", os.cpu_count() or 1))
+
+    flat_out = out.reshape(-1)
+    if len(frame_shape) == 0:  # 1D input, a single "pixel"
+        _median_along_first_axis(
+            numpy.ascontiguousarray(frames[()], dtype=dtype).reshape(-1, 1),
+            flat_out, 1)
+        return out
+
+    row_size = max(1, int(numpy.prod(frame_shape[1:])))
+    nb_rows = frame_shape[0]
+    rows_per_block = max(1, block_size // max(1, shape[0] * row_size * dtype.itemsize))
+    for start in range(0, nb_rows, rows_per_block):
+        stop = min(start + rows_per_block, nb_rows)
+        block = numpy.ascontiguousarray(frames[:, start:stop], dtype=dtype)
+        _median_along_first_axis(block.reshape(shape[0], -1),
+                                 flat_out[start * row_size:stop * row_size],
+                                 num_threads)
+    return out
+
+
+@cython.cdivision(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def _median_filter_histogram(histogram_types[:, ::1] input_buffer not None,
+                             histogram_types[:, ::1] output_buffer not None,
+                             cnumpy.int32_t[::1] kernel_size not None,
+                             bool conditional,
+                             int mode,
+                             histogram_types cval):
+    """Sliding histogram median filter of a 2D array, processed by row bands"""
+    cdef:
+        int band, nb_bands, band_height, y_start, y_end
+        int nbits = 8 * sizeof(histogram_types)
+        int[2] buffer_shape
+    buffer_shape[0] = input_buffer.shape[0]
+    buffer_shape[1] = input_buffer.shape[1]
+    if buffer_shape[0] == 0 or buffer_shape[1] == 0:
+        return
+
+    # Each band initializes its own histogram: use a few bands per thread
+    nb_bands = min(buffer_shape[0], 4 * (os.cpu_count() or 1))
+    band_height = (buffer_shape[0] + nb_bands - 1) // nb_bands
+
+    for band in prange(nb_bands, nogil=True, schedule="dynamic"):
+        y_start = band * band_height
+        y_end = min(y_start + band_height, buffer_shape[0])
+        if y_start < y_end:
+            median_filter.median_filter_histogram(
+                &input_buffer[0, 0],
+                &output_buffer[0, 0],
+                <int*> &kernel_size[0],
+                <int*> buffer_shape,
+                y_start,
+                y_end,
+                conditional,
+                mode,
+                cval,
+                nbits)
@@ -25,11 +25,11 @@
 
 __authors__ = ["H. Payno"]
 __license__ = "MIT"
-__date__ = "17/01/2018"
+__date__ = "19/10/2026"
 
 import unittest
 import numpy
-from silx.math.medianfilter import medfilt2d, medfilt1d
+from silx.math.medianfilter import medfilt, medfilt2d, medfilt1d, median_stack
 from silx.math.medianfilter.medianfilter import reflect, mirror
 from silx.math.medianfilter.medianfilter import MODES as silx_mf_modes
 from silx.utils.testutils import ParametricTestCase
@@ -654,6 +654,104 @@ def _getScipyAndSilxCommonModes():
     return modes
 
 
+class TestMedianFilterND(ParametricTestCase):
+    """Unit tests of the median filter on 3D arrays"""
+
+    def testSameAs2D(self):
+        """A kernel of size 1 along the first axis is a stack of 2D filters"""
+        data = numpy.random.RandomState(0).random_sample((4, 11, 13))
+        for mode in silx_mf_modes:
+            with self.subTest(mode=mode):
+                res = medfilt(data, (1, 5, 3), mode=mode, cval=0.5)
+                for index, image in enumerate(data):
+                    ref = medfilt2d(image, (5, 3), mode=mode, cval=0.5)
+                    self.assertTrue(numpy.array_equal(res[index], ref))
+
+    def testNaNs(self):
+        data = numpy.arange(27, dtype=numpy.float64).reshape(3, 3, 3)
+        data[:, 1, 1] = numpy.nan
+        res = medfilt(data, 3, mode='shrink')
+        self.assertEqual(res[1, 1, 1], 14)  # Highest of the 2 central values
+        self.assertEqual(res.dtype, data.dtype)
+
+        data[...] = numpy.nan
+        self.assertTrue(numpy.all(numpy.isnan(medfilt(data, 3))))
+
+    def testConditional(self):
+        data = numpy.zeros((5, 5, 5), dtype=numpy.int32)
+        data[2, 2, 2] = 100
+        data[1, 1, 1] = 1
+        res = medfilt(data, 3, conditional=True)
+        self.assertEqual(res[2, 2, 2], 0)
+        self.assertTrue(numpy.array_equal(res[3:], data[3:]))
+
+
+class TestMedianFilterHistogram(ParametricTestCase):
+    """Compare the histogram engine with the default one"""
+
+    def testSameAsSort(self):
+        state = numpy.random.RandomState(0)
+        for dtype in (numpy.uint8, numpy.uint16):
+            image = state.randint(0, numpy.iinfo(dtype).max, (37, 41)).astype(dtype)
+            for mode in silx_mf_modes:
+                for kernel in ((3, 3), (1, 5), (7, 3), (15, 15)):
+                    for conditional in (False, True):
+                        with self.subTest(dtype=dtype, mode=mode, kernel=kernel,
+                                          conditional=conditional):
+                            ref = medfilt2d(image.astype(numpy.uint32), kernel,
+                                            conditional, mode, cval=7)
+                            res = medfilt2d(image, kernel, conditional, mode,
+                                            cval=7, engine='histogram')
+                            self.assertEqual(res.dtype, dtype)
+                            self.assertTrue(numpy.array_equal(res, ref))
+
+    def test1D(self):
+        data = numpy.array([5, 1, 7, 3, 3, 9, 0], dtype=numpy.uint8)
+        res = medfilt1d(data, 3, engine='histogram')
+        self.assertTrue(numpy.array_equal(res, [5, 5, 3, 3, 3, 3, 0]))
+
+    def testErrors(self):
+        with self.assertRaises(ValueError):
+            medfilt2d(numpy.zeros((3, 3), numpy.float32), engine='histogram')
+        with self.assertRaises(ValueError):
+            medfilt(numpy.zeros((3, 3, 3), numpy.uint16), engine='histogram')
+        with self.assertRaises(ValueError):
+            medfilt2d(numpy.zeros((3, 3), numpy.uint16), engine='unknown')
+
+
+class TestMedianStack(ParametricTestCase):
+    """Unit tests of the median of a stack of frames"""
+
+    def testInt(self):
+        frames = numpy.random.RandomState(0).randint(0, 1000, (51, 17, 19))
+        frames = frames.astype(numpy.int32)
+        ref = numpy.median(frames, axis=0)
+        for block_size in (1, 2 ** 10, 2 ** 26):
+            with self.subTest(block_size=block_size):
+                res = median_stack(frames, block_size=block_size)
+                self.assertEqual(res.dtype, numpy.int32)
+                self.assertTrue(numpy.array_equal(res, ref))
+
+    def testAxisAndOutput(self):
+        frames = numpy.random.RandomState(1).random_sample((10, 9, 7)).astype(numpy.float32)
+        out = numpy.empty((10, 9), dtype=numpy.float32)
+        res = median_stack(frames, axis=2, out=out)
+        self.assertIs(res, out)
+        self.assertTrue(numpy.array_equal(out, numpy.median(frames, axis=2)))
+
+        with self.assertRaises(ValueError):
+            median_stack(frames, out=numpy.empty((9, 7), numpy.float64))
+
+    def testNaNs(self):
+        frames = numpy.arange(60, dtype=numpy.float64).reshape(5, 3, 4)
+        frames[1:3, 0, 0] = numpy.nan  # Values 0, 36, 48 left
+        frames[:, 1, 1] = numpy.nan
+        res = median_stack(frames)
+        self.assertEqual(res[0, 0], 36)
+        self.assertTrue(numpy.isnan(res[1, 1]))
+        self.assertEqual(res[2, 3], 35)
+
+
 @unittest.skipUnless(scipy is not None, "scipy not available")
 class TestVsScipy(ParametricTestCase):
     """Compare scipy.ndimage.median_filter vs silx.math.medianfilter
@@ -27,7 +27,7 @@ from __future__ import division
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "17/01/2018"
+__date__ = "19/10/2026"
 
 import unittest
 
@@ -172,3 +172,100 @@ class TestMarchingCubes(ParametricTestCase):
                 self.assertAllClose(ref_result.get_indices(),
                                     result.get_indices(),
                                     atol=0., rtol=0.)
+
+    @staticmethod
+    def _triangles(result):
+        """Returns sorted triangles as rows of vertices and normals"""
+        vertices, normals, indices = result
+        triangles = numpy.concatenate(
+            (vertices[indices].reshape(len(indices), -1),
+             normals[indices].reshape(len(indices), -1)), axis=1)
+        return triangles[numpy.lexsort(triangles.T[::-1])]
+
+    def test_slabs(self):
+        """Test processing by slabs, comparing to processing at once
+
+        Vertices shared by slabs are expected to be merged.
+        """
+        isolevel = 10.
+        z, y, x = numpy.mgrid[:30, :20, :25].astype(numpy.float32)
+        data = numpy.sqrt((z - 15)**2 + (y - 10)**2 + (x - 12)**2)
+        data += numpy.sin(x / 3.)
+
+        class ArrayLike(object):
+            """Array-like only supporting slicing"""
+            shape = data.shape
+
+            def __getitem__(self, item):
+                return data[item]
+
+        for sampling in ((1, 1, 1), (2, 1, 3)):
+            ref_result = marchingcubes.MarchingCubes(
+                data, isolevel, sampling=sampling)
+            ref_triangles = self._triangles(ref_result)
+
+            for array, num_threads, block_size in (
+                    (data, 3, 64 * 2**20),
+                    (data, 2, 1),
+                    (ArrayLike(), 1, 20 * 25 * 4 * 6)):
+                with self.subTest(sampling=sampling,
+                                  num_threads=num_threads,
+                                  block_size=block_size):
+                    result = marchingcubes.MarchingCubes(
+                        isolevel=isolevel, sampling=sampling)
+                    result.process(array, num_threads=num_threads,
+                                   block_size=block_size)
+                    self.assertEqual(result.shape, ref_result.shape)
+                    self.assertEqual(len(result.get_vertices()),
+                                     len(ref_result.get_vertices()))
+                    triangles = self._triangles(result)
+                    self.assertEqual(triangles.shape, ref_triangles.shape)
+                    self.assertAllClose(triangles, ref_triangles)
+
+    def test_list(self):
+        """Test with nested lists as input, which are converted to array"""
+        z, y, x = numpy.mgrid[:6, :7, :8].astype(numpy.float32)
+        data = numpy.sqrt((z - 3)**2 + (y - 3)**2 + (x - 4)**2)
+        ref_result = marchingcubes.MarchingCubes(data, isolevel=2.5)
+        ref_triangles = self._triangles(ref_result)
+
+        for num_threads in (1, 2):
+            with self.subTest(num_threads=num_threads):
+                result = marchingcubes.MarchingCubes(isolevel=2.5)
+                result.process(data.tolist(), num_threads=num_threads)
+                self.assertEqual(result.shape, ref_result.shape)
+                self.assertAllClose(self._triangles(result), ref_triangles)
+
+    def test_simplify(self):
+        """Test simplification of a sphere isosurface"""
+        center, radius = numpy.array((20., 18., 15.)), 12.
+        z, y, x = numpy.mgrid[:40, :36, :30]
+        data = numpy.sqrt((z - center[0])**2 + (y - center[1])**2 +
+                          (x - center[2])**2)
+        vertices, normals, indices = marchingcubes.MarchingCubes(data, radius)
+
+        # No simplification needed
+        result = marchingcubes.simplify(
+            vertices, normals, indices, len(indices))
+        self.assertAllClose(result[0], vertices)
+        self.assertAllClose(result[2], indices)
+
+        for nb_triangles in (len(indices) // 2, 500, 50):
+            with self.subTest(nb_triangles=nb_triangles):
+                new_vertices, new_normals, new_indices = marchingcubes.simplify(
+                    vertices, normals, indices, nb_triangles)
+                self.assertLessEqual(len(new_indices), nb_triangles)
+                self.assertGreater(len(new_indices), nb_triangles // 4)
+                self.assertEqual(len(new_vertices), len(new_normals))
+                self.assertEqual(new_indices.dtype, numpy.uint32)
+                # All vertices are used
+                self.assertEqual(len(numpy.unique(new_indices)),
+                                 len(new_vertices))
+                # Vertices stay close to the sphere
+                distances = numpy.linalg.norm(new_vertices - center, axis=1)
+                self.assertLess(numpy.abs(distances - radius).max(), 1.)
+                # Normals are unit vectors along gradient descent
+                self.assertAllClose(
+                    numpy.linalg.norm(new_normals, axis=1), 1., atol=1e-5)
+                self.assertTrue(numpy.all(numpy.sum(
+                    new_normals * (new_vertices - center), axis=1) < 0))
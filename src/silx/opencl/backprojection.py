@@ -29,9 +29,10 @@ from __future__ import absolute_import, print_function, with_statement, division
 
 __authors__ = ["A. Mirone, P. Paleo"]
 __license__ = "MIT"
-__date__ = "25/01/2019"
+__date__ = "19/10/2026"
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 from .common import pyopencl
@@ -111,6 +112,7 @@ class Backprojection(OpenclProcessing):
         self._compute_angles()
         self._init_kernels()
         self._init_filter(filter_name)
+        self._stack = None  # Resources of filtered_backprojection_stack
 
     def _init_geometry(self, sino_shape, slice_shape, angles, axis_position,
                       extra_options):
@@ -381,6 +383,200 @@ class Backprojection(OpenclProcessing):
 
     __call__ = filtered_backprojection
 
+    # -------------------------
+    # - Stack of sinograms   -
+    # -------------------------
+
+    def _init_stack(self, batch_size):
+        """Allocate the resources used by :meth:`filtered_backprojection_stack`
+
+        :param int batch_size: Number of sinograms filtered at once
+        """
+        if self._stack is not None and self._stack["batch_size"] == batch_size:
+            return
+        self._stack = None
+        stack_filter = SinoFilter(
+            (batch_size,) + tuple(self.shape),
+            ctx=self.ctx,
+            filter_name=self.filter_name,
+            extra_options=self.extra_options,
+        )
+        # Keep a possibly user-defined filter
+        stack_filter.set_filter(self.sino_filter.filter_f.copy(), normalize=False)
+
+        if self.profile:
+            properties = pyopencl.command_queue_properties.PROFILING_ENABLE
+        else:
+            properties = 0
+        # Two slots (sinogram, slice) so that the download of a slice on the
+        # transfer queue overlaps with the backprojection of the next one.
+        slots = []
+        for index in range(2):
+            if index == 0:
+                d_slice = self.cl_mem["_d_slice"]
+                d_sino_ref = self.d_sino_tex if self._use_textures else self.d_sino.data
+            else:
+                d_slice = parray.empty(self.queue, self.dimrec_shape, np.float32)
+                if self._use_textures:
+                    d_sino_ref = self.allocate_texture(self.shape)
+                else:
+                    d_sino_ref = parray.empty(self.queue, self.shape, np.float32).data
+            kernel_args = list(self._backproj_kernel_args)
+            kernel_args[3] = d_slice.data
+            kernel_args[4] = d_sino_ref
+            slots.append({
+                "d_slice": d_slice,
+                "d_sino": d_sino_ref,
+                "kernel_args": tuple(kernel_args),
+                "h_slice": np.empty(self.dimrec_shape, dtype=np.float32),
+                "event": None,  # download event of the slice
+                "index": None,  # index of the slice being downloaded
+            })
+        self._stack = {
+            "batch_size": batch_size,
+            "filter": stack_filter,
+            # Two filtered stacks so that a batch is filtered while the
+            # previous one is still being backprojected
+            "d_filtered": [parray.empty(self.queue, (batch_size,) + tuple(self.shape), np.float32)
+                           for _ in range(2)],
+            "copy_events": [None, None],
+            "transfer_queue": pyopencl.CommandQueue(self.ctx, properties=properties),
+            "slots": slots,
+        }
+
+    @staticmethod
+    def _read_batches(sinos, batch_size, shape):
+        """Generator of (start index, number of sinograms, batch array)
+
+        :param sinos: 3D array-like supporting slicing or iterable of 2D
+            sinograms
+        """
+        if hasattr(sinos, "shape") and hasattr(sinos, "__getitem__"):
+            for start in range(0, len(sinos), batch_size):
+                data = np.asarray(sinos[start:start + batch_size])
+                batch = np.zeros((batch_size,) + shape, dtype=np.float32)
+                batch[:len(data)] = data
+                yield start, len(data), batch
+        else:
+            start = 0
+            batch = np.zeros((batch_size,) + shape, dtype=np.float32)
+            count = 0
+            for sino in sinos:
+                batch[count] = sino
+                count += 1
+                if count == batch_size:
+                    yield start, count, batch
+                    start += count
+                    batch = np.zeros((batch_size,) + shape, dtype=np.float32)
+                    count = 0
+            if count:
+                yield start, count, batch
+
+    def _flush_slot(self, slot, output):
+        """Wait for the pending download of a slot and store the slice"""
+        if slot["event"] is None:
+            return
+        slot["event"].wait()
+        self.profile_add(slot["event"], "Transfer slice D->H")
+        result = slot["h_slice"][:self.slice_shape[0], :self.slice_shape[1]]
+        if isinstance(output, list):
+            output.append(result.copy())
+        else:
+            output[slot["index"]] = result
+        slot["event"] = None
+
+    def _backproject_from_stack(self, slot, d_filtered, position, index, output):
+        """Backproject one filtered sinogram of the device stack
+
+        :return: Event of the copy from the filtered stack
+        """
+        self._flush_slot(slot, output)
+        offset = position * int(np.prod(self.shape)) * _sizeof(np.float32)
+        if self._use_textures:
+            ev = pyopencl.enqueue_copy(self.queue, slot["d_sino"], d_filtered.data,
+                                       offset=offset, origin=(0, 0),
+                                       region=tuple(self.shape[::-1]))
+        else:
+            ev = pyopencl.enqueue_copy(self.queue, slot["d_sino"], d_filtered.data,
+                                       byte_count=int(np.prod(self.shape)) * _sizeof(np.float32),
+                                       src_offset=offset)
+        self.profile_add(ev, "Transfer filtered sino D->D")
+        copy_event = ev
+        if self._use_textures:
+            kernel = self.kernels.backproj_kernel
+        else:
+            kernel = self.kernels.backproj_cpu_kernel
+        ev = kernel(self.queue, self.ndrange, self.wg, *slot["kernel_args"])
+        self.profile_add(ev, "Backprojection")
+        # Transfer queue waits for the kernel, not for the whole main queue
+        slot["event"] = pyopencl.enqueue_copy(
+            self._stack["transfer_queue"], slot["h_slice"], slot["d_slice"].data,
+            is_blocking=False, wait_for=[ev])
+        slot["index"] = index
+        return copy_event
+
+    def filtered_backprojection_stack(self, sinos, output=None, batch_size=8):
+        """Compute the filtered backprojection of a stack of sinograms.
+
+        Sinograms are filtered by batches of `batch_size` (one FFT per batch)
+        while the next batch is read in a background thread, and slices are
+        downloaded on a separate queue while the next one is backprojected.
+
+        :param sinos: Stack of sinograms (n_slices, n_angles, n_bins):
+            numpy array, h5py dataset or any iterable of 2D sinograms.
+        :param output: Optional output: numpy array or h5py dataset of shape
+            (n_slices,) + slice_shape. If not provided, a new numpy array
+            is returned.
+        :param int batch_size: Number of sinograms filtered at once
+        :return: The reconstructed slices
+        """
+        shape = tuple(self.shape)
+        if output is None:
+            if hasattr(sinos, "shape"):
+                results = np.empty((len(sinos),) + tuple(self.slice_shape), np.float32)
+            else:
+                results = []
+        else:
+            results = output
+
+        with self.sem:
+            self._init_stack(batch_size)
+            stack = self._stack
+            slots = stack["slots"]
+            batches = self._read_batches(sinos, batch_size, shape)
+            counter = 0
+            batch_counter = 0
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(next, batches, None)
+                while True:
+                    item = future.result()
+                    if item is None:
+                        break
+                    # Read next batch while processing this one
+                    future = executor.submit(next, batches, None)
+                    start, count, batch = item
+                    which = batch_counter % 2
+                    batch_counter += 1
+                    d_filtered = stack["d_filtered"][which]
+                    if stack["copy_events"][which] is not None:
+                        # Wait until the stack is no longer read
+                        stack["copy_events"][which].wait()
+                    stack["filter"](batch, output=d_filtered)
+                    for position in range(count):
+                        slot = slots[counter % len(slots)]
+                        stack["copy_events"][which] = self._backproject_from_stack(
+                            slot, d_filtered, position, start + position, results)
+                        counter += 1
+            for offset in range(len(slots)):
+                self._flush_slot(slots[(counter + offset) % len(slots)], results)
+
+        if isinstance(results, list):
+            if results:
+                results = np.array(results)
+            else:
+                results = np.empty((0,) + tuple(self.slice_shape), np.float32)
+        return results
+
 
     # -------------------
     # - Compatibility  -
@@ -0,0 +1,333 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#    Project: S I L X project
+#             https://github.com/silx-kit/silx
+#
+#    Copyright (C) 2026 European Synchrotron Radiation Facility, Grenoble, France
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Cache of compiled OpenCL program binaries.
+
+Programs are identified by a hash of their source code, the compiler options
+and the name, platform and driver version of the devices they are built for.
+Binaries are kept in memory for the life time of the process and stored on
+disk so that other processes can skip the compilation.
+
+The location of the on-disk cache is defined by the `SILX_OPENCL_CACHE`
+environment variable. Set it to "0" or "False" to disable the cache
+completely.
+"""
+
+__author__ = "agent"
+__license__ = "MIT"
+__copyright__ = "European Synchrotron Radiation Facility, Grenoble, France"
+__date__ = "19/10/2026"
+__status__ = "stable"
+__all__ = ["ProgramCache", "program_cache"]
+
+import os
+import sys
+import struct
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .common import pyopencl
+
+logger = logging.getLogger(__name__)
+
+
+def _default_directory():
+    """Returns the default location of the on-disk cache"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME")
+        if not base:
+            base = os.path.join(os.path.expanduser("~"), ".cache")
+    if not base:
+        base = tempfile.gettempdir()
+    return os.path.join(base, "silx", "opencl")
+
+
+class ProgramCache(object):
+    """Two level (memory and disk) cache of OpenCL program binaries.
+
+    :param str directory: Folder where binaries are stored.
+        If None, only the in-memory cache is used.
+    :param int max_memory_size: Maximum size in bytes of the binaries
+        kept in memory
+    :param int max_disk_size: Maximum size in bytes of the on-disk cache
+    """
+
+    _HEADER = b"SXCLBIN1"
+    """Magic number of the cache files"""
+
+    def __init__(self, directory=None, max_memory_size=64 * 2 ** 20,
+                 max_disk_size=512 * 2 ** 20):
+        self.directory = directory
+        self.max_memory_size = max_memory_size
+        self.max_disk_size = max_disk_size
+        self.enabled = True
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(ctx, source, options=None):
+        """Compute the key identifying a program in the cache
+
+        :param pyopencl.Context ctx: Context the program is built for
+        :param str source: Source code of the program
+        :param Union[str,List[str]] options: Compiler options
+        :rtype: str
+        """
+        if isinstance(options, (list, tuple)):
+            options = " ".join(options)
+        items = [pyopencl.VERSION_TEXT, options or ""]
+        for device in ctx.devices:
+            items += [device.platform.name, device.platform.version,
+                      device.name, device.version, device.driver_version]
+        items.append(source)
+        checksum = hashlib.sha256()
+        for item in items:
+            checksum.update(item.encode("utf-8") + b"\0")
+        return checksum.hexdigest()
+
+    def _get_filename(self, key):
+        return os.path.join(self.directory, key + ".bin")
+
+    def _serialize(self, binaries):
+        lengths = [len(binary) for binary in binaries]
+        header = struct.pack("<8sI%dQ" % len(lengths), self._HEADER, len(lengths), *lengths)
+        return header + b"".join(binaries)
+
+    def _deserialize(self, data):
+        magic, count = struct.unpack_from("<8sI", data)
+        if magic != self._HEADER:
+            raise ValueError("Not a silx OpenCL binary cache file")
+        offset = struct.calcsize("<8sI")
+        lengths = struct.unpack_from("<%dQ" % count, data, offset)
+        offset += struct.calcsize("<%dQ" % count)
+        binaries = []
+        for length in lengths:
+            binaries.append(data[offset:offset + length])
+            offset += length
+        if offset != len(data):
+            raise ValueError("Truncated silx OpenCL binary cache file")
+        return binaries
+
+    def _read(self, key):
+        """Read binaries from the disk cache, or return None"""
+        if self.directory is None:
+            return None
+        filename = self._get_filename(key)
+        try:
+            with open(filename, "rb") as f:
+                binaries = self._deserialize(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as error:
+            logger.warning("Discard corrupted OpenCL cache file %s: %s", filename, error)
+            self._remove(filename)
+            return None
+        try:
+            # Keep track of the last use for the eviction policy
+            os.utime(filename)
+        except OSError:
+            pass
+        return binaries
+
+    def _write(self, key, binaries):
+        """Store binaries in the disk cache"""
+        if self.directory is None:
+            return
+        data = self._serialize(binaries)
+        if len(data) > self.max_disk_size:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmpname = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # Atomic with respect to concurrent readers
+            os.replace(tmpname, self._get_filename(key))
+        except OSError as error:
+            logger.warning("Unable to write OpenCL cache in %s: %s", self.directory, error)
+            return
+        self._evict_disk()
+
+    @staticmethod
+    def _remove(filename):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+    def _evict_disk(self):
+        """Remove least recently used files until the cache fits its size"""
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(".bin"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= self.max_disk_size:
+                break
+            self._remove(path)
+            total -= size
+
+    def _pop_from_memory(self, key=None):
+        """Remove an entry from the memory cache, keeping its size up to date.
+
+        To call with the lock held.
+
+        :param Union[str,None] key: Key of the entry, None for the least
+            recently used one
+        :returns: The removed binaries, or None if key is not in the cache
+        """
+        if key is None:
+            _key, binaries = self._memory.popitem(last=False)
+        else:
+            binaries = self._memory.pop(key, None)
+            if binaries is None:
+                return None
+        self._memory_size -= sum(len(binary) for binary in binaries)
+        return binaries
+
+    def _store_in_memory(self, key, binaries):
+        size = sum(len(binary) for binary in binaries)
+        if size > self.max_memory_size:
+            return
+        with self._lock:
+            if key in self._memory:
+                return
+            self._memory[key] = binaries
+            self._memory_size += size
+            while self._memory_size > self.max_memory_size:
+                self._pop_from_memory()
+
+    def get(self, key):
+        """Returns the list of binaries (one per device) or None.
+
+        :param str key: Key as provided by :meth:`get_key`
+        :rtype: Union[List[bytes],None]
+        """
+        with self._lock:
+            binaries = self._memory.get(key)
+            if binaries is not None:
+                self._memory.move_to_end(key)
+                return binaries
+        binaries = self._read(key)
+        if binaries is not None:
+            self._store_in_memory(key, binaries)
+        return binaries
+
+    def set(self, key, binaries):
+        """Store the binaries of a program in the cache
+
+        :param str key: Key as provided by :meth:`get_key`
+        :param List[bytes] binaries: One binary per device of the context
+        """
+        binaries = [bytes(binary) for binary in binaries]
+        self._store_in_memory(key, binaries)
+        self._write(key, binaries)
+
+    def clear(self, disk=False):
+        """Empty the cache
+
+        :param bool disk: True to also remove the files of the on-disk cache
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+        if disk and self.directory is not None and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".bin"):
+                    self._remove(os.path.join(self.directory, name))
+
+    def build(self, ctx, source, options=None):
+        """Build a program, reusing cached binaries when available
+
+        :param pyopencl.Context ctx: Context the program is built for
+        :param str source: Source code of the program
+        :param Union[str,List[str]] options: Compiler options
+        :rtype: pyopencl.Program
+        """
+        if not self.enabled:
+            return pyopencl.Program(ctx, source).build(options=options)
+
+        key = self.get_key(ctx, source, options)
+        binaries = self.get(key)
+        if binaries is not None:
+            try:
+                program = pyopencl.Program(ctx, ctx.devices, binaries).build(options=options)
+            except pyopencl.Error as error:
+                logger.warning("Cached OpenCL binaries are unusable, recompile: %s", error)
+                with self._lock:
+                    self._pop_from_memory(key)
+                if self.directory is not None:
+                    self._remove(self._get_filename(key))
+            else:
+                logger.debug("OpenCL program %s loaded from cache", key)
+                return program
+
+        program = pyopencl.Program(ctx, source).build(options=options)
+        try:
+            binaries = program.get_info(pyopencl.program_info.BINARIES)
+        except pyopencl.Error as error:
+            logger.debug("Unable to retrieve OpenCL program binaries: %s", error)
+        else:
+            if all(binaries):
+                self.set(key, binaries)
+        return program
+
+
+def _create_program_cache():
+    directory = os.environ.get("SILX_OPENCL_CACHE")
+    if directory in ("0", "False"):
+        cache = ProgramCache(directory=None)
+        cache.enabled = False
+    else:
+        cache = ProgramCache(directory=directory or _default_directory())
+    return cache
+
+
+program_cache = _create_program_cache()
+"""Cache of program binaries shared by all :class:`OpenclProcessing` instances"""
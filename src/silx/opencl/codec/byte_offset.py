@@ -37,10 +37,11 @@ __authors__ = ["Jérôme Kieffer"]
 __contact__ = "jerome.kieffer@esrf.eu"
 __license__ = "MIT"
 __copyright__ = "European Synchrotron Radiation Facility, Grenoble, France"
-__date__ = "11/10/2018"
+__date__ = "19/10/2026"
 __status__ = "production"
 
 
+import collections
 import functools
 import os
 import numpy
@@ -143,6 +144,108 @@ class ByteOffset(OpenclProcessing):
                                          output_statement=output_statement)
         return knl
 
+    def _allocate_raw_buffers(self, size):
+        """Allocate the buffers used to decompress a raw stream of `size` bytes
+
+        :param int size: padded size of the raw stream
+        :rtype: dict
+        """
+        return {name: pyopencl.array.empty(self.queue, size, dtype=dtype)
+                for name, dtype in (("raw", numpy.int8),
+                                    ("mask", numpy.int32),
+                                    ("exceptions", numpy.int32),
+                                    ("values", numpy.int32))}
+
+    def _enqueue_mark_exceptions(self, queue, mem, raw, events):
+        """First step of the decompression: upload the raw stream and mark
+        the exceptions. The number of exceptions is read back asynchronously.
+
+        :param queue: command queue to use
+        :param dict mem: buffers (raw, mask, values, exceptions, counter)
+        :param numpy.ndarray raw: compressed stream as a 1D array of int8
+        :param list events: list of EventDescription to complete
+        :return: (host array with the number of exceptions, event of the read)
+        """
+        wg = self.block_size
+        padded_size = mem["raw"].size
+        len_raw = numpy.int32(len(raw))
+        evt = pyopencl.enqueue_copy(queue, mem["raw"].data, raw,
+                                    is_blocking=False)
+        events.append(EventDescription("copy raw H -> D", evt))
+        evt = self.kernels.fill_int_mem(queue, (padded_size,), (wg,),
+                                        mem["mask"].data,
+                                        numpy.int32(padded_size),
+                                        numpy.int32(0),
+                                        numpy.int32(0))
+        events.append(EventDescription("memset mask", evt))
+        evt = self.kernels.fill_int_mem(queue, (1,), (1,),
+                                        mem["counter"].data,
+                                        numpy.int32(1),
+                                        numpy.int32(0),
+                                        numpy.int32(0))
+        events.append(EventDescription("memset counter", evt))
+        evt = self.kernels.mark_exceptions(queue, (padded_size,), (wg,),
+                                           mem["raw"].data,
+                                           len_raw,
+                                           numpy.int32(padded_size),
+                                           mem["mask"].data,
+                                           mem["values"].data,
+                                           mem["counter"].data,
+                                           mem["exceptions"].data)
+        events.append(EventDescription("mark exceptions", evt))
+        nb_exceptions = numpy.empty(1, dtype=numpy.int32)
+        evt = pyopencl.enqueue_copy(queue, nb_exceptions, mem["counter"].data,
+                                    is_blocking=False)
+        events.append(EventDescription("copy counter D -> H", evt))
+        return nb_exceptions, evt
+
+    def _enqueue_reconstruct(self, queue, mem, len_raw, nbexc, out, events):
+        """Second step of the decompression: treat the exceptions, perform
+        the cumulative sums and copy the result in `out`.
+
+        :param queue: command queue to use
+        :param dict mem: buffers (raw, mask, values, exceptions)
+        :param int len_raw: size of the compressed stream
+        :param int nbexc: number of exceptions in the compressed stream
+        :param pyopencl.array out: output array of int32 or float32
+        :param list events: list of EventDescription to complete
+        :return: event of the last kernel
+        """
+        wg = self.block_size
+        len_raw = numpy.int32(len_raw)
+        evt = None
+        if nbexc == 0:
+            logger.info("nbexc %i", nbexc)
+        else:
+            evt = self.kernels.treat_exceptions(queue, (nbexc,), (1,),
+                                                mem["raw"].data,
+                                                len_raw,
+                                                mem["mask"].data,
+                                                mem["exceptions"].data,
+                                                mem["values"].data
+                                                )
+            events.append(EventDescription("treat_exceptions", evt))
+
+        evt = self.kernels.scan(mem["values"],
+                                mem["mask"],
+                                queue=queue,
+                                size=int(len_raw),
+                                wait_for=None if evt is None else (evt,))
+        events.append(EventDescription("double scan", evt))
+        if out.dtype == numpy.float32:
+            copy_results = self.kernels.copy_result_float
+        else:
+            copy_results = self.kernels.copy_result_int
+        evt = copy_results(queue, (mem["raw"].size,), (wg,),
+                           mem["values"].data,
+                           mem["mask"].data,
+                           len_raw,
+                           self.dec_size,
+                           out.data
+                           )
+        events.append(EventDescription("copy_results", evt))
+        return evt
+
     def decode(self, raw, as_float=False, out=None):
         """This function actually performs the decompression by calling the kernels
 
@@ -164,93 +267,110 @@ class ByteOffset(OpenclProcessing):
                 self.raw_size = int(len(raw))
                 self.padded_raw_size = (self.raw_size + wg - 1) & ~(wg - 1)
                 logger.info("increase raw buffer size to %s", self.padded_raw_size)
-                buffers = {
-                           "raw": pyopencl.array.empty(self.queue, self.padded_raw_size, dtype=numpy.int8),
-                           "mask": pyopencl.array.empty(self.queue, self.padded_raw_size, dtype=numpy.int32),
-                           "exceptions": pyopencl.array.empty(self.queue, self.padded_raw_size, dtype=numpy.int32),
-                           "values": pyopencl.array.empty(self.queue, self.padded_raw_size, dtype=numpy.int32),
-                          }
-                self.cl_mem.update(buffers)
-            else:
-                wg = self.block_size
+                self.cl_mem.update(self._allocate_raw_buffers(self.padded_raw_size))
 
-            evt = pyopencl.enqueue_copy(self.queue, self.cl_mem["raw"].data,
-                                        raw,
-                                        is_blocking=False)
-            events.append(EventDescription("copy raw H -> D", evt))
-            evt = self.kernels.fill_int_mem(self.queue, (self.padded_raw_size,), (wg,),
-                                            self.cl_mem["mask"].data,
-                                            numpy.int32(self.padded_raw_size),
-                                            numpy.int32(0),
-                                            numpy.int32(0))
-            events.append(EventDescription("memset mask", evt))
-            evt = self.kernels.fill_int_mem(self.queue, (1,), (1,),
-                                            self.cl_mem["counter"].data,
-                                            numpy.int32(1),
-                                            numpy.int32(0),
-                                            numpy.int32(0))
-            events.append(EventDescription("memset counter", evt))
-            evt = self.kernels.mark_exceptions(self.queue, (self.padded_raw_size,), (wg,),
-                                               self.cl_mem["raw"].data,
-                                               len_raw,
-                                               numpy.int32(self.raw_size),
-                                               self.cl_mem["mask"].data,
-                                               self.cl_mem["values"].data,
-                                               self.cl_mem["counter"].data,
-                                               self.cl_mem["exceptions"].data)
-            events.append(EventDescription("mark exceptions", evt))
-            nb_exceptions = numpy.empty(1, dtype=numpy.int32)
-            evt = pyopencl.enqueue_copy(self.queue, nb_exceptions, self.cl_mem["counter"].data,
-                                        is_blocking=False)
-            events.append(EventDescription("copy counter D -> H", evt))
+            nb_exceptions, evt = self._enqueue_mark_exceptions(
+                self.queue, self.cl_mem, raw, events)
             evt.wait()
-            nbexc = int(nb_exceptions[0])
-            if nbexc == 0:
-                logger.info("nbexc %i", nbexc)
-            else:
-                evt = self.kernels.treat_exceptions(self.queue, (nbexc,), (1,),
-                                                    self.cl_mem["raw"].data,
-                                                    len_raw,
-                                                    self.cl_mem["mask"].data,
-                                                    self.cl_mem["exceptions"].data,
-                                                    self.cl_mem["values"].data
-                                                    )
-                events.append(EventDescription("treat_exceptions", evt))
-
-            #self.cl_mem["copy_values"] = self.cl_mem["values"].copy()
-            #self.cl_mem["copy_mask"] = self.cl_mem["mask"].copy()
-            evt = self.kernels.scan(self.cl_mem["values"],
-                                    self.cl_mem["mask"],
-                                    queue=self.queue,
-                                    size=int(len_raw),
-                                    wait_for=(evt,))
-            events.append(EventDescription("double scan", evt))
-            #evt.wait()
-            if out is not None:
-                if out.dtype == numpy.float32:
-                    copy_results = self.kernels.copy_result_float
-                else:
-                    copy_results = self.kernels.copy_result_int
-            else:
-                if as_float:
-                    out = self.cl_mem["data_float"]
-                    copy_results = self.kernels.copy_result_float
-                else:
-                    out = self.cl_mem["data_int"]
-                    copy_results = self.kernels.copy_result_int
-            evt = copy_results(self.queue, (self.padded_raw_size,), (wg,),
-                               self.cl_mem["values"].data,
-                               self.cl_mem["mask"].data,
-                               len_raw,
-                               self.dec_size,
-                               out.data
-                               )
-            events.append(EventDescription("copy_results", evt))
-            #evt.wait()
+            if out is None:
+                out = self.cl_mem["data_float" if as_float else "data_int"]
+            self._enqueue_reconstruct(self.queue, self.cl_mem, len_raw,
+                                      int(nb_exceptions[0]), out, events)
             if self.profile:
                 self.events += events
         return out
 
+    def decode_stream(self, raws, as_float=False, nbuffers=2, on_device=False):
+        """Decompress a stream of frames, overlapping transfers and
+        computation of consecutive frames.
+
+        Each frame in flight gets its own set of buffers and its own command
+        queue: the raw stream of the next frame is uploaded and its
+        exceptions are marked while the current frame is reconstructed and
+        the previous one is downloaded.
+
+        Usage:
+
+        >>> bo = ByteOffset(raw_size, dec_size)
+        >>> for frame in bo.decode_stream(cbf.read_raw() for cbf in files):
+        ...     process(frame.reshape(shape))
+
+        :param raws: iterable of compressed frames (bytes or 1D arrays of char)
+        :param bool as_float: True to decompress as float32,
+                              False (default) to decompress as int32
+        :param int nbuffers: number of frames processed concurrently (>= 2)
+        :param bool on_device: True to yield pyopencl arrays instead of numpy
+            arrays. Those device arrays are reused by the generator: they
+            are only valid until the next frame is requested.
+        :return: generator of decompressed frames, in the order of `raws`
+        """
+        assert self.dec_size is not None, \
+            "dec_size is a mandatory ByteOffset init argument for decompression"
+        if nbuffers < 2:
+            raise ValueError("At least 2 buffers are needed, got %s" % nbuffers)
+        dtype = numpy.float32 if as_float else numpy.int32
+
+        free_slots = []
+        for _ in range(nbuffers):
+            queue = pyopencl.CommandQueue(self.ctx, properties=self.queue.properties)
+            mem = {"counter": pyopencl.array.empty(queue, 1, dtype=numpy.int32),
+                   "output": pyopencl.array.empty(queue, int(self.dec_size), dtype=dtype)}
+            free_slots.append({"queue": queue, "mem": mem})
+        staged = None  # Slot waiting for its number of exceptions
+        pending = collections.deque()  # Slots with a result being computed
+
+        def reconstruct(slot):
+            slot["count_event"].wait()
+            evt = self._enqueue_reconstruct(slot["queue"], slot["mem"],
+                                            slot["len_raw"],
+                                            int(slot["nb_exceptions"][0]),
+                                            slot["mem"]["output"],
+                                            slot["events"])
+            if on_device:
+                slot["result_event"] = evt
+            else:
+                slot["result"] = numpy.empty(int(self.dec_size), dtype=dtype)
+                slot["result_event"] = pyopencl.enqueue_copy(
+                    slot["queue"], slot["result"], slot["mem"]["output"].data,
+                    is_blocking=False)
+                slot["events"].append(
+                    EventDescription("copy result D -> H", slot["result_event"]))
+            pending.append(slot)
+
+        def retrieve():
+            slot = pending.popleft()
+            slot["result_event"].wait()
+            if self.profile:
+                self.events += slot["events"]
+            free_slots.append(slot)
+            if on_device:
+                return slot["mem"]["output"]
+            return slot.pop("result")
+
+        for raw in raws:
+            if not free_slots:
+                yield retrieve()
+            slot = free_slots.pop(0)
+            raw = numpy.frombuffer(raw, dtype=numpy.int8)
+            mem = slot["mem"]
+            if "raw" not in mem or mem["raw"].size < len(raw):
+                wg = self.block_size
+                padded_size = (len(raw) + wg - 1) & ~(wg - 1)
+                mem.update(self._allocate_raw_buffers(padded_size))
+            # Keep a reference on the host buffer until its upload is over
+            slot["raw"] = raw
+            slot["len_raw"] = len(raw)
+            slot["events"] = []
+            slot["nb_exceptions"], slot["count_event"] = self._enqueue_mark_exceptions(
+                slot["queue"], mem, raw, slot["events"])
+            if staged is not None:
+                reconstruct(staged)
+            staged = slot
+        if staged is not None:
+            reconstruct(staged)
+        while pending:
+            yield retrieve()
+
     __call__ = decode
 
     def _init_compression_scan(self):
@@ -37,7 +37,7 @@ __authors__ = ["Jérôme Kieffer"]
 __contact__ = "jerome.kieffer@esrf.eu"
 __license__ = "MIT"
 __copyright__ = "2013 European Synchrotron Radiation Facility, Grenoble, France"
-__date__ = "02/03/2021"
+__date__ = "19/10/2026"
 
 import sys
 import time
@@ -301,3 +301,35 @@ class TestByteOffset(unittest.TestCase):
                      numpy.mean(bo_durations),
                      numpy.min(bo_durations),
                      numpy.max(bo_durations))
+
+    def test_decode_stream(self, ntest=5):
+        """Test the pipelined decompression of many frames"""
+        shape = (91, 97)
+        frames = [self._create_test_data(shape=shape, nexcept=i * 37, lam=100 + i)
+                  for i in range(ntest)]
+        try:
+            bo = byte_offset.ByteOffset(dec_size=numpy.prod(shape), profile=True)
+        except (RuntimeError, pyopencl.RuntimeError) as err:
+            logger.warning(err)
+            if sys.platform == "darwin":
+                raise unittest.SkipTest("Byte-offset decompression is known to be buggy on MacOS-CPU")
+            else:
+                raise err
+
+        results = list(bo.decode_stream(raw for _ref, raw in frames))
+        self.assertEqual(len(results), ntest)
+        for (ref, _raw), res in zip(frames, results):
+            self.assertEqual(res.dtype, numpy.int32)
+            self.assertEqual(abs(ref.ravel() - res).max(), 0)
+
+        for nbuffers in (2, 3):
+            stream = bo.decode_stream((raw for _ref, raw in frames),
+                                      as_float=True, nbuffers=nbuffers,
+                                      on_device=True)
+            for (ref, _raw), d_res in zip(frames, stream):
+                self.assertEqual(d_res.dtype, numpy.float32)
+                self.assertEqual(abs(ref.ravel() - d_res.get()).max(), 0)
+        bo.log_profile(stats=True)
+
+        with self.assertRaises(ValueError):
+            next(bo.decode_stream([frames[0][1]], nbuffers=1))
@@ -38,7 +38,7 @@ __author__ = "Jerome Kieffer"
 __contact__ = "Jerome.Kieffer@ESRF.eu"
 __license__ = "MIT"
 __copyright__ = "European Synchrotron Radiation Facility, Grenoble, France"
-__date__ = "02/03/2021"
+__date__ = "19/10/2026"
 __status__ = "stable"
 
 import sys
@@ -50,6 +50,7 @@ import numpy
 import threading
 from .common import ocl, pyopencl, release_cl_buffers, query_kernel_info, allocate_texture, check_textures_availability
 from .utils import concatenate_cl_kernel
+from .cache import program_cache
 import platform
 
 BufferDescription = namedtuple("BufferDescription", ["name", "size", "dtype", "flags"])
@@ -258,12 +259,16 @@ class OpenclProcessing(object):
                             logger.error("Error while freeing buffer %s", key)
                     self.cl_mem[key] = None
 
-    def compile_kernels(self, kernel_files=None, compile_options=None):
+    def compile_kernels(self, kernel_files=None, compile_options=None, use_cache=True):
         """Call the OpenCL compiler
 
+        Compiled binaries are stored in :data:`silx.opencl.cache.program_cache`
+        so that building the same program again is almost free.
+
         :param kernel_files: list of path to the kernel
             (by default use the one declared in the class)
         :param compile_options: string of compile options
+        :param bool use_cache: False to always compile from the sources
         """
         # concatenate all needed source files into a single openCL module
         kernel_files = kernel_files or self.kernel_files
@@ -272,7 +277,10 @@ class OpenclProcessing(object):
         compile_options = compile_options or self.get_compiler_options()
         logger.info("Compiling file %s with options %s", kernel_files, compile_options)
         try:
-            self.program = pyopencl.Program(self.ctx, kernel_src).build(options=compile_options)
+            if use_cache:
+                self.program = program_cache.build(self.ctx, kernel_src, compile_options)
+            else:
+                self.program = pyopencl.Program(self.ctx, kernel_src).build(options=compile_options)
         except (pyopencl.MemoryError, pyopencl.LogicError) as error:
             raise MemoryError(error)
         else:
@@ -29,7 +29,7 @@ from __future__ import absolute_import, print_function, with_statement, division
 
 __authors__ = ["P. Paleo"]
 __license__ = "MIT"
-__date__ = "07/06/2019"
+__date__ = "19/10/2026"
 
 import numpy as np
 from math import pi
@@ -61,7 +61,8 @@ class SinoFilter(OpenclProcessing):
                  profile=False, extra_options=None):
         """Constructor of OpenCL FFT-Convolve.
 
-        :param sino_shape: shape of the sinogram.
+        :param sino_shape: shape of the sinogram (n_a, d_x), or of a stack
+                           of sinograms (n_z, n_a, d_x) filtered at once.
         :param filter_name: Name of the filter. Defaut is "ram-lak".
         :param ctx: actual working context, left to None for automatic
                     initialization from device type or platformid/deviceid
@@ -94,14 +95,20 @@ class SinoFilter(OpenclProcessing):
         self.ndim = len(sino_shape)
         if self.ndim == 2:
             n_angles, dwidth = sino_shape
+            n_rows = n_angles
+        elif self.ndim == 3:
+            n_z, n_angles, dwidth = sino_shape
+            n_rows = n_z * n_angles
         else:
             raise ValueError("Invalid sinogram number of dimensions: "
-                             "expected 2 dimensions")
-        self.sino_shape = sino_shape
+                             "expected 2 or 3 dimensions")
+        self.sino_shape = tuple(sino_shape)
         self.n_angles = n_angles
         self.dwidth = dwidth
         self.dwidth_padded = get_next_power(2 * self.dwidth, powers=self.powers)
-        self.sino_padded_shape = (n_angles, self.dwidth_padded)
+        # A stack of sinograms is processed as a single tall 2D sinogram
+        self._sino_shape_2d = (n_rows, dwidth)
+        self.sino_padded_shape = (n_rows, self.dwidth_padded)
         sino_f_shape = list(self.sino_padded_shape)
         sino_f_shape[-1] = sino_f_shape[-1] // 2 + 1
         self.sino_f_shape = tuple(sino_f_shape)
@@ -150,8 +157,8 @@ class SinoFilter(OpenclProcessing):
             self.d_sino_padded = np.zeros(self.sino_padded_shape, "f")
             self.d_sino_f = np.zeros(self.sino_f_shape, np.complex64)
         # These are needed for rectangular memcpy in certain cases (see below).
-        self.tmp_sino_device = parray.zeros(self.queue, self.sino_shape, "f")
-        self.tmp_sino_host = np.zeros(self.sino_shape, "f")
+        self.tmp_sino_device = parray.zeros(self.queue, self._sino_shape_2d, "f")
+        self.tmp_sino_host = np.zeros(self._sino_shape_2d, "f")
 
     def _compute_filter(self, filter_name):
         """
@@ -252,6 +259,7 @@ class SinoFilter(OpenclProcessing):
         :param sino: sinogram
         """
         self.check_array(sino)
+        sino = sino.reshape(self._sino_shape_2d)
         self.d_sino_padded.fill(0)
         if self.fft_backend == "opencl":
             # OpenCL backend: FFT/mult/IFFT are done on device.
@@ -267,7 +275,7 @@ class SinoFilter(OpenclProcessing):
             else:
                 d_sino_ref = sino
             # Rectangular copy D->D
-            self.copy2d(self.d_sino_padded, d_sino_ref, self.sino_shape)
+            self.copy2d(self.d_sino_padded, d_sino_ref, self._sino_shape_2d)
             if self.is_cpu:
                 self.d_sino_padded.finish()  # should not be required here
         else:
@@ -279,7 +287,7 @@ class SinoFilter(OpenclProcessing):
             else:
                 h_sino_ref = sino
             # Rectangular copy H->H
-            self.copy2d_host(self.d_sino_padded, h_sino_ref, self.sino_shape)
+            self.copy2d_host(self.d_sino_padded, h_sino_ref, self._sino_shape_2d)
 
     def _get_output_sino(self, output):
         """
@@ -287,9 +295,8 @@ class SinoFilter(OpenclProcessing):
         :return: sinogram
         """
         if output is None:
-            res = np.zeros(self.sino_shape, dtype=np.float32)
-        else:
-            res = output
+            output = np.zeros(self.sino_shape, dtype=np.float32)
+        res = output.reshape(self._sino_shape_2d)
         if self.fft_backend == "opencl":
             if isinstance(res, np.ndarray):
                 # OpenCL backend + numpy output: copy D->H
@@ -298,14 +305,14 @@ class SinoFilter(OpenclProcessing):
                 # D->H.
                 self.copy2d(dst=self.tmp_sino_device,
                             src=self.d_sino_padded,
-                            transfer_shape=self.sino_shape)
+                            transfer_shape=self._sino_shape_2d)
                 if self.is_cpu:
                     self.tmp_sino_device.finish()  # should not be required here
                 res[:] = self.tmp_sino_device.get()[:]
             else:
                 if self.is_cpu:
                     self.d_sino_padded.finish()
-                self.copy2d(res, self.d_sino_padded, self.sino_shape)
+                self.copy2d(res, self.d_sino_padded, self._sino_shape_2d)
                 if self.is_cpu:
                     res.finish()  # should not be required here
         else:
@@ -313,12 +320,12 @@ class SinoFilter(OpenclProcessing):
                 # Numpy backend + pyopencl output: rect copy H->H + copy H->D
                 self.copy2d_host(dst=self.tmp_sino_host,
                                  src=self.d_sino_padded,
-                                 transfer_shape=self.sino_shape)
+                                 transfer_shape=self._sino_shape_2d)
                 res[:] = self.tmp_sino_host[:]
             else:
                 # Numpy backend + numpy output: rect copy H->H
-                self.copy2d_host(res, self.d_sino_padded, self.sino_shape)
-        return res
+                self.copy2d_host(res, self.d_sino_padded, self._sino_shape_2d)
+        return output
 
     def _do_fft(self):
         if self.fft_backend == "opencl":
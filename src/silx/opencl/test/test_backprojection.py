@@ -215,3 +215,47 @@ class TestFBP(unittest.TestCase):
             errmax, 1.e-1,
             "Something wrong with FBP on odd-sized sinogram"
         )
+
+
+@unittest.skipUnless(ocl and mako, "PyOpenCl is missing")
+class TestFBPStack(unittest.TestCase):
+
+    def setUp(self):
+        y, x = np.mgrid[:64, :64]
+        image = np.exp(-((x - 35) ** 2 + (y - 25) ** 2) / 50.)
+        angles = np.linspace(0, pi, 90, False)
+        # Sinogram of a gaussian blob (analytic Radon transform)
+        bins = np.arange(64) - 31.5
+        center = (35 - 31.5) * np.cos(angles) - (25 - 31.5) * np.sin(angles)
+        sino = np.exp(-(bins[None, :] - center[:, None]) ** 2 / 50.)
+        self.sino = (sino * np.sqrt(50 * pi)).astype(np.float32)
+        self.stack = np.array([self.sino * (i + 1) for i in range(7)])
+        self.fbp = backprojection.Backprojection(self.sino.shape)
+        self.reference = np.array([self.fbp(sino) for sino in self.stack])
+
+    def tearDown(self):
+        self.fbp = self.sino = self.stack = self.reference = None
+
+    def test_array(self):
+        res = self.fbp.filtered_backprojection_stack(self.stack, batch_size=3)
+        self.assertEqual(res.shape, self.reference.shape)
+        self.assertTrue(np.allclose(res, self.reference, atol=1e-5))
+
+    def test_iterator_and_output(self):
+        output = np.zeros(self.reference.shape, dtype=np.float32)
+        res = self.fbp.filtered_backprojection_stack(
+            iter(self.stack), output=output, batch_size=4)
+        self.assertIs(res, output)
+        self.assertTrue(np.allclose(output, self.reference, atol=1e-5))
+
+    def test_h5py(self):
+        import h5py
+        import tempfile
+        import os
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "stack.h5")
+            with h5py.File(filename, "w") as h5:
+                h5["sinos"] = self.stack
+                rec = h5.create_dataset("rec", shape=self.reference.shape, dtype=np.float32)
+                self.fbp.filtered_backprojection_stack(h5["sinos"], output=rec, batch_size=2)
+                self.assertTrue(np.allclose(rec[()], self.reference, atol=1e-5))
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#    Project: S I L X project
+#             https://github.com/silx-kit/silx
+#
+#    Copyright (C) 2026 European Synchrotron Radiation Facility, Grenoble, France
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Test of the OpenCL program binary cache
+"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__copyright__ = "2026 European Synchrotron Radiation Facility, Grenoble, France"
+__date__ = "19/10/2026"
+
+import os
+import shutil
+import tempfile
+import logging
+import numpy
+
+import unittest
+from ..common import ocl
+if ocl:
+    import pyopencl
+    import pyopencl.array
+    from ..cache import ProgramCache
+from ..utils import get_opencl_code
+logger = logging.getLogger(__name__)
+
+
+@unittest.skipUnless(ocl, "PyOpenCl is missing")
+class TestProgramCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = ocl.create_context()
+        cls.queue = pyopencl.CommandQueue(cls.ctx)
+        cls.source = get_opencl_code("addition")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ctx = cls.queue = cls.source = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="silx_opencl_cache_")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def check_program(self, program):
+        """Run the addition kernel of the program"""
+        a = pyopencl.array.to_device(self.queue, numpy.arange(16, dtype=numpy.float32))
+        b = pyopencl.array.to_device(self.queue, numpy.ones(16, dtype=numpy.float32))
+        res = pyopencl.array.empty_like(a)
+        program.addition(self.queue, (16,), None, a.data, b.data, res.data, numpy.int32(16))
+        self.assertTrue(numpy.allclose(res.get(), numpy.arange(16) + 1))
+
+    def test_key(self):
+        key = ProgramCache.get_key(self.ctx, self.source, "")
+        self.assertEqual(key, ProgramCache.get_key(self.ctx, self.source, None))
+        self.assertNotEqual(key, ProgramCache.get_key(self.ctx, self.source, "-DFOO"))
+        self.assertNotEqual(key, ProgramCache.get_key(self.ctx, self.source + " ", ""))
+
+    def test_memory_and_disk(self):
+        cache = ProgramCache(directory=self.directory)
+        program = cache.build(self.ctx, self.source)
+        self.check_program(program)
+        key = cache.get_key(self.ctx, self.source)
+        self.assertIsNotNone(cache.get(key))
+        self.assertTrue(os.path.exists(os.path.join(self.directory, key + ".bin")))
+
+        # A new cache instance reads binaries from the disk
+        other = ProgramCache(directory=self.directory)
+        binaries = other.get(key)
+        self.assertEqual(binaries, cache.get(key))
+        self.check_program(other.build(self.ctx, self.source))
+
+    def test_corrupted(self):
+        cache = ProgramCache(directory=self.directory)
+        key = cache.get_key(self.ctx, self.source)
+        with open(os.path.join(self.directory, key + ".bin"), "wb") as f:
+            f.write(b"garbage")
+        self.assertIsNone(cache.get(key))
+        self.check_program(cache.build(self.ctx, self.source))
+        self.assertIsNotNone(cache.get(key))
+
+    def test_unusable_binaries(self):
+        cache = ProgramCache(directory=self.directory)
+        key = cache.get_key(self.ctx, self.source)
+        cache.set(key, [b"not a binary"] * len(self.ctx.devices))
+        self.check_program(cache.build(self.ctx, self.source))
+
+        # The entry is replaced by the binaries of the compiled program
+        binaries = cache.get(key)
+        self.assertNotEqual(binaries[0], b"not a binary")
+        self.assertEqual(cache._memory_size,
+                         sum(len(binary) for binary in binaries))
+        other = ProgramCache(directory=self.directory)
+        self.assertEqual(other.get(key), binaries)
+
+    def test_size_limits(self):
+        cache = ProgramCache(directory=self.directory)
+        cache.set("a", [b"1" * 100])
+        size = os.path.getsize(os.path.join(self.directory, "a.bin"))
+
+        cache = ProgramCache(directory=self.directory,
+                             max_memory_size=150, max_disk_size=size + 10)
+        cache.set("a", [b"1" * 100])
+        cache.set("b", [b"2" * 100])
+        self.assertIsNone(cache._memory.get("a"))
+        self.assertEqual(cache._memory.get("b"), [b"2" * 100])
+        self.assertEqual(sorted(os.listdir(self.directory)), ["b.bin"])
+
+        cache.clear(disk=True)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_disabled(self):
+        cache = ProgramCache(directory=self.directory)
+        cache.enabled = False
+        self.check_program(cache.build(self.ctx, self.source))
+        self.assertEqual(os.listdir(self.directory), [])
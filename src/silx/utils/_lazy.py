@@ -0,0 +1,86 @@
+# coding: utf-8
+# /*##########################################################################
+# Copyright (C) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Helper to load the content of a package on first attribute access.
+
+It uses module `__getattr__` and `__dir__` functions (PEP 562), so that
+importing a package does not import its heavy dependencies.
+
+.. code-block:: python
+
+    # In a package __init__.py
+    from silx.utils._lazy import lazy_attributes as _lazy_attributes
+
+    __getattr__, __dir__ = _lazy_attributes(
+        __name__,
+        attributes={"open": ".utils"},
+        submodules=["utils", "dictdump"])
+"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+
+import importlib
+import sys
+
+
+def lazy_attributes(module_name, attributes=None, submodules=()):
+    """Returns `__getattr__` and `__dir__` functions for a package.
+
+    With Python < 3.7 which does not support module `__getattr__`, the
+    attributes are imported right away.
+
+    :param str module_name: Name of the package (i.e., its `__name__`)
+    :param Dict[str,str] attributes:
+        Mapping of attribute names to the relative name of the module
+        providing it.
+    :param List[str] submodules: Names of the submodules to import on access
+    :returns: (__getattr__, __dir__)
+    """
+    attributes = {} if attributes is None else dict(attributes)
+    submodules = frozenset(submodules)
+
+    def __getattr__(name):
+        if name in attributes:
+            module = importlib.import_module(attributes[name], module_name)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module("." + name, module_name)
+        else:
+            raise AttributeError(
+                "module '%s' has no attribute '%s'" % (module_name, name))
+        # Store it, next accesses do not go through __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__():
+        names = set(vars(sys.modules[module_name]))
+        return sorted(names.union(attributes, submodules))
+
+    if sys.version_info < (3, 7):
+        for name in attributes:
+            __getattr__(name)
+
+    return __getattr__, __dir__
@@ -0,0 +1,106 @@
+# coding: utf-8
+# /*##########################################################################
+# Copyright (C) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Tests of lazy loading of packages"""
+
+__authors__ = ["agent"]
+__license__ = "MIT"
+__date__ = "19/10/2026"
+
+
+import json
+import os
+import subprocess
+import sys
+import types
+import unittest
+
+from .._lazy import lazy_attributes
+
+
+_HEAVY_MODULES = "h5py", "fabio", "numpy", "PyQt5", "PySide2", "matplotlib"
+
+
+class TestLazyAttributes(unittest.TestCase):
+    """Tests of lazy_attributes"""
+
+    def setUp(self):
+        self.module = types.ModuleType("_silx_test_lazy")
+        self.module.__path__ = []
+        sys.modules[self.module.__name__] = self.module
+        getattr_, dir_ = lazy_attributes(
+            self.module.__name__,
+            attributes={"dumps": "json"},
+            submodules=["decoder"])
+        self.module.__getattr__ = getattr_
+        self.module.__dir__ = dir_
+
+    def tearDown(self):
+        del sys.modules[self.module.__name__]
+
+    def testAttribute(self):
+        self.assertIs(self.module.dumps, json.dumps)
+        self.assertIn("dumps", vars(self.module))
+
+    def testDir(self):
+        self.assertIn("dumps", dir(self.module))
+        self.assertIn("decoder", dir(self.module))
+
+    def testMissing(self):
+        with self.assertRaises(AttributeError):
+            self.module.missing
+
+
+class TestStartup(unittest.TestCase):
+    """Check that heavy modules are not imported at startup"""
+
+    def importedModules(self, code):
+        """Returns the heavy modules imported by code run in a subprocess"""
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(sys.path)
+        code += ("\nimport sys, json\n"
+                 "print(json.dumps([m for m in %r if m in sys.modules]))"
+                 % (_HEAVY_MODULES,))
+        output = subprocess.check_output(
+            [sys.executable, "-c", code], env=env, stderr=subprocess.DEVNULL)
+        return json.loads(output.decode().splitlines()[-1])
+
+    def testImportPackages(self):
+        modules = self.importedModules("import silx.io, silx.math, silx.gui")
+        self.assertEqual(modules, [])
+
+    def testHelp(self):
+        for argv in (["silx", "--help"], ["silx", "convert", "--help"]):
+            with self.subTest(argv=argv):
+                code = ("import sys\n"
+                        "sys.argv = %r\n"
+                        "from silx.__main__ import main\n"
+                        "try:\n"
+                        "    main()\n"
+                        "except SystemExit:\n"
+                        "    pass" % (argv,))
+                self.assertEqual(self.importedModules(code), [])
+
+    def testAccess(self):
+        modules = self.importedModules("import silx.io\nsilx.io.open")
+        self.assertIn("h5py", modules)